@@ -4,6 +4,8 @@ import logging
 import sys
 from typing import Dict, List, Union
 
+from .utils import logsummary
+
 try:
     from .version import version
 
@@ -26,6 +28,7 @@ def getLogger_pyscal(
             Only keys "output", "verbose" and "debug" will be looked at.
     """
     logger = logging.getLogger(module_name)
+    logsummary.register(logger)
     if len(logger.handlers) != 0:
         return logger
     if args_dict is None:
@@ -62,10 +65,13 @@ def getLogger_pyscal(
 
 
 # The order of imports must be conserved to avoid circular imports:
+from .utils.stats import reset_stats, stats  # noqa
+from .utils.logsummary import aggregated_logging  # noqa
 from .wateroil import WaterOil  # noqa
 from .wateroilgas import WaterOilGas  # noqa
 from .gasoil import GasOil  # noqa
 from .gaswater import GasWater  # noqa
-from .scalrecommendation import SCALrecommendation  # noqa
+from .scalrecommendation import CompiledSCALrecommendation, SCALrecommendation  # noqa
 from .pyscallist import PyscalList  # noqa
+from .densepyscallist import DensePyscalList  # noqa
 from .factory import PyscalFactory  # noqa
@@ -0,0 +1,435 @@
+"""Compact array-backed container for large lists of pyscal objects"""
+
+import collections.abc
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from pyscal import SCALrecommendation, getLogger_pyscal
+from pyscal.pyscallist import PYSCAL_OBJECTS, PyscalList, PyscalObjects
+
+PYSCAL_CLASSES = {cls.__name__: cls for cls in PYSCAL_OBJECTS}
+
+# Names of dataframe columns in wateroil/gasoil.table, and the
+# renamers applied in df(), equal to what PyscalList.df() does:
+WATEROIL_COL_RENAMER = {"SW": "SW", "KRW": "KRW", "KROW": "KROW", "PC": "PCOW"}
+GASOIL_COL_RENAMER = {"SG": "SG", "KRG": "KRG", "KROG": "KROG", "PC": "PCOG"}
+CASE_NAMES = {"low": "pess", "base": "base", "high": "opt"}
+
+# Version of the directory layout written by save_bundle()
+BUNDLE_FORMAT = 1
+BUNDLE_INDEX = "index.json"
+
+# Minimal number of SATNUMs the arrays are grown by when objects are added
+GROWTH_CHUNK = 64
+
+
+def _array_filename(table_name: str, col: str) -> str:
+    """Filename for a column array in a memmap directory or bundle"""
+    return f"{table_name}.{col}.npy"
+
+
+def _flatten(
+    pyscal_obj: PyscalObjects, prefix: str, tables: Dict[str, Dict[str, np.ndarray]]
+) -> Dict[str, Any]:
+    """Split a pyscal object into metadata and table columns
+
+    Args:
+        pyscal_obj: Object to split. Sub-objects (like wateroil in WaterOilGas)
+            are split recursively.
+        prefix: Attribute path to pyscal_obj, empty or ending in a dot.
+        tables: Dictionary to add table columns to. The keys are
+            the attribute path to the table, like "wateroil.table".
+
+    Returns:
+        Nested dictionary with all other attributes of the object.
+    """
+    metadata: Dict[str, Any] = {"__class__": type(pyscal_obj).__name__}
+    for key, value in pyscal_obj.__dict__.items():
+        if key == "logger":
+            continue
+        if key in ["_formatcache", "_curvecache"]:
+            # Cached output is not kept, restored objects start empty:
+            metadata[key] = {}
+            continue
+        if key == "table":
+            tables[prefix + key] = {
+                col: value[col].to_numpy(dtype=float) for col in value.columns
+            }
+            metadata[key] = {"__table__": prefix + key}
+        elif isinstance(value, tuple(PYSCAL_OBJECTS)):
+            metadata[key] = _flatten(value, prefix + key + ".", tables)
+        elif isinstance(value, type):
+            metadata[key] = {"__type__": value.__name__}
+        elif isinstance(value, np.generic):
+            metadata[key] = value.item()
+        else:
+            metadata[key] = value
+    return metadata
+
+
+class _ObjectViews(collections.abc.Sequence):
+    """Read-only sequence of pyscal objects, created on demand from a
+    DensePyscalList. Only the object being looked at is kept in memory."""
+
+    def __init__(self, dense_list: "DensePyscalList"):
+        self.dense_list = dense_list
+
+    def __len__(self) -> int:
+        return len(self.dense_list.metadata)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("SATNUM index out of range, length is " + str(len(self)))
+        return self.dense_list.restore(idx)
+
+
+class DensePyscalList(PyscalList):
+    """Compact alternative to PyscalList for very many SATNUMs.
+
+    All tables of the same kind (e.g. all wateroil tables) are stored as
+    padded 2D float arrays with one row pr. SATNUM, one array pr. column,
+    together with a vector of row counts. Endpoints, comments and other
+    attributes are kept as small dictionaries pr. SATNUM. The arrays can
+    optionally be numpy memory maps in a directory on local disk. The
+    objects are copied into the arrays one at a time as they are added,
+    so with memory maps the tables of a long list, or of an interpolation,
+    need not fit in memory.
+
+    Pyscal objects are only recreated when asked for, one at a time, e.g.
+    through indexing or when generating keywords, so the per-object
+    overhead of dataframes and loggers is not kept in memory. Objects
+    obtained by indexing are copies; modifying them does not modify the
+    list.
+
+    Args:
+        pyscal_list: Pyscal objects of equal type, e.g. a PyscalList. Any
+            iterable is accepted, objects are not kept after they are added.
+        memmap_dir: If provided, the arrays are stored as .npy files in
+            this directory and memory mapped. The directory is created
+            if it does not exist. Existing files will be overwritten.
+        args: Verbose, debug and output arguments from CLI
+            to create logger that splits log messages to stdout and stderr
+    """
+
+    def __init__(
+        self,
+        pyscal_list: Optional[Iterable[PyscalObjects]] = None,
+        memmap_dir: Optional[Union[str, Path]] = None,
+        args: Optional[dict] = None,
+    ):
+        # pylint: disable=super-init-not-called
+        self.logger = getLogger_pyscal(__name__, args)
+        self.pyscaltype: Optional[type] = None
+        self.memmap_dir: Optional[Path] = Path(memmap_dir) if memmap_dir else None
+
+        self.metadata: List[Dict[str, Any]] = []
+        self.columns: Dict[str, Dict[str, np.ndarray]] = {}
+        self.nrows: Dict[str, np.ndarray] = {}
+
+        if pyscal_list is None:
+            pyscal_list = []
+        if isinstance(pyscal_list, PyscalList):
+            pyscal_list = iter(pyscal_list.pyscal_list)
+
+        count = 0
+        for pyscal_obj in pyscal_list:
+            if not isinstance(pyscal_obj, tuple(PYSCAL_OBJECTS)):
+                raise ValueError("Not a pyscal object: " + str(pyscal_obj))
+            if self.pyscaltype is None:
+                self.pyscaltype = type(pyscal_obj)
+            if not isinstance(pyscal_obj, self.pyscaltype):
+                raise ValueError(
+                    f"Trying to add {type(pyscal_obj)} to list "
+                    f"of {self.pyscaltype} objects."
+                )
+            tables: Dict[str, Dict[str, np.ndarray]] = {}
+            self.metadata.append(_flatten(pyscal_obj, "", tables))
+            self._store(count, tables)
+            count += 1
+        self._trim(count)
+
+    def _store(self, idx: int, tables: Dict[str, Dict[str, np.ndarray]]) -> None:
+        """Copy the table columns of one SATNUM into the padded 2D arrays
+
+        The arrays are grown as needed, by at least GROWTH_CHUNK SATNUMs at
+        a time, so only one SATNUM is kept outside the arrays. Call _trim()
+        when all SATNUMs are stored.
+        """
+        for table_name, table in tables.items():
+            nrows = len(next(iter(table.values()), []))
+            if table_name not in self.nrows:
+                self.nrows[table_name] = np.zeros(0, dtype=np.int64)
+                self.columns[table_name] = {}
+            columns = self.columns[table_name]
+            capacity = len(self.nrows[table_name])
+            if idx >= capacity:
+                capacity = max(idx + 1, 2 * capacity, GROWTH_CHUNK)
+            width = max([0] + [array.shape[1] for array in columns.values()])
+            if nrows > width:
+                width = max(nrows, width + width // 2)
+            self._resize(table_name, capacity, width, list(table))
+            self.nrows[table_name][idx] = nrows
+            for col, values in table.items():
+                columns[col][idx, :nrows] = values
+
+    def _trim(self, count: int) -> None:
+        """Shrink or pad the arrays to count SATNUMs and the longest table"""
+        for table_name, nrows in self.nrows.items():
+            nrows = nrows[:count]
+            width = int(nrows.max()) if len(nrows) else 0
+            self._resize(table_name, count, width, [])
+
+    def _resize(
+        self, table_name: str, capacity: int, width: int, colnames: List[str]
+    ) -> None:
+        """Give all column arrays of a table a new shape, keeping the values
+        that fit and padding with NaN, and add arrays for new columns"""
+        nrows = self.nrows[table_name]
+        if len(nrows) != capacity:
+            self.nrows[table_name] = np.zeros(capacity, dtype=np.int64)
+            self.nrows[table_name][: min(len(nrows), capacity)] = nrows[:capacity]
+        columns = self.columns[table_name]
+        for col in list(columns) + [col for col in colnames if col not in columns]:
+            array = columns.get(col)
+            if array is None or array.shape != (capacity, width):
+                columns[col] = self._reallocate(
+                    _array_filename(table_name, col), array, (capacity, width)
+                )
+
+    def _allocate(self, name: str, shape: tuple) -> np.ndarray:
+        """Allocate an array, as a memory mapped .npy file if requested"""
+        if self.memmap_dir is None:
+            return np.empty(shape, dtype=float)
+        self.memmap_dir.mkdir(parents=True, exist_ok=True)
+        return np.lib.format.open_memmap(
+            self.memmap_dir / name, mode="w+", dtype=float, shape=shape
+        )
+
+    def _reallocate(
+        self, name: str, array: Optional[np.ndarray], shape: tuple
+    ) -> np.ndarray:
+        """Allocate an array of a new shape, filled with NaN, and copy the
+        overlapping part of the old array, if any, into it"""
+        if array is None or self.memmap_dir is None:
+            new_array = self._allocate(name, shape)
+        else:
+            new_array = self._allocate(name + ".resized", shape)
+        new_array[:] = np.nan
+        if array is not None:
+            rows = min(shape[0], array.shape[0])
+            cols = min(shape[1], array.shape[1])
+            new_array[:rows, :cols] = array[:rows, :cols]
+        if array is not None and self.memmap_dir is not None:
+            # The resized file takes the place of the old one:
+            new_array.flush()
+            del new_array
+            os.replace(self.memmap_dir / (name + ".resized"), self.memmap_dir / name)
+            new_array = np.load(self.memmap_dir / name, mmap_mode="r+")
+        return new_array
+
+    @property
+    def pyscal_list(self) -> _ObjectViews:  # type: ignore
+        """Pyscal objects in the list, recreated when accessed"""
+        return _ObjectViews(self)
+
+    def append(self, pyscal_obj: Optional[PyscalObjects]) -> None:
+        """Not supported, the arrays are allocated once
+
+        Raises:
+            TypeError
+        """
+        raise TypeError("DensePyscalList does not support append")
+
+    def table(self, table_name: str, satnum_idx: int) -> pd.DataFrame:
+        """Get the table for one SATNUM as a dataframe
+
+        Args:
+            table_name: Attribute path to the table, "table" for WaterOil and
+                GasOil, otherwise e.g. "wateroil.table" or "low.gasoil.table".
+            satnum_idx: Index for wanted SATNUM, starts at 1.
+        """
+        nrows = self.nrows[table_name][satnum_idx - 1]
+        table = pd.DataFrame(
+            {
+                col: np.array(array[satnum_idx - 1, :nrows])
+                for col, array in self.columns[table_name].items()
+            }
+        )
+        # Columns only present for other SATNUMs are all NaN:
+        return table.dropna(axis="columns", how="all")
+
+    def restore(self, idx: int) -> PyscalObjects:
+        """Recreate the pyscal object for one SATNUM
+
+        Args:
+            idx: Zero-based index of the SATNUM.
+        """
+        return self._restore(self.metadata[idx], idx)
+
+    def _restore(self, metadata: Dict[str, Any], idx: int) -> PyscalObjects:
+        # The objects are not initialized, only given their attributes back,
+        # which is much cheaper than recomputing the saturation grid.
+        cls = PYSCAL_CLASSES[metadata["__class__"]]
+        pyscal_obj = cls.__new__(cls)
+        attributes: Dict[str, Any] = {
+            "logger": getLogger_pyscal(cls.__module__, metadata.get("_logger_args"))
+        }
+        for key, value in metadata.items():
+            if key == "__class__":
+                continue
+            if key in ["_formatcache", "_curvecache"]:
+                attributes[key] = {}
+            elif isinstance(value, dict) and "__table__" in value:
+                attributes[key] = self.table(value["__table__"], idx + 1)
+            elif isinstance(value, dict) and "__type__" in value:
+                attributes[key] = PYSCAL_CLASSES[value["__type__"]]
+            elif isinstance(value, dict) and "__class__" in value:
+                attributes[key] = self._restore(value, idx)
+            else:
+                attributes[key] = value
+        pyscal_obj.__dict__.update(attributes)
+        return pyscal_obj
+
+    def df(self) -> pd.DataFrame:
+        """Dump dataframes of generated relperm data
+
+        Equivalent to PyscalList.df(), but constructed directly
+        from the arrays without recreating any pyscal objects. The
+        returned dataframe has a default integer index.
+        """
+        sort_candidates = ["SATNUM", "CASE", "KEYWORD", "SW", "SG", "SL"]
+        df_list = []
+        for table_name, columns in self.columns.items():
+            if "SW" in columns:
+                renamer = WATEROIL_COL_RENAMER
+            elif "SG" in columns:
+                renamer = GASOIL_COL_RENAMER
+            else:
+                continue
+            nrows = self.nrows[table_name]
+            mask = np.arange(max(nrows.max(), 0)) < nrows[:, np.newaxis]
+            dframe = pd.DataFrame(
+                {
+                    renamer[col]: np.asarray(array)[mask]
+                    for col, array in columns.items()
+                    if col in renamer
+                }
+            )
+            dframe["SATNUM"] = np.repeat(np.arange(1, len(nrows) + 1), nrows)
+            case = table_name.split(".")[0]
+            if self.pyscaltype == SCALrecommendation and case in CASE_NAMES:
+                dframe["CASE"] = CASE_NAMES[case]
+            df_list.append(dframe)
+        dframe = pd.concat(df_list, sort=False, ignore_index=True)
+        sort_rows_on = [colname for colname in sort_candidates if colname in dframe]
+        if sort_rows_on:
+            dframe.sort_values(sort_rows_on, inplace=True)
+        return dframe.reset_index(drop=True)
+
+    def save_bundle(self, path: Union[str, Path]) -> None:
+        """Save the list as a bundle directory, see PyscalList.save_bundle()
+
+        Arrays already memory mapped to files in the bundle directory
+        are only flushed to disk.
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        for table_name, columns in self.columns.items():
+            for col, array in columns.items():
+                filename = path / _array_filename(table_name, col)
+                if (
+                    isinstance(array, np.memmap)
+                    and array.filename
+                    and Path(array.filename).resolve() == filename.resolve()
+                ):
+                    array.flush()
+                else:
+                    np.save(filename, array)
+        index = {
+            "format": BUNDLE_FORMAT,
+            "pyscaltype": self.pyscaltype.__name__ if self.pyscaltype else None,
+            "columns": {
+                table_name: list(columns)
+                for table_name, columns in self.columns.items()
+            },
+            "nrows": {
+                table_name: nrows.tolist() for table_name, nrows in self.nrows.items()
+            },
+            "metadata": self.metadata,
+        }
+        with open(path / BUNDLE_INDEX, "w", encoding="utf-8") as f_handle:
+            json.dump(index, f_handle)
+        self.logger.info("Saved %d SATNUMs to bundle %s", len(self), str(path))
+
+    @classmethod
+    def open_bundle(
+        cls, path: Union[str, Path], args: Optional[dict] = None
+    ) -> "DensePyscalList":
+        """Open a bundle directory, see PyscalList.open_bundle()"""
+        path = Path(path)
+        if not (path / BUNDLE_INDEX).is_file():
+            raise ValueError(f"Not a pyscal bundle, no {BUNDLE_INDEX} in {path}")
+        with open(path / BUNDLE_INDEX, encoding="utf-8") as f_handle:
+            index = json.load(f_handle)
+        if index.get("format") != BUNDLE_FORMAT:
+            raise ValueError(f"Unsupported bundle format {index.get('format')}")
+
+        dense_list = cls(args=args)
+        if index["pyscaltype"] is not None:
+            dense_list.pyscaltype = PYSCAL_CLASSES[index["pyscaltype"]]
+        dense_list.metadata = index["metadata"]
+        for table_name, colnames in index["columns"].items():
+            dense_list.nrows[table_name] = np.array(
+                index["nrows"][table_name], dtype=np.int64
+            )
+            dense_list.columns[table_name] = {
+                col: np.load(path / _array_filename(table_name, col), mmap_mode="r")
+                for col in colnames
+            }
+        return dense_list
+
+    def interpolate(
+        self,
+        int_params_wo: Union[float, int, List[float]],
+        int_params_go: Optional[Union[float, int, List[Optional[float]]]] = None,
+        h: Optional[float] = None,
+        args: Optional[dict] = None,
+        validation: Optional[str] = None,
+        processes: Optional[int] = None,
+        memmap_dir: Optional[Union[str, Path]] = None,
+    ) -> "DensePyscalList":
+        """Interpolate each SCALrecommendation to the chosen parameters
+
+        See PyscalList.interpolate() for the arguments. The interpolants
+        are computed one SATNUM at a time and stored directly in a new
+        DensePyscalList.
+
+        Args:
+            memmap_dir: Directory for memory mapped arrays of the
+                interpolated list, should differ from the directory
+                used by this list. Optional.
+
+        Returns:
+            DensePyscalList of type WaterOilGas or GasWater
+        """
+        return DensePyscalList(
+            self._interpolants(
+                int_params_wo,
+                int_params_go,
+                h=h,
+                args=args,
+                validation=validation,
+                processes=processes,
+            ),
+            memmap_dir=memmap_dir,
+            args=args,
+        )
@@ -1,16 +1,17 @@
 """Factory functions for creating the pyscal objects"""
 
+import copy
 import logging
-import zipfile
+import os
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Set, Union
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Union
 
 import numpy as np
-import openpyxl
 import pandas as pd
-import xlrd
 
-from pyscal.utils import capillarypressure
+from pyscal.constants import EPSILON as epsilon
+from pyscal.constants import MAX_EXPONENT
+from pyscal.utils import capillarypressure, fromtable, stats, tabular
 from pyscal import getLogger_pyscal
 
 from .gasoil import GasOil
@@ -116,6 +117,7 @@ class PyscalFactory(object):
         params: Optional[Dict[str, float]] = None,
         fast: bool = False,
         args: Optional[dict] = None,
+        validation: Optional[str] = None,
     ) -> WaterOil:
         """Create a WaterOil object from a dictionary of parameters.
 
@@ -142,6 +144,8 @@ class PyscalFactory(object):
         Args:
             params: Dictionary with parameters describing the WaterOil object.
             fast: If fast-mode should be set for constructed object.
+            validation: Validation level for constructed objects, "none",
+                "cheap" or "full". Overrides fast if given.
             args: Verbose, debug and output arguments from CLI
                 to create logger that splits log messages to stdout and stderr
         """
@@ -174,7 +178,7 @@ class PyscalFactory(object):
             params["swl"] = capillarypressure.swl_from_height_simpleJ(
                 **params_swl_from_height
             )
-            logger.debug("Computed swl from swlwheight to %s", str(params["swl"]))
+            logger.debug("Computed swl from swlwheight to %s", params["swl"])
             if "swcr" in params and params["swcr"] < params["swl"]:
                 raise ValueError(
                     f'Provided swcr={params["swcr"]} is lower than '
@@ -205,12 +209,13 @@ class PyscalFactory(object):
 
         # No requirements to the base objects, defaults are ok.
         wateroil = WaterOil(
-            **PyscalFactory.alias_sgrw(slicedict(params, WO_INIT)), fast=fast, args=args
+            **PyscalFactory.alias_sgrw(slicedict(params, WO_INIT)),
+            fast=fast,
+            args=args,
+            validation=validation,
         )
         usedparams = usedparams.union(set(slicedict(params, WO_INIT).keys()))
-        logger.debug(
-            "Initialized WaterOil object from parameters %s", str(list(usedparams))
-        )
+        logger.debug("Initialized WaterOil object from parameters %s", list(usedparams))
 
         # Water curve
         params_corey_water = slicedict(params, WO_COREY_WATER + WO_WATER_ENDPOINTS)
@@ -219,7 +224,7 @@ class PyscalFactory(object):
             wateroil.add_corey_water(**params_corey_water)
             logger.debug(
                 "Added Corey water to WaterOil object from parameters %s",
-                str(params_corey_water.keys()),
+                params_corey_water.keys(),
             )
         elif set(WO_LET_WATER).issubset(set(params_let_water)):
             params_let_water["l"] = params_let_water.pop("lw")
@@ -228,7 +233,7 @@ class PyscalFactory(object):
             wateroil.add_LET_water(**params_let_water)
             logger.debug(
                 "Added LET water to WaterOil object from parameters %s",
-                str(params_let_water.keys()),
+                params_let_water.keys(),
             )
 
         # Oil curve:
@@ -240,7 +245,7 @@ class PyscalFactory(object):
             wateroil.add_corey_oil(**params_corey_oil)
             logger.debug(
                 "Added Corey water to WaterOil object from parameters %s",
-                str(params_corey_oil.keys()),
+                params_corey_oil.keys(),
             )
         elif set(WO_LET_OIL).issubset(set(params_let_oil)):
             params_let_oil["l"] = params_let_oil.pop("low")
@@ -249,7 +254,7 @@ class PyscalFactory(object):
             wateroil.add_LET_oil(**params_let_oil)
             logger.debug(
                 "Added LET water to WaterOil object from parameters %s",
-                str(params_let_oil.keys()),
+                params_let_oil.keys(),
             )
         elif set(WO_LET_OIL_ALT).issubset(set(params_let_oil)):
             params_let_oil["l"] = params_let_oil.pop("lo")
@@ -258,7 +263,7 @@ class PyscalFactory(object):
             wateroil.add_LET_oil(**params_let_oil)
             logger.debug(
                 "Added LET water to WaterOil object from parameters %s",
-                str(params_let_oil.keys()),
+                params_let_oil.keys(),
             )
 
         # Capillary pressure:
@@ -280,7 +285,7 @@ class PyscalFactory(object):
                     "WaterOil object. Using zero."
                 )
             )
-        if not wateroil.selfcheck():
+        if wateroil.validation != "none" and not wateroil.selfcheck():
             raise ValueError(
                 ("Incomplete WaterOil object, some parameters missing to factory")
             )
@@ -292,6 +297,7 @@ class PyscalFactory(object):
         params: Optional[Dict[str, float]] = None,
         fast: bool = False,
         args: Optional[dict] = None,
+        validation: Optional[str] = None,
     ) -> GasOil:
         """Create a GasOil object from a dictionary of parameters.
 
@@ -314,6 +320,8 @@ class PyscalFactory(object):
         Args:
             params: Dictionary with parameters describing the GasOil object.
             fast: If fast-mode should be set for constructed object.
+            validation: Validation level for constructed objects, "none",
+                "cheap" or "full". Overrides fast if given.
             args: Verbose, debug and output arguments from CLI
                 to create logger that splits log messages to stdout and stderr
         """
@@ -336,11 +344,11 @@ class PyscalFactory(object):
 
         usedparams: Set[str] = set()
         # No requirements to the base objects, defaults are ok.
-        gasoil = GasOil(**slicedict(params, GO_INIT), fast=fast, args=args)
-        usedparams = usedparams.union(set(slicedict(params, GO_INIT).keys()))
-        logger.debug(
-            "Initialized GasOil object from parameters %s", str(list(usedparams))
+        gasoil = GasOil(
+            **slicedict(params, GO_INIT), fast=fast, args=args, validation=validation
         )
+        usedparams = usedparams.union(set(slicedict(params, GO_INIT).keys()))
+        logger.debug("Initialized GasOil object from parameters %s", list(usedparams))
 
         # Gas curve
         params_corey_gas = slicedict(params, GO_COREY_GAS + GO_GAS_ENDPOINTS)
@@ -349,7 +357,7 @@ class PyscalFactory(object):
             gasoil.add_corey_gas(**params_corey_gas)
             logger.debug(
                 "Added Corey gas to GasOil object from parameters %s",
-                str(params_corey_gas.keys()),
+                params_corey_gas.keys(),
             )
         elif set(GO_LET_GAS).issubset(set(params_let_gas)):
             params_let_gas["l"] = params_let_gas.pop("lg")
@@ -358,7 +366,7 @@ class PyscalFactory(object):
             gasoil.add_LET_gas(**params_let_gas)
             logger.debug(
                 "Added LET gas to GasOil object from parameters %s",
-                str(params_let_gas.keys()),
+                params_let_gas.keys(),
             )
         else:
             logger.warning(
@@ -372,7 +380,7 @@ class PyscalFactory(object):
             gasoil.add_corey_oil(**params_corey_oil)
             logger.debug(
                 "Added Corey gas to GasOil object from parameters %s",
-                str(params_corey_oil.keys()),
+                params_corey_oil.keys(),
             )
         elif set(GO_LET_OIL).issubset(set(params_let_oil)):
             params_let_oil["l"] = params_let_oil.pop("log")
@@ -381,13 +389,13 @@ class PyscalFactory(object):
             gasoil.add_LET_oil(**params_let_oil)
             logger.debug(
                 "Added LET gas to GasOil object from parameters %s",
-                str(params_let_oil.keys()),
+                params_let_oil.keys(),
             )
         else:
             logger.warning(
                 "Missing or ambiguous parameters for oil curve in GasOil object"
             )
-        if not gasoil.selfcheck():
+        if gasoil.validation != "none" and not gasoil.selfcheck():
             raise ValueError(
                 ("Incomplete GasOil object, some parameters missing to factory")
             )
@@ -399,6 +407,7 @@ class PyscalFactory(object):
         params: Optional[Dict[str, float]] = None,
         fast: bool = False,
         args: Optional[dict] = None,
+        validation: Optional[str] = None,
     ) -> WaterOilGas:
         """Create a WaterOilGas object from a dictionary of parameters
 
@@ -411,6 +420,8 @@ class PyscalFactory(object):
         Params:
             params: Dictionary with parameters describing the WaterOilGas object.
             fast: If fast-mode should be set for constructed object.
+            validation: Validation level for constructed objects, "none",
+                "cheap" or "full". Overrides fast if given.
             args: Verbose, debug and output arguments from CLI
                 to create logger that splits log messages to stdout and stderr
         """
@@ -428,7 +439,9 @@ class PyscalFactory(object):
 
         wateroil: Optional[WaterOil]
         if sufficient_water_oil_params(params, failhard=False):
-            wateroil = PyscalFactory.create_water_oil(params, fast=fast, args=args)
+            wateroil = PyscalFactory.create_water_oil(
+                params, fast=fast, args=args, validation=validation
+            )
         else:
             logger.info("No wateroil parameters. Assuming only gas-oil in wateroilgas")
             wateroil = None
@@ -440,19 +453,23 @@ class PyscalFactory(object):
 
         gasoil: Optional[GasOil]
         if sufficient_gas_oil_params(params, failhard=False):
-            gasoil = PyscalFactory.create_gas_oil(params, fast=fast, args=args)
+            gasoil = PyscalFactory.create_gas_oil(
+                params, fast=fast, args=args, validation=validation
+            )
         else:
             logger.info("No gasoil parameters, assuming two-phase oilwatergas")
             gasoil = None
 
         wog_init_params = slicedict(params, WOG_INIT)
-        wateroilgas = WaterOilGas(**wog_init_params, fast=fast, args=args)
+        wateroilgas = WaterOilGas(
+            **wog_init_params, fast=fast, args=args, validation=validation
+        )
         # The wateroilgas __init__ has already created WaterOil and GasOil objects
         # but we overwrite the references with newly created ones, this factory function
         # must then guarantee that they are compatible.
         wateroilgas.wateroil = wateroil  # This might be None
         wateroilgas.gasoil = gasoil  # This might be None
-        if not wateroilgas.selfcheck():
+        if wateroilgas.validation != "none" and not wateroilgas.selfcheck():
             raise ValueError(
                 f"Inconsistent WaterOilGas object. Bug? Input was {params}"
             )
@@ -464,6 +481,7 @@ class PyscalFactory(object):
         params: Optional[Dict[str, float]] = None,
         fast: bool = False,
         args: Optional[dict] = None,
+        validation: Optional[str] = None,
     ) -> GasWater:
         """Create a GasWater object.
 
@@ -473,6 +491,8 @@ class PyscalFactory(object):
         Args:
             params: Dictionary with parameters for GasWater.
             fast: If fast-mode should be set for constructed object.
+            validation: Validation level for constructed objects, "none",
+                "cheap" or "full". Overrides fast if given.
             args: Verbose, debug and output arguments from CLI
                 to create logger that splits log messages to stdout and stderr
         """
@@ -487,7 +507,9 @@ class PyscalFactory(object):
         sufficient_gas_water_params(params, failhard=True)
 
         gw_init_params = slicedict(params, GW_INIT)
-        gaswater = GasWater(**gw_init_params, fast=fast, args=args)
+        gaswater = GasWater(
+            **gw_init_params, fast=fast, args=args, validation=validation
+        )
 
         # We are using the create_water_oil_gas factory function
         # to avoid replicating code. It works because GasWater and
@@ -498,7 +520,9 @@ class PyscalFactory(object):
         # Set some dummy parameters for oil:
         wog_params["nog"] = 1
         wog_params["now"] = 1
-        wog = PyscalFactory.create_water_oil_gas(wog_params, fast=fast, args=args)
+        wog = PyscalFactory.create_water_oil_gas(
+            wog_params, fast=fast, args=args, validation=validation
+        )
         assert wog.wateroil is not None
         assert wog.gasoil is not None
         gaswater.wateroil = wog.wateroil
@@ -512,6 +536,7 @@ class PyscalFactory(object):
         h: Optional[float] = None,
         fast: bool = False,
         args: Optional[dict] = None,
+        validation: Optional[str] = None,
     ) -> SCALrecommendation:
         """
         Set up a SCAL recommendation curve set from input as a
@@ -540,6 +565,8 @@ class PyscalFactory(object):
             tag: String to be used as the tag, will end up in comments.
             h: Saturation step length
             fast: If fast-mode should be set for constructed object.
+            validation: Validation level for constructed objects, "none",
+                "cheap" or "full". Overrides fast if given.
             args: Verbose, debug and output arguments from CLI
                 to create logger that splits log messages to stdout and stderr
         """
@@ -588,19 +615,19 @@ class PyscalFactory(object):
         if wateroil or gasoil:
             try:
                 wog_low = PyscalFactory.create_water_oil_gas(
-                    params["low"], fast=fast, args=args
+                    params["low"], fast=fast, args=args, validation=validation
                 )
             except ValueError as err:
                 raise ValueError(f"Problem with low/pess case: {err}") from err
             try:
                 wog_base = PyscalFactory.create_water_oil_gas(
-                    params["base"], fast=fast, args=args
+                    params["base"], fast=fast, args=args, validation=validation
                 )
             except ValueError as err:
                 raise ValueError(f"Problem with base case: {err}") from err
             try:
                 wog_high = PyscalFactory.create_water_oil_gas(
-                    params["high"], fast=fast, args=args
+                    params["high"], fast=fast, args=args, validation=validation
                 )
             except ValueError as err:
                 raise ValueError(f"Problem with high/opt case: {err}") from err
@@ -608,24 +635,27 @@ class PyscalFactory(object):
             # Note that gaswater will be True in three-phase configs.
             try:
                 wog_low = PyscalFactory.create_gas_water(
-                    params["low"], fast=fast, args=args
+                    params["low"], fast=fast, args=args, validation=validation
                 )
             except ValueError as err:
                 raise ValueError(f"Problem with low/pess case: {err}") from err
             try:
                 wog_base = PyscalFactory.create_gas_water(
-                    params["base"], fast=fast, args=args
+                    params["base"], fast=fast, args=args, validation=validation
                 )
             except ValueError as err:
                 raise ValueError(f"Problem with base case: {err}") from err
             try:
                 wog_high = PyscalFactory.create_gas_water(
-                    params["high"], fast=fast, args=args
+                    params["high"], fast=fast, args=args, validation=validation
                 )
             except ValueError as err:
                 raise ValueError(f"Problem with high/opt case: {err}") from err
 
-        errored = all(not wog.selfcheck() for wog in [wog_low, wog_base, wog_high])
+        errored = all(
+            wog.validation != "none" and not wog.selfcheck()
+            for wog in [wog_low, wog_base, wog_high]
+        )
 
         if errored:
             raise ValueError("Incomplete SCAL recommendation")
@@ -638,6 +668,7 @@ class PyscalFactory(object):
         inputfile: Union[str, pd.DataFrame],
         sheet_name: Optional[str] = None,
         args: Optional[dict] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
     ) -> pd.DataFrame:
         """Read CSV or XLSX from file and return scal/relperm data
         a dataframe.
@@ -658,6 +689,12 @@ class PyscalFactory(object):
             sheet_name: Sheet-name, only used when loading xlsx files.
             args: Verbose, debug and output arguments from CLI
                 to create logger that splits log messages to stdout and stderr
+            cache_dir: Directory for caching the parsed file contents, keyed
+                by the path, size and modification time of the file and the
+                sheet name, see :mod:`pyscal.utils.tabular`. Defaults to the
+                environment variable PYSCAL_CACHE_DIR, no caching if not set
+                or if pyarrow is not installed. The data is validated also
+                when loaded from the cache.
 
         Returns:
             To be handed over to pyscal list factory methods.
@@ -665,6 +702,8 @@ class PyscalFactory(object):
         """
 
         logger = getLogger_pyscal(__name__, args)
+        if cache_dir is None:
+            cache_dir = os.environ.get("PYSCAL_CACHE_DIR") or None
 
         if isinstance(inputfile, (str, Path)) and Path(inputfile).is_file():
             tabular_file_format = infer_tabular_file_format(inputfile)
@@ -677,13 +716,13 @@ class PyscalFactory(object):
                 logger.warning(
                     "Sheet name only relevant for XLSX files, ignoring %s", sheet_name
                 )
-            excel_engines = {"xls": "xlrd", "xlsx": "openpyxl"}
             if tabular_file_format != "csv" and sheet_name:
                 try:
-                    input_df = pd.read_excel(
+                    input_df = tabular.read_tabular(
                         inputfile,
+                        tabular_file_format,
                         sheet_name=sheet_name,
-                        engine=excel_engines[tabular_file_format],
+                        cache_dir=cache_dir,
                     )
                     logger.info(
                         "Parsed %s file %s, sheet %s",
@@ -691,20 +730,15 @@ class PyscalFactory(object):
                         inputfile,
                         sheet_name,
                     )
-                except (KeyError, ValueError) as err:
+                except KeyError as err:
                     raise ValueError(
                         f"Non-existing sheet-name {sheet_name} provided."
                     ) from err
-            elif tabular_file_format.startswith("xls"):
-                input_df = pd.read_excel(
-                    inputfile, engine=excel_engines[tabular_file_format]
-                )
-                logger.info("Parsed %s file %s", tabular_file_format.upper(), inputfile)
             else:
-                input_df = pd.read_csv(
-                    inputfile, skipinitialspace=True, encoding="utf-8"
+                input_df = tabular.read_tabular(
+                    inputfile, tabular_file_format, cache_dir=cache_dir
                 )
-                logger.info("Parsed CSV file %s", inputfile)
+                logger.info("Parsed %s file %s", tabular_file_format.upper(), inputfile)
 
         elif isinstance(inputfile, pd.DataFrame):
             input_df = inputfile
@@ -713,6 +747,71 @@ class PyscalFactory(object):
                 raise IOError("File not found " + str(inputfile))
             raise ValueError("Unsupported argument " + str(inputfile))
         assert isinstance(input_df, pd.DataFrame)
+        return PyscalFactory._validate_relperm_df(input_df, args=args)
+
+    @staticmethod
+    def load_relperm_dfs(
+        inputfile: Union[str, Path],
+        sheet_names: Optional[List[str]] = None,
+        args: Optional[dict] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """Read several sheets from an XLSX or XLS file, opening the file
+        only once.
+
+        Each sheet is validated and processed as in load_relperm_df().
+
+        Args:
+            inputfile: Filename for XLSX or XLS file.
+            sheet_names: Names of sheets to load. All sheets if None.
+            args: Verbose, debug and output arguments from CLI
+                to create logger that splits log messages to stdout and stderr
+            cache_dir: Directory for caching the parsed sheets, see
+                load_relperm_df().
+
+        Returns:
+            Dataframe for each sheet, keyed by sheet name in the requested
+            order, to be handed over to pyscal list factory methods.
+        """
+        logger = getLogger_pyscal(__name__, args)
+        if cache_dir is None:
+            cache_dir = os.environ.get("PYSCAL_CACHE_DIR") or None
+        if not Path(inputfile).is_file():
+            raise IOError("File not found " + str(inputfile))
+        tabular_file_format = infer_tabular_file_format(inputfile)
+        if tabular_file_format not in ["xlsx", "xls"]:
+            raise ValueError(f"Sheets can only be loaded from XLSX/XLS: {inputfile}")
+        if sheet_names is not None:
+            existing = tabular.sheet_names_in(inputfile, tabular_file_format)
+            missing = [name for name in sheet_names if name not in existing]
+            if missing:
+                raise ValueError(f"Non-existing sheet-name {missing[0]} provided.")
+        input_dfs = tabular.read_tabular_sheets(
+            inputfile, tabular_file_format, sheet_names, cache_dir=cache_dir
+        )
+        logger.info(
+            "Parsed %s file %s, sheets %s",
+            tabular_file_format.upper(),
+            inputfile,
+            ", ".join(input_dfs),
+        )
+        relperm_dfs = {}
+        for sheet_name, input_df in input_dfs.items():
+            try:
+                relperm_dfs[sheet_name] = PyscalFactory._validate_relperm_df(
+                    input_df, args=args
+                )
+            except ValueError as err:
+                raise ValueError(f"Error in sheet {sheet_name}: {err}") from err
+        return relperm_dfs
+
+    @staticmethod
+    def _validate_relperm_df(
+        input_df: pd.DataFrame, args: Optional[dict] = None
+    ) -> pd.DataFrame:
+        """Validate and process a dataframe with scal/relperm data,
+        for load_relperm_df()"""
+        logger = getLogger_pyscal(__name__, args)
 
         if input_df.empty:
             logger.error("Relperm input dataframe is empty!")
@@ -803,8 +902,8 @@ class PyscalFactory(object):
             logger.warning("Fast mode is not an option for individual SATNUMs")
             logger.warning("it is implemented as a global option.")
             logger.warning("The fast column in the dataframe will be ignored.")
-            logger.warning("Use fast=True in the function call instead.")
-            logger.warning("Fast mode is only available through the Python API")
+            logger.warning("Use fast=True or validation='none' in the function call")
+            logger.warning("instead, or --validation none on the command line.")
 
         # Check that we are able to make something out of the first row:
         firstrow = input_df.iloc[0, :]
@@ -897,6 +996,7 @@ class PyscalFactory(object):
         h: Optional[float] = None,
         fast: bool = False,
         args: Optional[dict] = None,
+        validation: Optional[str] = None,
     ) -> PyscalList:
         """Requires SATNUM and CASE to be defined in the input data
 
@@ -905,6 +1005,8 @@ class PyscalFactory(object):
                 through load_relperm_df().
             h: Saturation step-value
             fast: If fast-mode should be set for constructed object
+            validation: Validation level for constructed objects, "none",
+                "cheap" or "full". Overrides fast if given.
             args: Verbose, debug and output arguments from CLI
                 to create logger that splits log messages to stdout and stderr
 
@@ -915,6 +1017,7 @@ class PyscalFactory(object):
         assert isinstance(input_df, pd.DataFrame)
 
         scalinput = input_df.set_index(["SATNUM", "CASE"])
+        created: Dict[Hashable, SCALrecommendation] = {}
 
         for satnum in scalinput.index.levels[0].values:
             # load_relperm_df only validates the CASE column for all SATNUMs at
@@ -923,18 +1026,31 @@ class PyscalFactory(object):
                 raise ValueError(f"Too many cases supplied for SATNUM {satnum}")
             if len(scalinput.loc[satnum, :]) < 3:
                 raise ValueError(f"Too few cases supplied for SATNUM {satnum}")
-            try:
-                scal_l.append(
-                    PyscalFactory.create_scal_recommendation(
-                        scalinput.loc[satnum, :].to_dict(orient="index"),
+            caseparams = scalinput.loc[satnum, :].to_dict(orient="index")
+            key = tuple(
+                sorted((case, _parameter_key(caseparams[case])) for case in caseparams)
+            )
+            with stats.satnum_context(satnum):
+                if key in created:
+                    scal = copy.deepcopy(created[key])
+                    for case in ["low", "base", "high"]:
+                        _set_tag(getattr(scal, case), _row_tag(caseparams[case]))
+                    stats.increment("parameter_rows_deduplicated")
+                    scal_l.append(scal)
+                    continue
+                try:
+                    created[key] = PyscalFactory.create_scal_recommendation(
+                        caseparams,
                         h=h,
                         fast=fast,
                         args=args,
+                        validation=validation,
                     )
-                )
-            except ValueError as err:
-                raise ValueError(f"Error for SATNUM {satnum}: {str(err)}") from err
+                    scal_l.append(created[key])
+                except ValueError as err:
+                    raise ValueError(f"Error for SATNUM {satnum}: {str(err)}") from err
 
+        _log_deduplication(len(scal_l), len(created), args)
         return scal_l
 
     @staticmethod
@@ -943,6 +1059,7 @@ class PyscalFactory(object):
         h: Optional[float] = None,
         fast: bool = False,
         args: Optional[dict] = None,
+        validation: Optional[str] = None,
     ):
         """Create WaterOilGas, WaterOil, GasOil or GasWater list
         based on what is available
@@ -952,6 +1069,8 @@ class PyscalFactory(object):
                 through load_relperm_df().
             h: Saturation step-value
             fast: If fast-mode should be set for constructed object
+            validation: Validation level for constructed objects, "none",
+                "cheap" or "full". Overrides fast if given.
             args: Verbose, debug and output arguments from CLI
                 to create logger that splits log messages to stdout and stderr
 
@@ -965,19 +1084,19 @@ class PyscalFactory(object):
 
         if water_oil and gas_oil:
             return PyscalFactory.create_wateroilgas_list(
-                relperm_params_df, h, fast, args=args
+                relperm_params_df, h, fast, args=args, validation=validation
             )
         if water_oil:
             return PyscalFactory.create_wateroil_list(
-                relperm_params_df, h, fast, args=args
+                relperm_params_df, h, fast, args=args, validation=validation
             )
         if gas_oil:
             return PyscalFactory.create_gasoil_list(
-                relperm_params_df, h, fast, args=args
+                relperm_params_df, h, fast, args=args, validation=validation
             )
         if gas_water:
             return PyscalFactory.create_gaswater_list(
-                relperm_params_df, h, fast, args=args
+                relperm_params_df, h, fast, args=args, validation=validation
             )
         raise ValueError("Could not determine two or three phase from parameters")
 
@@ -987,6 +1106,7 @@ class PyscalFactory(object):
         h: Optional[float] = None,
         fast: bool = False,
         args: Optional[dict] = None,
+        validation: Optional[str] = None,
     ) -> PyscalList:
         """Create a PyscalList with WaterOilGas objects from
         a dataframe
@@ -996,6 +1116,8 @@ class PyscalFactory(object):
                 through load_relperm_df().
             h: Saturation step-value
             fast: If fast-mode should be set for constructed object
+            validation: Validation level for constructed objects, "none",
+                "cheap" or "full". Overrides fast if given.
             args: Verbose, debug and output arguments from CLI
                 to create logger that splits log messages to stdout and stderr
 
@@ -1003,17 +1125,28 @@ class PyscalFactory(object):
             PyscalList, consisting of WaterOilGas objects
         """
         wogl = PyscalList(args=args)
+        created: Dict[Hashable, Any] = {}
         for (row_idx, params) in relperm_params_df.sort_values("SATNUM").iterrows():
             if h is not None:
                 params["h"] = h
-            try:
-                wogl.append(
-                    PyscalFactory.create_water_oil_gas(
-                        params.to_dict(), fast=fast, args=args
+            key = _parameter_key(params)
+            with stats.satnum_context(row_idx + 1):
+                if key in created:
+                    wogl.append(_copy_with_tag(created[key], _row_tag(params)))
+                    continue
+                try:
+                    created[key] = PyscalFactory.create_water_oil_gas(
+                        params.to_dict(),
+                        fast=fast,
+                        args=args,
+                        validation=validation,
                     )
-                )
-            except (AssertionError, ValueError, TypeError) as err:
-                raise ValueError(f"Error for SATNUM {row_idx+1}: {str(err)}") from err
+                    wogl.append(created[key])
+                except (AssertionError, ValueError, TypeError) as err:
+                    raise ValueError(
+                        f"Error for SATNUM {row_idx+1}: {str(err)}"
+                    ) from err
+        _log_deduplication(len(wogl), len(created), args)
         return wogl
 
     @staticmethod
@@ -1022,6 +1155,7 @@ class PyscalFactory(object):
         h: Optional[float] = None,
         fast: bool = False,
         args: Optional[dict] = None,
+        validation: Optional[str] = None,
     ) -> PyscalList:
         """Create a PyscalList with WaterOil objects from
         a dataframe
@@ -1031,6 +1165,8 @@ class PyscalFactory(object):
                 WaterOil parameters, processed through load_relperm_df()
             h: Saturation steplength
             fast: If fast-mode should be set for constructed object
+            validation: Validation level for constructed objects, "none",
+                "cheap" or "full". Overrides fast if given.
             args: Verbose, debug and output arguments from CLI
                 to create logger that splits log messages to stdout and stderr
 
@@ -1038,19 +1174,28 @@ class PyscalFactory(object):
             PyscalList, consisting of WaterOil objects
         """
         wol = PyscalList(args=args)
+        created: Dict[Hashable, Any] = {}
         for (_, params) in relperm_params_df.iterrows():
             if h is not None:
                 params["h"] = h
-            try:
-                wol.append(
-                    PyscalFactory.create_water_oil(
-                        params.to_dict(), fast=fast, args=args
+            key = _parameter_key(params)
+            with stats.satnum_context(params["SATNUM"]):
+                if key in created:
+                    wol.append(_copy_with_tag(created[key], _row_tag(params)))
+                    continue
+                try:
+                    created[key] = PyscalFactory.create_water_oil(
+                        params.to_dict(),
+                        fast=fast,
+                        args=args,
+                        validation=validation,
                     )
-                )
-            except (AssertionError, ValueError, TypeError) as err:
-                raise ValueError(
-                    f"Error for SATNUM {params['SATNUM']}: {str(err)}"
-                ) from err
+                    wol.append(created[key])
+                except (AssertionError, ValueError, TypeError) as err:
+                    raise ValueError(
+                        f"Error for SATNUM {params['SATNUM']}: {str(err)}"
+                    ) from err
+        _log_deduplication(len(wol), len(created), args)
         return wol
 
     @staticmethod
@@ -1059,6 +1204,7 @@ class PyscalFactory(object):
         h: Optional[float] = None,
         fast: bool = False,
         args: Optional[dict] = None,
+        validation: Optional[str] = None,
     ) -> PyscalList:
         """Create a PyscalList with GasOil objects from
         a dataframe
@@ -1068,6 +1214,8 @@ class PyscalFactory(object):
                 processed through load_relperm_df()
             h: Saturation steplength
             fast: If fast-mode should be set for constructed object
+            validation: Validation level for constructed objects, "none",
+                "cheap" or "full". Overrides fast if given.
             args: Verbose, debug and output arguments from CLI
                 to create logger that splits log messages to stdout and stderr
 
@@ -1075,17 +1223,28 @@ class PyscalFactory(object):
             PyscalList, consisting of GasOil objects
         """
         gol = PyscalList(args=args)
+        created: Dict[Hashable, Any] = {}
         for (_, params) in relperm_params_df.iterrows():
             if h is not None:
                 params["h"] = h
-            try:
-                gol.append(
-                    PyscalFactory.create_gas_oil(params.to_dict(), fast=fast, args=args)
-                )
-            except (AssertionError, ValueError, TypeError) as err:
-                raise ValueError(
-                    f"Error for SATNUM {params['SATNUM']}: {str(err)}"
-                ) from err
+            key = _parameter_key(params)
+            with stats.satnum_context(params["SATNUM"]):
+                if key in created:
+                    gol.append(_copy_with_tag(created[key], _row_tag(params)))
+                    continue
+                try:
+                    created[key] = PyscalFactory.create_gas_oil(
+                        params.to_dict(),
+                        fast=fast,
+                        args=args,
+                        validation=validation,
+                    )
+                    gol.append(created[key])
+                except (AssertionError, ValueError, TypeError) as err:
+                    raise ValueError(
+                        f"Error for SATNUM {params['SATNUM']}: {str(err)}"
+                    ) from err
+        _log_deduplication(len(gol), len(created), args)
         return gol
 
     @staticmethod
@@ -1094,6 +1253,7 @@ class PyscalFactory(object):
         h: Optional[float] = None,
         fast: bool = False,
         args: Optional[dict] = None,
+        validation: Optional[str] = None,
     ) -> PyscalList:
         """Create a PyscalList with WaterOilGas objects from
         a dataframe, to be used for GasWater
@@ -1103,6 +1263,8 @@ class PyscalFactory(object):
                 parameters, processed through load_relperm_df()
             h: Saturation steplength
             fast: If fast-mode should be set for constructed object
+            validation: Validation level for constructed objects, "none",
+                "cheap" or "full". Overrides fast if given.
             args: Verbose, debug and output arguments from CLI
                 to create logger that splits log messages to stdout and stderr
 
@@ -1110,21 +1272,169 @@ class PyscalFactory(object):
             PyscalList, consisting of GasWater objects
         """
         gwl = PyscalList(args=args)
+        created: Dict[Hashable, Any] = {}
         for (_, params) in relperm_params_df.iterrows():
             if h is not None:
                 params["h"] = h
-            try:
-                gwl.append(
-                    PyscalFactory.create_gas_water(
-                        params.to_dict(), fast=fast, args=args
+            key = _parameter_key(params)
+            with stats.satnum_context(params["SATNUM"]):
+                if key in created:
+                    gwl.append(_copy_with_tag(created[key], _row_tag(params)))
+                    continue
+                try:
+                    created[key] = PyscalFactory.create_gas_water(
+                        params.to_dict(),
+                        fast=fast,
+                        args=args,
+                        validation=validation,
                     )
-                )
-            except (AssertionError, ValueError, TypeError) as err:
-                raise ValueError(
-                    f"Error for SATNUM {params['SATNUM']}: {str(err)}"
-                ) from err
+                    gwl.append(created[key])
+                except (AssertionError, ValueError, TypeError) as err:
+                    raise ValueError(
+                        f"Error for SATNUM {params['SATNUM']}: {str(err)}"
+                    ) from err
+        _log_deduplication(len(gwl), len(created), args)
         return gwl
 
+    @staticmethod
+    def create_fromtable_list(
+        dframe: pd.DataFrame,
+        h: Optional[float] = None,
+        fast: bool = False,
+        args: Optional[dict] = None,
+        validation: Optional[str] = None,
+    ) -> PyscalList:
+        """Create a PyscalList from tabulated relperm data for many SATNUMs
+
+        The data must be in long format with a SATNUM column, as from
+        PyscalList.df() or pyscal.utils.satfunc.df(). Water-oil data
+        must have the column SW and some of KRW, KROW and PCOW, gas-oil
+        data must have the column SG and some of KRG, KROG and PCOG.
+
+        All SATNUMs are checked together, and errors for all SATNUMs
+        are reported at once. Each SATNUM is interpolated as by
+        WaterOil.add_fromtable() or GasOil.add_fromtable(), with swl
+        determined from the saturation data.
+
+        Args:
+            dframe: Tabulated data for all SATNUMs.
+            h: Saturation step-value
+            fast: If fast-mode should be set for constructed object
+            validation: Validation level for constructed objects, "none",
+                "cheap" or "full". Overrides fast if given.
+            args: Verbose, debug and output arguments from CLI
+                to create logger that splits log messages to stdout and stderr
+
+        Returns:
+            PyscalList, consisting of either WaterOil or GasOil objects
+        """
+        if "SATNUM" not in dframe:
+            raise ValueError("SATNUM column is required for tabulated data")
+        if "SW" in dframe and "SG" in dframe:
+            raise ValueError("Both SW and SG in tabulated data, use only one of them")
+        if "SW" in dframe:
+            satcol, relpermcols, pccol = "SW", ["KRW", "KROW"], "PCOW"
+            # Monotonicity direction for each relperm column:
+            signs = {"KRW": 1, "KROW": -1, pccol: -1}
+        elif "SG" in dframe:
+            satcol, relpermcols, pccol = "SG", ["KRG", "KROG"], "PCOG"
+            signs = {"KRG": 1, "KROG": -1, pccol: 1}
+        else:
+            raise ValueError("No SW or SG column in tabulated data")
+
+        # Extract contiguous float arrays once, ordered by SATNUM:
+        order, satnums, groups = fromtable.group_rows(dframe["SATNUM"].to_numpy())
+        arrays = {}
+        for col in [satcol] + relpermcols + [pccol]:
+            if col in dframe:
+                try:
+                    arrays[col] = dframe[col].to_numpy(dtype=float)[order]
+                except (TypeError, ValueError) as err:
+                    raise ValueError(
+                        f"Failed to parse column {col} as numbers"
+                    ) from err
+        sat = arrays[satcol]
+        starts = fromtable.group_starts(groups)
+        rowcount = np.diff(np.append(starts, len(groups)))
+
+        errors: Dict[str, np.ndarray] = {}
+        errors[f"{satcol} data not sorted or missing"] = np.union1d(
+            fromtable.failed_groups(fromtable.grouped_diff(sat, groups) < 0, groups),
+            fromtable.failed_groups(np.isnan(sat), groups),
+        )
+        present: Dict[str, np.ndarray] = {}
+        for col in relpermcols:
+            if col not in arrays:
+                continue
+            values = arrays[col]
+            valid = np.bincount(
+                groups, weights=~np.isnan(values), minlength=len(satnums)
+            )
+            present[col] = valid > 0
+            errors[f"{col} has missing values"] = np.flatnonzero(
+                (valid > 0) & (valid < rowcount)
+            )
+            errors[f"{col} is above 1"] = fromtable.failed_groups(values > 1, groups)
+            errors[f"{col} is below 0"] = fromtable.failed_groups(values < 0, groups)
+            diffs = fromtable.grouped_diff(values, groups) * signs[col]
+            errors[f"{col} not monotone"] = fromtable.failed_groups(
+                diffs <= -epsilon, groups
+            )
+        if pccol in arrays:
+            # Infinite and missing pc values are ignored
+            finite = np.isfinite(arrays[pccol])
+            present[pccol] = (
+                np.bincount(groups, weights=finite, minlength=len(satnums)) > 0
+            )
+            pc_values = arrays[pccol][finite]
+            pc_groups = groups[finite]
+            pc_sum = np.bincount(
+                pc_groups, weights=np.abs(pc_values), minlength=len(satnums)
+            )
+            diffs = fromtable.grouped_diff(pc_values, pc_groups) * signs[pccol]
+            errors[f"{pccol} not strictly monotone"] = fromtable.failed_groups(
+                (diffs <= 0) & (pc_sum[pc_groups] > 0), pc_groups
+            )
+        error_messages = [
+            f"{message} for SATNUM {', '.join(map(str, satnums[failed]))}"
+            for message, failed in errors.items()
+            if len(failed)
+        ]
+        if error_messages:
+            raise ValueError("Errors in tabulated data:\n" + "\n".join(error_messages))
+
+        pyscal_list = PyscalList(args=args)
+        for idx, (satnum, start) in enumerate(zip(satnums, starts)):
+            rows = slice(start, start + rowcount[idx])
+            columns = {
+                col.lower(): arrays[col][rows] for col in present if present[col][idx]
+            }
+            columns["pc"] = columns.pop(pccol.lower(), None)
+            with stats.satnum_context(satnum):
+                try:
+                    if satcol == "SW":
+                        pyscal_obj = WaterOil(
+                            swl=sat[start],
+                            h=h,
+                            fast=fast,
+                            args=args,
+                            validation=validation,
+                        )
+                    else:
+                        pyscal_obj = GasOil(
+                            swl=1 - sat[rows].max(),
+                            h=h,
+                            fast=fast,
+                            args=args,
+                            validation=validation,
+                        )
+                    # pylint: disable=protected-access
+                    pyscal_obj._resample_fromtable(sat[rows], **columns)
+                except (AssertionError, ValueError, TypeError) as err:
+                    raise ValueError(f"Error for SATNUM {satnum}: {str(err)}") from err
+            pyscal_list.append(pyscal_obj)
+        return pyscal_list
+
 
 def sufficient_water_oil_params(params: dict, failhard: bool = False) -> bool:
     """Determine if the supplied parameters are sufficient for
@@ -1232,6 +1542,364 @@ def sufficient_gas_water_params(params: dict, failhard: bool = False) -> bool:
     return water_ok and gas_ok
 
 
+# Curves that are checked for completeness by check_relperm_df(), with
+# the Corey parameter and the alternative sets of LET parameters.
+CURVE_PARAMETERS = {
+    "water": (WO_COREY_WATER[0], [WO_LET_WATER]),
+    "oil (water-oil)": (WO_COREY_OIL[0], [WO_LET_OIL, WO_LET_OIL_ALT]),
+    "gas": (GO_COREY_GAS[0], [GO_LET_GAS]),
+    "oil (gas-oil)": (GO_COREY_OIL[0], [GO_LET_OIL]),
+}
+
+SATURATION_ENDPOINTS = [
+    "swirr",
+    "swl",
+    "swcr",
+    "sorw",
+    "socr",
+    "sgrw",
+    "sgcr",
+    "sorg",
+    "sgro",
+    "sgl",
+]
+
+# Numeric parameters used by the factory. Other columns, f.ex. for
+# bookkeeping, are not checked by check_relperm_df():
+NUMERIC_PARAMETERS = sorted(
+    set(
+        WO_INIT
+        + WO_COREY_WATER
+        + WO_WATER_ENDPOINTS
+        + WO_COREY_OIL
+        + WO_LET_WATER
+        + WO_LET_OIL
+        + WO_LET_OIL_ALT
+        + WO_OIL_ENDPOINTS
+        + WO_SIMPLE_J
+        + WO_SWL_FROM_HEIGHT
+        + WO_SWCR_ADD
+        + WO_NORM_J
+        + WO_SIMPLE_J_PETRO
+        + GO_INIT
+        + GO_COREY_GAS
+        + GO_GAS_ENDPOINTS
+        + GO_COREY_OIL
+        + GO_OIL_ENDPOINTS
+        + GO_LET_GAS
+        + GO_LET_OIL
+        + GW_INIT
+        + GW_WATER_ENDPOINTS
+        + GW_GAS_ENDPOINTS
+        + ["g"]
+    )
+    - {"tag", "krgendanchor"}
+)
+
+
+def check_relperm_df(relperm_df: pd.DataFrame) -> pd.DataFrame:
+    """Check all rows of relperm input data for invalid parameters, before
+    any curves are computed.
+
+    The checks are done column-wise for the whole table, and cover the
+    ranges of saturation and relperm endpoints, bounds for Corey and LET
+    exponents, consistency between swl, swcr, sorw, sgcr and sorg, and
+    that each curve in use has a complete Corey or LET parametrization
+    on every row. Passing these checks does not guarantee that the
+    curves can be made, but covers what most often goes wrong. Only the
+    columns in NUMERIC_PARAMETERS are checked to be numbers, other
+    columns are ignored.
+
+    Args:
+        relperm_df: Input data, typically processed through
+            PyscalFactory.load_relperm_df(). Column names are case
+            insensitive.
+
+    Returns:
+        One row pr. problem, with columns SATNUM, CASE (None if there is no
+        CASE column), PARAMETERS (the parameters involved, with values)
+        and PROBLEM. Empty if no problems are found.
+    """
+    # pylint: disable=too-many-locals
+    params = relperm_df.rename(columns=lambda name: str(name).lower()).reset_index(
+        drop=True
+    )
+    nrows = len(params)
+    problem_rows: List[np.ndarray] = []
+    problem_params: List[List[str]] = []
+    problem_texts: List[str] = []
+
+    numbers: Dict[str, np.ndarray] = {}
+    for name in params.columns:
+        if name in NUMERIC_PARAMETERS:
+            numbers[name] = pd.to_numeric(params[name], errors="coerce").to_numpy(
+                dtype=float
+            )
+
+    def given(name: str) -> np.ndarray:
+        if name not in numbers:
+            return np.zeros(nrows, dtype=bool)
+        return ~np.isnan(numbers[name])
+
+    def value(name: str, default: float = np.nan) -> np.ndarray:
+        if name not in numbers:
+            return np.full(nrows, default)
+        return np.where(np.isnan(numbers[name]), default, numbers[name])
+
+    def report(mask: np.ndarray, names: List[str], problem: str) -> None:
+        if mask.any():
+            problem_rows.append(np.flatnonzero(mask))
+            problem_params.append(names)
+            problem_texts.append(problem)
+
+    for name in numbers:
+        report(params[name].notnull().to_numpy() & ~given(name), [name], "Not a number")
+
+    for name in SATURATION_ENDPOINTS:
+        sat = value(name)
+        report(
+            given(name) & ~((sat > -epsilon) & (sat < 1 + epsilon)),
+            [name],
+            f"{name} must be between 0 and 1",
+        )
+
+    in_use: Dict[str, bool] = {}
+    for curve, (corey, let_sets) in CURVE_PARAMETERS.items():
+        let_complete = np.zeros(nrows, dtype=bool)
+        let_any = np.zeros(nrows, dtype=bool)
+        for let_set in let_sets:
+            let_complete |= np.all([given(name) for name in let_set], axis=0)
+            let_any |= np.any([given(name) for name in let_set], axis=0)
+        in_use[curve] = bool((given(corey) | let_any).any())
+        if in_use[curve]:
+            report(
+                ~given(corey) & ~let_complete,
+                [corey] + let_sets[0],
+                f"Missing {curve} parametrization, "
+                f"needs {corey} or all of {', '.join(let_sets[0])}",
+            )
+        lower = 10 * epsilon if corey == WO_COREY_WATER[0] else epsilon
+        report(
+            given(corey) & ~((value(corey) > lower) & (value(corey) < MAX_EXPONENT)),
+            [corey],
+            f"Corey exponent {corey} must be positive and less than {MAX_EXPONENT}",
+        )
+        for name in sum(let_sets, []):
+            report(
+                given(name) & ~((value(name) > epsilon) & (value(name) < MAX_EXPONENT)),
+                [name],
+                f"LET parameter {name} must be positive and less than {MAX_EXPONENT}",
+            )
+
+    for end, maximum in [("krwend", "krwmax"), ("kroend", ""), ("krgend", "krgmax")]:
+        report(
+            given(end) & ~((value(end) > 0) & (value(end) <= 1)),
+            [end],
+            f"{end} must be larger than 0 and at most 1",
+        )
+        if maximum:
+            report(
+                given(maximum)
+                & ~((value(end, 1) <= value(maximum)) & (value(maximum) <= 1)),
+                [end, maximum],
+                f"{maximum} must be between {end} and 1",
+            )
+    # kromax is ignored when sgro is zero:
+    report(
+        given("kromax")
+        & ~np.isclose(value("sgro", 0), 0)
+        & (value("kroend", 1) > value("kromax")),
+        ["kroend", "kromax", "sgro"],
+        "kromax must be larger than or equal to kroend",
+    )
+
+    # Consistency between saturation endpoints, as in the constructors:
+    swl = np.maximum(value("swl", 0), value("swirr", 0))
+    swcr = np.where(given("swcr_add"), swl + value("swcr_add", 0), value("swcr", 0))
+    # swl from swlheight is not known until curves are computed:
+    swl_known = ~given("swlheight")
+    sorw = np.where(given("sorw"), value("sorw", 0), value("sgrw", 0))
+    if in_use["water"] or in_use["oil (water-oil)"]:
+        report(
+            swl_known & ~(swl < 1 - sorw),
+            ["swl", "sorw", "sgrw"],
+            "swl must be less than 1 - sorw",
+        )
+        report(
+            ~(swcr < 1 - sorw),
+            ["swcr", "swcr_add", "sorw", "sgrw"],
+            "swcr must be less than 1 - sorw",
+        )
+        report(
+            ~(value("swirr", 0) < 1 - sorw),
+            ["swirr", "sorw", "sgrw"],
+            "swirr must be less than 1 - sorw",
+        )
+        report(
+            given("socr") & (value("socr") < sorw - epsilon),
+            ["socr", "sorw"],
+            "socr must be equal to or larger than sorw",
+        )
+    if in_use["gas"] or in_use["oil (gas-oil)"]:
+        sgcr = value("sgcr", 0)
+        sgro = value("sgro", 0)
+        report(
+            ~(np.isclose(sgro, 0) | np.isclose(sgro, sgcr)),
+            ["sgro", "sgcr"],
+            "sgro must be zero or equal to sgcr",
+        )
+        if "krgendanchor" in params:
+            anchor_sorg = (params["krgendanchor"].fillna("sorg") == "sorg").to_numpy()
+        else:
+            anchor_sorg = np.ones(nrows, dtype=bool)
+        # sorg is not used for GasWater:
+        sorg = value("sorg", 0) if in_use["oil (gas-oil)"] else np.zeros(nrows)
+        report(
+            swl_known & ~(1 - swl - sgcr - np.where(anchor_sorg, sorg, 0) > epsilon),
+            ["swl", "sgcr", "sorg"],
+            "swl + sgcr + sorg must be less than 1",
+        )
+
+    satnums = (
+        params["satnum"].to_numpy() if "satnum" in params else np.arange(1, nrows + 1)
+    )
+    cases = params["case"].to_numpy() if "case" in params else np.full(nrows, None)
+    problems = [
+        {
+            "SATNUM": satnums[row],
+            "CASE": cases[row],
+            "PARAMETERS": ", ".join(
+                f"{name}={params[name][row]}"
+                for name in names
+                if name in params and pd.notnull(params[name][row])
+            ),
+            "PROBLEM": text,
+        }
+        for rows, names, text in zip(problem_rows, problem_params, problem_texts)
+        for row in rows
+    ]
+    if "case" in params:
+        ncases = params.groupby("satnum")["case"].count()
+        problems += [
+            {
+                "SATNUM": satnum,
+                "CASE": None,
+                "PARAMETERS": f"CASE={', '.join(params['case'][satnums == satnum])}",
+                "PROBLEM": f"Expected 3 cases for SATNUM, got {count}",
+            }
+            for satnum, count in ncases[ncases != 3].items()
+        ]
+    return (
+        pd.DataFrame(problems, columns=["SATNUM", "CASE", "PARAMETERS", "PROBLEM"])
+        .sort_values("SATNUM", kind="mergesort")
+        .reset_index(drop=True)
+    )
+
+
+def format_problems(problems: pd.DataFrame) -> str:
+    """Format the problems found by check_relperm_df() as a report, with
+    one line pr. problem
+
+    Args:
+        problems: Dataframe returned from check_relperm_df()
+
+    Returns:
+        Multiline string, empty if there are no problems.
+    """
+    if problems.empty:
+        return ""
+    lines = [
+        f"Found {len(problems)} problems in "
+        f"{problems['SATNUM'].nunique()} SATNUMs in the input data:"
+    ]
+    for _, problem in problems.iterrows():
+        location = f"SATNUM {problem['SATNUM']}"
+        if problem["CASE"] is not None and pd.notnull(problem["CASE"]):
+            location += f" ({problem['CASE']})"
+        details = f" ({problem['PARAMETERS']})" if problem["PARAMETERS"] else ""
+        lines.append(f"  {location}: {problem['PROBLEM']}{details}")
+    return "\n".join(lines)
+
+
+def _parameter_key(params: Dict[str, Any]) -> Hashable:
+    """Make a hashable key from the parameters in one row of input data.
+
+    Rows that only differ in SATNUM, TAG or COMMENT give the same key, and
+    thus the same curves. Empty cells (NaN) are regarded as equal.
+
+    Args:
+        params: Parameters for one SATNUM (and CASE), as a dict or a
+            row in a dataframe.
+
+    Returns:
+        Tuple with sorted (parameter, value) pairs.
+    """
+    return tuple(
+        sorted(
+            (
+                str(key).lower(),
+                None if not isinstance(value, str) and pd.isnull(value) else value,
+            )
+            for key, value in params.items()
+            if str(key).upper() not in ["SATNUM", "TAG", "COMMENT"]
+        )
+    )
+
+
+def _row_tag(params: Dict[str, Any]) -> str:
+    """Get the tag from a row of input data, as used by the create_*
+    functions, defaulting to the empty string."""
+    for key, value in params.items():
+        if str(key).lower() == "tag" and isinstance(value, str):
+            return value
+    return ""
+
+
+def _copy_with_tag(
+    pyscal_obj: Union[WaterOil, GasOil, WaterOilGas, GasWater], tag: str
+) -> Union[WaterOil, GasOil, WaterOilGas, GasWater]:
+    """Copy a pyscal object, computed for a parameter set that is repeated
+    in the input data, and give the copy its own tag.
+
+    Args:
+        pyscal_obj: Object to copy
+        tag: Tag for the copy
+
+    Returns:
+        Deep copy of the object.
+    """
+    clone = copy.deepcopy(pyscal_obj)
+    _set_tag(clone, tag)
+    stats.increment("parameter_rows_deduplicated")
+    return clone
+
+
+def _set_tag(
+    pyscal_obj: Union[WaterOil, GasOil, WaterOilGas, GasWater], tag: str
+) -> None:
+    """Set the tag of a pyscal object, for three-phase objects in both of the
+    two-phase objects they consist of."""
+    if isinstance(pyscal_obj, (WaterOil, GasOil)):
+        pyscal_obj.tag = tag
+    else:
+        for twophase in [pyscal_obj.wateroil, pyscal_obj.gasoil]:
+            if twophase is not None:
+                twophase.tag = tag
+
+
+def _log_deduplication(rows: int, distinct: int, args: Optional[dict]) -> None:
+    """Log how many of the parameter rows were computed and how
+    many were copied from identical rows."""
+    logger = getLogger_pyscal(__name__, args)
+    if rows:
+        logger.info(
+            "Computed %d distinct parameter sets for %d SATNUMs, dedupe ratio %.2f",
+            distinct,
+            rows,
+            1 - distinct / rows,
+        )
+
+
 def filter_nan_from_dict(params: dict) -> dict:
     """Clean out keys with NaN values in a dict.
 
@@ -1259,6 +1927,10 @@ def infer_tabular_file_format(
     """Determine the file format of a file containing tabular data,
     distinguishes between csv, xls and xlsx
 
+    Only the first bytes of the file are read, see
+    :func:`pyscal.utils.tabular.sniff_file_format`. The file is parsed
+    later, or loaded from the cache, by the tabular readers.
+
     Args:
         filename: Path to file
         args: Verbose, debug and output arguments from CLI
@@ -1267,42 +1939,11 @@ def infer_tabular_file_format(
     Returns:
         One of "csv", "xlsx" or "xls". Empty string if nothing found out.
     """
-    logger = getLogger_pyscal(__name__, args)
-    try:
-        pd.read_excel(filename, engine="openpyxl")
-        return "xlsx"
-    except (
-        ValueError,
-        OSError,
-        openpyxl.utils.exceptions.InvalidFileException,
-        zipfile.BadZipFile,
-    ):
-        # < Pandas 1.2, we get InvalidFileException from openpyxl
-        # Pandas 1.2.0 - 1.2.1: CSV gives ValueError,
-        #                       XLS gives OSError
-        # >= Pandas 1.2.2:      CSV gives zipfile.BadZipFile,
-        #                       XLS gives OSError
-        pass
-    try:
-        pd.read_excel(filename, engine="xlrd")
-        return "xls"
-    except (ValueError, TypeError, xlrd.biffh.XLRDError):
-        # We get here for both CSV and XLSX files.
-        pass
-    try:
-        dframe = pd.read_csv(filename, encoding="utf-8")
-        # >= 1.2.1: Pandas: Bugfix makes read_csv() more encoding fault
-        #                   tolerant which this code opts out from.
-        if not dframe.empty:
-            return "csv"
-    except UnicodeDecodeError:
-        # (xls and xlsx files)
-        pass
-    except (pd.errors.ParserError, pd.errors.EmptyDataError) as csverror:
-        logger.error("Message from CSV parser: %s", str(csverror))
-        # (Some text file that is not CSV)
-
-    return ""
+    file_format = tabular.sniff_file_format(filename)
+    if not file_format:
+        logger = getLogger_pyscal(__name__, args)
+        logger.error("%s is not a CSV, XLS or XLSX file", str(filename))
+    return file_format
 
 
 def check_deprecated(params: Dict[str, Any]) -> None:
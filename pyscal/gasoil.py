@@ -1,6 +1,6 @@
 """Representing a GasOil object"""
 
-from typing import Optional
+from typing import Any, Dict, Hashable, List, Optional
 
 import numpy as np
 import pandas as pd
@@ -9,12 +9,14 @@ from scipy.interpolate import PchipInterpolator
 import pyscal
 from pyscal.constants import EPSILON as epsilon
 from pyscal.constants import MAX_EXPONENT, SWINTEGERS
+from pyscal.utils import decimation, fromtable, kernels, stats
+from pyscal.utils.pickling import PicklableLogger
 from pyscal.utils.relperm import crosspoint, estimate_diffjumppoint, truncate_zeroness
 from pyscal.utils.string import comment_formatter, df2str
-from pyscal import getLogger_pyscal
+from pyscal.utils.validation import FastFlag, checked, validation_level
 
 
-class GasOil(object):
+class GasOil(FastFlag, PicklableLogger):
     """Object to represent two-phase properties for gas and oil.
 
     Parametrizations available for relative permeability:
@@ -53,7 +55,11 @@ class GasOil(object):
         tag: Optional string identifier, only used in comments.
         fast: Set to True if in order to skip some integrity checks
             and nice-to-have features. Not needed to set for normal pyscal
-            runs, as speed is seldom crucial. Default False
+            runs, as speed is seldom crucial. Default False. Equivalent
+            to validation="none".
+        validation: Level of validation when making output, "none",
+            "cheap" or "full", see pyscal.utils.validation. Overrides
+            fast if given. Default "full".
         args: Verbose, debug and output arguments from CLI
             to create logger that splits log messages to stdout and stderr
     """
@@ -69,6 +75,7 @@ class GasOil(object):
         tag: str = "",
         krgendanchor: str = "sorg",
         fast: bool = False,
+        validation: Optional[str] = None,
         _sgl: float = None,  # Only to be used by GasWater.
         args: Optional[dict] = None,
     ) -> None:
@@ -84,7 +91,7 @@ class GasOil(object):
             krgendanchor = ""
         assert isinstance(krgendanchor, str), "krgendanchor must be a string"
 
-        self.logger: Optional[object] = getLogger_pyscal(__name__, args)
+        self._set_logger(args)
 
         h_min = 1.0 / float(SWINTEGERS)
         if h < h_min:
@@ -126,7 +133,7 @@ class GasOil(object):
             self.logger.warning("Unknown krgendanchor %s, ignored", str(krgendanchor))
             self.krgendanchor = ""
 
-        self.fast = fast
+        self.validation: str = validation_level(validation, fast)
 
         if np.isclose(self.sorg, 0.0) and self.krgendanchor == "sorg":
             self.krgendanchor = ""  # This is critical to avoid bugs due to numerics.
@@ -158,7 +165,9 @@ class GasOil(object):
         self.table["sgint"] = list(
             map(int, list(map(round, self.table["SG"] * SWINTEGERS)))
         )
+        rows_before_dedupe = len(self.table)
         self.table.drop_duplicates("sgint", inplace=True)
+        stats.increment("grid_points_dropped", rows_before_dedupe - len(self.table))
 
         # Now sg=1-sorg-swl might be accidentally dropped, so make sure we
         # have it by replacing the closest value by 1 - sorg exactly
@@ -180,28 +189,52 @@ class GasOil(object):
         self.table = self.table[["SG"]]
         self.table["SL"] = 1 - self.table["SG"]
         if krgendanchor == "sorg":
-            # Normalized sg (sgn) is 0 at sgcr, and 1 at 1-swl-sorg
             assert 1 - swl - sgcr - sorg > epsilon
-            self.table["SGN"] = (self.table["SG"] - self.sgcr) / (
-                1 - self.swl - self.sgcr - self.sorg
-            )
         else:
             assert 1 - swl - sgcr > epsilon
-            self.table["SGN"] = (self.table["SG"] - self.sgcr) / (
-                1 - self.swl - self.sgcr
-            )
 
-        # Normalized oil saturation should be 0 at sg=1-swl-sorg, and 1 at sg=sgro
-        self.table["SON"] = (self.table["SL"] - self.sorg - self.swl) / (
-            1 - self.sorg - self.swl - self.sgro
-        )
         self.update_sgcomment_and_sorg()
         self.krgcomment = ""
         self.krogcomment = ""
         self.pccomment = ""
 
+        # Formatted columns for reuse between keywords, see
+        # pyscal.utils.string.format_column():
+        self._formatcache: Dict[Hashable, List[str]] = {}
+
+        # Normalized curves for reuse in interpolation, see
+        # pyscal.utils.interpolation.normalize_nonlinpart_wo/go():
+        self._curvecache: Dict[Hashable, Any] = {}
+
+        stats.increment("tables_initialized")
+        stats.increment("table_rows", len(self.table))
         self.logger.debug(
-            "Initialized GasOil with %s saturation points", str(len(self.table))
+            "Initialized GasOil with %s saturation points", len(self.table)
+        )
+
+    @property
+    def sgn(self) -> pd.Series:
+        """Gas saturation normalized for krg.
+
+        Normalized sg (sgn) is 0 at sgcr, and 1 at 1-swl-sorg, or at
+        1 - swl if krgendanchor is not sorg. Computed on demand from the
+        SG column and the current endpoints.
+        """
+        if self.krgendanchor == "sorg":
+            return (self.table["SG"] - self.sgcr) / (
+                1 - self.swl - self.sgcr - self.sorg
+            )
+        return (self.table["SG"] - self.sgcr) / (1 - self.swl - self.sgcr)
+
+    @property
+    def son(self) -> pd.Series:
+        """Oil saturation normalized for krog.
+
+        Normalized oil saturation is 0 at sg=1-swl-sorg, and 1 at sg=sgro.
+        Computed on demand from the SL column and the current endpoints.
+        """
+        return (self.table["SL"] - self.sorg - self.swl) / (
+            1 - self.sorg - self.swl - self.sgro
         )
 
     def update_sgcomment_and_sorg(self):
@@ -240,6 +273,9 @@ class GasOil(object):
 
         Calling function is responsible for checking if any data was
         actually added to the table.
+
+        Eclipse and Nexus include files can be converted to dataframes
+        with pyscal.utils.satfunc.df(), or with the python package ecl2df.
         """
         # Avoid having to deal with multi-indices:
         if len(dframe.index.names) > 1:
@@ -253,23 +289,69 @@ class GasOil(object):
                 f"{sgcolname} not found in dataframe, can't read table data"
             )
 
-        for col in [sgcolname, krgcolname, krogcolname, pccolname]:
-            # Typecheck/convert all numerical columns:
-            if col in dframe and not pd.api.types.is_numeric_dtype(dframe[col]):
-                # Try to convert to numeric type
-                try:
-                    dframe[col] = dframe[col].astype(float)
-                    self.logger.info(
-                        "Converted column %s to numbers for fromtable()", col
-                    )
-                except (TypeError, ValueError) as err:
-                    raise ValueError(
-                        f"Failed to parse column {col} as numbers for add_fromtable()"
-                    ) from err
-
-        if dframe[sgcolname].min() > 0.0:
+        # Extract contiguous float arrays once, the incoming dataframe
+        # is never modified:
+        sg = fromtable.float_column(dframe, sgcolname)
+        krg = (
+            fromtable.float_column(dframe, krgcolname) if krgcolname in dframe else None
+        )
+        krog = (
+            fromtable.float_column(dframe, krogcolname)
+            if krogcolname in dframe
+            else None
+        )
+        pc = fromtable.float_column(dframe, pccolname) if pccolname in dframe else None
+
+        if krg is not None:
+            if (np.diff(krg) <= -epsilon).any():
+                raise ValueError("Incoming krg not increasing")
+            if np.nanmax(krg) > 1.0:
+                raise ValueError("krg is above 1 in incoming table")
+            if np.nanmin(krg) < 0.0:
+                raise ValueError("krg is below 0 in incoming table")
+        if krog is not None:
+            if (np.diff(krog) >= epsilon).any():
+                raise ValueError("Incoming krog not decreasing")
+            if np.nanmax(krog) > 1.0:
+                raise ValueError("krog is above 1 in incoming table")
+            if np.nanmin(krog) < 0.0:
+                raise ValueError("krog is below 0 in incoming table")
+        if pc is not None:
+            # If nonzero, then it must be increasing:
+            finite_pc = pc[np.isfinite(pc)]
+            if np.abs(finite_pc).sum() > 0 and (np.diff(finite_pc) <= 0.0).any():
+                raise ValueError("Incoming pc not increasing")
+
+        self._resample_fromtable(
+            sg,
+            krg=krg,
+            krog=krog,
+            pc=pc,
+            krgcomment=krgcomment,
+            krogcomment=krogcomment,
+            pccomment=pccomment,
+        )
+
+    def _resample_fromtable(
+        self,
+        sg: np.ndarray,
+        krg: Optional[np.ndarray] = None,
+        krog: Optional[np.ndarray] = None,
+        pc: Optional[np.ndarray] = None,
+        krgcomment: str = "",
+        krogcomment: str = "",
+        pccomment: str = "",
+    ) -> None:
+        """Interpolate tabular data onto the saturation table
+
+        Equivalent to add_fromtable(), for float arrays where bounds and
+        monotonicity are already checked. krg and krog are interpolated
+        together. The incoming arrays are not modified.
+        """
+        sggrid = self.table["SG"].to_numpy()
+        if sg.min() > 0.0:
             raise ValueError("sg must start at zero")
-        swlfrominput = 1 - dframe[sgcolname].max()
+        swlfrominput = 1 - sg.max()
         if abs(swlfrominput - self.swl) > epsilon:
             self.logger.warning(
                 "swl=%f and 1-max(sg)=%f from incoming table do not seem compatible",
@@ -277,49 +359,30 @@ class GasOil(object):
                 swlfrominput,
             )
             self.logger.warning("         Do not trust the result near the endpoint.")
-
         if 0 < swlfrominput - self.swl < epsilon:
-            # Perturb max sg in incoming dataframe when we are this close,
-            # or we will get into floating trouble when interpolating.
-            dframe.loc[dframe[sgcolname].idxmax(), sgcolname] += swlfrominput - self.swl
-
-        if krgcolname in dframe:
-            if not (dframe[krgcolname].diff().dropna() > -epsilon).all():
-                raise ValueError("Incoming krg not increasing")
-            if dframe[krgcolname].max() > 1.0:
-                raise ValueError("krg is above 1 in incoming table")
-            if dframe[krgcolname].min() < 0.0:
-                raise ValueError("krg is below 0 in incoming table")
-            pchip = PchipInterpolator(
-                dframe[sgcolname].astype(float), dframe[krgcolname].astype(float)
+            # Perturb max sg when we are this close, or we will get into
+            # floating trouble when interpolating.
+            sg = sg.copy()
+            sg[np.argmax(sg)] += swlfrominput - self.swl
+
+        relperm = {"KRG": krg, "KROG": krog}
+        relperm = {col: values for col, values in relperm.items() if values is not None}
+        if relperm:
+            # Do not extrapolate this data, but fill with the end values:
+            resampled = PchipInterpolator(sg, np.column_stack(list(relperm.values())))(
+                sggrid, extrapolate=False
             )
-            # Do not extrapolate this data. We will bfill and ffill afterwards
-            self.table["KRG"] = pchip(self.table["SG"], extrapolate=False)
-            self.table["KRG"].fillna(method="ffill", inplace=True)
-            self.table["KRG"].fillna(method="bfill", inplace=True)
-            self.table["KRG"].clip(lower=0.0, upper=1.0, inplace=True)
+            fromtable.fill_ends(resampled)
+            np.clip(resampled, 0.0, 1.0, out=resampled)
+            relperm = dict(zip(relperm, resampled.T))
+        if "KRG" in relperm:
+            self.table["KRG"] = relperm["KRG"]
             self.krgcomment = "-- krg from tabular input" + krgcomment + "\n"
             self.sgcr = self.estimate_sgcr()
-        if krogcolname in dframe:
-            if not (dframe[krogcolname].diff().dropna() < epsilon).all():
-                raise ValueError("Incoming krog not decreasing")
-            if dframe[krogcolname].max() > 1.0:
-                raise ValueError("krog is above 1 in incoming table")
-            if dframe[krogcolname].min() < 0.0:
-                raise ValueError("krog is below 0 in incoming table")
-            pchip = PchipInterpolator(
-                dframe[sgcolname].astype(float), dframe[krogcolname].astype(float)
-            )
-            self.table["KROG"] = pchip(self.table["SG"], extrapolate=False)
-            self.table["KROG"].fillna(method="ffill", inplace=True)
-            self.table["KROG"].fillna(method="bfill", inplace=True)
-            self.table["KROG"].clip(lower=0.0, upper=1.0, inplace=True)
+        if "KROG" in relperm:
+            self.table["KROG"] = relperm["KROG"]
             self.krogcomment = "-- krog from tabular input" + krogcomment + "\n"
             self.sorg = self.estimate_sorg()
-
-            # For tabulated relperm data, correct knowlegde of sgro
-            # is not important to pyscal (it is relevant when add_corey_gas()
-            # etc is called). It is estimated here just for convenience.
             sgro_estimate = self.estimate_sgro()
             if not (
                 np.isclose(sgro_estimate, 0.0) or np.isclose(sgro_estimate, self.sgcr)
@@ -333,32 +396,24 @@ class GasOil(object):
                 self.sgro = 0.0
             else:
                 self.sgro = sgro_estimate
-        if pccolname in dframe:
-            # Incoming dataframe must cover the range:
-            if dframe[sgcolname].max() < self.table["SG"].max():
+
+        if pc is not None:
+            if sg.max() < sggrid.max():
                 raise ValueError(
                     f"Too large swl for pcog interpolation, "
-                    f"max incoming sg is {dframe[sgcolname].max()} "
-                    f"and existing max(SG) is {self.table['SG'].max()}"
+                    f"max incoming sg is {sg.max()} "
+                    f"and existing max(SG) is {sggrid.max()}"
                 )
-            if np.isinf(dframe[pccolname]).any():
+            if np.isinf(pc).any():
                 self.logger.warning(
-                    (
-                        "Infinity pc values detected. Will be dropped, "
-                        "risk of extrapolation"
-                    )
+                    "Infinity pc values detected. Will be dropped, "
+                    "risk of extrapolation"
                 )
-            dframe = dframe.replace([np.inf, -np.inf], np.nan)
-            dframe.dropna(subset=[pccolname], how="all", inplace=True)
-            # If nonzero, then it must be increasing:
-            if dframe[pccolname].abs().sum() > 0:
-                if not (dframe[pccolname].diff().dropna() > 0.0).all():
-                    raise ValueError("Incoming pc not increasing")
-            pchip = PchipInterpolator(
-                dframe[sgcolname].astype(float), dframe[pccolname].astype(float)
+            finite = np.isfinite(pc)
+            self.table["PC"] = PchipInterpolator(sg[finite], pc[finite])(
+                sggrid, extrapolate=False
             )
-            self.table["PC"] = pchip(self.table["SG"], extrapolate=False)
-            if np.isnan(self.table["PC"]).any() or np.isinf(self.table["PC"]).any():
+            if not np.isfinite(self.table["PC"]).all():
                 raise ValueError("inf/nan in interpolated data, check input")
             self.pccomment = "-- pc from tabular input" + pccomment + "\n"
 
@@ -451,9 +506,8 @@ class GasOil(object):
         # Linear part [0, sgro] for gas-condensate:
         sgroindex = (self.table["SG"] - (self.sgro)).abs().sort_values().index[0]
         if sgroindex > 1:
-            self.table.loc[1 : sgroindex - 1, "KROG"] = np.nan
-            self.table["KROG"] = (
-                self.table.set_index("SG")["KROG"].interpolate(method="index").values
+            self.table["KROG"] = kernels.get("linear_section")(
+                self.table["SG"].values, self.table["KROG"].values, 0, sgroindex
             )
 
     def add_corey_gas(
@@ -474,7 +528,7 @@ class GasOil(object):
         assert 0 < krgend <= 1.0
         if krgmax is not None:
             assert 0 < krgend <= krgmax <= 1.0
-        self.table["KRG"] = krgend * self.table["SGN"] ** ng
+        self.table["KRG"] = kernels.get("corey")(self.sgn.values, ng, krgend)
 
         self.set_endpoints_linearpart_krg(krgend, krgmax)
 
@@ -506,7 +560,7 @@ class GasOil(object):
         assert epsilon < nog < MAX_EXPONENT
         assert 0 < kroend <= 1.0
 
-        self.table["KROG"] = kroend * self.table["SON"] ** nog
+        self.table["KROG"] = kernels.get("corey")(self.son.values, nog, kroend)
 
         self.set_endpoints_linearpart_krog(kroend, kromax)
 
@@ -552,13 +606,10 @@ class GasOil(object):
         else:
             assert 0 < krgend <= 1.0
 
-        self.table["KRG"] = (
-            krgend
-            * self.table["SGN"] ** l
-            / ((self.table["SGN"] ** l) + e * (1 - self.table["SGN"]) ** t)
-        )
+        sgn = self.sgn
+        self.table["KRG"] = kernels.get("let")(sgn.values, l, e, t, krgend)
         # This equation is undefined for t a float and sgn=1, set explicitly:
-        self.table.loc[np.isclose(self.table["SGN"], 1.0), "KRG"] = krgend
+        self.table.loc[np.isclose(sgn, 1.0), "KRG"] = krgend
 
         self.set_endpoints_linearpart_krg(krgend, krgmax)
 
@@ -597,13 +648,10 @@ class GasOil(object):
         assert epsilon < t < MAX_EXPONENT
         assert 0 < kroend <= 1.0
 
-        self.table["KROG"] = (
-            kroend
-            * self.table["SON"] ** l
-            / ((self.table["SON"] ** l) + e * (1 - self.table["SON"]) ** t)
-        )
+        son = self.son
+        self.table["KROG"] = kernels.get("let")(son.values, l, e, t, kroend)
         # This equation is undefined for t a float and son=1, set explicitly:
-        self.table.loc[np.isclose(self.table["SON"], 1.0), "KROG"] = kroend
+        self.table.loc[np.isclose(son, 1.0), "KROG"] = kroend
 
         self.set_endpoints_linearpart_krog(kroend, kromax)
 
@@ -673,6 +721,12 @@ class GasOil(object):
         """
         return self.table[self.table["KRG"] < 10 * epsilon]["SG"].max()
 
+    def _default_pc(self) -> None:
+        """Add zero capillary pressure if there is none, before output"""
+        if "PC" not in self.table.columns:
+            self.table["PC"] = 0.0
+            self.pccomment = "-- Zero capillary pressure\n"
+
     def crosspoint(self) -> float:
         """Locate and return the saturation point where krg = krog
 
@@ -700,6 +754,7 @@ class GasOil(object):
         Args:
             mode: If mode is "SGFN", krog is not required.
         """
+        stats.increment("selfcheck_calls")
         error = False
         if "KRG" not in self.table:
             self.logger.error("KRG data missing")
@@ -768,13 +823,11 @@ class GasOil(object):
             dataincommentrow: Whether metadata should be printed,
                 defaults to True.
         """
-        if not self.fast and not self.selfcheck():
+        if self.validation != "none" and not checked(self, "selfcheck"):
             # selfcheck() will log error/warning messages
             return ""
         string = ""
-        if "PC" not in self.table:
-            self.table["PC"] = 0.0
-            self.pccomment = "-- Zero capillary pressure\n"
+        self._default_pc()
         if header:
             string += "SGOF\n"
         string += comment_formatter(self.tag)
@@ -783,8 +836,8 @@ class GasOil(object):
             string += self.sgcomment
             string += self.krgcomment
             string += self.krogcomment
-            if not self.fast:
-                string += f"-- krg = krog @ sg={self.crosspoint():1.5f}\n"
+            if self.validation == "full":
+                string += f"-- krg = krog @ sg={checked(self, 'crosspoint'):1.5f}\n"
             string += self.pccomment
         width = 10
         string += (
@@ -802,8 +855,9 @@ class GasOil(object):
                 "KRG": {"sign": 1, "lower": 0, "upper": 1},
                 "PC": {"sign": 1, "allowzero": True},
             }
-            if not self.fast
+            if self.validation == "full"
             else None,
+            cache=self._formatcache,
         )
         string += "/\n"
         return string
@@ -848,13 +902,11 @@ class GasOil(object):
             dataincommentrow: boolean for wheter metadata should be printed,
                 defaults to True.
         """
-        if not self.selfcheck():
+        if self.validation != "none" and not checked(self, "selfcheck"):
             # Selfcheck will issue error messages.
             return ""
         string = ""
-        if "PC" not in self.table:
-            self.table["PC"] = 0.0
-            self.pccomment = "-- Zero capillary pressure\n"
+        self._default_pc()
         if header:
             string += "SLGOF\n"
         string += comment_formatter(self.tag)
@@ -863,7 +915,8 @@ class GasOil(object):
             string += self.sgcomment
             string += self.krgcomment
             string += self.krogcomment
-            string += f"-- krg = krog @ sg={self.crosspoint():1.5f}\n"
+            if self.validation == "full":
+                string += f"-- krg = krog @ sg={checked(self, 'crosspoint'):1.5f}\n"
             string += self.pccomment
         width = 10
         string += (
@@ -881,8 +934,9 @@ class GasOil(object):
                 "KRG": {"sign": -1, "lower": 0, "upper": 1},
                 "PC": {"sign": -1, "allowzero": True},
             }
-            if not self.fast
+            if self.validation == "full"
             else None,
+            cache=self._formatcache,
         )
         string += "/\n"
         return string
@@ -917,13 +971,11 @@ class GasOil(object):
                 string, overrides what this object can provide. Used by GasWater.
                 If None, it will be computed, use empty string to avoid.
         """
-        if not self.selfcheck(mode="SGFN"):
+        if self.validation != "none" and not checked(self, "selfcheck", "SGFN"):
             # Selfcheck will issue error messages.
             return ""
         string = ""
-        if "PC" not in self.table.columns:
-            self.table["PC"] = 0.0
-            self.pccomment = "-- Zero capillary pressure\n"
+        self._default_pc()
         if header:
             string += "SGFN\n"
         string += comment_formatter(self.tag)
@@ -935,8 +987,8 @@ class GasOil(object):
                 string += self.sgcomment
             string += self.krgcomment
             if crosspointcomment is None:
-                if "KROG" in self.table.columns:
-                    string += f"-- krg = krog @ sg={self.crosspoint():1.5f}\n"
+                if "KROG" in self.table.columns and self.validation == "full":
+                    string += f"-- krg = krog @ sg={checked(self, 'crosspoint'):1.5f}\n"
             else:
                 string += crosspointcomment
             string += self.pccomment
@@ -954,8 +1006,9 @@ class GasOil(object):
                 "KRG": {"sign": 1, "lower": 0, "upper": 1},
                 "PC": {"sign": 1, "allowzero": True},
             }
-            if not self.fast
+            if self.validation == "full"
             else None,
+            cache=self._formatcache,
         )
         string += "/\n"
         return string
@@ -978,10 +1031,11 @@ class GasOil(object):
             dataincommentrow: boolean for wheter metadata should be printed,
                 defaults to True.
         """
+        if self.validation != "none" and not checked(self, "selfcheck"):
+            # selfcheck() will log error/warning messages
+            return ""
         string = ""
-        if "PC" not in self.table.columns:
-            self.table["PC"] = 0.0
-            self.pccomment = "-- Zero capillary pressure\n"
+        self._default_pc()
         if header:
             string += "GOTABLE\n"
             string += "SG KRG KROG PC\n"
@@ -990,7 +1044,8 @@ class GasOil(object):
             string += self.sgcomment.replace("--", "!")
             string += self.krgcomment.replace("--", "!")
             string += self.krogcomment.replace("--", "!")
-            string += f"! krg = krog @ sw={self.crosspoint():1.5f}\n"
+            if self.validation == "full":
+                string += f"! krg = krog @ sw={checked(self, 'crosspoint'):1.5f}\n"
             string += self.pccomment.replace("--", "!")
         width = 10
         string += (
@@ -1008,8 +1063,9 @@ class GasOil(object):
                 "KRG": {"sign": 1, "lower": 0, "upper": 1},
                 "PC": {"sign": 1, "allowzero": True},
             }
-            if self.fast
+            if self.validation == "full"
             else None,
+            cache=self._formatcache,
         )
         return string
 
@@ -1023,12 +1079,17 @@ class GasOil(object):
         marker: Optional[str] = None,
         label: Optional[str] = None,
         logyscale: bool = False,
+        decimate: bool = False,
     ):
         """Plot krg and krog
 
         If mpl_ax is not None, it will be used as a
         matplotlib axis to plot on, if None, a fresh plot
         will be made.
+
+        If decimate is True, the curves are drawn through a subset of the
+        table rows, enough for the resolution of the axis, see
+        pyscal.utils.decimation. The table is not modified.
         """
         # pylint: disable=import-outside-toplevel
         # Lazy import of matplotlib for speed reasons
@@ -1043,7 +1104,12 @@ class GasOil(object):
         if logyscale:
             useax.set_yscale("log")
             useax.set_ylim([1e-8, 1])
-        self.table.plot(
+        table = self.table
+        if decimate:
+            table = decimation.decimate_table(
+                table, "SG", ["KRG", "KROG"], decimation.axis_pixels(useax)
+            )
+        table.plot(
             ax=useax,
             x="SG",
             y="KRG",
@@ -1055,7 +1121,7 @@ class GasOil(object):
             linestyle=linestyle,
             marker=marker,
         )
-        self.table.plot(
+        table.plot(
             ax=useax,
             x="SG",
             y="KROG",
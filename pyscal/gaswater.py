@@ -5,8 +5,10 @@ from typing import Optional
 
 import pandas as pd
 
+from pyscal.utils import decimation
+from pyscal.utils.pickling import PicklableLogger
 from pyscal.utils.relperm import crosspoint
-from pyscal import getLogger_pyscal
+from pyscal.utils.validation import FastFlag, checked, validation_level
 
 from .gasoil import GasOil
 from .wateroil import WaterOil
@@ -22,7 +24,7 @@ def is_documented_by(original):
     return wrapper
 
 
-class GasWater(object):
+class GasWater(FastFlag, PicklableLogger):
     """A representation of two-phase properties for gas-water
 
     Internally, this class handles gas-water by using one WaterOil
@@ -38,7 +40,11 @@ class GasWater(object):
         h: Saturation intervals in generated tables.
         tag: Optional text that will be included as comments.
         fast: Set to True if you prefer speed over robustness. Not recommended,
-            pyscal will not guarantee valid output in this mode.
+            pyscal will not guarantee valid output in this mode. Equivalent
+            to validation="none".
+        validation: Level of validation when making output, "none",
+            "cheap" or "full", see pyscal.utils.validation. Overrides
+            fast if given. Default "full".
         args: Verbose, debug and output arguments from CLI
             to create logger that splits log messages to stdout and stderr
     """
@@ -54,14 +60,15 @@ class GasWater(object):
         h: Optional[float] = None,
         tag: str = "",
         fast: bool = False,
+        validation: Optional[str] = None,
         args: Optional[dict] = None,
     ) -> None:
         """Sets up the saturation range for a GasWater object,
         by initializing one WaterOil and one GasOil object, with
         endpoints set to fit with the GasWater proxy object."""
-        self.fast: bool = fast
+        self.validation: str = validation_level(validation, fast)
 
-        self.logger: Optional[object] = getLogger_pyscal(__name__, args)
+        self._set_logger(args)
 
         if h is None:
             h = 0.01
@@ -73,7 +80,7 @@ class GasWater(object):
             sorw=sgrw,
             h=h,
             tag=tag,
-            fast=fast,
+            validation=self.validation,
             _sgcr=sgcr,
             _sgl=sgl,
             args=args,
@@ -91,7 +98,7 @@ class GasWater(object):
             swl=swl,
             h=h,
             tag=tag,
-            fast=fast,
+            validation=self.validation,
             _sgl=sgl,
             args=args,
         )
@@ -228,10 +235,10 @@ class GasWater(object):
             dataincommentrow: boolean for wheter metadata should be printed,
                 defaults to True.
         """
-        if self.fast:
+        if self.validation != "full":
             crosspointcomment = ""
         else:
-            crosspoint_value = self.crosspoint()
+            crosspoint_value = checked(self, "crosspoint")
             if crosspoint_value is not None:
                 crosspointcomment = f"-- krw = krg @ sw={crosspoint_value:1.5f}\n"
             else:
@@ -258,10 +265,10 @@ class GasWater(object):
             dataincommentrow: boolean for wheter metadata should be printed,
                 defaults to True.
         """
-        if self.fast:
+        if self.validation != "full":
             crosspointcomment = ""
         else:
-            crosspoint_value = self.crosspoint()
+            crosspoint_value = checked(self, "crosspoint")
             if crosspoint_value is not None:
                 crosspointcomment = f"-- krw = krg @ sw={crosspoint_value:1.5f}\n"
             else:
@@ -319,12 +326,18 @@ class GasWater(object):
         marker: Optional[str] = None,
         label: str = "",
         logyscale: bool = False,
+        decimate: bool = False,
     ):
         """Plot krw and krg
 
         If the argument 'mpl_ax' is not supplied, a new plot
         window will be made. If supplied, it will draw on
-        the specified axis."""
+        the specified axis.
+
+        If decimate is True, the curves are drawn through a subset of the
+        table rows, enough for the resolution of the axis, see
+        pyscal.utils.decimation. The table is not modified.
+        """
 
         # pylint: disable=import-outside-toplevel
         # Lazy import of matplotlib for speed reasons.
@@ -339,7 +352,13 @@ class GasWater(object):
         if logyscale:
             useax.set_yscale("log")
             useax.set_ylim([1e-8, 1])
-        self.wateroil.table.plot(
+        watertable = self.wateroil.table
+        gastable = self.gasoil.table
+        if decimate:
+            pixels = decimation.axis_pixels(useax)
+            watertable = decimation.decimate_table(watertable, "SW", ["KRW"], pixels)
+            gastable = decimation.decimate_table(gastable, "SL", ["KRG"], pixels)
+        watertable.plot(
             ax=useax,
             x="SW",
             y="KRW",
@@ -351,7 +370,7 @@ class GasWater(object):
             linestyle=linestyle,
             marker=marker,
         )
-        self.gasoil.table.plot(
+        gastable.plot(
             ax=useax,
             x="SL",
             y="KRG",
@@ -363,7 +382,7 @@ class GasWater(object):
             linestyle=linestyle,
             marker=marker,
         )
-        plt.xlabel("SW")
+        useax.set_xlabel("SW")
         if mpl_ax is None:
             plt.show()
 
@@ -1,11 +1,14 @@
 """Command line tool for pyscal"""
 
 import argparse
+import contextlib
 import sys
 import traceback
 import warnings
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Union
+
+import pandas as pd
 
 from pyscal import (
     GasWater,
@@ -15,7 +18,10 @@ from pyscal import (
     getLogger_pyscal,
 )
 
-from .factory import PyscalFactory
+from .factory import PyscalFactory, check_relperm_df, format_problems
+from .utils import stats
+from .utils.logsummary import aggregated_logging
+from .utils.validation import VALIDATION_LEVELS
 
 
 EPILOG = """
@@ -119,8 +125,29 @@ def get_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--sheet_name",
         type=str,
+        action="append",
         default=None,
-        help="Sheet name if reading XLSX file. Defaults to first sheet",
+        help=(
+            "Sheet name if reading XLSX file. Defaults to first sheet. "
+            "Repeat the option to process several sheets in one run, the "
+            "sheet names are then appended to the output filename"
+        ),
+    )
+    parser.add_argument(
+        "--all_sheets",
+        action="store_true",
+        default=False,
+        help="Process all sheets in the XLSX file, as for repeated --sheet_name",
+    )
+    parser.add_argument(
+        "--cache_dir",
+        type=str,
+        default=None,
+        help=(
+            "Directory for caching the parsed input file, speeds up repeated "
+            "loading of an unchanged file. Defaults to the environment "
+            "variable PYSCAL_CACHE_DIR, no caching if not set. Requires pyarrow"
+        ),
     )
     parser.add_argument(
         "--slgof",
@@ -138,6 +165,37 @@ def get_parser() -> argparse.ArgumentParser:
             "Implicit for gas-water input."
         ),
     )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        default=False,
+        help=(
+            "Print runtime statistics after processing, like the number of "
+            "monotonicity fix iterations, pr. SATNUM where relevant"
+        ),
+    )
+    parser.add_argument(
+        "--validation",
+        choices=VALIDATION_LEVELS,
+        default="full",
+        help=(
+            "Level of validation of the generated tables. 'full' checks the "
+            "tables and ensures monotonicity after rounding in the output, "
+            "'cheap' only checks the tables, 'none' skips all checks and "
+            "should only be used for trusted input. Unless 'none', all "
+            "parameters are checked before any tables are made, and all "
+            "problems found are reported at once. Default 'full'"
+        ),
+    )
+    parser.add_argument(
+        "--aggregate_logs",
+        action="store_true",
+        default=False,
+        help=(
+            "Log each distinct warning only once, and print a summary of "
+            "repeated log messages with counts pr. SATNUM when finished"
+        ),
+    )
     return parser
 
 
@@ -157,8 +215,13 @@ def main() -> None:
             int_param_wo=args.int_param_wo,
             int_param_go=args.int_param_go,
             sheet_name=args.sheet_name,
+            all_sheets=args.all_sheets,
+            cache_dir=args.cache_dir,
             slgof=args.slgof,
             family2=args.family2,
+            print_stats=args.stats,
+            aggregate_logs=args.aggregate_logs,
+            validation=args.validation,
         )
     except (OSError, ValueError) as err:
         print("".join(traceback.format_tb(err.__traceback__)))
@@ -173,9 +236,14 @@ def pyscal_main(
     delta_s: Optional[float] = None,
     int_param_wo: Optional[List[float]] = None,
     int_param_go: Optional[List[Optional[float]]] = None,
-    sheet_name: str = None,
+    sheet_name: Union[str, List[str], None] = None,
+    all_sheets: bool = False,
+    cache_dir: Optional[str] = None,
     slgof: bool = False,
     family2: bool = False,
+    print_stats: bool = False,
+    aggregate_logs: bool = False,
+    validation: str = "full",
 ) -> None:
     """A "main()" method not relying on argparse. This can be used
     for testing, and also by an ERT forward model, e.g.
@@ -189,16 +257,122 @@ def pyscal_main(
         delta_s: Saturation step-length
         int_param_wo: Interpolation params for wateroil
         int_param_go: Interpolation params for gasoil
-        sheet_name: Which sheet in XLSX file
+        sheet_name: Which sheet in XLSX file, or a list of sheets.
+            For several sheets, the workbook is only read once, and the
+            output for each sheet is written to a file with the sheet
+            name appended to the output filename.
+        all_sheets: Process all sheets in the XLSX file, as for a list
+            of sheets.
+        cache_dir: Directory for caching the parsed input file
         slgof: Use SLGOF
         family2: Dump family 2 keywords
+        print_stats: Print runtime statistics when finished
+        aggregate_logs: Log each distinct message only once, and print
+            a summary of the repeated messages when finished
+        validation: Validation level for the generated tables, "none",
+            "cheap" or "full"
     """
     args = {"debug": debug, "verbose": verbose, "output": output}
     logger = getLogger_pyscal(__name__, args)
+    stats.reset_stats()
 
-    scalinput_df = PyscalFactory.load_relperm_df(
-        parametertable, sheet_name=sheet_name, args=args
-    )
+    with contextlib.ExitStack() as exitstack:
+        aggregator = (
+            exitstack.enter_context(aggregated_logging(summary=False))
+            if aggregate_logs
+            else None
+        )
+        sheet_names: Optional[List[str]] = None
+        single_sheet: Optional[str] = None
+        if isinstance(sheet_name, list) and len(sheet_name) != 1:
+            sheet_names = sheet_name
+        elif isinstance(sheet_name, list):
+            single_sheet = sheet_name[0]
+        else:
+            single_sheet = sheet_name
+        # The key is None when a single table is processed:
+        scalinput_dfs: Dict[Optional[str], pd.DataFrame]
+        if all_sheets or sheet_names is not None:
+            scalinput_dfs = {
+                sheet: scalinput_df
+                for sheet, scalinput_df in PyscalFactory.load_relperm_dfs(
+                    parametertable,
+                    sheet_names=None if all_sheets else sheet_names,
+                    args=args,
+                    cache_dir=cache_dir,
+                ).items()
+            }
+        else:
+            scalinput_dfs = {
+                None: PyscalFactory.load_relperm_df(
+                    parametertable,
+                    sheet_name=single_sheet,
+                    args=args,
+                    cache_dir=cache_dir,
+                )
+            }
+        if validation != "none":
+            # Report all invalid parameters before computing any curves:
+            reports = []
+            for sheet, scalinput_df in scalinput_dfs.items():
+                report = format_problems(check_relperm_df(scalinput_df))
+                if report:
+                    reports.append(report if sheet is None else f"{sheet}: {report}")
+            if reports:
+                raise ValueError("\n".join(reports))
+        for sheet, scalinput_df in scalinput_dfs.items():
+            if sheet is not None:
+                logger.info("Processing sheet %s", sheet)
+            _generate_output(
+                scalinput_df,
+                output=output if sheet is None else _sheet_output(output, sheet),
+                delta_s=delta_s,
+                int_param_wo=int_param_wo,
+                int_param_go=int_param_go,
+                slgof=slgof,
+                family2=family2,
+                validation=validation,
+                args=args,
+            )
+
+    # Summaries must not pollute the include file if written to stdout:
+    if aggregator is not None:
+        print(
+            aggregator.format_summary(),
+            end="",
+            file=sys.stderr if output == "-" else sys.stdout,
+        )
+    if print_stats:
+        print(
+            stats.format_stats(),
+            end="",
+            file=sys.stderr if output == "-" else sys.stdout,
+        )
+
+
+def _sheet_output(output: str, sheet: str) -> str:
+    """Output filename for a sheet when processing several sheets,
+    the sheet name is appended to the stem of the filename."""
+    if output == "-":
+        return output
+    path = Path(output)
+    return str(path.with_name(f"{path.stem}_{sheet}{path.suffix}"))
+
+
+def _generate_output(
+    scalinput_df: pd.DataFrame,
+    output: str,
+    delta_s: Optional[float],
+    int_param_wo: Optional[List[float]],
+    int_param_go: Optional[List[Optional[float]]],
+    slgof: bool,
+    family2: bool,
+    validation: str,
+    args: dict,
+) -> None:
+    """Generate include file contents from loaded input data, and write
+    it to the output file or stdout. See pyscal_main() for the arguments"""
+    logger = getLogger_pyscal(__name__, args)
     logger.debug("Input data:\n%s", scalinput_df.to_string(index=False))
     if int_param_go is not None and int_param_wo is None:
         raise ValueError("Don't use int_param_go alone, only int_param_wo")
@@ -224,7 +398,7 @@ def pyscal_main(
         if int_param_wo is None:
             raise ValueError("No interpolation parameters provided")
         scalrec_list = PyscalFactory.create_scal_recommendation_list(
-            scalinput_df, h=delta_s, args=args
+            scalinput_df, h=delta_s, args=args, validation=validation
         )
         assert isinstance(scalrec_list[1], SCALrecommendation)
         if scalrec_list[1].type == WaterOilGas:
@@ -234,18 +408,22 @@ def pyscal_main(
                 str(int_param_go),
             )
             wog_list = scalrec_list.interpolate(
-                int_param_wo, int_param_go, h=delta_s, args=args
+                int_param_wo,
+                int_param_go,
+                h=delta_s,
+                args=args,
+                validation=validation,
             )
         elif scalrec_list[1].type == GasWater:
             logger.info(
                 "Interpolating, gaswater=%s", str(int_param_wo),
             )
             wog_list = scalrec_list.interpolate(
-                int_param_wo, None, h=delta_s, args=args
+                int_param_wo, None, h=delta_s, args=args, validation=validation
             )
     else:
         wog_list = PyscalFactory.create_pyscal_list(
-            scalinput_df, h=delta_s, args=args
+            scalinput_df, h=delta_s, args=args, validation=validation
         )  # can be both water-oil, water-oil-gas, or gas-water
 
     if (
@@ -270,7 +448,8 @@ def pyscal_main(
             )
             Path(output).parent.mkdir(exist_ok=True, parents=True)
         Path(output).write_text(
-            wog_list.build_eclipse_data(family=family, slgof=slgof), encoding="utf-8"
+            wog_list.build_eclipse_data(family=family, slgof=slgof),
+            encoding="utf-8",
         )
         print("Written to " + output)
 
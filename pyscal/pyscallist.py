@@ -1,7 +1,7 @@
 """Container class for list of Pyscal objects"""
 
 from pathlib import Path
-from typing import List, Optional, Type, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Type, Union
 
 import pandas as pd
 
@@ -13,6 +13,9 @@ from pyscal import (
     WaterOilGas,
     getLogger_pyscal,
 )
+from pyscal.utils import asyncwrite, stats
+from pyscal.utils.validation import shared_checks
+from pyscal.utils.workers import satnum_map
 
 PYSCAL_OBJECTS = [WaterOil, GasOil, GasWater, WaterOilGas, SCALrecommendation]
 
@@ -22,6 +25,30 @@ PyscalObjects = Union[WaterOil, GasOil, GasWater, WaterOilGas, SCALrecommendatio
 # logger = getLogger_pyscal(__name__)
 
 
+def _interpolate_satnum(
+    shared: Tuple[
+        List[SCALrecommendation],
+        List[Tuple[float, Optional[float]]],
+        Optional[float],
+        Optional[dict],
+        Optional[str],
+    ],
+    idx: int,
+) -> Union[WaterOilGas, GasWater]:
+    """Interpolate one SATNUM, see PyscalList.interpolate()"""
+    recommendations, int_params, h, args, validation = shared
+    scalrec = recommendations[idx]
+    assert isinstance(scalrec, SCALrecommendation)
+    with stats.satnum_context(idx + 1):
+        return scalrec.interpolate(
+            int_params[idx][0],
+            int_params[idx][1],
+            h=h,
+            args=args,
+            validation=validation,
+        )
+
+
 class PyscalList(object):
     """Container class for a list of WaterOilGas objects.
 
@@ -71,7 +98,13 @@ class PyscalList(object):
         if not isinstance(pyscal_obj, tuple(PYSCAL_OBJECTS)):
             raise ValueError("Not a pyscal object: " + str(pyscal_obj))
         if not self.pyscaltype:
-            self.pyscaltype = type(pyscal_obj)
+            # Subclasses, like CompiledSCALrecommendation, are listed
+            # as their pyscal base type:
+            self.pyscaltype = next(
+                pyscaltype
+                for pyscaltype in PYSCAL_OBJECTS
+                if isinstance(pyscal_obj, pyscaltype)
+            )
             # Beware, this list can be of type WaterOilGas, with
             # WaterOilGas objects where gasoil is None, effectively
             # making that object a WaterOil object.
@@ -265,7 +298,37 @@ class PyscalList(object):
             family,
             len(self),
         )
-        return "\n".join([getattr(self, keyword)() for keyword in keywords])
+        return "\n".join(self.make_ecl_keywords(keywords).values())
+
+    def make_ecl_keywords(self, keywords: List[str]) -> Dict[str, str]:
+        """Construct strings for several keywords in one pass over the list
+
+        Each SATNUM is visited once, producing all the requested keywords.
+        The checks that each keyword generator runs, like selfcheck() and
+        the crosspoint, are run only once pr. object in a visit, see
+        pyscal.utils.validation.shared_checks(). Columns that are common
+        to several of the keywords, f.ex. KRW and PC in SWOF and SWFN,
+        are monotonicity-fixed and formatted only once pr. SATNUM, as the
+        objects cache their formatted columns.
+
+        Args:
+            keywords: Keywords to construct, like SWOF or SOF3.
+
+        Returns:
+            Dictionary with the keywords as keys, in the requested order,
+            and the strings with data for all SATNUMs as values.
+        """
+        if self.pyscaltype == SCALrecommendation:
+            raise TypeError(
+                "You need to interpolate before you can dump a SCAL recommendation"
+            )
+        buffers: Dict[str, List[str]] = {keyword: [] for keyword in keywords}
+        for (satnum, pyscal_obj) in enumerate(self.pyscal_list):
+            outputters = [getattr(pyscal_obj, keyword) for keyword in keywords]
+            with stats.satnum_context(satnum + 1), shared_checks(pyscal_obj):
+                for keyword, outputter in zip(keywords, outputters):
+                    buffers[keyword].append(outputter(header=satnum == 0))
+        return {keyword: "".join(buffer) for keyword, buffer in buffers.items()}
 
     def dump_family_1(self, filename: Optional[str] = None, slgof: bool = False) -> str:
         """Dumps family 1 Eclipse saturation tables to one
@@ -309,12 +372,126 @@ class PyscalList(object):
             Path(filename).write_text(string, encoding="utf-8")
         return string
 
+    async def write_async(
+        self,
+        filenames: List[Union[str, Path]],
+        family: int = 1,
+        slgof: bool = False,
+        max_concurrency: int = asyncwrite.DEFAULT_CONCURRENCY,
+        fsync: bool = False,
+    ) -> Dict[Path, Exception]:
+        """Write the Eclipse data to several files concurrently
+
+        The data is generated once, in the calling process, and written
+        to all the files with bounded concurrency, f.ex. to one
+        ``realization-N/iter-M`` directory pr. realization. For different
+        data in each file, use :func:`pyscal.utils.asyncwrite.write_files`.
+
+        Example::
+
+          errors = asyncio.run(pyscal_list.write_async(filenames))
+
+        Args:
+            filenames: Paths to write to, parent directories are created.
+            family: Family 1 or 2 keywords, see build_eclipse_data().
+            slgof: Set to true if SLGOF is wanted instead of SGOF.
+            max_concurrency: Maximal number of files being written at the
+                same time.
+            fsync: If True, each file is flushed to disk.
+
+        Returns:
+            The exception for each path that could not be written.
+        """
+        string = self.build_eclipse_data(family=family, slgof=slgof)
+        return await asyncwrite.write_files_async(
+            {filename: string for filename in filenames},
+            max_concurrency=max_concurrency,
+            fsync=fsync,
+        )
+
+    def save_bundle(self, path: Union[str, Path]) -> None:
+        """Save the generated tables to a bundle directory
+
+        The bundle holds one .npy file pr. table column, with one padded
+        row pr. SATNUM, and an index.json file with the row count for each
+        SATNUM and all other object attributes. Use open_bundle() to
+        reopen it. Existing bundle files in the directory are overwritten.
+
+        Args:
+            path: Directory to write to, created if it does not exist.
+        """
+        # pylint: disable=import-outside-toplevel
+        from pyscal.densepyscallist import DensePyscalList
+
+        DensePyscalList(self, memmap_dir=path).save_bundle(path)
+
+    @staticmethod
+    def open_bundle(path: Union[str, Path], args: Optional[dict] = None):
+        """Open a bundle directory written by save_bundle()
+
+        The column arrays are memory mapped read-only, so only the
+        pages of the SATNUMs being used are read from disk.
+
+        Args:
+            path: Bundle directory
+            args: Verbose, debug and output arguments from CLI
+                to create logger that splits log messages to stdout and stderr
+
+        Returns:
+            DensePyscalList, supporting df(), indexing and keyword output
+            like a PyscalList.
+        """
+        # pylint: disable=import-outside-toplevel
+        from pyscal.densepyscallist import DensePyscalList
+
+        return DensePyscalList.open_bundle(path, args=args)
+
+    def plot_report(
+        self,
+        path: Union[str, Path],
+        processes: Optional[int] = None,
+        logyscale: bool = False,
+        dpi: int = 100,
+        decimate: bool = False,
+    ) -> None:
+        """Plot all SATNUMs to a PDF or HTML report, for visual QC
+
+        One page is made pr. SATNUM, with the low, base and high cases
+        overlaid for SCALrecommendations. The pages are rendered with the
+        Agg backend, no display is needed. See
+        :func:`pyscal.utils.plotreport.plot_report`.
+
+        Args:
+            path: File to write, with suffix ".pdf" for a multipage PDF,
+                or ".html" for an index of PNG images.
+            processes: If larger than 1, render the pages in this number
+                of worker processes.
+            logyscale: Set to True to plot relative permeabilities on a
+                logarithmic axis.
+            dpi: Resolution of the pages.
+            decimate: Set to True to draw the curves through only as many
+                table rows as needed at this resolution.
+        """
+        # pylint: disable=import-outside-toplevel
+        from pyscal.utils import plotreport
+
+        plotreport.plot_report(
+            self.pyscal_list,
+            path,
+            processes=processes or 1,
+            logyscale=logyscale,
+            dpi=dpi,
+            decimate=decimate,
+        )
+
     def interpolate(
         self,
         int_params_wo: Union[float, int, List[float]],
         int_params_go: Optional[Union[float, int, List[Optional[float]]]] = None,
         h: Optional[float] = None,
         args: Optional[dict] = None,
+        validation: Optional[str] = None,
+        processes: Optional[int] = None,
     ) -> "PyscalList":
         """This function will interpolate each SCALrecommendation
         object to the chosen parameters
@@ -327,11 +504,41 @@ class PyscalList(object):
                 numbers between -1 and 1 (inclusive).
             int_params_go: If specified, will be used for GasOil interpolation.
             h: Saturation step-length
+            validation: Validation level for the interpolants, "none",
+                "cheap" or "full". Defaults to the validation level of each
+                SCALrecommendation.
+            processes: If larger than 1, interpolate in this number of
+                worker processes. The SCALrecommendations and parameters
+                are sent once to each worker, and only the interpolants are
+                passed back, see pyscal.utils.workers. Runtime statistics
+                are not collected from the workers.
 
         Returns:
             PyscalList of type WaterOilGas, with the same length.
         """
 
+        wog_list: PyscalList = PyscalList(args=args)
+        for interpolant in self._interpolants(
+            int_params_wo,
+            int_params_go,
+            h=h,
+            args=args,
+            validation=validation,
+            processes=processes,
+        ):
+            wog_list.append(interpolant)
+        return wog_list
+
+    def _interpolants(
+        self,
+        int_params_wo: Union[float, int, List[float]],
+        int_params_go: Optional[Union[float, int, List[Optional[float]]]] = None,
+        h: Optional[float] = None,
+        args: Optional[dict] = None,
+        validation: Optional[str] = None,
+        processes: Optional[int] = None,
+    ) -> Iterator[Union[WaterOilGas, GasWater]]:
+        """Yield the interpolant for each SATNUM in order, see interpolate()"""
         if self.pyscaltype != SCALrecommendation:
             raise TypeError(
                 "Can only interpolate PyscalList of type SCALrecommendation"
@@ -360,31 +567,24 @@ class PyscalList(object):
             raise ValueError(
                 f"Too many interpolation parameters given for GasOil {int_params_go}"
             )
-        wog_list: PyscalList = PyscalList(args=args)
-        for (satnum, scalrec) in enumerate(self.pyscal_list):
-            assert isinstance(scalrec, SCALrecommendation)
-            wog_list.append(
-                scalrec.interpolate(
-                    int_params_wo[satnum], int_params_go[satnum], h=h, args=args
-                )
-            )
-        return wog_list
+        yield from satnum_map(
+            _interpolate_satnum,
+            (
+                self.pyscal_list,
+                list(zip(int_params_wo, int_params_go)),
+                h,
+                args,
+                validation,
+            ),
+            len(self),
+            processes=processes or 1,
+        )
 
     def make_ecl_output(
         self, keyword: str, write_to_filename: Optional[str] = None,
     ) -> str:
         """Internal helper function for constructing strings and writing to disk"""
-        if self.pyscaltype == SCALrecommendation:
-            raise TypeError(
-                "You need to interpolate before you can dump a SCAL recommendation"
-            )
-        first_obj = self.pyscal_list[0]
-        outputter = getattr(first_obj, keyword)
-        string = outputter(header=True)
-        if len(self.pyscal_list) > 1:
-            for pyscal_obj in self.pyscal_list[1:]:
-                outputter = getattr(pyscal_obj, keyword)
-                string += outputter(header=False)
+        string = self.make_ecl_keywords([keyword])[keyword]
         if write_to_filename:
             Path(write_to_filename).parent.mkdir(parents=True, exist_ok=True)
             Path(write_to_filename).write_text(string, encoding="utf-8")
@@ -414,6 +614,28 @@ class PyscalList(object):
         """Make SOF3 string and optionally print to file"""
         return self.make_ecl_output("SOF3", write_to_filename)
 
+    @property
+    def stats(self) -> pd.DataFrame:
+        """Runtime statistics pr. SATNUM in this list
+
+        Counters are accumulated globally since the last call to
+        pyscal.reset_stats(), and attributed to a SATNUM when the event
+        occurs while this (or another) PyscalList processes that SATNUM.
+
+        Returns:
+            Dataframe with SATNUM as index and one column pr. counter.
+            Counters not registered for a SATNUM are zero.
+        """
+        satnum_counters = stats.satnum_stats()
+        dframe = pd.DataFrame(
+            [
+                satnum_counters.get(satnum, {})
+                for satnum in range(1, len(self.pyscal_list) + 1)
+            ],
+            index=pd.Index(range(1, len(self.pyscal_list) + 1), name="SATNUM"),
+        )
+        return dframe.fillna(0).astype(int)
+
     def __len__(self) -> int:
         """Return the count of Pyscal objects in the list"""
         return len(self.pyscal_list)
@@ -1,15 +1,24 @@
 """SCALrecommendation, container for low, base and high WaterOilGas objects"""
 
 import copy
-from typing import Optional, Set, Type, Union
+from typing import Dict, List, Optional, Set, Tuple, Type, Union
 
 import numpy as np
+import pandas as pd
 
-from pyscal import GasWater, WaterOilGas, getLogger_pyscal
-from pyscal.utils.interpolation import interpolate_go, interpolate_wo
+from pyscal import GasOil, GasWater, WaterOil, WaterOilGas
+from pyscal.utils import stats
+from pyscal.utils.interpolation import (
+    CompiledGasOil,
+    CompiledWaterOil,
+    interpolate_go,
+    interpolate_wo,
+)
+from pyscal.utils.pickling import PicklableLogger
+from pyscal.utils.validation import strictest, validation_level
 
 
-class SCALrecommendation(object):
+class SCALrecommendation(PicklableLogger):
     """A SCAL recommendation consists of three OilWaterGas objects,
     tagged low, base and high.
 
@@ -50,7 +59,7 @@ class SCALrecommendation(object):
         self.base: Union[WaterOilGas, GasWater]
         self.high: Union[WaterOilGas, GasWater]
         self.type: Type
-        self.logger: Optional[object] = getLogger_pyscal(__name__, args)
+        self._set_logger(args)
 
         if (
             isinstance(low, WaterOilGas)
@@ -75,19 +84,24 @@ class SCALrecommendation(object):
         else:
             raise ValueError("Wrong arguments to SCALrecommendation")
 
-        self.fast: bool = False
-        if all([self.low.fast, self.base.fast, self.high.fast]):
-            self.fast = True
-        elif any([self.low.fast, self.base.fast, self.high.fast]):
-            self.fast = self.low.fast = self.base.fast = self.high.fast = False
+        levels = {self.low.validation, self.base.validation, self.high.validation}
+        self.validation: str = strictest(levels)
+        if len(levels) > 1:
+            self.low.validation = self.base.validation = self.validation
+            self.high.validation = self.validation
             self.logger.warning(
                 (
-                    "One or more of the low/base/high objects are set to be run in "
-                    "fast mode, but not all. Fast mode set to false in all objects. "
-                    "Code is run in normal mode."
-                )
+                    "The low/base/high objects have different validation levels. "
+                    "Validation level %s is used for all objects."
+                ),
+                self.validation,
             )
 
+    @property
+    def fast(self) -> bool:
+        """True if no validation is done, as validation="none"."""
+        return self.validation == "none"
+
     # User should add capillary pressure explicitly by calling add**
     # on the class objects, or run the following method to add the
     # same to all curves:
@@ -121,6 +135,7 @@ class SCALrecommendation(object):
         parameter2: Optional[float] = None,
         h: Optional[float] = None,
         args: Optional[dict] = None,
+        validation: Optional[str] = None,
     ) -> Union[WaterOilGas, GasWater]:
         """Interpolate between low, base and high
 
@@ -143,7 +158,13 @@ class SCALrecommendation(object):
                 GasOil. Ignored for GasWater (no warning).
             h: Saturation step length in generated tables. Does not
                 need to be the same as the tables interpolation is done from.
+            validation: Validation level for the interpolant, "none",
+                "cheap" or "full". Defaults to the validation level of
+                the low/base/high objects.
         """
+        if validation is None:
+            validation = self.validation
+        validation = validation_level(validation)
 
         if parameter2 is not None:
             gasparameter = parameter2
@@ -202,10 +223,7 @@ class SCALrecommendation(object):
                 set([self.base.gasoil.tag, self.low.gasoil.tag, self.high.gasoil.tag])
             )
         tagstring = "\n".join(tags)
-        if do_gaswater:
-            interpolant = GasWater(h=h, tag=tagstring, args=args)
-        else:
-            interpolant = WaterOilGas(h=h, tag=tagstring, args=args)
+        interpolant = self._new_interpolant(h=h, tag=tagstring, args=args)
 
         if do_wateroil or do_gaswater:
             tag = f"SCAL recommendation interpolation to {parameter}\n" + tagstring
@@ -219,19 +237,18 @@ class SCALrecommendation(object):
             if np.isclose(parameter, 0.0):
                 interpolant.wateroil = copy.deepcopy(self.base.wateroil)
                 interpolant.wateroil.tag = tag
+                stats.increment("interpolation_deepcopies")
             elif np.isclose(parameter, -1.0):
                 interpolant.wateroil = copy.deepcopy(self.low.wateroil)
                 interpolant.wateroil.tag = tag
+                stats.increment("interpolation_deepcopies")
             elif np.isclose(parameter, 1.0):
                 interpolant.wateroil = copy.deepcopy(self.high.wateroil)
                 interpolant.wateroil.tag = tag
-            elif parameter < 0.0:
-                interpolant.wateroil = interpolate_wo(
-                    self.base.wateroil, self.low.wateroil, -parameter, h=h, tag=tag,
-                )
-            elif parameter > 0.0:
-                interpolant.wateroil = interpolate_wo(
-                    self.base.wateroil, self.high.wateroil, parameter, h=h, tag=tag,
+                stats.increment("interpolation_deepcopies")
+            else:
+                interpolant.wateroil = self._interpolate_wateroil(
+                    parameter, h=h, tag=tag
                 )
         else:
             interpolant.wateroil = None
@@ -249,23 +266,251 @@ class SCALrecommendation(object):
             if np.isclose(gasparameter, 0.0):
                 interpolant.gasoil = copy.deepcopy(self.base.gasoil)
                 interpolant.gasoil.tag = tag
+                stats.increment("interpolation_deepcopies")
             elif np.isclose(gasparameter, -1.0):
                 interpolant.gasoil = copy.deepcopy(self.low.gasoil)
                 interpolant.gasoil.tag = tag
+                stats.increment("interpolation_deepcopies")
             elif np.isclose(gasparameter, 1.0):
                 interpolant.gasoil = copy.deepcopy(self.high.gasoil)
                 interpolant.gasoil.tag = tag
-            elif gasparameter < 0.0:
-                interpolant.gasoil = interpolate_go(
-                    self.base.gasoil, self.low.gasoil, -1 * gasparameter, h=h, tag=tag,
-                )
-            elif gasparameter > 0.0:
-                interpolant.gasoil = interpolate_go(
-                    self.base.gasoil, self.high.gasoil, gasparameter, h=h, tag=tag,
+                stats.increment("interpolation_deepcopies")
+            else:
+                interpolant.gasoil = self._interpolate_gasoil(
+                    gasparameter, h=h, tag=tag
                 )
         else:
             interpolant.gasoil = None
 
-        interpolant.fast = self.fast
+        interpolant.validation = validation
+        if interpolant.wateroil is not None:
+            interpolant.wateroil.validation = validation
+        if interpolant.gasoil is not None:
+            interpolant.gasoil.validation = validation
 
         return interpolant
+
+    def _new_interpolant(
+        self, h: Optional[float], tag: str, args: Optional[dict]
+    ) -> Union[WaterOilGas, GasWater]:
+        """Construct the object to be filled with interpolated curves"""
+        if self.type == GasWater:
+            return GasWater(h=h, tag=tag, args=args)
+        return WaterOilGas(h=h, tag=tag, args=args)
+
+    def _interpolate_wateroil(
+        self, parameter: float, h: Optional[float], tag: str
+    ) -> WaterOil:
+        """Interpolate water-oil curves for a parameter strictly
+        between -1 and 1, and not 0"""
+        if parameter < 0.0:
+            return interpolate_wo(
+                self.base.wateroil, self.low.wateroil, -parameter, h=h, tag=tag
+            )
+        return interpolate_wo(
+            self.base.wateroil, self.high.wateroil, parameter, h=h, tag=tag
+        )
+
+    def _interpolate_gasoil(
+        self, parameter: float, h: Optional[float], tag: str
+    ) -> GasOil:
+        """Interpolate gas-oil curves for a parameter strictly
+        between -1 and 1, and not 0"""
+        if parameter < 0.0:
+            return interpolate_go(
+                self.base.gasoil, self.low.gasoil, -parameter, h=h, tag=tag
+            )
+        return interpolate_go(
+            self.base.gasoil, self.high.gasoil, parameter, h=h, tag=tag
+        )
+
+    def interpolate_with_derivatives(
+        self,
+        parameter: float,
+        parameter2: Optional[float] = None,
+        h: Optional[float] = None,
+    ) -> Tuple[Union[WaterOilGas, GasWater], Dict[str, pd.DataFrame]]:
+        """Interpolate, and compute the derivatives of the interpolated
+        tables with respect to the interpolation parameters
+
+        The derivatives are computed in closed form, at fixed saturation
+        on the grid of the interpolant, see
+        :meth:`pyscal.utils.interpolation.CompiledWaterOil.derivatives`.
+        The water-oil tables depend only on parameter, and the gas-oil
+        tables only on parameter2 if it is given, otherwise on parameter.
+
+        This compiles the recommendation for every call, use compile()
+        first when this is called repeatedly.
+
+        Args:
+            parameter: Between -1 and 1, see interpolate().
+            parameter2: Parameter for the gas-oil interpolation, see
+                interpolate().
+            h: Saturation step length in generated tables.
+
+        Returns:
+            The interpolant, and a dictionary with the derivatives of the
+            wateroil and gasoil tables, as dataframes with the same
+            columns as the tables, under the keys "wateroil" and "gasoil"
+            if the interpolant has them.
+        """
+        return self.compile().interpolate_with_derivatives(
+            parameter, parameter2=parameter2, h=h
+        )
+
+    def compile(self) -> "CompiledSCALrecommendation":
+        """Prepare the recommendation for many interpolations
+
+        See CompiledSCALrecommendation. The low, base and high objects
+        are shared with the returned object, but later changes to them are
+        not seen by it.
+        """
+        return CompiledSCALrecommendation(
+            self.low, self.base, self.high, tag=self.tag, h=self.h
+        )
+
+
+class CompiledSCALrecommendation(SCALrecommendation):
+    """A SCAL recommendation prepared for fast interpolation
+
+    The low, base and high curves are resampled once on common normalized
+    saturation grids. Each interpolation is then reduced to weighted sums
+    of arrays and an interpolation of the saturation endpoints, instead of
+    locating endpoints and normalizing the input curves every time. The
+    interpolants are equal to those from SCALrecommendation up to floating
+    point roundoff.
+
+    Use this when interpolating the same recommendation many times, f.ex.
+    for every realization in an ensemble. The low, base and high objects
+    must not be modified after construction, except through add_simple_J().
+
+    Args:
+        low: An object representing the low case
+        base: An object representing the base case
+        high: An object representing the high case
+        tag: A string that describes the recommendation. Optional.
+        args: Verbose, debug and output arguments from CLI
+            to create logger that splits log messages to stdout and stderr
+    """
+
+    def __init__(
+        self,
+        low: Union[WaterOilGas, GasWater],
+        base: Union[WaterOilGas, GasWater],
+        high: Union[WaterOilGas, GasWater],
+        tag: Optional[str] = None,
+        h: float = 0.01,
+        args: Optional[dict] = None,
+    ) -> None:
+        super().__init__(low, base, high, tag=tag, h=h, args=args)
+        self._compile()
+
+    def _compile(self) -> None:
+        """Resample the low, base and high curves"""
+        cases = [self.low, self.base, self.high]
+        self._wateroil: Optional[CompiledWaterOil] = None
+        self._gasoil: Optional[CompiledGasOil] = None
+        if all(case.wateroil is not None for case in cases):
+            self._wateroil = CompiledWaterOil([case.wateroil for case in cases])
+        if all(case.gasoil is not None for case in cases):
+            self._gasoil = CompiledGasOil([case.gasoil for case in cases])
+
+    def add_simple_J(
+        self,
+        a: float = 5.0,
+        b: float = -1.5,
+        poro_ref: float = 0.25,
+        perm_ref: float = 100.0,
+        drho: float = 300.0,
+        g: float = 9.81,
+    ) -> None:
+        """Add (identical) simplified J-function to all water-oil
+        curves in the SCAL recommendation set"""
+        super().add_simple_J(
+            a=a, b=b, poro_ref=poro_ref, perm_ref=perm_ref, drho=drho, g=g
+        )
+        self._compile()
+
+    def _new_interpolant(
+        self, h: Optional[float], tag: str, args: Optional[dict]
+    ) -> Union[WaterOilGas, GasWater]:
+        if self.type == GasWater:
+            return GasWater(h=h, tag=tag, args=args)
+        # Both curves are set by the caller, avoid constructing
+        # default curves in WaterOilGas.__init__():
+        return WaterOilGas.from_curves(
+            None, None, validation=self.validation, args=args
+        )
+
+    def _interpolate_wateroil(
+        self, parameter: float, h: Optional[float], tag: str
+    ) -> WaterOil:
+        assert self._wateroil is not None
+        return self._wateroil.interpolate(parameter, h=h, tag=tag)
+
+    def _interpolate_gasoil(
+        self, parameter: float, h: Optional[float], tag: str
+    ) -> GasOil:
+        assert self._gasoil is not None
+        return self._gasoil.interpolate(parameter, h=h, tag=tag)
+
+    def compile(self) -> "CompiledSCALrecommendation":
+        """Return self, already compiled"""
+        return self
+
+    def interpolate_with_derivatives(
+        self,
+        parameter: float,
+        parameter2: Optional[float] = None,
+        h: Optional[float] = None,
+    ) -> Tuple[Union[WaterOilGas, GasWater], Dict[str, pd.DataFrame]]:
+        """Interpolate, and compute the derivatives of the interpolated
+        tables with respect to the interpolation parameters
+
+        See SCALrecommendation.interpolate_with_derivatives().
+        """
+        interpolant = self.interpolate(parameter, parameter2=parameter2, h=h)
+        if parameter2 is None:
+            parameter2 = parameter
+        derivatives: Dict[str, pd.DataFrame] = {}
+        if interpolant.wateroil is not None:
+            assert self._wateroil is not None
+            derivatives["wateroil"] = self._wateroil.derivatives(
+                parameter, interpolant.wateroil
+            )
+        if interpolant.gasoil is not None:
+            assert self._gasoil is not None
+            derivatives["gasoil"] = self._gasoil.derivatives(
+                parameter2, interpolant.gasoil
+            )
+        return interpolant, derivatives
+
+    def make_ecl_keywords(
+        self,
+        keywords: List[str],
+        parameter: float,
+        parameter2: Optional[float] = None,
+        h: Optional[float] = None,
+    ) -> Dict[str, str]:
+        """Interpolate and return the keyword strings for the interpolant
+
+        Args:
+            keywords: Keywords to construct, like SWOF or SGOF.
+            parameter: Between -1 and 1, see interpolate().
+            parameter2: Parameter for the gas-oil interpolation, see
+                interpolate().
+            h: Saturation step length in generated tables.
+
+        Returns:
+            Dictionary with the keywords as keys, in the requested order,
+            and the strings with their data as values.
+        """
+        interpolant = self.interpolate(parameter, parameter2=parameter2, h=h)
+        outputters = {}
+        for keyword in keywords:
+            if not hasattr(interpolant, keyword):
+                raise ValueError(
+                    f"Keyword {keyword} not supported for {self.type.__name__}"
+                )
+            outputters[keyword] = getattr(interpolant, keyword)
+        return {keyword: outputter() for keyword, outputter in outputters.items()}
@@ -0,0 +1,120 @@
+"""Concurrent writing of many output files
+
+Ensemble workflows write one include file pr. realization, typically into
+``realization-N/iter-M/`` directories on a shared filesystem where the
+latency of each file operation dominates. The functions here overlap the
+directory creation, writing and optional fsync for many files using
+asyncio, with the blocking file operations run in a thread pool of
+bounded size.
+
+The strings to write should be generated beforehand, f.ex. in worker
+processes. Errors are collected pr. path instead of stopping the other
+writes.
+
+Example::
+
+  from pyscal.utils.asyncwrite import write_files
+
+  contents = {
+      f"realization-{real}/iter-0/relperm.inc": pyscal_list.build_eclipse_data()
+      for real, pyscal_list in enumerate(pyscal_lists)
+  }
+  errors = write_files(contents, max_concurrency=32)
+"""
+
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY: int = 32
+
+
+def _write_file(path: Path, string: str, fsync: bool) -> None:
+    """Blocking write of one file, run in a thread"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file_handle:
+        file_handle.write(string)
+        if fsync:
+            file_handle.flush()
+            os.fsync(file_handle.fileno())
+
+
+async def write_files_async(
+    contents: Mapping[Union[str, Path], str],
+    max_concurrency: int = DEFAULT_CONCURRENCY,
+    fsync: bool = False,
+    executor: Optional[ThreadPoolExecutor] = None,
+) -> Dict[Path, Exception]:
+    """Write strings to files concurrently, coroutine version
+
+    Use this inside a running event loop, otherwise use write_files().
+
+    Args:
+        contents: The string to write for each path. Parent directories
+            are created as needed, and existing files are overwritten.
+        max_concurrency: Maximal number of files being written at the
+            same time.
+        fsync: If True, each file is flushed to disk before it is
+            regarded as written.
+        executor: Thread pool to run the file operations in. If not
+            given, a pool with max_concurrency threads is used.
+
+    Returns:
+        The exception raised for each path that could not be written.
+        Empty if all files were written.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be positive")
+    loop = asyncio.get_event_loop()
+    semaphore = asyncio.Semaphore(max_concurrency)
+    errors: Dict[Path, Exception] = {}
+
+    own_executor = executor is None
+    if executor is None:
+        executor = ThreadPoolExecutor(max_workers=max_concurrency)
+
+    async def write_one(path: Path, string: str) -> None:
+        async with semaphore:
+            try:
+                await loop.run_in_executor(executor, _write_file, path, string, fsync)
+            except Exception as err:  # pylint: disable=broad-except
+                logger.error("Could not write %s: %s", str(path), str(err))
+                errors[path] = err
+
+    try:
+        await asyncio.gather(
+            *(write_one(Path(path), string) for path, string in contents.items())
+        )
+    finally:
+        if own_executor:
+            executor.shutdown(wait=True)
+    logger.info("Wrote %d of %d files", len(contents) - len(errors), len(contents))
+    return errors
+
+
+def write_files(
+    contents: Mapping[Union[str, Path], str],
+    max_concurrency: int = DEFAULT_CONCURRENCY,
+    fsync: bool = False,
+) -> Dict[Path, Exception]:
+    """Write strings to files concurrently
+
+    Runs write_files_async() in a new event loop, see there for the
+    arguments.
+
+    Returns:
+        The exception raised for each path that could not be written.
+        Empty if all files were written.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(
+            write_files_async(contents, max_concurrency=max_concurrency, fsync=fsync)
+        )
+    finally:
+        loop.close()
@@ -1,20 +1,28 @@
-"""Support functions for capillary pressure"""
+"""Support functions for capillary pressure
 
-import math
+The functions accept both floats and numpy arrays for saturations,
+heights and rock properties, arrays are evaluated elementwise.
+"""
+
+from typing import Tuple, Union
+
+import numpy as np
 
 from pyscal.constants import MAX_EXPONENT
 
+# Floats, or numpy arrays evaluated elementwise:
+FloatOrArray = Union[float, np.ndarray]
+
 
 def simple_J(
-    # sw: Union[float, Iterable[float]],
-    sw: float,
+    sw: FloatOrArray,
     a: float,
     b: float,
     poro_ref: float,
     perm_ref: float,
     drho: float,
     g: float = 9.81,
-) -> float:  # Union[float, Iterable[float]]:
+) -> FloatOrArray:
     # pylint: disable=invalid-name,anomalous-backslash-in-string
     r"""Calculate capillary pressure with bar as unit
 
@@ -59,7 +67,7 @@ def simple_J(
     return _height_to_pc(height, drho, g)
 
 
-def _height_to_pc(height: float, drho: float, g: float) -> float:
+def _height_to_pc(height: FloatOrArray, drho: FloatOrArray, g: float) -> FloatOrArray:
     """From height above free water level, multiplication
     with density difference and gravity gives capillary pressure.
 
@@ -74,21 +82,23 @@ def _height_to_pc(height: float, drho: float, g: float) -> float:
     return height * drho / 1000 * g / 100.0
 
 
-def _sw_to_simpleJ(sw: float, a: float, b: float) -> float:
+def _sw_to_simpleJ(sw: FloatOrArray, a: FloatOrArray, b: FloatOrArray) -> FloatOrArray:
     # pylint: disable=invalid-name
     """Convert a water saturation value to the associated J-value,
     using RMS simple-J"""
-    return float(a) * sw ** float(b)
+    return np.multiply(a, np.power(sw, np.asarray(b, dtype=float)))
 
 
-def _simpleJ_to_sw(J: float, a: float, b: float) -> float:
+def _simpleJ_to_sw(J: FloatOrArray, a: FloatOrArray, b: FloatOrArray) -> FloatOrArray:
     # pylint: disable=invalid-name
     """Convert a J-function-value to a water saturation value,
     using RMS simple-J"""
-    return math.pow(J / float(a), 1.0 / float(b))
+    return np.power(np.divide(J, a), np.divide(1.0, b))
 
 
-def _simpleJ_to_height(J: float, poro_ref: float, perm_ref: float) -> float:
+def _simpleJ_to_height(
+    J: FloatOrArray, poro_ref: FloatOrArray, perm_ref: FloatOrArray
+) -> FloatOrArray:
     # pylint: disable=invalid-name
     """Convert a J-function value to a height-value in meters
 
@@ -102,10 +112,12 @@ def _simpleJ_to_height(J: float, poro_ref: float, perm_ref: float) -> float:
         poro_ref: Porosity between 0 and 1
         perm_ref: Permeability in milliDarcy
     """
-    return J * math.sqrt(float(poro_ref) / float(perm_ref))
+    return J * np.sqrt(np.divide(poro_ref, perm_ref))
 
 
-def _height_to_simpleJ(H: float, poro_ref: float, perm_ref: float):
+def _height_to_simpleJ(
+    H: FloatOrArray, poro_ref: FloatOrArray, perm_ref: FloatOrArray
+) -> FloatOrArray:
     # pylint: disable=invalid-name
     """Convert a height value (in meters) to a corresponding J-function
 
@@ -119,7 +131,49 @@ def _height_to_simpleJ(H: float, poro_ref: float, perm_ref: float):
         poro_ref: Porosity between 0 and 1
         perm_ref: Permeability in milliDarcy
     """
-    return H * math.sqrt(float(perm_ref) / float(poro_ref))
+    return H * np.sqrt(np.divide(perm_ref, poro_ref))
+
+
+def _height_to_normalizedJ(
+    H: FloatOrArray,
+    poro: FloatOrArray,
+    perm: FloatOrArray,
+    sigma_costau: FloatOrArray,
+    drho: FloatOrArray,
+    g: float,
+) -> FloatOrArray:
+    # pylint: disable=invalid-name,too-many-arguments
+    """Convert a height value (in meters) to a normalized (dimensionless)
+    J-function value
+
+    This is the inverse of the scaling from J to capillary pressure in
+    WaterOil.add_normalized_J(), with the capillary pressure given by the
+    height above free water level.
+
+    Args:
+        H: Height in meters.
+        poro: Porosity between 0 and 1
+        perm: Permeability in milliDarcy
+        sigma_costau: Interfacial tension in mN/m
+        drho: Density difference between water and oil, in kg/m³
+        g: Gravitational acceleration, in m/s²
+    """
+    pc_pascal = np.multiply(H, np.multiply(drho, g))
+    perm_sq_meters = np.divide(perm, 1000) * 9.869233e-13
+    return (
+        pc_pascal
+        * np.sqrt(perm_sq_meters / np.asarray(poro))
+        / np.divide(sigma_costau, 1000)
+    )
+
+
+def _normalizedJ_to_sw(
+    J: FloatOrArray, a: FloatOrArray, b: FloatOrArray
+) -> FloatOrArray:
+    # pylint: disable=invalid-name
+    """Convert a normalized J-function value to a water saturation value,
+    normalized with respect to swirr"""
+    return np.multiply(a, np.power(J, np.asarray(b, dtype=float)))
 
 
 def swl_from_height_simpleJ(
@@ -151,4 +205,58 @@ def swl_from_height_simpleJ(
     swn_swlheight = _simpleJ_to_sw(j_value_at_swlheight, a, b)
 
     # Normalize with respect the the asymptotic swirr and return
-    return swirr + (1 - swirr) * swn_swlheight
+    return float(swirr + (1 - swirr) * swn_swlheight)
+
+
+def sw_from_height_simpleJ(
+    height: FloatOrArray,
+    swirr: FloatOrArray,
+    a: FloatOrArray,
+    b: FloatOrArray,
+    poro_ref: FloatOrArray,
+    perm_ref: FloatOrArray,
+) -> FloatOrArray:
+    # pylint: disable=invalid-name
+    """Calculate the water saturation at a height above free water level
+
+    This is the inverse of the capillary pressure curve from
+    WaterOil.add_simple_J(), expressed as height above free water level.
+    At and below free water level the saturation is 1.
+
+    Args:
+        height: Height above free water level, in meters.
+        swirr: Asymptotic irreducible water saturation.
+        a: a coefficient in RMS simplified J function
+        b: b coefficient in RMS simplified J function
+        poro_ref: Porosity, between 0 and 1
+        perm_ref: Permeability, in milliDarcy
+
+    Returns:
+        Water saturation between swirr and 1, same type as the
+        height input argument.
+    """
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        swn = _simpleJ_to_sw(_height_to_simpleJ(height, poro_ref, perm_ref), a, b)
+        sw = np.where(
+            np.greater(height, 0), np.add(swirr, np.multiply(1 - swirr, swn)), 1.0
+        )
+    sw = np.minimum(sw, 1.0)
+    if sw.ndim == 0:
+        return float(sw)
+    return sw
+
+
+def simpleJ_petro_to_rms(
+    a: FloatOrArray, b: FloatOrArray
+) -> Tuple[FloatOrArray, FloatOrArray]:
+    # pylint: disable=invalid-name
+    """Convert the petrophysical simple-J coefficients to the RMS version
+
+    Args:
+        a: a coefficient, petrophysical version
+        b: b coefficient, petrophysical version
+
+    Returns:
+        a and b coefficients for the RMS version of the simple-J function
+    """
+    return np.power(np.divide(1.0, a), np.divide(1.0, b)), np.divide(1.0, b)
@@ -0,0 +1,95 @@
+"""Thinning of tabulated curves for plotting
+
+With small saturation steps, a table can have far more points than there
+are pixels to draw them on. The functions here select the rows needed to
+draw the curves at a given horizontal resolution: in each pixel column
+the first, last, lowest and highest point of each curve is kept, which
+draws the same as the full curve, together with the sharpest bend of
+each curve, the points where a curve becomes zero or nonzero (the
+saturation endpoints), the table endpoints and the points around
+crossings of the curves. Tables are not modified, a subset of their rows is returned.
+"""
+
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+
+def decimate(x: np.ndarray, curves: List[np.ndarray], pixels: int) -> np.ndarray:
+    """Select the points to draw curves with at a given resolution
+
+    Args:
+        x: Increasing or decreasing x values, shared by the curves.
+        curves: The y values of each curve.
+        pixels: Number of pixel columns the x range is drawn on.
+
+    Returns:
+        Sorted indices of the points to keep. All points are kept if
+        there are fewer points than pixels.
+    """
+    if pixels < 1:
+        raise ValueError("pixels must be positive")
+    x = np.asarray(x, dtype=float)
+    npoints = len(x)
+    if npoints <= pixels:
+        return np.arange(npoints)
+
+    xspan = x[-1] - x[0]
+    if xspan != 0:
+        column = np.minimum(((x - x[0]) / xspan * pixels).astype(int), pixels - 1)
+    else:
+        column = np.zeros(npoints, dtype=int)
+    starts = np.flatnonzero(np.diff(column, prepend=-1))
+    ends = np.append(starts[1:], npoints)
+
+    keep = [np.array([0, npoints - 1]), starts, ends - 1]
+    for curve in curves:
+        curve = np.asarray(curve, dtype=float)
+        by_value = np.lexsort((curve, column))
+        keep.extend([by_value[starts], by_value[ends - 1]])
+
+        # Saturation endpoints, where the curve becomes zero or nonzero:
+        zero = curve == 0
+        edges = np.flatnonzero(zero[:-1] != zero[1:])
+        keep.extend([edges, edges + 1])
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slopes = np.diff(curve) / np.diff(x)
+        bend = np.zeros(npoints)
+        bend[1:-1] = np.nan_to_num(np.abs(np.diff(slopes)))
+        keep.append(np.lexsort((bend, column))[ends - 1])
+
+    for idx, curve in enumerate(curves):
+        for other in curves[idx + 1 :]:
+            sign = np.sign(np.asarray(curve, dtype=float) - np.asarray(other))
+            crossings = np.flatnonzero(sign[:-1] != sign[1:])
+            keep.extend([crossings, crossings + 1])
+
+    return np.unique(np.concatenate(keep))
+
+
+def decimate_table(
+    table: pd.DataFrame, xcol: str, ycols: List[str], pixels: int
+) -> pd.DataFrame:
+    """Select the rows of a table to draw some of its columns with
+
+    See decimate().
+
+    Args:
+        table: Table sorted by xcol, ascending or descending.
+        xcol: Column for the x axis.
+        ycols: Columns to be drawn as curves.
+        pixels: Number of pixel columns the x range is drawn on.
+
+    Returns:
+        The selected rows, the table itself is not modified.
+    """
+    return table.iloc[
+        decimate(table[xcol].values, [table[ycol].values for ycol in ycols], pixels)
+    ]
+
+
+def axis_pixels(mpl_ax) -> int:
+    """Width of a matplotlib axis in pixels, at the figure resolution"""
+    return max(1, int(np.ceil(mpl_ax.get_window_extent().width)))
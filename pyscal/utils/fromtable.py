@@ -0,0 +1,88 @@
+"""Vectorized helpers for tabulated relperm and capillary pressure data
+
+The functions work on numpy arrays holding several tables after each
+other, where an integer array of group indices tells which table each
+row belongs to. A single table is one group.
+"""
+
+import logging
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def float_column(dframe: pd.DataFrame, colname: str) -> np.ndarray:
+    """Extract a dataframe column as a contiguous float array
+
+    The dataframe is not modified. Non-numeric columns are converted.
+
+    Args:
+        dframe: Dataframe with tabulated data
+        colname: Name of column to extract
+
+    Returns:
+        Float array with the values from the column.
+    """
+    column = dframe[colname]
+    if not pd.api.types.is_numeric_dtype(column):
+        try:
+            column = column.astype(float)
+        except (TypeError, ValueError) as err:
+            raise ValueError(
+                f"Failed to parse column {colname} as numbers for add_fromtable()"
+            ) from err
+        logger.info("Converted column %s to numbers for fromtable()", colname)
+    return np.ascontiguousarray(column.to_numpy(dtype=float))
+
+
+def group_rows(keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Group rows by a key, like SATNUM
+
+    Args:
+        keys: Key for each row
+
+    Returns:
+        Stable ordering of the rows that makes the groups contiguous, the
+        sorted unique keys, and the group index for each row after ordering.
+    """
+    order = np.argsort(keys, kind="stable")
+    unique_keys, groups = np.unique(keys[order], return_inverse=True)
+    return order, unique_keys, groups
+
+
+def group_starts(groups: np.ndarray) -> np.ndarray:
+    """Row indices where a new group starts, groups must be contiguous"""
+    return np.flatnonzero(np.diff(groups, prepend=-1) != 0)
+
+
+def grouped_diff(values: np.ndarray, groups: np.ndarray) -> np.ndarray:
+    """Difference to the previous row, NaN for the first row in each group"""
+    diffs = np.diff(values, prepend=np.nan)
+    diffs[group_starts(groups)] = np.nan
+    return diffs
+
+
+def failed_groups(failed: np.ndarray, groups: np.ndarray) -> np.ndarray:
+    """Sorted indices of groups with at least one failed row"""
+    return np.unique(groups[failed])
+
+
+def fill_ends(values: np.ndarray) -> None:
+    """Fill NaN values in each column in-place, first forward then backward
+
+    Equivalent to fillna(method="ffill") followed by fillna(method="bfill")
+    for a dataframe, used for data that is interpolated without
+    extrapolation.
+    """
+    for column in values.T:
+        valid = ~np.isnan(column)
+        if not valid.any():
+            continue
+        column[:] = column[
+            np.maximum.accumulate(np.where(valid, np.arange(len(column)), 0))
+        ]
+        first = np.argmax(valid)
+        column[:first] = column[first]
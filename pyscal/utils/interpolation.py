@@ -1,17 +1,160 @@
 """Utility function for pyscal"""
 
+import hashlib
 import logging
-from typing import Callable, Optional, Tuple, Union
+from typing import Callable, Optional, Sequence, Tuple, Union
 
 import numpy as np
-from scipy.interpolate import interp1d
+import pandas as pd
 
 from pyscal import GasOil, WaterOil
+from pyscal.constants import EPSILON as epsilon
+from pyscal.utils import stats
+from pyscal.utils.validation import strictest
 
 logger = logging.getLogger(__name__)
 
+# Maximal number of NormalizedCurve objects cached pr. WaterOil/GasOil:
+CURVECACHE_SIZE: int = 16
 
-def normalize_nonlinpart_wo(curve: WaterOil) -> Tuple[Callable, Callable]:
+
+class NormalizedCurve:
+    """A tabulated curve evaluated on a normalized saturation interval
+
+    The normalized saturation sn in [0, 1] is mapped to the saturation
+    offset + sn * scale, and the curve is linearly interpolated in its
+    knots there with np.interp(). Outside the knots, the curve is constant
+    at the values left and right.
+
+    Objects are immutable, and can be pickled, hashed and compared. They
+    are cached on the WaterOil and GasOil objects for as long as the
+    table data and endpoints are unchanged, see the normalize functions.
+
+    Args:
+        sat: Saturation values of the knots, in any order.
+        values: Curve values at the knots.
+        offset: Saturation value at sn=0.
+        scale: Length of the saturation interval mapped to [0, 1].
+        left: Curve value below the smallest saturation knot.
+        right: Curve value above the largest saturation knot.
+    """
+
+    __slots__ = ("sat", "values", "offset", "scale", "left", "right", "_hash")
+
+    def __init__(
+        self,
+        sat: np.ndarray,
+        values: np.ndarray,
+        offset: float,
+        scale: float,
+        left: float,
+        right: float,
+    ) -> None:
+        order = np.argsort(np.asarray(sat, dtype=float), kind="mergesort")
+        self.sat = np.asarray(sat, dtype=float)[order]
+        self.values = np.asarray(values, dtype=float)[order]
+        self.sat.setflags(write=False)
+        self.values.setflags(write=False)
+        self.offset = float(offset)
+        self.scale = float(scale)
+        self.left = float(left)
+        self.right = float(right)
+        self._hash: Optional[int] = None
+
+    def __call__(self, sn):
+        """Evaluate the curve at normalized saturation values"""
+        return np.interp(
+            self.offset + sn * self.scale,
+            self.sat,
+            self.values,
+            left=self.left,
+            right=self.right,
+        )
+
+    def _params(self) -> Tuple[float, float, float, float]:
+        return (self.offset, self.scale, self.left, self.right)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, NormalizedCurve):
+            return NotImplemented
+        return (
+            self._params() == other._params()
+            and np.array_equal(self.sat, other.sat)
+            and np.array_equal(self.values, other.values)
+        )
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(
+                (self.sat.tobytes(), self.values.tobytes()) + self._params()
+            )
+        return self._hash
+
+    def __reduce__(self):
+        return (NormalizedCurve, (self.sat, self.values) + self._params())
+
+    def __repr__(self) -> str:
+        return (
+            f"NormalizedCurve({len(self.sat)} knots, offset={self.offset}, "
+            f"scale={self.scale}, left={self.left}, right={self.right})"
+        )
+
+
+def _cached_curve(
+    curve: Union[WaterOil, GasOil],
+    satcol: str,
+    valuecol: str,
+    offset: float,
+    scale: float,
+    left: Optional[float] = None,
+    right: Optional[float] = None,
+    reverse: bool = False,
+) -> NormalizedCurve:
+    """Make a NormalizedCurve for a table column, or reuse one cached on
+    the object for the same table data and endpoints. At most
+    CURVECACHE_SIZE curves are cached, the least recently used are dropped.
+
+    The fill values left and right default to zero and the maximal value
+    of the column. If reverse is True, the knots are at 1 - sat, as when
+    the curve is normalized on oil saturation.
+    """
+    sat = curve.table[satcol].to_numpy()
+    values = curve.table[valuecol].to_numpy()
+    key = (
+        satcol,
+        valuecol,
+        len(values),
+        hashlib.sha1(sat.tobytes()).digest(),
+        hashlib.sha1(values.tobytes()).digest(),
+        offset,
+        scale,
+        left,
+        right,
+        reverse,
+    )
+    # The cache is created here for objects restored without it:
+    cache = vars(curve).setdefault("_curvecache", {})
+    if key in cache:
+        stats.increment("normalized_curves_reused")
+        # Move to the end, as the most recently used:
+        cache[key] = cache.pop(key)
+        return cache[key]
+    while len(cache) >= CURVECACHE_SIZE:
+        del cache[next(iter(cache))]
+    cache[key] = NormalizedCurve(
+        1.0 - sat if reverse else sat,
+        values,
+        offset,
+        scale,
+        0.0 if left is None else left,
+        values.max() if right is None else right,
+    )
+    return cache[key]
+
+
+def normalize_nonlinpart_wo(
+    curve: WaterOil,
+) -> Tuple[NormalizedCurve, NormalizedCurve]:
     """Make krw and krow functions that evaluate only on the
     (potentially) nonlinear part of the relperm curves, and with
     a normalized argument (0,1) on that interval.
@@ -33,46 +176,31 @@ def normalize_nonlinpart_wo(curve: WaterOil) -> Tuple[Callable, Callable]:
         curve: incoming oilwater curve set (krw and krow)
 
     Returns:
-        tuple of lambda functions. The first will evaluate krw on
+        tuple of NormalizedCurve objects. The first will evaluate krw on
         the normalized Sw interval [0,1], the second will
         evaluate krow on the normalized So interval [0,1].
     """
-    krw_interp = interp1d(
-        curve.table["SW"],
-        curve.table["KRW"],
-        kind="linear",
-        bounds_error=False,
-        fill_value=(0.0, curve.table["KRW"].max()),
-    )
-
     # The internal dataframe might contain normalized
     # saturation values, but we do not want to assume they
     # are there or even correct, therefore we effectively
     # recalculate them
-    def sw_fn(swn):
-        return curve.swcr + swn * (1.0 - curve.swcr - curve.sorw)
-
-    def krw_fn(swn):
-        return krw_interp(sw_fn(swn))
-
-    kro_interp = interp1d(
-        1.0 - curve.table["SW"],
-        curve.table["KROW"],
-        kind="linear",
-        bounds_error=False,
-        fill_value=(0.0, curve.table["KROW"].max()),
+    krw_fn = _cached_curve(
+        curve, "SW", "KRW", curve.swcr, 1.0 - curve.swcr - curve.sorw
+    )
+    kro_fn = _cached_curve(
+        curve,
+        "SW",
+        "KROW",
+        curve.sorw,
+        1.0 - curve.sorw - curve.swl,
+        reverse=True,
     )
-
-    def so_fn(son):
-        return curve.sorw + son * (1.0 - curve.sorw - curve.swl)
-
-    def kro_fn(son):
-        return kro_interp(so_fn(son))
-
     return (krw_fn, kro_fn)
 
 
-def normalize_nonlinpart_go(curve: GasOil) -> Tuple[Callable, Callable]:
+def normalize_nonlinpart_go(
+    curve: GasOil,
+) -> Tuple[NormalizedCurve, NormalizedCurve]:
     """Make krg and krog functions that evaluates only on the
     (potentially) nonlinear part of the relperm curves, and with
     a normalized argument (0,1) on that interval.
@@ -95,44 +223,29 @@ def normalize_nonlinpart_go(curve: GasOil) -> Tuple[Callable, Callable]:
         curve: incoming gasoil curve set (krg and krog)
 
     Returns:
-        tuple of functions. The first will evaluate krg on
+        tuple of NormalizedCurve objects. The first will evaluate krg on
         the normalized Sg interval [0,1], the second will
         evaluate krog on the normalized So interval [0,1].
     """
-    krg_interp = interp1d(
-        curve.table["SG"],
-        curve.table["KRG"],
-        kind="linear",
-        bounds_error=False,
-        fill_value=(0.0, curve.table["KRG"].max()),
-    )
-
     # The internal dataframe might contain normalized
     # saturation values, but we do not want to assume they
     # are there or even correct, therefore we effectively
     # recalculate them
-    def sg_fn(sgn):
-        return curve.sgcr + sgn * (1.0 - curve.swl - curve.sgcr - curve.sorg)
-
-    def krg_fn(sgn):
-        return krg_interp(sg_fn(sgn))
-
-    kro_interp = interp1d(
-        1.0 - curve.table["SG"],
-        curve.table["KROG"],
-        kind="linear",
-        bounds_error=False,
-        fill_value=(0.0, curve.table["KROG"].max()),
+    krg_fn = _cached_curve(
+        curve,
+        "SG",
+        "KRG",
+        curve.sgcr,
+        1.0 - curve.swl - curve.sgcr - curve.sorg,
+    )
+    kro_fn = _cached_curve(
+        curve,
+        "SG",
+        "KROG",
+        curve.swl + curve.sorg,
+        1.0 - curve.swl - curve.sorg - curve.sgro,
+        reverse=True,
     )
-
-    def so_fn(son):
-        return (
-            curve.swl + curve.sorg + son * (1.0 - curve.swl - curve.sorg - curve.sgro)
-        )
-
-    def kro_fn(son):
-        return kro_interp(so_fn(son))
-
     return (krg_fn, kro_fn)
 
 
@@ -150,8 +263,9 @@ def normalize_pc(curve: Union[WaterOil, GasOil]) -> Callable:
         curve: An object with a table with a pc column
 
     Returns:
-        a lambda function that will evaluate pc on
-        the normalized interval [0,1]
+        a NormalizedCurve that will evaluate pc on
+        the normalized interval [0,1], or a function returning
+        zero if there is no pc column.
     """
     if isinstance(curve, WaterOil):
         sat_col = "SW"
@@ -164,28 +278,21 @@ def normalize_pc(curve: Union[WaterOil, GasOil]) -> Callable:
         # Return a dummy zero lambda
         return lambda sxn: 0
 
-    min_pc = curve.table["PC"].min()
-    max_pc = curve.table["PC"].max()
     min_sx = curve.table[sat_col].min()
     max_sx = curve.table[sat_col].max()
 
-    pc_interp = interp1d(
-        curve.table[sat_col],
-        curve.table["PC"],
-        kind="linear",
-        bounds_error=False,
-        fill_value=(max_pc, min_pc),  # This gives constant extrapolation outside [0, 1]
+    # Map from normalized value to real saturation domain, with constant
+    # extrapolation outside [0, 1]:
+    return _cached_curve(
+        curve,
+        sat_col,
+        "PC",
+        min_sx,
+        max_sx - min_sx,
+        left=curve.table["PC"].max(),
+        right=curve.table["PC"].min(),
     )
 
-    # Map from normalized value to real saturation domain:
-    def sx_fn(sxn):
-        return curve.table[sat_col].min() + sxn * (max_sx - min_sx)
-
-    def pc_fn(sxn):
-        return pc_interp(sx_fn(sxn))
-
-    return pc_fn
-
 
 def _interpolate_tags(
     low: Union[WaterOil, GasOil],
@@ -219,6 +326,79 @@ def _interpolate_tags(
     return tag
 
 
+def _fill_wateroil(
+    wo_new: WaterOil,
+    krw_fn: Callable,
+    kro_fn: Callable,
+    pc_fn: Callable,
+    krwend: float,
+    krwmax: float,
+    kroend: float,
+) -> None:
+    """Fill the table of an interpolated WaterOil object
+
+    Args:
+        wo_new: Object with the interpolated saturation endpoints.
+        krw_fn: Interpolated krw on the normalized Sw interval [0, 1].
+        kro_fn: Interpolated krow on the normalized So interval [0, 1].
+        pc_fn: Interpolated pc on the normalized Sw interval of the table.
+        krwend: Interpolated krw at 1 - sorw.
+        krwmax: Interpolated krw at Sw=1.
+        kroend: Interpolated krow at swl.
+    """
+    # Add interpolated relperm data in nonlinear parts:
+    wo_new.table["KRW"] = krw_fn(wo_new.swn)
+    wo_new.table["KROW"] = kro_fn(wo_new.son)
+
+    wo_new.set_endpoints_linearpart_krw(krwend=krwend, krwmax=krwmax)
+    wo_new.set_endpoints_linearpart_krow(kroend=kroend)
+
+    # We need a new fit-for-purpose normalized swnpc, that ignores
+    # the initial swnpc (swirr-influenced)
+    swn_pc_intp = (wo_new.table["SW"] - wo_new.table["SW"].min()) / (
+        wo_new.table["SW"].max() - wo_new.table["SW"].min()
+    )
+    wo_new.table["PC"] = pc_fn(swn_pc_intp)
+
+
+def _fill_gasoil(
+    go_new: GasOil,
+    krg_fn: Callable,
+    kro_fn: Callable,
+    pc_fn: Callable,
+    krgend: float,
+    krgmax: float,
+    kroend: float,
+    kromax: float,
+) -> None:
+    """Fill the table of an interpolated GasOil object
+
+    Args:
+        go_new: Object with the interpolated saturation endpoints.
+        krg_fn: Interpolated krg on the normalized Sg interval [0, 1].
+        kro_fn: Interpolated krog on the normalized So interval [0, 1].
+        pc_fn: Interpolated pc on the normalized Sg interval of the table.
+        krgend: Interpolated krg at 1 - swl - sorg.
+        krgmax: Interpolated krg at Sg=1 - swl.
+        kroend: Interpolated krog at sgro.
+        kromax: Interpolated krog at Sg=0.
+    """
+    # Add interpolated relperm data in nonlinear parts:
+    go_new.table["KRG"] = krg_fn(go_new.sgn)
+    go_new.table["KROG"] = kro_fn(go_new.son)
+
+    # We need a new fit-for-purpose normalized sgnpc
+    sgn_pc_intp = (go_new.table["SG"] - go_new.table["SG"].min()) / (
+        go_new.table["SG"].max() - go_new.table["SG"].min()
+    )
+    go_new.table["PC"] = pc_fn(sgn_pc_intp)
+
+    go_new.set_endpoints_linearpart_krog(kroend=kroend, kromax=kromax)
+
+    # Here we should have honored krgendanchor. Check github issue.
+    go_new.set_endpoints_linearpart_krg(krgend=krgend, krgmax=krgmax)
+
+
 def interpolate_wo(
     wo_low: WaterOil,
     wo_high: WaterOil,
@@ -254,8 +434,8 @@ def interpolate_wo(
     assert 0 <= parameter <= 1
     # Extrapolation is refused, but perhaps later implemented with truncation to (0,1)
 
-    # Running fast mode if both interpolants have fast mode
-    fast = wo_low.fast and wo_high.fast
+    # Validate as thoroughly as the most thoroughly validated interpolant:
+    validation = strictest([wo_low.validation, wo_high.validation])
 
     # Constructs functions that works on normalized saturation interval
     krw1, kro1 = normalize_nonlinpart_wo(wo_low)
@@ -280,26 +460,18 @@ def interpolate_wo(
 
     # Construct the new WaterOil object, with interpolated
     # endpoints:
-    wo_new = WaterOil(swl=swl_new, swcr=swcr_new, sorw=sorw_new, h=h, fast=fast)
-
-    # Add interpolated relperm data in nonlinear parts:
-    wo_new.table["KRW"] = weighted_value(
-        krw1(wo_new.table["SWN"]), krw2(wo_new.table["SWN"])
-    )
-    wo_new.table["KROW"] = weighted_value(
-        kro1(wo_new.table["SON"]), kro2(wo_new.table["SON"])
+    wo_new = WaterOil(
+        swl=swl_new, swcr=swcr_new, sorw=sorw_new, h=h, validation=validation
     )
 
-    wo_new.set_endpoints_linearpart_krw(krwend=krwend_new, krwmax=krwmax_new)
-    wo_new.set_endpoints_linearpart_krow(kroend=kroend_new)
-
-    # We need a new fit-for-purpose normalized swnpc, that ignores
-    # the initial swnpc (swirr-influenced)
-    wo_new.table["swn_pc_intp"] = (wo_new.table["SW"] - wo_new.table["SW"].min()) / (
-        wo_new.table["SW"].max() - wo_new.table["SW"].min()
-    )
-    wo_new.table["PC"] = weighted_value(
-        pc1(wo_new.table["swn_pc_intp"]), pc2(wo_new.table["swn_pc_intp"])
+    _fill_wateroil(
+        wo_new,
+        lambda swn: weighted_value(krw1(swn), krw2(swn)),
+        lambda son: weighted_value(kro1(son), kro2(son)),
+        lambda swn: weighted_value(pc1(swn), pc2(swn)),
+        krwend=krwend_new,
+        krwmax=krwmax_new,
+        kroend=kroend_new,
     )
 
     wo_new.tag = _interpolate_tags(wo_low, wo_high, parameter, tag)
@@ -342,8 +514,8 @@ def interpolate_go(
     assert 0 <= parameter <= 1
     # Extrapolation is refused, but perhaps later implemented with truncation to (0,1)
 
-    # Running fast mode if both interpolants have fast mode
-    fast = go_low.fast and go_high.fast
+    # Validate as thoroughly as the most thoroughly validated interpolant:
+    validation = strictest([go_low.validation, go_high.validation])
 
     # Constructs functions that works on normalized saturation interval
     krg1, kro1 = normalize_nonlinpart_go(go_low)
@@ -377,33 +549,475 @@ def interpolate_go(
     # Construct the new GasOil object, with interpolated
     # endpoints:
     go_new = GasOil(
-        swl=swl_new, sgcr=sgcr_new, sorg=sorg_new, sgro=sgro_new, h=h, fast=fast
+        swl=swl_new,
+        sgcr=sgcr_new,
+        sorg=sorg_new,
+        sgro=sgro_new,
+        h=h,
+        validation=validation,
     )
 
-    # Add interpolated relperm data in nonlinear parts:
-    go_new.table["KRG"] = weighted_value(
-        krg1(go_new.table["SGN"]), krg2(go_new.table["SGN"])
-    )
-    go_new.table["KROG"] = weighted_value(
-        kro1(go_new.table["SON"]), kro2(go_new.table["SON"])
-    )
-    go_new.table["PC"] = weighted_value(
-        pc1(go_new.table["SGN"]), pc2(go_new.table["SGN"])
+    _fill_gasoil(
+        go_new,
+        lambda sgn: weighted_value(krg1(sgn), krg2(sgn)),
+        lambda son: weighted_value(kro1(son), kro2(son)),
+        lambda sgn: weighted_value(pc1(sgn), pc2(sgn)),
+        krgend=krgend_new,
+        krgmax=krgmax_new,
+        kroend=kroend_new,
+        kromax=kromax_new,
     )
 
-    # We need a new fit-for-purpose normalized sgnpc
-    go_new.table["sgn_pc_intp"] = (go_new.table["SG"] - go_new.table["SG"].min()) / (
-        go_new.table["SG"].max() - go_new.table["SG"].min()
+    go_new.tag = _interpolate_tags(go_low, go_high, parameter, tag)
+
+    return go_new
+
+
+class CompiledCurves:
+    """Normalized curves for the low, base and high cases, resampled on a
+    common normalized saturation grid
+
+    The grid holds the knots of all three curves, so that any weighted
+    sum of the curves is exactly represented on it, and interpolation
+    is reduced to weighted sums of arrays.
+
+    Args:
+        curves: Normalized curves for the low, base and high cases.
+            Other callables (the zero function from normalize_pc()) are
+            treated as zero.
+    """
+
+    def __init__(self, curves: Sequence[Callable]) -> None:
+        normalized = [
+            curve
+            if isinstance(curve, NormalizedCurve)
+            else NormalizedCurve(np.array([0.0, 1.0]), np.zeros(2), 0.0, 1.0, 0.0, 0.0)
+            for curve in curves
+        ]
+        knots = np.sort(
+            np.concatenate(
+                [(curve.sat - curve.offset) / curve.scale for curve in normalized]
+            )
+        )
+        # Knots shared by the curves differ by roundoff after normalization,
+        # merge them to avoid near zero segment widths in curve_slope():
+        self.grid: np.ndarray = knots[np.append(True, np.diff(knots) > epsilon)]
+        self.values: np.ndarray = np.array([curve(self.grid) for curve in normalized])
+        self.left: np.ndarray = np.array([curve.left for curve in normalized])
+        self.right: np.ndarray = np.array([curve.right for curve in normalized])
+
+    def blend(self, other: int, parameter: float) -> NormalizedCurve:
+        """Interpolate between the base case and another case
+
+        Args:
+            other: Index of the other case, 0 for low and 2 for high.
+            parameter: Between 0 (base) and 1 (the other case).
+        """
+        return NormalizedCurve(
+            self.grid,
+            self.values[1] * (1.0 - parameter) + self.values[other] * parameter,
+            0.0,
+            1.0,
+            self.left[1] * (1.0 - parameter) + self.left[other] * parameter,
+            self.right[1] * (1.0 - parameter) + self.right[other] * parameter,
+        )
+
+    def difference(self, other: int) -> NormalizedCurve:
+        """The derivative of blend() with respect to its parameter,
+        the other case minus the base case"""
+        return NormalizedCurve(
+            self.grid,
+            self.values[other] - self.values[1],
+            0.0,
+            1.0,
+            self.left[other] - self.left[1],
+            self.right[other] - self.right[1],
+        )
+
+
+def curve_slope(
+    curve: NormalizedCurve, sn: np.ndarray, direction: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Derivative of a normalized curve with respect to the normalized
+    saturation
+
+    The curve is piecewise linear, and at its knots the slope on one of
+    the sides is used. Saturations closer to a knot than EPSILON, in
+    normalized saturation, are taken to be at the knot. The slope is zero
+    outside the knots.
+
+    Args:
+        curve: The curve to differentiate.
+        sn: Normalized saturation values.
+        direction: The slope to the left is used at knots where this
+            is negative, otherwise the slope to the right.
+    """
+    sn = np.asarray(sn, dtype=float)
+    sat = curve.offset + sn * curve.scale
+    if direction is None:
+        direction = np.ones(len(sn))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slopes = np.diff(curve.values) / np.diff(curve.sat)
+    # Roundoff in the normalized saturations must not select a segment on
+    # the wrong side of a knot:
+    tolerance = epsilon * abs(curve.scale)
+    segment = (
+        np.where(
+            np.asarray(direction) * curve.scale < 0,
+            np.searchsorted(curve.sat, sat - tolerance, side="left"),
+            np.searchsorted(curve.sat, sat + tolerance, side="right"),
+        )
+        - 1
     )
-    go_new.table["PC"] = weighted_value(
-        pc1(go_new.table["sgn_pc_intp"]), pc2(go_new.table["sgn_pc_intp"])
+    inside = (segment >= 0) & (segment < len(curve.sat) - 1)
+    slope = np.zeros(len(sat))
+    slope[inside] = slopes[segment[inside]]
+    return slope * curve.scale
+
+
+def _curve_derivative(
+    curves: "CompiledCurves",
+    other: int,
+    parameter: float,
+    sn: np.ndarray,
+    sn_rate: np.ndarray,
+) -> np.ndarray:
+    """Derivative with respect to the interpolation parameter of a blended
+    curve, where the normalized saturation sn changes with sn_rate
+
+    At kinks, the derivative is one-sided, for increasing parameter
+    except at parameter 1 where it is for decreasing parameter.
+    """
+    direction = sn_rate if parameter < 1 else -sn_rate
+    return (
+        curves.difference(other)(sn)
+        + curve_slope(curves.blend(other, parameter), sn, direction) * sn_rate
     )
 
-    go_new.set_endpoints_linearpart_krog(kroend=kroend_new, kromax=kromax_new)
 
-    # Here we should have honored krgendanchor. Check github issue.
-    go_new.set_endpoints_linearpart_krg(krgend=krgend_new, krgmax=krgmax_new)
+def _branch(parameter: float) -> Tuple[int, float, float]:
+    """Index of the case to interpolate towards from base, for a
+    parameter between -1 and 1, the interpolation parameter towards it,
+    and the derivative of that with respect to the parameter"""
+    assert -1 <= parameter <= 1
+    if parameter < 0:
+        return 0, -parameter, -1.0
+    return 2, parameter, 1.0
 
-    go_new.tag = _interpolate_tags(go_low, go_high, parameter, tag)
 
-    return go_new
+def _blend_endpoints(endpoints: np.ndarray, other: int, parameter: float):
+    """Interpolate endpoint values (one column pr. endpoint) between the
+    base case (row 1) and another case"""
+    return endpoints[1] * (1.0 - parameter) + endpoints[other] * parameter
+
+
+class CompiledWaterOil:
+    """Low, base and high WaterOil objects prepared for fast interpolation
+
+    The normalized curves of the three cases are resampled once on a
+    common grid, and the endpoints are stored in an array. Each
+    interpolation is then weighted sums of arrays, giving the same result
+    as interpolate_wo() up to floating point roundoff.
+
+    Changes to the objects after this is constructed are not seen.
+
+    Args:
+        cases: The low, base and high WaterOil objects, with known endpoints.
+    """
+
+    def __init__(self, cases: Sequence[WaterOil]) -> None:
+        curves = [normalize_nonlinpart_wo(case) for case in cases]
+        self.krw = CompiledCurves([krw for krw, _ in curves])
+        self.kro = CompiledCurves([kro for _, kro in curves])
+        self.pc = CompiledCurves([normalize_pc(case) for case in cases])
+        # Columns: swl, swcr, sorw, krwmax, krwend, kroend
+        self.endpoints: np.ndarray = np.array(
+            [
+                [
+                    case.swl,
+                    case.swcr,
+                    case.sorw,
+                    case.table["KRW"].max(),
+                    krw(1),
+                    kro(1),
+                ]
+                for case, (krw, kro) in zip(cases, curves)
+            ]
+        )
+        self.validations = [case.validation for case in cases]
+
+    def interpolate(
+        self, parameter: float, h: Optional[float] = None, tag: str = ""
+    ) -> WaterOil:
+        """Interpolate between the cases
+
+        Args:
+            parameter: Between -1 (low) and 1 (high), 0 is base.
+            h: Saturation step length in the interpolant.
+            tag: Tag for the interpolant.
+        """
+        other, parameter, _ = _branch(parameter)
+        validation = strictest([self.validations[1], self.validations[other]])
+        swl, swcr, sorw, krwmax, krwend, kroend = _blend_endpoints(
+            self.endpoints, other, parameter
+        )
+        wo_new = WaterOil(
+            swl=swl, swcr=swcr, sorw=sorw, h=h, tag=tag, validation=validation
+        )
+        _fill_wateroil(
+            wo_new,
+            self.krw.blend(other, parameter),
+            self.kro.blend(other, parameter),
+            self.pc.blend(other, parameter),
+            krwend=krwend,
+            krwmax=krwmax,
+            kroend=kroend,
+        )
+        return wo_new
+
+    def derivatives(self, parameter: float, wateroil: WaterOil) -> pd.DataFrame:
+        """Derivatives of an interpolated table with respect to the
+        interpolation parameter
+
+        The derivatives are at fixed water saturation, taken on the grid of
+        the interpolant, and computed in closed form: The interpolated
+        curves are linear in the parameter at fixed normalized saturation,
+        and the normalized saturation of a fixed saturation value moves with
+        the interpolated endpoints. Where the table has a kink in the
+        parameter, f.ex. at knots of the input curves and at parameter 0,
+        the one-sided derivative away from the base case is returned,
+        except at -1 and 1 where it is towards the base case.
+
+        Args:
+            parameter: Between -1 (low) and 1 (high), 0 is base.
+            wateroil: The interpolant for the parameter.
+
+        Returns:
+            Dataframe with the SW column of the interpolant, and derivatives
+            of its KRW, KROW and PC columns.
+        """
+        other, param, sign = _branch(parameter)
+        swl, swcr, sorw = wateroil.swl, wateroil.swcr, wateroil.sorw
+        _, _, _, krwmax, krwend, _ = _blend_endpoints(self.endpoints, other, param)
+        d_swl, d_swcr, d_sorw, d_krwmax, d_krwend, _ = (
+            self.endpoints[other] - self.endpoints[1]
+        )
+        sw = wateroil.table["SW"].values
+
+        # At fixed sw, the normalized saturations change with the endpoints:
+        swn = (sw - swcr) / (1 - swcr - sorw)
+        d_krw = _curve_derivative(
+            self.krw,
+            other,
+            param,
+            swn,
+            -np.interp(sw, [swcr, 1 - sorw], [d_swcr, -d_sorw]) / (1 - swcr - sorw),
+        )
+        linear = sw > 1 - sorw - epsilon
+        if sorw > 0:
+            swlin = (sw[linear] - (1 - sorw)) / sorw
+            d_krw[linear] = (
+                d_krwend * (1 - swlin)
+                + d_krwmax * swlin
+                + (krwmax - krwend) / sorw * d_sorw * (1 - swlin)
+            )
+        else:
+            d_krw[linear] = d_krwend
+        d_krw[sw < swcr] = 0
+
+        son = (1 - sw - sorw) / (1 - swl - sorw)
+        d_krow = _curve_derivative(
+            self.kro,
+            other,
+            param,
+            son,
+            np.interp(sw, [swl, 1 - sorw], [d_swl, -d_sorw]) / (1 - swl - sorw),
+        )
+        d_krow[linear] = 0
+
+        swnpc = (sw - sw.min()) / (sw.max() - sw.min())
+        d_pc = _curve_derivative(
+            self.pc,
+            other,
+            param,
+            swnpc,
+            -np.interp(sw, [sw.min(), sw.max()], [d_swl, 0]) / (sw.max() - sw.min()),
+        )
+
+        derivatives = pd.DataFrame(
+            {"SW": sw, "KRW": sign * d_krw, "KROW": sign * d_krow, "PC": sign * d_pc}
+        )
+        # Copies of the low, base or high objects can lack columns:
+        return derivatives[[col for col in derivatives if col in wateroil.table]]
+
+
+class CompiledGasOil:
+    """Low, base and high GasOil objects prepared for fast interpolation
+
+    See CompiledWaterOil, the result is as from interpolate_go().
+
+    Args:
+        cases: The low, base and high GasOil objects, with known endpoints.
+    """
+
+    def __init__(self, cases: Sequence[GasOil]) -> None:
+        curves = [normalize_nonlinpart_go(case) for case in cases]
+        self.krg = CompiledCurves([krg for krg, _ in curves])
+        self.kro = CompiledCurves([kro for _, kro in curves])
+        self.pc = CompiledCurves([normalize_pc(case) for case in cases])
+        # Columns: swl, sgcr, sorg, sgro, krgmax, krgend, kromax, kroend
+        self.endpoints: np.ndarray = np.array(
+            [
+                [
+                    case.swl,
+                    case.sgcr,
+                    case.sorg,
+                    case.sgro,
+                    case.table["KRG"].max(),
+                    krg(1),
+                    case.table["KROG"].max(),
+                    kro(1),
+                ]
+                for case, (krg, kro) in zip(cases, curves)
+            ]
+        )
+        self.validations = [case.validation for case in cases]
+
+    def interpolate(
+        self, parameter: float, h: Optional[float] = None, tag: str = ""
+    ) -> GasOil:
+        """Interpolate between the cases
+
+        Args:
+            parameter: Between -1 (low) and 1 (high), 0 is base.
+            h: Saturation step length in the interpolant.
+            tag: Tag for the interpolant.
+        """
+        other, parameter, _ = _branch(parameter)
+        validation = strictest([self.validations[1], self.validations[other]])
+        (
+            swl,
+            sgcr,
+            sorg,
+            sgro,
+            krgmax,
+            krgend,
+            kromax,
+            kroend,
+        ) = _blend_endpoints(self.endpoints, other, parameter)
+
+        if not (np.isclose(sgro, sgcr) or np.isclose(sgro, 0.0)):
+            raise ValueError(
+                f"Interpolated sgro ({sgro}) not equal "
+                f"to zero or interpolated sgcr ({sgcr})"
+            )
+
+        go_new = GasOil(
+            swl=swl,
+            sgcr=sgcr,
+            sorg=sorg,
+            sgro=sgro,
+            h=h,
+            tag=tag,
+            validation=validation,
+        )
+        _fill_gasoil(
+            go_new,
+            self.krg.blend(other, parameter),
+            self.kro.blend(other, parameter),
+            self.pc.blend(other, parameter),
+            krgend=krgend,
+            krgmax=krgmax,
+            kroend=kroend,
+            kromax=kromax,
+        )
+        return go_new
+
+    def derivatives(self, parameter: float, gasoil: GasOil) -> pd.DataFrame:
+        """Derivatives of an interpolated table with respect to the
+        interpolation parameter
+
+        See CompiledWaterOil.derivatives(), the derivatives are at fixed gas
+        saturation.
+
+        Args:
+            parameter: Between -1 (low) and 1 (high), 0 is base.
+            gasoil: The interpolant for the parameter.
+
+        Returns:
+            Dataframe with the SG column of the interpolant, and derivatives
+            of its KRG, KROG and PC columns.
+        """
+        other, param, sign = _branch(parameter)
+        swl, sgcr, sorg, sgro = gasoil.swl, gasoil.sgcr, gasoil.sorg, gasoil.sgro
+        (_, _, _, _, krgmax, krgend, kromax, kroend) = _blend_endpoints(
+            self.endpoints, other, param
+        )
+        d_swl, d_sgcr, d_sorg, d_sgro, d_krgmax, d_krgend, d_kromax, d_kroend = (
+            self.endpoints[other] - self.endpoints[1]
+        )
+        sg = gasoil.table["SG"].values
+
+        # See CompiledWaterOil.derivatives()
+        if gasoil.krgendanchor == "sorg":
+            sgend = 1 - swl - sorg
+            d_sgend = -d_swl - d_sorg
+            linear = sg >= 1 - (sorg + swl + epsilon)
+        else:
+            sgend = 1 - swl
+            d_sgend = -d_swl
+            linear = sg > 1 - (swl + epsilon)
+        sgn = (sg - sgcr) / (sgend - sgcr)
+        d_krg = _curve_derivative(
+            self.krg,
+            other,
+            param,
+            sgn,
+            -np.interp(sg, [sgcr, sgend], [d_sgcr, d_sgend]) / (sgend - sgcr),
+        )
+        if gasoil.krgendanchor == "sorg":
+            sglin = (sg[linear] - sgend) / sorg
+            d_sglin = np.interp(sg[linear], [sgend, 1 - swl], [d_sgend, -d_swl])
+            d_krg[linear] = (
+                d_krgend * (1 - sglin)
+                + d_krgmax * sglin
+                - (krgmax - krgend) / sorg * d_sglin
+            )
+        else:
+            d_krg[linear] = d_krgend
+        d_krg[sg <= sgcr] = 0
+
+        son = (1 - sg - sorg - swl) / (1 - sorg - swl - sgro)
+        d_krog = _curve_derivative(
+            self.kro,
+            other,
+            param,
+            son,
+            np.interp(sg, [sgro, 1 - sorg - swl], [d_sgro, -d_sorg - d_swl])
+            / (1 - sorg - swl - sgro),
+        )
+        if sgro > 0:
+            linear = (sg > 0) & (sg < sgro - epsilon)
+            sglin = sg[linear] / sgro
+            d_krog[linear] = (
+                d_kromax * (1 - sglin)
+                + d_kroend * sglin
+                - (kroend - kromax) / sgro * d_sgro * sglin
+            )
+        d_krog[sg == 0] = d_kromax
+        d_krog[sg > 1 - sorg - swl - epsilon] = 0
+
+        sgnpc = (sg - sg.min()) / (sg.max() - sg.min())
+        d_pc = _curve_derivative(
+            self.pc,
+            other,
+            param,
+            sgnpc,
+            -np.interp(sg, [sg.min(), sg.max()], [0, -d_swl]) / (sg.max() - sg.min()),
+        )
+
+        derivatives = pd.DataFrame(
+            {"SG": sg, "KRG": sign * d_krg, "KROG": sign * d_krog, "PC": sign * d_pc}
+        )
+        # Copies of the low, base or high objects can lack columns:
+        return derivatives[[col for col in derivatives if col in gasoil.table]]
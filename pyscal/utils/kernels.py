@@ -0,0 +1,339 @@
+"""Numerical kernels for the innermost loops in pyscal
+
+The kernels operate on plain numpy arrays, and are used for evaluating
+Corey and LET parametrizations, for filling in linear sections of
+curves, for enforcing strict monotonicity in output and for locating
+crosspoints.
+
+Two backends are available:
+
+ * ``numpy``: Vectorized numpy implementations, always available.
+
+ * ``numba``: The same computations as explicit loops, compiled with
+   `Numba <https://numba.pydata.org>`_ on first use. Requires numba to
+   be installed (``pip install pyscal[numba]``).
+
+The default backend is ``auto``, which selects ``numba`` if it can be
+imported, and ``numpy`` otherwise. The backend can be changed at runtime
+with :func:`set_backend`, or through the environment variable
+``PYSCAL_KERNELS`` when pyscal is imported. Both backends give the same
+results up to floating point roundoff.
+"""
+
+import functools
+import logging
+import os
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from pyscal.constants import EPSILON as epsilon
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ["auto", "numpy", "numba"]
+
+_BACKEND: str = "auto"
+
+# Compiled numba kernels, compiled on first use:
+_COMPILED: Dict[str, Callable] = {}
+
+# Tolerance for a zero difference in crosspoint(), as in np.isclose()
+CROSSPOINT_ATOL: float = 1e-8
+
+
+@functools.lru_cache(maxsize=1)
+def _numba_available() -> bool:
+    """Check if numba can be imported"""
+    try:
+        import numba  # noqa: F401 pylint: disable=import-outside-toplevel,unused-import
+    except ImportError:
+        return False
+    return True
+
+
+def set_backend(backend: str) -> None:
+    """Set the backend used for the numerical kernels
+
+    Args:
+        backend: One of "auto", "numpy" or "numba".
+    """
+    # pylint: disable=global-statement
+    global _BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown kernel backend {backend}, use one of {BACKENDS}")
+    if backend == "numba" and not _numba_available():
+        raise ImportError("numba is required for the numba kernel backend")
+    _BACKEND = backend
+
+
+def get_backend() -> str:
+    """Return the backend in use, either "numpy" or "numba"
+
+    If the backend is set to "auto", this resolves it.
+    """
+    if _BACKEND == "auto":
+        return "numba" if _numba_available() else "numpy"
+    return _BACKEND
+
+
+def get(name: str, backend: Optional[str] = None) -> Callable:
+    """Return a kernel function for a backend
+
+    Args:
+        name: Name of the kernel, one of the keys in NUMPY_KERNELS.
+        backend: Backend to use, if not the active one.
+
+    Returns:
+        The kernel function, compiled if the backend is numba.
+    """
+    if backend is None:
+        backend = get_backend()
+    elif backend == "auto":
+        backend = "numba" if _numba_available() else "numpy"
+    if backend == "numpy":
+        return NUMPY_KERNELS[name]
+    if name not in _COMPILED:
+        import numba  # pylint: disable=import-outside-toplevel
+
+        logger.debug("Compiling %s kernel with numba", name)
+        _COMPILED[name] = numba.njit(cache=True)(LOOP_KERNELS[name])
+    return _COMPILED[name]
+
+
+def corey(sn: np.ndarray, exponent: float, end: float) -> np.ndarray:
+    """Corey parametrization, end * sn^exponent
+
+    Args:
+        sn: Normalized saturation values.
+        exponent: The Corey exponent.
+        end: Value at sn=1.
+    """
+    # Negative sn gives nan for non-integer exponents, like in pandas:
+    with np.errstate(invalid="ignore"):
+        return _corey(sn, exponent, end)
+
+
+def _corey(sn: np.ndarray, exponent: float, end: float) -> np.ndarray:
+    """Corey parametrization, for numba"""
+    return end * np.power(sn, exponent)
+
+
+def let(  # pylint: disable=invalid-name
+    sn: np.ndarray, l: float, e: float, t: float, end: float
+) -> np.ndarray:
+    """LET parametrization, end * sn^l / (sn^l + e (1 - sn)^t)
+
+    Args:
+        sn: Normalized saturation values.
+        l: L parameter
+        e: E parameter
+        t: T parameter
+        end: Value at sn=1.
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return _let(sn, l, e, t, end)
+
+
+def _let(  # pylint: disable=invalid-name
+    sn: np.ndarray, l: float, e: float, t: float, end: float
+) -> np.ndarray:
+    """LET parametrization, for numba"""
+    return end * np.power(sn, l) / (np.power(sn, l) + e * np.power(1 - sn, t))
+
+
+def linear_section(x: np.ndarray, y: np.ndarray, first: int, last: int) -> np.ndarray:
+    """Replace y values between two indices with a linear interpolation
+    in x between the values at the indices.
+
+    Args:
+        x: Increasing x values, typically saturation.
+        y: y values, the values at first and last are kept.
+        first: Index of the first point of the linear section.
+        last: Index of the last point of the linear section.
+
+    Returns:
+        Copy of y with the linear section filled in.
+    """
+    y = y.copy()
+    y[first + 1 : last] = np.interp(
+        x[first + 1 : last], [x[first], x[last]], [y[first], y[last]]
+    )
+    return y
+
+
+def _linear_section_loop(
+    x: np.ndarray, y: np.ndarray, first: int, last: int
+) -> np.ndarray:
+    """Loop version of linear_section(), using the formula of np.interp()"""
+    y = y.copy()
+    slope = (y[last] - y[first]) / (x[last] - x[first])
+    for idx in range(first + 1, last):
+        y[idx] = slope * (x[idx] - x[first]) + y[first]
+    return y
+
+
+def monotone_fix(
+    values: np.ndarray, sign: int, digits: int, lower: float, upper: float
+) -> Tuple[np.ndarray, int]:
+    """Modify values so that they are strictly monotone when rounded to
+    a number of digits.
+
+    This is the iteration in
+    :func:`pyscal.utils.monotonicity.modify_dframe_monotonicity`: Values
+    that are constant, after rounding, are nudged by one digit until
+    there are no such values left. Constant values at the limits
+    are allowed.
+
+    Args:
+        values: Values to modify.
+        sign: 1 for increasing, -1 for decreasing values.
+        digits: Number of digits in the output.
+        lower: Lower limit, use -np.inf for no limit.
+        upper: Upper limit, use np.inf for no limit.
+
+    Returns:
+        Modified copy of values, and the number of iterations used.
+    """
+    values = values.copy()
+    constants = _rows_to_be_fixed(values, sign, digits, lower, upper)
+    iterations = 0
+    while constants.any():
+        iterations += 1
+        assert iterations <= 2 * len(values), "Too many iterations for monotonicity fix"
+        values[constants] = values[constants] + sign / np.power(10.0, digits) - epsilon
+        if sign > 0:
+            values = np.maximum.accumulate(values)
+        else:
+            values = np.minimum.accumulate(values)
+        values = np.clip(values, lower, upper)
+        constants = _rows_to_be_fixed(values, sign, digits, lower, upper)
+    return values, iterations
+
+
+def _rows_to_be_fixed(
+    values: np.ndarray, sign: int, digits: int, lower: float, upper: float
+) -> np.ndarray:
+    """Boolean array of values that are constant, for monotone_fix()"""
+    accuracy = 1.0 / np.power(10.0, digits) - epsilon
+    constants = np.zeros(len(values), dtype=bool)
+    diffs = np.diff(np.round(values, digits + 1))
+    if sign > 0:
+        constants[1:] = diffs < accuracy
+    else:
+        constants[1:] = diffs > -accuracy
+    return constants & (values < upper - accuracy) & (values > lower + accuracy)
+
+
+def _monotone_fix_loop(
+    values: np.ndarray, sign: int, digits: int, lower: float, upper: float
+) -> Tuple[np.ndarray, int]:
+    """Loop version of monotone_fix()"""
+    accuracy = 1.0 / np.power(10.0, digits) - epsilon
+    values = values.copy()
+    rounded = np.empty_like(values)
+    constants = np.zeros(len(values), dtype=np.bool_)
+    iterations = 0
+    while True:
+        np.round(values, digits + 1, rounded)
+        anyconstant = False
+        for idx in range(1, len(values)):
+            diff = rounded[idx] - rounded[idx - 1]
+            constant = diff < accuracy if sign > 0 else diff > -accuracy
+            constants[idx] = (
+                constant
+                and values[idx] < upper - accuracy
+                and values[idx] > lower + accuracy
+            )
+            anyconstant = anyconstant or constants[idx]
+        if not anyconstant:
+            return values, iterations
+        iterations += 1
+        assert iterations <= 2 * len(values), "Too many iterations for monotonicity fix"
+        for idx in range(1, len(values)):
+            if constants[idx]:
+                values[idx] = values[idx] + sign / np.power(10.0, digits) - epsilon
+        for idx in range(len(values)):
+            if idx > 0:
+                if sign > 0:
+                    values[idx] = max(values[idx], values[idx - 1])
+                else:
+                    values[idx] = min(values[idx], values[idx - 1])
+        for idx in range(len(values)):
+            values[idx] = min(max(values[idx], lower), upper)
+
+
+def crosspoint(sat: np.ndarray, kr1: np.ndarray, kr2: np.ndarray) -> float:
+    """Locate the saturation value where two curves cross
+
+    The saturation value is interpolated linearly as a function of the
+    difference kr1 - kr2. If the difference is zero at some saturation
+    values, the first of these is returned.
+
+    Args:
+        sat: Saturation values.
+        kr1: Values of the first curve.
+        kr2: Values of the second curve.
+
+    Returns:
+        The saturation value at the crossing, or nan if the difference
+        does not change sign.
+    """
+    krdiff = kr1 - kr2
+    zeros = np.abs(krdiff) <= CROSSPOINT_ATOL
+    if zeros.any():
+        return float(sat[np.argmax(zeros)])
+    order = np.argsort(krdiff, kind="mergesort")
+    krdiff = krdiff[order]
+    if not krdiff[0] < 0 < krdiff[-1]:
+        return np.nan
+    return float(np.interp(0.0, krdiff, sat[order]))
+
+
+def _crosspoint_loop(sat: np.ndarray, kr1: np.ndarray, kr2: np.ndarray) -> float:
+    """Loop version of crosspoint()
+
+    Finds the closest difference values below and above zero, which are
+    the neighbours of zero in the sorted differences. For repeated
+    differences, the same rows as in np.interp() are picked.
+    """
+    below = -np.inf
+    above = np.inf
+    sat_below = np.nan
+    sat_above = np.nan
+    for idx in range(len(sat)):  # pylint: disable=consider-using-enumerate
+        krdiff = kr1[idx] - kr2[idx]
+        if abs(krdiff) <= CROSSPOINT_ATOL:
+            return sat[idx]
+        if below <= krdiff < 0:
+            below = krdiff
+            sat_below = sat[idx]
+        elif 0 < krdiff < above:
+            above = krdiff
+            sat_above = sat[idx]
+    if np.isnan(sat_below) or np.isnan(sat_above):
+        return np.nan
+    slope = (sat_above - sat_below) / (above - below)
+    return slope * (0.0 - below) + sat_below
+
+
+NUMPY_KERNELS: Dict[str, Callable] = {
+    "corey": corey,
+    "let": let,
+    "linear_section": linear_section,
+    "monotone_fix": monotone_fix,
+    "crosspoint": crosspoint,
+}
+
+# Kernels written as loops for numba. The array expressions in the
+# parametrizations are supported by numba as they are.
+LOOP_KERNELS: Dict[str, Callable] = {
+    "corey": _corey,
+    "let": _let,
+    "linear_section": _linear_section_loop,
+    "monotone_fix": _monotone_fix_loop,
+    "crosspoint": _crosspoint_loop,
+}
+
+if os.environ.get("PYSCAL_KERNELS"):
+    set_backend(os.environ["PYSCAL_KERNELS"])
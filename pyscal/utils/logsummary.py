@@ -0,0 +1,143 @@
+"""Aggregation of repeated log messages from pyscal
+
+In decks with thousands of SATNUMs, the same warning is often emitted for
+many of them. Inside :func:`aggregated_logging`, each distinct message
+template is only let through a limited number of times, while all
+occurrences are counted, in total and pr. SATNUM (see
+:func:`pyscal.utils.stats.satnum_context`). A summary of the suppressed
+messages is logged when the block is left.
+
+Example::
+
+  import pyscal
+  with pyscal.aggregated_logging():
+      ...  # Generate many tables
+"""
+
+import collections
+import contextlib
+import logging
+from typing import Counter, Dict, Iterator, Optional, Tuple
+
+from . import stats
+
+logger = logging.getLogger(__name__)
+
+# Key for a message template: (levelname, logger name, unformatted message)
+MessageKey = Tuple[str, str, str]
+
+_ACTIVE: Optional["AggregatingFilter"] = None
+
+
+class AggregatingFilter(logging.Filter):
+    """Logging filter counting and deduplicating messages
+
+    Messages are identified by their unformatted template (the msg
+    attribute of the log record), so that the string formatting of
+    suppressed messages is never done.
+
+    Args:
+        max_repeats: Number of times each message template is let through.
+    """
+
+    def __init__(self, max_repeats: int = 1) -> None:
+        super().__init__()
+        self.max_repeats = max_repeats
+        self.counts: Counter[MessageKey] = collections.Counter()
+        self.satnum_counts: Dict[MessageKey, Counter[int]] = collections.defaultdict(
+            collections.Counter
+        )
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.levelname, record.name, str(record.msg))
+        self.counts[key] += 1
+        satnum = stats.current_satnum()
+        if satnum is not None:
+            self.satnum_counts[key][satnum] += 1
+        return self.counts[key] <= self.max_repeats
+
+    def suppressed(self) -> Dict[MessageKey, int]:
+        """Return the number of suppressed messages pr. message template"""
+        return {
+            key: count - self.max_repeats
+            for key, count in self.counts.items()
+            if count > self.max_repeats
+        }
+
+    def format_summary(self, top: int = 5) -> str:
+        """Make a compact summary of the repeated messages
+
+        Args:
+            top: Number of SATNUMs to list for each message, those
+                with the highest counts are listed.
+
+        Returns:
+            Multiline string, empty if no messages were suppressed.
+        """
+        suppressed = self.suppressed()
+        if not suppressed:
+            return ""
+        lines = [f"Suppressed {sum(suppressed.values())} repeated log messages:"]
+        for key, _ in sorted(suppressed.items(), key=lambda item: -item[1]):
+            levelname, name, msg = key
+            line = f"  {self.counts[key]} x {levelname}:{name}:{msg}"
+            satnum_counts = self.satnum_counts.get(key)
+            if satnum_counts:
+                line += " (SATNUM " + ", ".join(
+                    f"{satnum}: {count}"
+                    for satnum, count in satnum_counts.most_common(top)
+                )
+                if len(satnum_counts) > top:
+                    line += f", ... {len(satnum_counts)} SATNUMs in total"
+                line += ")"
+            lines.append(line)
+        return "\n".join(lines) + "\n"
+
+
+def _pyscal_loggers() -> Iterator[logging.Logger]:
+    """Yield all existing loggers in the pyscal namespace"""
+    for name in list(logging.Logger.manager.loggerDict):
+        if name == "pyscal" or name.startswith("pyscal."):
+            yield logging.getLogger(name)
+
+
+def register(pyscal_logger: logging.Logger) -> None:
+    """Attach the active filter, if any, to a pyscal logger
+
+    Used by getLogger_pyscal() for loggers created inside
+    aggregated_logging().
+    """
+    if _ACTIVE is not None:
+        pyscal_logger.addFilter(_ACTIVE)
+
+
+@contextlib.contextmanager
+def aggregated_logging(
+    max_repeats: int = 1, summary: bool = True
+) -> Iterator[AggregatingFilter]:
+    """Deduplicate log messages from pyscal inside a with-block
+
+    Args:
+        max_repeats: Number of times each distinct message template is
+            logged, further occurrences are only counted.
+        summary: If True, the counts of suppressed messages are logged as a
+            warning when the block is left.
+
+    Yields:
+        The filter doing the counting, for inspection.
+    """
+    # pylint: disable=global-statement
+    global _ACTIVE
+    previous = _ACTIVE
+    aggregator = AggregatingFilter(max_repeats)
+    _ACTIVE = aggregator
+    for pyscal_logger in _pyscal_loggers():
+        pyscal_logger.addFilter(aggregator)
+    try:
+        yield aggregator
+    finally:
+        _ACTIVE = previous
+        for pyscal_logger in _pyscal_loggers():
+            pyscal_logger.removeFilter(aggregator)
+        if summary and aggregator.suppressed():
+            logger.warning("%s", aggregator.format_summary().rstrip())
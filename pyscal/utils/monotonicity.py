@@ -14,6 +14,7 @@ import numpy as np
 import pandas as pd
 
 from pyscal.constants import EPSILON as epsilon
+from pyscal.utils import kernels, stats
 
 logger = logging.getLogger(__name__)
 
@@ -106,35 +107,30 @@ def modify_dframe_monotonicity(
             if max_value < accuracy and monotonicity[col]["allowzero"]:
                 continue
 
-        constants = rows_to_be_fixed(dframe[col], monotonicity[col], digits)
-        iterations = 0
+        # Nudge constant rows, see rows_to_be_fixed(), and ensure nonstrict
+        # monotonicity and clip as in clip_accumulate() until no rows are
+        # left to fix:
         sign = monotonicity[col]["sign"]
-        while constants.any():
-            iterations += 1
-
-            assert iterations <= 2 * len(
-                dframe[col]
-            ), "Too many iterations for monotonicity fix"
-
-            dframe.loc[constants, col] = (
-                dframe.loc[constants, col] + sign / 10.0 ** digits - epsilon
-            )
-
-            # Ensure nonstrict monotonicity and clips after each modification:
-            dframe[col] = clip_accumulate(dframe[col], monotonicity[col])
+        dframe[col], iterations = kernels.get("monotone_fix")(
+            dframe[col].values,
+            sign,
+            digits,
+            monotonicity[col].get("lower", -np.inf),
+            monotonicity[col].get("upper", np.inf),
+        )
 
-            # Evaluate what is left to fix:
-            constants = rows_to_be_fixed(dframe[col], monotonicity[col], digits)
+        stats.increment("monotonicity_iterations", iterations)
 
         # Warn if more iterations than 5% of the rows
         # (number of iterations do not necessarily correspond with
         # number of changed rows)
         if float(iterations) / float(len(dframe[col])) > 0.05:
+            stats.increment("monotonicity_slow_fixes")
             logger.warning(
                 "Needed %s iterations on column %s of length %s",
-                str(iterations),
+                iterations,
                 col,
-                str(len(dframe[col])),
+                len(dframe[col]),
             )
 
         # Assert that we have successfully managed to force monotonicity
@@ -0,0 +1,34 @@
+"""Pickling of pyscal objects that have a logger"""
+
+from typing import Optional
+
+from pyscal import getLogger_pyscal
+
+
+class PicklableLogger(object):
+    """Mixin for objects with a logger from getLogger_pyscal()
+
+    Loggers can only be pickled from Python 3.7, so the logger is left out
+    when pickling. It is fetched again when unpickling, f.ex. in worker
+    processes or in copy.deepcopy(), with the same verbose, debug and
+    output arguments as the object was initialized with.
+    """
+
+    def _set_logger(self, args: Optional[dict] = None) -> None:
+        """Set the logger for the module of the class
+
+        Args:
+            args: Verbose, debug and output arguments from CLI
+                to create logger that splits log messages to stdout and stderr
+        """
+        self._logger_args = args
+        self.logger: Optional[object] = getLogger_pyscal(type(self).__module__, args)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state.pop("logger", None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._set_logger(state.get("_logger_args"))
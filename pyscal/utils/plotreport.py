@@ -0,0 +1,288 @@
+"""Plot reports for visual quality control of many SATNUMs
+
+One page is rendered pr. SATNUM, with one panel pr. curve set (water-oil,
+gas-oil, gas-water and capillary pressure when nonzero). For
+SCALrecommendation objects the low, base and high cases are overlaid
+on the same panels.
+
+Pages are rendered with the Agg backend on standalone figures, so
+pyplot state is left untouched and no display is needed. The pages can
+be rendered in worker processes, while the calling process assembles
+them, in order, into either a multipage PDF or an HTML index of PNG
+images.
+
+Example::
+
+  from pyscal.utils.plotreport import plot_report
+
+  plot_report(pyscal_list.pyscal_list, "relperm.pdf", processes=8)
+"""
+
+import html
+import io
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple, Union
+
+from pyscal import GasOil, GasWater, SCALrecommendation, WaterOil, WaterOilGas
+from pyscal.utils.workers import satnum_map
+
+logger = logging.getLogger(__name__)
+
+CASE_COLORS: Dict[str, str] = {"low": "red", "base": "black", "high": "blue"}
+
+REPORT_FORMATS: List[str] = [".pdf", ".html"]
+
+
+def _panels(pyscal_obj: Any) -> List[Tuple[str, Callable]]:
+    """The plot functions for the curve sets in one object, with panel titles"""
+    panels: List[Tuple[str, Callable]] = []
+    wateroil = None
+    gasoil = None
+    if isinstance(pyscal_obj, WaterOil):
+        wateroil = pyscal_obj
+    elif isinstance(pyscal_obj, GasOil):
+        gasoil = pyscal_obj
+    elif isinstance(pyscal_obj, WaterOilGas):
+        wateroil = pyscal_obj.wateroil
+        gasoil = pyscal_obj.gasoil
+    elif isinstance(pyscal_obj, GasWater):
+        panels.append(("Gas-water", pyscal_obj.plotkrwkrg))
+        wateroil = pyscal_obj.wateroil
+    else:
+        raise TypeError(f"Can't plot {type(pyscal_obj)}")
+
+    if wateroil is not None and not isinstance(pyscal_obj, GasWater):
+        panels.append(("Water-oil", wateroil.plotkrwkrow))
+    if gasoil is not None:
+        panels.append(("Gas-oil", gasoil.plotkrgkrog))
+    if (
+        wateroil is not None
+        and "PC" in wateroil.table
+        and (wateroil.table["PC"] != 0).any()
+    ):
+        panels.append(("Capillary pressure", wateroil.plotpc))
+    return panels
+
+
+def render_page(
+    pyscal_obj: Any,
+    satnum: int,
+    logyscale: bool = False,
+    dpi: int = 100,
+    decimate: bool = False,
+):
+    """Render the page for one SATNUM
+
+    Args:
+        pyscal_obj: WaterOil, GasOil, GasWater, WaterOilGas or
+            SCALrecommendation.
+        satnum: Used in the page title.
+        logyscale: Set to True to plot relative permeabilities on a
+            logarithmic axis.
+        dpi: Resolution of the figure.
+        decimate: Set to True to draw the curves through only as many
+            table rows as needed at this resolution.
+
+    Returns:
+        matplotlib Figure, with an Agg canvas.
+    """
+    # pylint: disable=import-outside-toplevel
+    # Lazy import of matplotlib for speed reasons.
+    import matplotlib.style
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    if isinstance(pyscal_obj, SCALrecommendation):
+        cases = [
+            ("low", pyscal_obj.low),
+            ("base", pyscal_obj.base),
+            ("high", pyscal_obj.high),
+        ]
+    else:
+        cases = [("", pyscal_obj)]
+    case_panels = [(case, _panels(case_obj)) for case, case_obj in cases]
+    titles = list(
+        dict.fromkeys(title for _, panels in case_panels for title, _ in panels)
+    )
+
+    with matplotlib.style.context("ggplot"):
+        figure = Figure(figsize=(4.5 * len(titles), 4.5), dpi=dpi)
+        FigureCanvasAgg(figure)
+        axes = figure.subplots(1, len(titles), squeeze=False)[0]
+        for case, panels in case_panels:
+            for title, plotfunc in panels:
+                plotfunc(
+                    mpl_ax=axes[titles.index(title)],
+                    color=CASE_COLORS.get(case, "blue"),
+                    label=case,
+                    logyscale=logyscale and title != "Capillary pressure",
+                    decimate=decimate,
+                )
+        for mpl_ax, title in zip(axes, titles):
+            mpl_ax.set_title(title)
+            if len(cases) > 1:
+                mpl_ax.legend(
+                    handles=[
+                        line
+                        for line in mpl_ax.get_lines()
+                        if line.get_label() in CASE_COLORS
+                    ]
+                )
+        tag = getattr(pyscal_obj, "tag", None)
+        figure.suptitle(f"SATNUM {satnum}" + (f": {tag}" if tag else ""))
+        figure.tight_layout(rect=(0, 0, 1, 0.95))
+    return figure
+
+
+def render_png(
+    pyscal_obj: Any,
+    satnum: int,
+    logyscale: bool = False,
+    dpi: int = 100,
+    decimate: bool = False,
+) -> bytes:
+    """Render the page for one SATNUM as a PNG image, see render_page()"""
+    figure = render_page(
+        pyscal_obj, satnum, logyscale=logyscale, dpi=dpi, decimate=decimate
+    )
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format="png", dpi=dpi)
+    return buffer.getvalue()
+
+
+def _use_agg() -> None:
+    """Select the Agg backend in a worker process"""
+    # pylint: disable=import-outside-toplevel
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def _render_satnum(shared: Tuple[Sequence[Any], bool, int, bool], idx: int) -> bytes:
+    """Render the page for one SATNUM as a PNG image"""
+    pyscal_objects, logyscale, dpi, decimate = shared
+    return render_png(
+        pyscal_objects[idx], idx + 1, logyscale=logyscale, dpi=dpi, decimate=decimate
+    )
+
+
+def _pages(
+    pyscal_objects: Sequence[Any],
+    logyscale: bool,
+    dpi: int,
+    decimate: bool,
+    processes: int,
+) -> Iterator[bytes]:
+    """Yield the PNG image for each SATNUM in order"""
+    return satnum_map(
+        _render_satnum,
+        (pyscal_objects, logyscale, dpi, decimate),
+        len(pyscal_objects),
+        processes=processes,
+        initializer=_use_agg,
+    )
+
+
+def _write_pdf(path: Path, pages: Iterator[bytes], dpi: int) -> None:
+    """Write PNG images as pages in a PDF file"""
+    # pylint: disable=import-outside-toplevel
+    import matplotlib.image
+    from matplotlib.backends.backend_pdf import PdfPages
+    from matplotlib.figure import Figure
+
+    with PdfPages(path) as pdf:
+        for png in pages:
+            image = matplotlib.image.imread(io.BytesIO(png), format="png")
+            height, width = image.shape[:2]
+            page = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+            page.figimage(image)
+            pdf.savefig(page, dpi=dpi)
+
+
+def _write_html(
+    path: Path, pages: Iterator[bytes], pyscal_objects: Sequence[Any]
+) -> None:
+    """Write PNG images to a directory next to an HTML index of them"""
+    image_dir = path.parent / (path.stem + "_files")
+    image_dir.mkdir(parents=True, exist_ok=True)
+    figures = []
+    for satnum, png in enumerate(pages, start=1):
+        image_name = f"{image_dir.name}/satnum-{satnum}.png"
+        (path.parent / image_name).write_bytes(png)
+        tag = getattr(pyscal_objects[satnum - 1], "tag", None)
+        caption = html.escape(f"SATNUM {satnum}" + (f": {tag}" if tag else ""))
+        figures.append(
+            f'<figure><a href="{image_name}"><img src="{image_name}" '
+            f'alt="SATNUM {satnum}" loading="lazy"></a>'
+            f"<figcaption>{caption}</figcaption></figure>"
+        )
+    title = html.escape(path.stem)
+    path.write_text(
+        "\n".join(
+            [
+                "<!DOCTYPE html>",
+                "<html>",
+                f'<head><meta charset="utf-8"><title>{title}</title>',
+                "<style>figure {display: inline-block; margin: 4px} "
+                "img {width: 320px}</style></head>",
+                f"<body><h1>{title}</h1>",
+                *figures,
+                "</body>",
+                "</html>",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+
+def plot_report(
+    pyscal_objects: Sequence[Any],
+    path: Union[str, Path],
+    processes: int = 1,
+    logyscale: bool = False,
+    dpi: int = 100,
+    decimate: bool = False,
+) -> None:
+    """Plot all SATNUMs to a report file
+
+    The format is given by the file suffix. A ".pdf" file gets one page
+    pr. SATNUM. For ".html", the pages are written as PNG files in a
+    directory named after the file, with suffix "_files", and the HTML
+    file shows them as thumbnails linking to the full images. The pages
+    are raster images in both formats, to keep the file size independent
+    of the number of points in the tables.
+
+    Args:
+        pyscal_objects: Objects to plot, one pr. SATNUM, starting at
+            SATNUM 1.
+        path: Report file to write, the parent directory must exist.
+        processes: If larger than 1, render the pages in this number of
+            worker processes. The objects are sent once to each worker.
+        logyscale: Set to True to plot relative permeabilities on a
+            logarithmic axis.
+        dpi: Resolution of the pages.
+        decimate: Set to True to draw the curves through only as many
+            table rows as needed at this resolution, which is faster for
+            tables with small saturation steps.
+    """
+    path = Path(path)
+    if path.suffix.lower() not in REPORT_FORMATS:
+        raise ValueError(
+            f"Unsupported report format {path.suffix}, use one of {REPORT_FORMATS}"
+        )
+    if not pyscal_objects:
+        raise ValueError("No pyscal objects to plot")
+    pages = _pages(
+        pyscal_objects,
+        logyscale=logyscale,
+        dpi=dpi,
+        decimate=decimate,
+        processes=processes,
+    )
+    if path.suffix.lower() == ".pdf":
+        _write_pdf(path, pages, dpi)
+    else:
+        _write_html(path, pages, pyscal_objects)
+    logger.info("Wrote plots of %d SATNUMs to %s", len(pyscal_objects), str(path))
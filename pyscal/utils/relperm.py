@@ -8,6 +8,7 @@ import pandas as pd
 
 from ..constants import EPSILON as epsilon
 from ..constants import SWINTEGERS
+from . import kernels
 
 logger = logging.getLogger(__name__)
 
@@ -45,24 +46,20 @@ def crosspoint(dframe: pd.DataFrame, satcol: str, kr1col: str, kr2col: str) -> f
 
     if cross_dframe.isna().any().any():
         logger.error("nan in input to crosspoint()")
-        logger.debug(str(cross_dframe))
+        logger.debug("%s", cross_dframe)
         return -1
 
-    cross_dframe.loc[:, "krdiff"] = cross_dframe[kr1col] - cross_dframe[kr2col]
+    # Interpolate the saturation column to where the difference is zero:
+    satcross = kernels.get("crosspoint")(
+        *(cross_dframe[col].values.astype(float) for col in [satcol, kr1col, kr2col])
+    )
 
-    # Add a zero value for the difference column, and interpolate
-    # the saturation column to the zero value
-    zerodf = pd.DataFrame(index=[len(cross_dframe)], data={"krdiff": 0.0})
-    cross_dframe = pd.concat([cross_dframe, zerodf], sort=True).set_index("krdiff")
-
-    cross_dframe.interpolate(method="slinear", inplace=True)
-
-    if cross_dframe.isna().any().any():
+    if np.isnan(satcross):
         logger.error("Could not compute crosspoint)")
-        logger.debug(str(cross_dframe))
+        logger.debug("%s", cross_dframe)
         return -1
 
-    return cross_dframe[np.isclose(cross_dframe.index, 0.0)][satcol].values[0]
+    return satcross
 
 
 def estimate_diffjumppoint(
@@ -103,34 +100,39 @@ def estimate_diffjumppoint(
     side = side.lower()
     assert side in ["left", "right"]
 
+    # The table is not modified, all intermediate results are local arrays.
+    xvalues = table[xcol].to_numpy(dtype=float)
+    yvalues = table[ycol].to_numpy(dtype=float)
+
     # Compute the derivative:
-    table["_deriv"] = table[ycol].diff() / table[xcol].diff()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        deriv = np.diff(yvalues, prepend=np.nan) / np.diff(xvalues, prepend=np.nan)
     # The first becomes NaN, extrapolate from the second row:
-    table.loc[0, "_deriv"] = table["_deriv"].iloc[1]
+    deriv[0] = deriv[1]
 
     # Pick the derivative at the first or last segment:
     iloc = {"left": 0, "right": -1}
-    lin_a = table["_deriv"].iloc[iloc[side]]
+    lin_a = deriv[iloc[side]]
 
     # Make a linear extrapolation from the last segment, starting at max x
-    table["_linear"] = (table[xcol] - table[xcol].iloc[iloc[side]]) * lin_a + table[
-        ycol
-    ].iloc[iloc[side]]
-    assert table["_linear"].values[iloc[side]] == table[ycol].values[iloc[side]]
+    linear = (xvalues - xvalues[iloc[side]]) * lin_a + yvalues[iloc[side]]
+    assert linear[iloc[side]] == yvalues[iloc[side]]
 
     # Compute how much krw deviates from the linear krw:
-    table["_lindev"] = (table[ycol] - table["_linear"]).abs()
+    lindev = np.abs(yvalues - linear)
 
     # Use the cumulative sum to determine the onset of non-zero deviation
-    # starting from sw=1:
-    table["_lindevcumsum"] = table["_lindev"].cumsum()
-
-    if side == "right":
-        maxcumsum = table["_lindevcumsum"].max()
-        linearpart = table[(table["_lindevcumsum"] - maxcumsum).abs() < epsilon]
-        return linearpart.iloc[1][xcol]
-
-    linearpart = table[(table["_lindevcumsum"] < epsilon)]
-    if len(linearpart) == 1:
-        linearpart = table[(table["_lindevcumsum"].shift(1) < epsilon)]
-    return linearpart.iloc[-1][xcol]
+    # starting from sw=1. NaN deviations are skipped, as in pandas:
+    lindevcumsum = np.nancumsum(lindev)
+    lindevcumsum[np.isnan(lindev)] = np.nan
+
+    with np.errstate(invalid="ignore"):
+        if side == "right":
+            maxcumsum = np.nanmax(lindevcumsum)
+            linearpart = np.abs(lindevcumsum - maxcumsum) < epsilon
+            return xvalues[linearpart][1]
+
+        linearpart = lindevcumsum < epsilon
+        if linearpart.sum() == 1:
+            linearpart = np.concatenate(([False], lindevcumsum[:-1] < epsilon))
+    return xvalues[linearpart][-1]
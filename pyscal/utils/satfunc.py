@@ -0,0 +1,189 @@
+"""Parsing of saturation function include files for Eclipse and Nexus"""
+
+import logging
+from pathlib import Path
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Column names for each keyword, equal to the names used in PyscalList.df()
+# and as defaults in WaterOil.add_fromtable() and GasOil.add_fromtable():
+ECLIPSE_COLUMNS = {
+    "SWOF": ["SW", "KRW", "KROW", "PCOW"],
+    "SGOF": ["SG", "KRG", "KROG", "PCOG"],
+    "SLGOF": ["SL", "KRG", "KROG", "PCOG"],
+    "SWFN": ["SW", "KRW", "PCOW"],
+    "SGFN": ["SG", "KRG", "PCOG"],
+    "SOF3": ["SO", "KROW", "KROG"],
+}
+
+# Nexus tables have their own header line with column names, where
+# capillary pressure is always called PC:
+NEXUS_PC_RENAMER = {"WOTABLE": "PCOW", "GOTABLE": "PCOG"}
+
+SUPPORTED_KEYWORDS = list(ECLIPSE_COLUMNS) + list(NEXUS_PC_RENAMER)
+
+
+def _strip_comment(line: str) -> str:
+    """Remove Eclipse (--) and Nexus (!) comments from a line"""
+    for marker in ("--", "!"):
+        pos = line.find(marker)
+        if pos > -1:
+            line = line[:pos]
+    return line.strip()
+
+
+def _is_data(line: str) -> bool:
+    """Check if a non-empty line starts with a number or a table terminator"""
+    return line[0] in "0123456789.-+/"
+
+
+def _parse_table(
+    keyword: str, satnum: int, datalines: List[str], columns: List[str]
+) -> Dict[str, np.ndarray]:
+    """Convert the collected data lines of one table to column arrays
+
+    All numbers are converted in one go by numpy, not row by row.
+    """
+    try:
+        values = np.array(" ".join(datalines).split(), dtype=float)
+    except ValueError as err:
+        raise ValueError(
+            f"Could not parse numbers in {keyword} for SATNUM {satnum}, "
+            "defaulted values (1*) are not supported"
+        ) from err
+    if values.size % len(columns):
+        raise ValueError(
+            f"Number of values in {keyword} for SATNUM {satnum} is not "
+            f"a multiple of the number of columns ({len(columns)})"
+        )
+    values = values.reshape(-1, len(columns))
+    return {col: values[:, idx] for idx, col in enumerate(columns)}
+
+
+def iter_tables(
+    source: Union[str, Path, IO[str], Iterable[str]],
+    keywords: Optional[List[str]] = None,
+) -> Iterator[Tuple[str, int, Dict[str, np.ndarray]]]:
+    """Stream saturation function tables from an include file
+
+    The file is read line by line, and only the table currently being
+    read is kept in memory. Eclipse tables (SWOF, SGOF, SLGOF, SWFN, SGFN
+    and SOF3) are terminated by a slash, and SATNUMs are counted by the
+    number of tables for each keyword. Nexus tables (WOTABLE and GOTABLE)
+    have a header line with column names, and each occurrence of the
+    keyword is counted as a new SATNUM.
+
+    Args:
+        source: Filename, open file or any iterable of lines.
+        keywords: Keywords to read, other keywords are skipped.
+            Defaults to all supported keywords.
+
+    Yields:
+        Tuples with keyword, SATNUM and a dictionary with one numpy array
+        pr. column. Column names are as in PyscalList.df().
+    """
+    if keywords is None:
+        keywords = SUPPORTED_KEYWORDS
+    keywords = [keyword.upper() for keyword in keywords]
+    unsupported = set(keywords) - set(SUPPORTED_KEYWORDS)
+    if unsupported:
+        raise ValueError(f"Unsupported keywords: {sorted(unsupported)}")
+
+    if isinstance(source, (str, Path)):
+        with open(source, encoding="utf-8") as f_handle:
+            yield from iter_tables(f_handle, keywords)
+        return
+
+    satnums: Dict[str, int] = {}
+    keyword: Optional[str] = None
+    columns: List[str] = []
+    datalines: List[str] = []
+
+    def _finish_table() -> Tuple[str, int, Dict[str, np.ndarray]]:
+        assert keyword is not None
+        satnums[keyword] = satnums.get(keyword, 0) + 1
+        table = _parse_table(keyword, satnums[keyword], datalines, columns)
+        datalines.clear()
+        return keyword, satnums[keyword], table
+
+    for line in source:
+        line = _strip_comment(line)
+        if not line:
+            continue
+        if not _is_data(line):
+            if keyword in NEXUS_PC_RENAMER and not columns:
+                columns = [
+                    NEXUS_PC_RENAMER[keyword] if col == "PC" else col
+                    for col in line.upper().split()
+                ]
+                continue
+            if keyword is not None and datalines:
+                if keyword in ECLIPSE_COLUMNS:
+                    raise ValueError(f"{keyword} table not terminated by /")
+                yield _finish_table()
+            keyword = line.split()[0].upper()
+            if keyword not in keywords:
+                keyword = None
+            columns = list(ECLIPSE_COLUMNS.get(keyword, []))
+            continue
+        if keyword is None:
+            continue
+        if keyword in NEXUS_PC_RENAMER and not columns:
+            raise ValueError(f"{keyword} is missing its header line")
+        if "/" in line:
+            if keyword in NEXUS_PC_RENAMER:
+                raise ValueError(f"Unexpected / in {keyword}")
+            data, _ = line.split("/", 1)
+            datalines.append(data)
+            if not "".join(datalines).strip():
+                # An empty table ends the keyword:
+                datalines.clear()
+                keyword = None
+                continue
+            yield _finish_table()
+        else:
+            datalines.append(line)
+    if keyword is not None and datalines:
+        if keyword in ECLIPSE_COLUMNS:
+            raise ValueError(f"{keyword} table not terminated by /")
+        yield _finish_table()
+
+
+def df(
+    source: Union[str, Path, IO[str], Iterable[str]],
+    keywords: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """Parse saturation function tables from an include file to a dataframe
+
+    The dataframe has the same column names as PyscalList.df(), with
+    additional columns KEYWORD and SATNUM. Subsets of it pr. SATNUM and
+    KEYWORD can be given directly to WaterOil.add_fromtable() and
+    GasOil.add_fromtable().
+
+    Args:
+        source: Filename, open file or any iterable of lines.
+        keywords: Keywords to read, other keywords are skipped.
+            Defaults to all supported keywords.
+    """
+    # Columns are collected pr. keyword and concatenated once, which is
+    # much faster than one dataframe pr. table:
+    collected: Dict[str, Dict[str, List[np.ndarray]]] = {}
+    for keyword, satnum, table in iter_tables(source, keywords):
+        arrays = collected.setdefault(keyword, {})
+        for col, values in table.items():
+            arrays.setdefault(col, []).append(values)
+        arrays.setdefault("SATNUM", []).append(np.full(len(values), satnum))
+    if not collected:
+        logger.warning("No saturation function tables found")
+        return pd.DataFrame()
+    dframes = [
+        pd.DataFrame(
+            {col: np.concatenate(values) for col, values in arrays.items()}
+        ).assign(KEYWORD=keyword)
+        for keyword, arrays in collected.items()
+    ]
+    return pd.concat(dframes, ignore_index=True, sort=False)
@@ -0,0 +1,151 @@
+"""Saturation height functions for many rock classes at once
+
+Each rock class is one row in a dataframe with capillary pressure
+parameters, using the same parameter names as the PyscalFactory. The
+water saturation is evaluated for all heights and all rock classes in
+one broadcasted numpy operation.
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from pyscal.utils import capillarypressure
+
+# Parameter names as in the PyscalFactory for WaterOil:
+SIMPLE_J = ["a", "b", "poro_ref", "perm_ref"]
+SIMPLE_J_PETRO = ["a_petro", "b_petro", "poro_ref", "perm_ref"]
+NORM_J = ["a", "b", "poro", "perm", "sigma_costau", "drho"]
+
+
+def _parameter(rockclasses: pd.DataFrame, name: str, default: float) -> np.ndarray:
+    """Parameter values for each rock class as a row vector"""
+    if name in rockclasses:
+        return rockclasses[name].to_numpy(dtype=float)[np.newaxis, :]
+    return np.full((1, len(rockclasses)), default)
+
+
+def sw_height(
+    heights: np.ndarray, rockclasses: pd.DataFrame, g: float = 9.81
+) -> np.ndarray:
+    """Water saturation for each height and rock class
+
+    The rock classes are described with either the simple-J parameters
+    (a, b, poro_ref, perm_ref), the petrophysical simple-J parameters
+    (a_petro, b_petro, poro_ref, perm_ref) or the normalized J-function
+    parameters (a, b, poro, perm, sigma_costau, drho), in that order of
+    precedence as in the PyscalFactory. The saturations are normalized
+    with respect to swirr, which is zero if not supplied. Column names
+    are case insensitive.
+
+    This gives the saturation where the capillary pressure from
+    WaterOil.add_simple_J(), add_simple_J_petro() or add_normalized_J()
+    balances the height above free water level.
+
+    Args:
+        heights: Heights above free water level, in meters.
+        rockclasses: One row for each rock class.
+        g: Gravitational acceleration, in m/s², used for normalized J.
+
+    Returns:
+        Water saturations between swirr and 1, one row for each height
+        and one column for each rock class. The saturation is 1 at and
+        below free water level.
+    """
+    # pylint: disable=invalid-name,protected-access
+    rockclasses = rockclasses.rename(str.lower, axis="columns")
+    height = np.asarray(heights, dtype=float)[:, np.newaxis]
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        if set(SIMPLE_J).issubset(rockclasses):
+            swn = capillarypressure._simpleJ_to_sw(
+                capillarypressure._height_to_simpleJ(
+                    height,
+                    _parameter(rockclasses, "poro_ref", np.nan),
+                    _parameter(rockclasses, "perm_ref", np.nan),
+                ),
+                _parameter(rockclasses, "a", np.nan),
+                _parameter(rockclasses, "b", np.nan),
+            )
+        elif set(SIMPLE_J_PETRO).issubset(rockclasses):
+            a_rms, b_rms = capillarypressure.simpleJ_petro_to_rms(
+                _parameter(rockclasses, "a_petro", np.nan),
+                _parameter(rockclasses, "b_petro", np.nan),
+            )
+            swn = capillarypressure._simpleJ_to_sw(
+                capillarypressure._height_to_simpleJ(
+                    height,
+                    _parameter(rockclasses, "poro_ref", np.nan),
+                    _parameter(rockclasses, "perm_ref", np.nan),
+                ),
+                a_rms,
+                b_rms,
+            )
+        elif set(NORM_J).issubset(rockclasses):
+            swn = capillarypressure._normalizedJ_to_sw(
+                capillarypressure._height_to_normalizedJ(
+                    height,
+                    _parameter(rockclasses, "poro", np.nan),
+                    _parameter(rockclasses, "perm", np.nan),
+                    _parameter(rockclasses, "sigma_costau", np.nan),
+                    _parameter(rockclasses, "drho", np.nan),
+                    g,
+                ),
+                _parameter(rockclasses, "a", np.nan),
+                _parameter(rockclasses, "b", np.nan),
+            )
+        else:
+            raise ValueError(
+                "Rock classes must have all of "
+                f"{SIMPLE_J}, {SIMPLE_J_PETRO} or {NORM_J}"
+            )
+        swirr = _parameter(rockclasses, "swirr", 0.0)
+        sw = np.where(height > 0, swirr + (1 - swirr) * swn, 1.0)
+    return np.minimum(sw, 1.0)
+
+
+def sw_height_df(
+    heights: np.ndarray,
+    rockclasses: pd.DataFrame,
+    g: float = 9.81,
+    idcolumn: Optional[str] = None,
+) -> pd.DataFrame:
+    """Saturation height tables for many rock classes as one dataframe
+
+    Args:
+        heights: Heights above free water level, in meters.
+        rockclasses: One row for each rock class, see sw_height()
+        g: Gravitational acceleration, in m/s².
+        idcolumn: Column in rockclasses identifying each rock class. If
+            not supplied, the index of the rockclasses dataframe is used.
+
+    Returns:
+        Dataframe with one table for each rock class after each other,
+        with the identifier column and the columns HEIGHT and SW. If drho
+        is known for the rock classes, the capillary pressure in bar is
+        included as the column PC. Use ``pivot()`` to get one column per
+        rock class.
+    """
+    # pylint: disable=invalid-name,protected-access
+    sw = sw_height(heights, rockclasses, g)
+    heights = np.asarray(heights, dtype=float)
+    if idcolumn is None:
+        idcolumn = rockclasses.index.name or "ROCKCLASS"
+        ids = rockclasses.index.to_numpy()
+    else:
+        ids = rockclasses[idcolumn].to_numpy()
+    dframe = pd.DataFrame(
+        {
+            idcolumn: np.repeat(ids, len(heights)),
+            "HEIGHT": np.tile(heights, len(ids)),
+            "SW": sw.T.ravel(),
+        }
+    )
+    drho = [col for col in rockclasses if col.lower() == "drho"]
+    if drho:
+        dframe["PC"] = capillarypressure._height_to_pc(
+            dframe["HEIGHT"].to_numpy(),
+            np.repeat(rockclasses[drho[0]].to_numpy(dtype=float), len(heights)),
+            g,
+        )
+    return dframe
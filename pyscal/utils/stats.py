@@ -0,0 +1,122 @@
+"""Runtime counters for events in pyscal that are relevant for performance
+
+Some problems in large decks only show up as slowness, like monotonicity
+fixes needing many iterations or saturation points being dropped from the
+grid. Code paths where such events occur increment named counters here.
+Counters are accumulated in total, and also for the SATNUM currently being
+processed if that is known (see :func:`satnum_context`).
+
+Example::
+
+  import pyscal
+  pyscal.reset_stats()
+  ...  # Generate some tables
+  print(pyscal.stats())
+"""
+
+import collections
+import contextlib
+from typing import Counter, Dict, Iterator, List, Optional
+
+_COUNTERS: Counter[str] = collections.Counter()
+_SATNUM_COUNTERS: Dict[int, Counter[str]] = collections.defaultdict(collections.Counter)
+_SATNUM_STACK: List[int] = []
+
+
+def increment(name: str, value: int = 1) -> None:
+    """Increment a named counter.
+
+    If a SATNUM is registered as being processed, the counter for that
+    SATNUM is incremented as well.
+
+    Args:
+        name: Name of the counter, lower case with underscores.
+        value: Amount to add to the counter.
+    """
+    _COUNTERS[name] += value
+    if _SATNUM_STACK:
+        _SATNUM_COUNTERS[_SATNUM_STACK[-1]][name] += value
+
+
+def current_satnum() -> Optional[int]:
+    """Return the SATNUM currently being processed, None if not known"""
+    if _SATNUM_STACK:
+        return _SATNUM_STACK[-1]
+    return None
+
+
+@contextlib.contextmanager
+def satnum_context(satnum: int) -> Iterator[None]:
+    """Attribute events inside the with-block to a specific SATNUM
+
+    Args:
+        satnum: The SATNUM being processed, starting at 1.
+    """
+    _SATNUM_STACK.append(int(satnum))
+    try:
+        yield
+    finally:
+        _SATNUM_STACK.pop()
+
+
+def stats() -> Dict[str, int]:
+    """Return a copy of all counters accumulated since last reset
+
+    Returns:
+        Dictionary with counter names as keys, sorted by name.
+    """
+    return dict(sorted(_COUNTERS.items()))
+
+
+def satnum_stats() -> Dict[int, Dict[str, int]]:
+    """Return a copy of the counters accumulated pr. SATNUM
+
+    Returns:
+        Dictionary with SATNUMs as keys, and dictionaries similar
+        to what stats() returns as values.
+    """
+    return {
+        satnum: dict(sorted(counters.items()))
+        for satnum, counters in sorted(_SATNUM_COUNTERS.items())
+    }
+
+
+def reset_stats() -> None:
+    """Reset all counters, typically done at the start of a run"""
+    _COUNTERS.clear()
+    _SATNUM_COUNTERS.clear()
+
+
+def format_stats(top: int = 5) -> str:
+    """Make a human readable summary of the counters
+
+    For each counter, the SATNUMs with the highest counts are listed,
+    in order to spot pathological SATNUMs in large decks.
+
+    Args:
+        top: Number of SATNUMs to list for each counter.
+
+    Returns:
+        Multiline string, empty if no counters are registered.
+    """
+    if not _COUNTERS:
+        return ""
+    width = max(len(name) for name in _COUNTERS)
+    lines = ["pyscal runtime statistics:"]
+    for name, total in sorted(_COUNTERS.items()):
+        line = f"  {name.ljust(width)}  {total}"
+        satnum_counts = sorted(
+            (
+                (counters[name], satnum)
+                for satnum, counters in _SATNUM_COUNTERS.items()
+                if counters[name]
+            ),
+            reverse=True,
+        )
+        if satnum_counts:
+            line += " (max in SATNUM " + ", ".join(
+                f"{satnum}: {count}" for count, satnum in satnum_counts[:top]
+            )
+            line += ")"
+        lines.append(line)
+    return "\n".join(lines) + "\n"
@@ -1,14 +1,24 @@
 """Utility functions for creating strings from pyscal"""
 
+import hashlib
 import logging
-from typing import Dict, Optional
+from typing import Dict, Hashable, List, Optional
 
+import numpy as np
 import pandas as pd
 
-from .monotonicity import MonotonicitySpec, modify_dframe_monotonicity
+from . import stats
+from .monotonicity import (
+    MonotonicitySpec,
+    modify_dframe_monotonicity,
+    validate_monotonicity_arg,
+)
 
 logger = logging.getLogger(__name__)
 
+FORMATCACHE_SIZE: int = 64
+"""Maximal number of formatted columns kept in a cache for format_column()"""
+
 
 def df2str(
     dframe: pd.DataFrame,
@@ -16,6 +26,7 @@ def df2str(
     roundlevel: int = 9,
     header: bool = False,
     monotonicity: Optional[Dict[str, MonotonicitySpec]] = None,
+    cache: Optional[Dict[Hashable, List[str]]] = None,
 ) -> str:
     """
     Make a string representation of a dataframe with
@@ -41,15 +52,97 @@ def df2str(
         header: If the dataframe column header should be included
         monotonicity: Column names in dframe are the keys, pointing
             to a specification for monotonicity to be enforced.
+        cache: Dictionary for reusing formatted columns between calls
+            with the same data, see format_column().
     """
     float_format = "%1." + str(digits) + "f"
 
-    if monotonicity is not None:
-        dframe = modify_dframe_monotonicity(dframe, monotonicity, digits)
+    stats.increment("rows_formatted", len(dframe))
 
-    return dframe.round(roundlevel).to_csv(
-        sep=" ", float_format=float_format, header=header, index=False
-    )
+    if (
+        header
+        or dframe.empty
+        or not dframe.columns.is_unique
+        or not (dframe.dtypes == np.float64).all()
+    ):
+        if monotonicity is not None:
+            dframe = modify_dframe_monotonicity(dframe, monotonicity, digits)
+
+        return dframe.round(roundlevel).to_csv(
+            sep=" ", float_format=float_format, header=header, index=False
+        )
+
+    # Float columns are formatted one by one, which is faster than
+    # to_csv() and lets formatted columns be reused:
+    validate_monotonicity_arg(monotonicity, dframe.columns)
+    columns = [
+        format_column(dframe[col], digits, roundlevel, monotonicity, cache)
+        for col in dframe
+    ]
+    return "\n".join(map(" ".join, zip(*columns))) + "\n"
+
+
+def format_column(
+    column: pd.Series,
+    digits: int = 7,
+    roundlevel: int = 9,
+    monotonicity: Optional[Dict[str, MonotonicitySpec]] = None,
+    cache: Optional[Dict[Hashable, List[str]]] = None,
+) -> List[str]:
+    """Format a float column to strings, as a column printed by df2str()
+
+    Args:
+        column: Float values to format, the name of the series is used
+            for looking up the monotonicity specification.
+        digits: Number of digits in the floating point format.
+        roundlevel: To how many digits should we round prior to print.
+        monotonicity: Monotonicity specification for all columns in
+            the table, as for df2str(). All columns are rounded to
+            digits + 1 when this is not None.
+        cache: If supplied, formatted columns are stored in and reused
+            from this dictionary. They are keyed on a fingerprint of the
+            column data (the table version), the column name and the
+            formatting options, so modified data is formatted again. The
+            least recently used columns are dropped when it holds more
+            than FORMATCACHE_SIZE columns.
+
+    Returns:
+        List of strings, one for each value, empty strings for NaN.
+    """
+    spec = None if monotonicity is None else monotonicity.get(column.name)
+    if cache is not None:
+        values = column.to_numpy()
+        key = (
+            column.name,
+            values.dtype.str,
+            len(values),
+            hashlib.sha1(values.tobytes()).digest(),
+            digits,
+            roundlevel,
+            monotonicity is not None,
+            None if spec is None else tuple(sorted(spec.items())),
+        )
+        if key in cache:
+            stats.increment("formatted_columns_reused")
+            # Move to the end, as the most recently used:
+            cache[key] = cache.pop(key)
+            return cache[key]
+
+    if monotonicity is not None:
+        # All columns are rounded when monotonicity is enforced on a table:
+        column = modify_dframe_monotonicity(
+            column.to_frame(), {} if spec is None else {column.name: spec}, digits
+        )[column.name]
+    float_format = "%1." + str(digits) + "f"
+    formatted = [
+        float_format % value if value == value else ""
+        for value in column.round(roundlevel).to_numpy().tolist()
+    ]
+    if cache is not None:
+        while len(cache) >= FORMATCACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = formatted
+    return formatted
 
 
 def comment_formatter(multiline: str, prefix: str = "-- "):
@@ -0,0 +1,228 @@
+"""Per grid cell SWL and SWATINIT from simple-J capillary pressure
+
+The cell properties (height above free water level, porosity,
+permeability and SATNUM) are numpy arrays, typically memory mapped
+from disk for large grids. They are processed in chunks so that memory
+usage is bounded by the chunk size and not by the number of cells.
+"""
+
+import logging
+from pathlib import Path
+from typing import IO, Iterator, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from pyscal.utils import capillarypressure
+
+logger = logging.getLogger(__name__)
+
+CHUNKSIZE: int = 1000000
+"""Default number of grid cells processed at once"""
+
+VALUES_PER_LINE: int = 8
+"""Number of values on each line in GRDECL output"""
+
+SIMPLE_J = ["a", "b", "swirr", "swlheight"]
+SIMPLE_J_PETRO = ["a_petro", "b_petro", "swirr", "swlheight"]
+
+
+def satnum_parameters(jparams: pd.DataFrame) -> pd.DataFrame:
+    """Prepare a lookup table with RMS simple-J parameters for each SATNUM
+
+    The incoming dataframe must have a SATNUM column and the columns a, b,
+    swirr and swlheight, or a_petro, b_petro, swirr and swlheight for the
+    petrophysical version of the simple-J function (as in the
+    PyscalFactory). Column names are case insensitive.
+
+    Args:
+        jparams: One row per SATNUM.
+
+    Returns:
+        Dataframe with columns a, b, swirr and swlheight (RMS version),
+        indexed by SATNUM from zero to max(SATNUM), with NaN for undefined
+        SATNUMs.
+    """
+    jparams = jparams.rename(str.lower, axis="columns")
+    if "satnum" not in jparams:
+        raise ValueError("SATNUM column missing in simple-J parameters")
+    if jparams["satnum"].duplicated().any():
+        raise ValueError("Duplicate SATNUM in simple-J parameters")
+    if set(SIMPLE_J).issubset(jparams):
+        a_rms, b_rms = jparams["a"], jparams["b"]
+    elif set(SIMPLE_J_PETRO).issubset(jparams):
+        if (jparams["b_petro"] > 0).any():
+            raise ValueError(
+                "positive b will give increasing capillary pressure with saturation"
+            )
+        a_rms, b_rms = capillarypressure.simpleJ_petro_to_rms(
+            jparams["a_petro"], jparams["b_petro"]
+        )
+    else:
+        raise ValueError(
+            f"Simple-J parameters must have all of {SIMPLE_J} or {SIMPLE_J_PETRO}"
+        )
+    if (jparams["swlheight"] <= 0).any():
+        raise ValueError("swlheight must be larger than zero")
+    satnums = jparams["satnum"].astype(int).to_numpy()
+    if (satnums < 1).any():
+        raise ValueError("SATNUM must be positive")
+    table = pd.DataFrame(
+        index=pd.RangeIndex(satnums.max() + 1, name="SATNUM"),
+        columns=["a", "b", "swirr", "swlheight"],
+        dtype=float,
+    )
+    table.loc[satnums, "a"] = np.asarray(a_rms, dtype=float)
+    table.loc[satnums, "b"] = np.asarray(b_rms, dtype=float)
+    table.loc[satnums, "swirr"] = jparams["swirr"].to_numpy(dtype=float)
+    table.loc[satnums, "swlheight"] = jparams["swlheight"].to_numpy(dtype=float)
+    return table
+
+
+def swl_swatinit(
+    height: np.ndarray,
+    poro: np.ndarray,
+    perm: np.ndarray,
+    satnum: np.ndarray,
+    jparams: pd.DataFrame,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute SWL and SWATINIT for a set of grid cells
+
+    SWL is computed as in the PyscalFactory from swlheight, but with the
+    porosity and permeability of each cell in the simple-J function.
+    SWATINIT is the water saturation from the same simple-J function at
+    the height of the cell, which is 1 below free water level and never
+    below SWL.
+
+    Args:
+        height: Height above free water level for each cell, in meters.
+        poro: Porosity for each cell, between 0 and 1.
+        perm: Permeability for each cell, in milliDarcy.
+        satnum: SATNUM for each cell.
+        jparams: Simple-J parameters per SATNUM, either as accepted by
+            satnum_parameters() or as returned from it.
+
+    Returns:
+        SWL and SWATINIT arrays, with one value per cell.
+    """
+    if jparams.index.name != "SATNUM":
+        jparams = satnum_parameters(jparams)
+    satnum = np.asarray(satnum, dtype=int)
+    if satnum.min(initial=1) < 1 or satnum.max(initial=0) >= len(jparams):
+        raise ValueError("SATNUM in grid cells not covered by simple-J parameters")
+    cellparams = jparams.to_numpy()[satnum]
+    if np.isnan(cellparams).any():
+        raise ValueError("SATNUM in grid cells not covered by simple-J parameters")
+    a_rms, b_rms, swirr, swlheight = cellparams.T
+    poro = np.asarray(poro, dtype=float)
+    perm = np.asarray(perm, dtype=float)
+
+    swl = np.asarray(
+        capillarypressure.sw_from_height_simpleJ(
+            swlheight, swirr, a_rms, b_rms, poro, perm
+        )
+    )
+    swatinit = np.asarray(
+        capillarypressure.sw_from_height_simpleJ(
+            np.asarray(height, dtype=float), swirr, a_rms, b_rms, poro, perm
+        )
+    )
+    np.maximum(swatinit, swl, out=swatinit)
+    return swl, swatinit
+
+
+def iter_swl_swatinit(
+    height: np.ndarray,
+    poro: np.ndarray,
+    perm: np.ndarray,
+    satnum: np.ndarray,
+    jparams: pd.DataFrame,
+    chunksize: int = CHUNKSIZE,
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Compute SWL and SWATINIT chunk by chunk
+
+    Only one chunk of the incoming cell property arrays is read into
+    memory at a time, which makes it suitable for memory mapped arrays
+    (np.load(..., mmap_mode="r")).
+
+    Args:
+        height: Height above free water level for each cell, in meters.
+        poro: Porosity for each cell, between 0 and 1.
+        perm: Permeability for each cell, in milliDarcy.
+        satnum: SATNUM for each cell.
+        jparams: Simple-J parameters per SATNUM, see satnum_parameters()
+        chunksize: Number of cells in each chunk.
+
+    Yields:
+        SWL and SWATINIT arrays for consecutive chunks of cells.
+    """
+    if not len(height) == len(poro) == len(perm) == len(satnum):
+        raise ValueError("height, poro, perm and satnum must have equal length")
+    if chunksize < 1:
+        raise ValueError("chunksize must be positive")
+    if jparams.index.name != "SATNUM":
+        jparams = satnum_parameters(jparams)
+    for start in range(0, len(height), chunksize):
+        chunk = slice(start, start + chunksize)
+        yield swl_swatinit(
+            height[chunk], poro[chunk], perm[chunk], satnum[chunk], jparams
+        )
+
+
+def _write_grdecl_values(stream: IO[str], values: np.ndarray, fmt: str) -> None:
+    """Write values to a GRDECL keyword, VALUES_PER_LINE on each line"""
+    fullrows = len(values) // VALUES_PER_LINE * VALUES_PER_LINE
+    if fullrows:
+        np.savetxt(
+            stream,
+            values[:fullrows].reshape(-1, VALUES_PER_LINE),
+            fmt=fmt,
+            delimiter=" ",
+        )
+    if fullrows < len(values):
+        np.savetxt(stream, values[fullrows:].reshape(1, -1), fmt=fmt, delimiter=" ")
+
+
+def write_swl_swatinit(
+    swlfile: Union[str, Path],
+    swatinitfile: Union[str, Path],
+    height: np.ndarray,
+    poro: np.ndarray,
+    perm: np.ndarray,
+    satnum: np.ndarray,
+    jparams: pd.DataFrame,
+    chunksize: int = CHUNKSIZE,
+    digits: int = 5,
+) -> None:
+    """Write SWL and SWATINIT as GRDECL include files
+
+    The files are written chunk by chunk, memory usage is bounded by the
+    chunk size.
+
+    Args:
+        swlfile: Filename for the SWL keyword.
+        swatinitfile: Filename for the SWATINIT keyword.
+        height: Height above free water level for each cell, in meters.
+        poro: Porosity for each cell, between 0 and 1.
+        perm: Permeability for each cell, in milliDarcy.
+        satnum: SATNUM for each cell.
+        jparams: Simple-J parameters per SATNUM, see satnum_parameters()
+        chunksize: Number of cells in each chunk. Rounded up to a multiple
+            of the number of values per line.
+        digits: Number of decimals in the output.
+    """
+    chunksize = -(-chunksize // VALUES_PER_LINE) * VALUES_PER_LINE
+    fmt = f"%.{digits}f"
+    with open(swlfile, "w", encoding="utf-8") as swlstream, open(
+        swatinitfile, "w", encoding="utf-8"
+    ) as swatinitstream:
+        swlstream.write("SWL\n")
+        swatinitstream.write("SWATINIT\n")
+        for swl, swatinit in iter_swl_swatinit(
+            height, poro, perm, satnum, jparams, chunksize=chunksize
+        ):
+            _write_grdecl_values(swlstream, swl, fmt)
+            _write_grdecl_values(swatinitstream, swatinit, fmt)
+        swlstream.write("/\n")
+        swatinitstream.write("/\n")
+    logger.info("Written SWL to %s and SWATINIT to %s", swlfile, swatinitfile)
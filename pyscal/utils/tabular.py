@@ -0,0 +1,424 @@
+"""Fast loading of tabular input files, with an optional cache
+
+Parameter tables in XLSX files are read by streaming the cell values of
+one sheet through openpyxl in read-only mode, which avoids the overhead
+of going through pandas. CSV files are parsed with pyarrow if it is
+installed, and with pandas otherwise.
+
+When a cache directory is given, the parsed table is stored there in a
+sidecar file named from the path, size and modification time of the input
+file and the sheet name. Loading an unchanged file again only reads the
+sidecar file. The sidecar files are in the Feather format, which can not
+hold executable content, so caching requires pyarrow and is skipped
+without it. The cached tables are the raw file contents, any validation
+of the contents must be done after loading.
+
+Several sheets in a workbook can be read while opening the file only
+once, which is faster than reading the sheets one by one.
+
+Example::
+
+  from pyscal.utils.tabular import read_tabular, read_tabular_sheets
+
+  dframe = read_tabular("relperm.xlsx", "xlsx", sheet_name="Field A",
+                        cache_dir="/scratch/pyscal-cache")
+  dframes = read_tabular_sheets("relperm.xlsx", "xlsx", ["Field A", "Pc"])
+"""
+
+import codecs
+import functools
+import hashlib
+import logging
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+from xml.etree import ElementTree
+
+import numpy as np
+import openpyxl
+import pandas as pd
+import xlrd
+
+logger = logging.getLogger(__name__)
+
+# The first bytes of zip archives, like XLSX files, and of OLE2 compound
+# documents, like XLS files:
+ZIP_MAGIC = b"PK\x03\x04"
+OLE2_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+
+# Number of bytes looked at when determining the file format:
+SNIFF_BYTES = 65536
+
+
+@functools.lru_cache(maxsize=1)
+def _pyarrow_available() -> bool:
+    """Check if pyarrow can be imported"""
+    try:
+        # pylint: disable=import-outside-toplevel,unused-import
+        import pyarrow  # noqa: F401
+        import pyarrow.csv  # noqa: F401
+        import pyarrow.feather  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def sniff_file_format(filename: Union[str, Path]) -> str:
+    """Determine the format of a tabular file from its first bytes, without
+    parsing it.
+
+    XLSX files are zip archives and XLS files are OLE2 compound documents,
+    both recognized by their magic bytes. Other files are taken as CSV if they
+    start with UTF-8 text.
+
+    Returns:
+        One of "csv", "xlsx" or "xls". Empty string if the file is empty
+        or does not start with UTF-8 text.
+    """
+    with open(filename, "rb") as fhandle:
+        head = fhandle.read(SNIFF_BYTES)
+    if head.startswith(ZIP_MAGIC):
+        return "xlsx"
+    if head.startswith(OLE2_MAGIC):
+        return "xls"
+    if not head.strip():
+        logger.error("No columns to parse from file %s", str(filename))
+        return ""
+    try:
+        # Not final, as the last character may be cut by SNIFF_BYTES:
+        text = codecs.getincrementaldecoder("utf-8")().decode(head)
+    except UnicodeDecodeError:
+        return ""
+    if "\x00" in text:
+        return ""
+    return "csv"
+
+
+def _column_names(header: tuple) -> List[str]:
+    """Column names from a header row, like pandas names them: Empty
+    cells are named "Unnamed: <idx>", and repeated names are suffixed
+    with ".1", ".2" etc."""
+    names: List[str] = []
+    for idx, value in enumerate(header):
+        name = f"Unnamed: {idx}" if value is None else str(value)
+        candidate = name
+        count = 0
+        while candidate in names:
+            count += 1
+            candidate = f"{name}.{count}"
+        names.append(candidate)
+    return names
+
+
+def _worksheet_dataframe(worksheet) -> pd.DataFrame:
+    """Make a dataframe from an openpyxl worksheet, with the first row
+    as the header"""
+    rows = worksheet.iter_rows(values_only=True)
+    header = next(rows, ())
+    data = list(rows)
+    # Strip trailing empty header cells and empty trailing rows, which
+    # openpyxl reports when the sheet dimensions are larger than the data.
+    while header and header[-1] is None:
+        header = header[:-1]
+    while data and all(value is None for value in data[-1]):
+        data.pop()
+    width = len(header)
+    dframe = pd.DataFrame(
+        [row[:width] + (None,) * (width - len(row)) for row in data],
+        columns=_column_names(header),
+    )
+    # Empty cells in text columns are None, pandas gives NaN:
+    return dframe.where(dframe.notnull(), np.nan)
+
+
+def read_xlsx(
+    filename: Union[str, Path], sheet_name: Optional[str] = None
+) -> pd.DataFrame:
+    """Read a sheet in an XLSX file into a dataframe.
+
+    The first row is the header. Formulas are read as their cached values,
+    and empty cells become NaN.
+
+    Args:
+        filename: Path to XLSX file
+        sheet_name: Name of sheet to read. The first sheet if None.
+
+    Returns:
+        pd.DataFrame, with the same contents as pd.read_excel() gives.
+
+    Raises:
+        KeyError: If the sheet does not exist.
+    """
+    workbook = openpyxl.load_workbook(
+        filename, read_only=True, data_only=True, keep_links=False
+    )
+    try:
+        if sheet_name is None:
+            return _worksheet_dataframe(workbook.worksheets[0])
+        return _worksheet_dataframe(workbook[sheet_name])
+    finally:
+        workbook.close()
+
+
+def read_xlsx_sheets(
+    filename: Union[str, Path], sheet_names: Optional[List[str]] = None
+) -> Dict[str, pd.DataFrame]:
+    """Read several sheets in an XLSX file, opening the file once.
+
+    Args:
+        filename: Path to XLSX file
+        sheet_names: Names of sheets to read. All sheets if None.
+
+    Returns:
+        Dataframe for each sheet, see read_xlsx(), in the requested order.
+
+    Raises:
+        KeyError: If a sheet does not exist.
+    """
+    workbook = openpyxl.load_workbook(
+        filename, read_only=True, data_only=True, keep_links=False
+    )
+    try:
+        if sheet_names is None:
+            sheet_names = workbook.sheetnames
+        return {name: _worksheet_dataframe(workbook[name]) for name in sheet_names}
+    finally:
+        workbook.close()
+
+
+def sheet_names_in(filename: Union[str, Path], file_format: str) -> List[str]:
+    """List the sheet names in an XLSX or XLS file, without reading the
+    sheets.
+
+    Args:
+        filename: Path to file
+        file_format: "xlsx" or "xls"
+    """
+    if file_format == "xls":
+        workbook = xlrd.open_workbook(filename, on_demand=True)
+        try:
+            return workbook.sheet_names()
+        finally:
+            workbook.release_resources()
+    with zipfile.ZipFile(filename) as archive:
+        root = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+    # The namespace differs between transitional and strict OOXML:
+    return [
+        element.attrib["name"]
+        for element in root.iter()
+        if element.tag.endswith("}sheet") and "name" in element.attrib
+    ]
+
+
+def read_csv(filename: Union[str, Path]) -> pd.DataFrame:
+    """Read a CSV file into a dataframe.
+
+    pyarrow is used if it is installed, unless the file has whitespace
+    after the delimiters, which only the pandas parser can skip.
+
+    Args:
+        filename: Path to CSV file, UTF-8 encoded.
+
+    Returns:
+        pd.DataFrame
+    """
+    if _pyarrow_available():
+        # pylint: disable=import-outside-toplevel
+        import pyarrow
+        import pyarrow.csv
+
+        try:
+            dframe = pyarrow.csv.read_csv(
+                str(filename),
+                convert_options=pyarrow.csv.ConvertOptions(strings_can_be_null=True),
+            ).to_pandas()
+        except (pyarrow.ArrowInvalid, UnicodeDecodeError) as err:
+            logger.debug("pyarrow could not parse %s: %s", str(filename), str(err))
+        else:
+            padded = [str(name) for name in dframe if str(name) != str(name).lstrip()]
+            padded += [
+                col
+                for col in dframe.select_dtypes(include="object")
+                if dframe[col].dropna().astype(str).str.startswith(" ").any()
+            ]
+            if not padded:
+                return dframe.where(dframe.notnull(), np.nan)
+    return pd.read_csv(filename, skipinitialspace=True, encoding="utf-8")
+
+
+def _read_xls(
+    filename: Union[str, Path], sheet_names: Optional[List[Union[str, int]]] = None
+) -> Dict[Union[str, int], pd.DataFrame]:
+    """Read sheets in a legacy XLS file, using pandas and xlrd. Sheets can
+    be given by name or index, all sheets are read if sheet_names is None"""
+    try:
+        return pd.read_excel(filename, sheet_name=sheet_names, engine="xlrd")
+    except ValueError as err:
+        # pandas raises ValueError for missing sheets in XLS files
+        raise KeyError(str(err)) from err
+
+
+def cache_path(
+    cache_dir: Union[str, Path],
+    filename: Union[str, Path],
+    sheet_name: Optional[str] = None,
+) -> Path:
+    """Path to the sidecar cache file for a file and sheet
+
+    The name is a hash of the absolute path, size and modification time
+    of the file, and the sheet name, so that any change to the file gives
+    a new cache file.
+    """
+    filename = Path(filename).resolve()
+    stat = filename.stat()
+    key = "\n".join(
+        [str(filename), str(stat.st_size), str(stat.st_mtime_ns), str(sheet_name)]
+    )
+    return Path(cache_dir) / (hashlib.sha1(key.encode()).hexdigest() + ".feather")
+
+
+def _usable_cache_dir(
+    cache_dir: Optional[Union[str, Path]]
+) -> Optional[Union[str, Path]]:
+    """The cache directory, or None if caching is not possible without
+    pyarrow"""
+    if cache_dir is not None and not _pyarrow_available():
+        _warn_no_cache()
+        return None
+    return cache_dir
+
+
+@functools.lru_cache(maxsize=1)
+def _warn_no_cache() -> None:
+    """Warn once that the cache directory is ignored"""
+    logger.warning("Caching of input files requires pyarrow, not caching")
+
+
+def _read_cache(path: Path) -> Optional[pd.DataFrame]:
+    """Read a sidecar cache file, None if it does not exist or is unreadable"""
+    if not path.is_file():
+        return None
+    try:
+        return pd.read_feather(path)
+    except Exception as err:  # pylint: disable=broad-except
+        logger.warning("Ignoring unreadable cache file %s: %s", str(path), str(err))
+        return None
+
+
+def _write_cache(dframe: pd.DataFrame, path: Path) -> None:
+    """Write a sidecar cache file atomically, so that concurrent
+    readers never see partial files. Failures are only logged."""
+    tmpname = ""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=str(path.parent), suffix=path.suffix, delete=False
+        ) as file_handle:
+            tmpname = file_handle.name
+        dframe.to_feather(tmpname)
+        os.replace(tmpname, str(path))
+    except Exception as err:  # pylint: disable=broad-except
+        logger.warning("Could not write cache file %s: %s", str(path), str(err))
+        if tmpname and os.path.exists(tmpname):
+            os.remove(tmpname)
+
+
+def read_tabular(
+    filename: Union[str, Path],
+    file_format: str,
+    sheet_name: Optional[str] = None,
+    cache_dir: Optional[Union[str, Path]] = None,
+) -> pd.DataFrame:
+    """Read an XLSX, XLS or CSV file, through a sidecar cache if a cache
+    directory is given.
+
+    Args:
+        filename: Path to file
+        file_format: One of "xlsx", "xls" or "csv", see
+            :func:`pyscal.factory.infer_tabular_file_format`
+        sheet_name: Sheet to read, the first sheet if None. Ignored
+            for CSV files.
+        cache_dir: Directory for sidecar cache files. No caching if None,
+            or if pyarrow is not installed.
+
+    Returns:
+        pd.DataFrame, with the file contents.
+
+    Raises:
+        KeyError: If the sheet does not exist.
+    """
+    if file_format == "csv":
+        sheet_name = None
+    readers: Dict[str, Callable[[], pd.DataFrame]] = {
+        "xlsx": lambda: read_xlsx(filename, sheet_name),
+        "xls": lambda: _read_xls(filename, [sheet_name or 0])[sheet_name or 0],
+        "csv": lambda: read_csv(filename),
+    }
+    reader = readers[file_format]
+    cache_dir = _usable_cache_dir(cache_dir)
+    if cache_dir is None:
+        return reader()
+
+    sidecar = cache_path(cache_dir, filename, sheet_name)
+    dframe = _read_cache(sidecar)
+    if dframe is not None:
+        logger.info("Loaded %s from cache file %s", str(filename), str(sidecar))
+        return dframe
+    dframe = reader()
+    _write_cache(dframe, sidecar)
+    return dframe
+
+
+def read_tabular_sheets(
+    filename: Union[str, Path],
+    file_format: str,
+    sheet_names: Optional[List[str]] = None,
+    cache_dir: Optional[Union[str, Path]] = None,
+) -> Dict[str, pd.DataFrame]:
+    """Read several sheets in an XLSX or XLS file, opening the file only
+    once. Sheets found in the cache directory are not read from the file.
+
+    Args:
+        filename: Path to file
+        file_format: "xlsx" or "xls"
+        sheet_names: Sheets to read. All sheets if None.
+        cache_dir: Directory for sidecar cache files. No caching if None,
+            or if pyarrow is not installed.
+
+    Returns:
+        Dataframe for each sheet, in the requested order.
+
+    Raises:
+        KeyError: If a sheet does not exist.
+    """
+    if file_format not in ["xlsx", "xls"]:
+        raise ValueError(f"Only XLSX and XLS files have sheets, not {file_format}")
+    if sheet_names is None:
+        sheet_names = sheet_names_in(filename, file_format)
+
+    dframes: Dict[str, pd.DataFrame] = {}
+    cache_dir = _usable_cache_dir(cache_dir)
+    if cache_dir is not None:
+        for name in sheet_names:
+            cached = _read_cache(cache_path(cache_dir, filename, name))
+            if cached is not None:
+                dframes[name] = cached
+        if dframes:
+            logger.info(
+                "Loaded sheets %s in %s from cache",
+                ", ".join(dframes),
+                str(filename),
+            )
+    missing = [name for name in sheet_names if name not in dframes]
+    if missing:
+        if file_format == "xlsx":
+            parsed = read_xlsx_sheets(filename, missing)
+        else:
+            parsed = _read_xls(filename, missing)  # type: ignore
+        if cache_dir is not None:
+            for name, dframe in parsed.items():
+                _write_cache(dframe, cache_path(cache_dir, filename, name))
+        dframes.update(parsed)
+    return {name: dframes[name] for name in sheet_names}
@@ -0,0 +1,119 @@
+"""Levels of validation done when generating tables and output
+
+The validation level is set for each object with the ``validation``
+argument, which replaces the older boolean ``fast`` argument:
+
+ * ``full``: Tables are checked with selfcheck() before output is made,
+   and the output is modified to ensure monotonicity after rounding.
+   Crosspoints are computed for comments. This is the default.
+
+ * ``cheap``: Tables are checked (selfcheck() and three-phase
+   consistency), but the output is not modified for monotonicity and
+   no crosspoints are computed.
+
+ * ``none``: No checks are done, for trusted input in production
+   pipelines. Equivalent to ``fast=True``. Pyscal will not guarantee
+   valid output in this mode.
+
+When several keywords are made from the same object, the checks that
+each keyword runs can be shared with shared_checks(), so that f.ex.
+selfcheck() runs once pr. object and not once pr. keyword.
+"""
+
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator, Optional
+
+VALIDATION_LEVELS = ["none", "cheap", "full"]
+
+
+def validation_level(validation: Optional[str] = None, fast: bool = False) -> str:
+    """Determine the validation level from the arguments to an object
+
+    Args:
+        validation: One of "none", "cheap" or "full", case insensitive.
+            If given, fast is ignored.
+        fast: Old style argument, True means "none", False means "full".
+
+    Returns:
+        The validation level, in lower case.
+    """
+    if validation is None:
+        return "none" if fast else "full"
+    if not isinstance(validation, str) or validation.lower() not in VALIDATION_LEVELS:
+        raise ValueError(
+            f"Unknown validation level {validation}, use one of {VALIDATION_LEVELS}"
+        )
+    return validation.lower()
+
+
+class FastFlag(object):
+    """Mixin for objects with a validation level, with the older boolean
+    ``fast`` argument as a property"""
+
+    validation: str
+
+    @property
+    def fast(self) -> bool:
+        """True if no validation is done, as validation="none"."""
+        return self.validation == "none"
+
+    @fast.setter
+    def fast(self, value: bool) -> None:
+        self.validation = "none" if value else "full"
+
+
+def strictest(levels: Iterable[str]) -> str:
+    """Return the most thorough of some validation levels
+
+    Used when objects with possibly different validation levels are
+    combined, like in interpolation.
+    """
+    return max(levels, key=VALIDATION_LEVELS.index)
+
+
+@contextmanager
+def shared_checks(pyscal_obj: Any) -> Iterator[None]:
+    """Run each check only once pr. object within the context
+
+    The results of checked() are kept on the object and on its WaterOil
+    and GasOil parts until the context exits, and are then forgotten, as
+    the object may be modified afterwards.
+
+    Args:
+        pyscal_obj: WaterOil, GasOil, GasWater or WaterOilGas object.
+    """
+    objs = [pyscal_obj] + [
+        getattr(pyscal_obj, part, None) for part in ["wateroil", "gasoil"]
+    ]
+    objs = [obj for obj in objs if obj is not None]
+    for obj in objs:
+        obj._checks = {}
+    try:
+        yield
+    finally:
+        for obj in objs:
+            vars(obj).pop("_checks", None)
+
+
+def checked(obj: Any, check: str, *args: Any) -> Any:
+    """Return the result of a check method on an object
+
+    Inside shared_checks() for the object, the method is called once for
+    each set of arguments, and the result is reused. A passed selfcheck()
+    in the default mode, which checks all the columns, is also reused for
+    the other modes, like SWFN.
+
+    Args:
+        obj: Object with the check method.
+        check: Name of the method, like "selfcheck" or "crosspoint".
+        args: Arguments to the method.
+    """
+    checks = vars(obj).get("_checks")
+    if checks is None:
+        return getattr(obj, check)(*args)
+    if check == "selfcheck" and checks.get((check,)) is True:
+        return True
+    key = (check,) + args
+    if key not in checks:
+        checks[key] = getattr(obj, check)(*args)
+    return checks[key]
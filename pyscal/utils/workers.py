@@ -0,0 +1,98 @@
+"""Processing of many SATNUMs in worker processes
+
+The data for all SATNUMs, like the pyscal objects, is sent once to each
+worker process when the pool starts, and only the SATNUM indices and the
+results are passed pr. task. The results are yielded in SATNUM order, and
+errors are raised with the SATNUM in the same way as when processing in
+the calling process.
+
+Example::
+
+  from pyscal.utils.workers import satnum_map
+
+  def interpolate(shared, idx):
+      recommendations, parameters = shared
+      return recommendations[idx].interpolate(parameters[idx])
+
+  interpolants = list(
+      satnum_map(interpolate, (recommendations, parameters), len(parameters), 4)
+  )
+"""
+
+import multiprocessing
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Type
+
+# Errors that are raised with the SATNUM, see satnum_map():
+SATNUM_ERRORS: Tuple[Type[Exception], ...] = (AssertionError, ValueError, TypeError)
+
+# Function and data in worker processes, set once pr. worker by _init_worker():
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_worker(
+    func: Callable[[Any, int], Any],
+    shared: Any,
+    initializer: Optional[Callable[[], None]],
+) -> None:
+    """Receive the function and data in a worker process"""
+    if initializer is not None:
+        initializer()
+    _WORKER_STATE.update(func=func, shared=shared)
+
+
+def _call_in_worker(idx: int) -> Tuple[bool, Any]:
+    """Process one SATNUM in a worker process
+
+    Errors in SATNUM_ERRORS are returned, flagged by False, to be raised
+    with the SATNUM in the calling process.
+    """
+    try:
+        return True, _WORKER_STATE["func"](_WORKER_STATE["shared"], idx)
+    except SATNUM_ERRORS as err:
+        return False, err
+
+
+def satnum_map(
+    func: Callable[[Any, int], Any],
+    shared: Any,
+    count: int,
+    processes: int = 1,
+    initializer: Optional[Callable[[], None]] = None,
+) -> Iterator[Any]:
+    """Yield func(shared, idx) for each SATNUM index idx, in order
+
+    Errors in SATNUM_ERRORS are raised as ValueError with the SATNUM in
+    the message, other errors are raised as they are.
+
+    Args:
+        func: Function of the shared data and the SATNUM index, starting
+            at 0. Must be picklable, i.e. defined at module level, when
+            processes is larger than 1.
+        shared: Data for all SATNUMs, sent once to each worker process.
+        count: Number of SATNUMs.
+        processes: If larger than 1, call func in this number of worker
+            processes.
+        initializer: Called without arguments when each worker process
+            starts, not called when processes is 1.
+    """
+    if processes > 1 and count > 1:
+        # Some SATNUMs pr. task to limit the overhead, but not too many
+        # to keep the workers balanced:
+        chunksize = max(1, count // (4 * processes))
+        with multiprocessing.Pool(
+            processes,
+            initializer=_init_worker,
+            initargs=(func, shared, initializer),
+        ) as pool:
+            results = pool.imap(_call_in_worker, range(count), chunksize=chunksize)
+            for satnum, (success, result) in enumerate(results, start=1):
+                if not success:
+                    raise ValueError(f"Error for SATNUM {satnum}: {result}") from result
+                yield result
+        return
+    for idx in range(count):
+        try:
+            result = func(shared, idx)
+        except SATNUM_ERRORS as err:
+            raise ValueError(f"Error for SATNUM {idx + 1}: {err}") from err
+        yield result
@@ -1,7 +1,6 @@
 ﻿"""Wateroil module"""
-from pyscal import getLogger_pyscal
 import math
-from typing import Optional
+from typing import Any, Dict, Hashable, List, Optional
 
 import numpy as np
 import pandas as pd
@@ -10,12 +9,15 @@ from scipy.interpolate import PchipInterpolator, interp1d
 import pyscal
 from pyscal.constants import EPSILON as epsilon
 from pyscal.constants import MAX_EXPONENT, SWINTEGERS
-from pyscal.utils.capillarypressure import simple_J
+from pyscal.utils import decimation, fromtable, kernels, stats
+from pyscal.utils.capillarypressure import simple_J, simpleJ_petro_to_rms
+from pyscal.utils.pickling import PicklableLogger
 from pyscal.utils.relperm import crosspoint, estimate_diffjumppoint, truncate_zeroness
 from pyscal.utils.string import comment_formatter, df2str
+from pyscal.utils.validation import FastFlag, checked, validation_level
 
 
-class WaterOil(object):
+class WaterOil(FastFlag, PicklableLogger):
     """A representation of two-phase properties for oil-water.
 
     Can hold relative permeability data, and capillary pressure.
@@ -53,7 +55,11 @@ class WaterOil(object):
         tag: Optional string identifier, only used in comments.
         fast: Set to True if in order to skip some integrity checks
             and nice-to-have features. Not needed to set for normal pyscal
-            runs, as speed is seldom crucial. Default False
+            runs, as speed is seldom crucial. Default False. Equivalent
+            to validation="none".
+        validation: Level of validation when making output, "none",
+            "cheap" or "full", see pyscal.utils.validation. Overrides
+            fast if given. Default "full".
         args: Verbose, debug and output arguments from CLI
             to create logger that splits log messages to stdout and stderr
     """
@@ -68,6 +74,7 @@ class WaterOil(object):
         h: Optional[float] = None,
         tag: str = "",
         fast: bool = False,
+        validation: Optional[str] = None,
         _sgcr: float = None,
         _sgl: float = None,
         args: Optional[dict] = None,
@@ -85,7 +92,7 @@ class WaterOil(object):
         if socr is not None:
             assert -epsilon < socr < 1.0 + epsilon
 
-        self.logger: Optional[object] = getLogger_pyscal(__name__, args)
+        self._set_logger(args)
 
         if h is None:
             h = 0.01
@@ -132,7 +139,7 @@ class WaterOil(object):
             self.socr = self.sorw
 
         self.tag = tag
-        self.fast = fast
+        self.validation: str = validation_level(validation, fast)
         sw_list = (
             list(np.arange(self.swl, 1 - self.sgl, self.h))
             + [self.swcr]
@@ -148,7 +155,9 @@ class WaterOil(object):
         self.table["swint"] = list(
             map(int, list(map(round, self.table["SW"] * SWINTEGERS)))
         )
+        rows_before_dedupe = len(self.table)
         self.table.drop_duplicates("swint", inplace=True)
+        stats.increment("grid_points_dropped", rows_before_dedupe - len(self.table))
 
         # Now, sw=1-sorw might be accidentaly dropped, so make sure we
         # have it by replacing the closest value by 1-sorw exactly
@@ -172,16 +181,6 @@ class WaterOil(object):
         self.table.reset_index(inplace=True)
         self.table = self.table[["SW"]]  # Drop the swint column
 
-        # Normalize for krw:
-        self.table["SWN"] = (self.table["SW"] - self.swcr) / (1 - self.swcr - self.sorw)
-        # Normalize for krow:
-        self.table["SON"] = (1 - self.table["SW"] - self.socr) / (
-            1 - self.swl - self.socr
-        )
-
-        # Different normalization for Sw used for capillary pressure
-        self.table["SWNPC"] = (self.table["SW"] - swirr) / (1 - swirr)
-
         if _sgcr is None:
             self.swcomment = (
                 f"-- swirr={self.swirr:g} swl={self.swl:g} "
@@ -204,10 +203,46 @@ class WaterOil(object):
         self.krowcomment = ""
         self.pccomment = ""
 
+        # Formatted columns for reuse between keywords, see
+        # pyscal.utils.string.format_column():
+        self._formatcache: Dict[Hashable, List[str]] = {}
+
+        # Normalized curves for reuse in interpolation, see
+        # pyscal.utils.interpolation.normalize_nonlinpart_wo/go():
+        self._curvecache: Dict[Hashable, Any] = {}
+
+        stats.increment("tables_initialized")
+        stats.increment("table_rows", len(self.table))
         self.logger.debug(
-            "Initialized WaterOil with %s saturation points", str(len(self.table))
+            "Initialized WaterOil with %s saturation points", len(self.table)
         )
 
+    @property
+    def swn(self) -> pd.Series:
+        """Water saturation normalized for krw, between swcr and 1 - sorw.
+
+        Computed on demand from the SW column and the current endpoints.
+        """
+        return (self.table["SW"] - self.swcr) / (1 - self.swcr - self.sorw)
+
+    @property
+    def son(self) -> pd.Series:
+        """Oil saturation normalized for krow, between socr and 1 - swl.
+
+        Computed on demand from the SW column and the current endpoints.
+        """
+        return (1 - self.table["SW"] - self.socr) / (1 - self.swl - self.socr)
+
+    @property
+    def swnpc(self) -> pd.Series:
+        """Water saturation normalized for capillary pressure.
+
+        The normalization is with respect to swirr, not to swl (the
+        swirr here is sometimes called 'swirra' - asymptotic swirr).
+        Computed on demand from the SW column.
+        """
+        return (self.table["SW"] - self.swirr) / (1 - self.swirr)
+
     def add_fromtable(
         self,
         dframe: pd.DataFrame,
@@ -237,8 +272,8 @@ class WaterOil(object):
         pressure data will be interpolated monotone cubicly over the
         entire saturation interval
 
-        The python package ecl2df has a tool for converting Eclipse input
-        files to dataframes.
+        Eclipse and Nexus include files can be converted to dataframes
+        with pyscal.utils.satfunc.df(), or with the python package ecl2df.
 
         Args:
             dframe: containing data
@@ -265,149 +300,140 @@ class WaterOil(object):
             )
             raise ValueError
 
-        # Typecheck/convert all numerical columns:
-        for col in [swcolname, krwcolname, krowcolname, pccolname]:
-            if col in dframe and not pd.api.types.is_numeric_dtype(dframe[col]):
-                # Try to convert to numeric type
-                try:
-                    dframe[col] = dframe[col].astype(float)
-                    self.logger.info(
-                        "Converted column %s to numbers for fromtable()", col
-                    )
-                except (TypeError, ValueError) as err:
-                    raise ValueError(
-                        f"Failed to parse column {col} as numbers for add_fromtable()"
-                    ) from err
-
-        if (dframe[swcolname].diff() < 0).any():
+        # Extract contiguous float arrays once, the incoming dataframe
+        # is never modified:
+        sw = fromtable.float_column(dframe, swcolname)
+        krw = (
+            fromtable.float_column(dframe, krwcolname) if krwcolname in dframe else None
+        )
+        krow = (
+            fromtable.float_column(dframe, krowcolname)
+            if krowcolname in dframe
+            else None
+        )
+        pc = fromtable.float_column(dframe, pccolname) if pccolname in dframe else None
+
+        if (np.diff(sw) < 0).any():
             raise ValueError("SW data not sorted")
-        if krwcolname in dframe:
+        if krw is not None:
+            if np.nanmax(krw) > 1.0:
+                raise ValueError("KRW is above 1 in incoming table")
+            if np.nanmin(krw) < 0.0:
+                raise ValueError("KRW is below 0 in incoming table")
+        if (krw is not None or krow is not None) and not np.isclose(
+            sw.min(), self.table["SW"].min()
+        ):
+            raise ValueError("Incompatible swl")
+        # Verify that incoming data is increasing (or level):
+        if krw is not None and (np.diff(krw) <= -epsilon).any():
+            raise ValueError("Incoming KRW not increasing")
+        if krow is not None:
+            if (np.diff(krow) >= epsilon).any():
+                raise ValueError("Incoming KROW Not decreasing")
+            if np.nanmax(krow) > 1.0:
+                raise ValueError("KROW is above 1 in incoming table")
+            if np.nanmin(krow) < 0.0:
+                raise ValueError("KROW is below 0 in incoming table")
+        if pc is not None:
+            # If nonzero, then it must be decreasing:
+            finite_pc = pc[np.isfinite(pc)]
+            if np.abs(finite_pc).sum() > 0 and (np.diff(finite_pc) >= 0.0).any():
+                raise ValueError("Incoming pc not decreasing")
+
+        self._resample_fromtable(
+            sw,
+            krw=krw,
+            krow=krow,
+            pc=pc,
+            sorw=sorw,
+            krwcomment=krwcomment,
+            krowcomment=krowcomment,
+            pccomment=pccomment,
+        )
+
+    def _resample_fromtable(
+        self,
+        sw: np.ndarray,
+        krw: Optional[np.ndarray] = None,
+        krow: Optional[np.ndarray] = None,
+        pc: Optional[np.ndarray] = None,
+        sorw: Optional[float] = None,
+        krwcomment: str = "",
+        krowcomment: str = "",
+        pccomment: str = "",
+    ) -> None:
+        """Interpolate tabular data onto the saturation table
+
+        Equivalent to add_fromtable(), for float arrays where sorting,
+        bounds and monotonicity are already checked. krw and krow are
+        interpolated together, into preallocated arrays.
+        """
+        swgrid = self.table["SW"].to_numpy()
+        relperm = {"KRW": krw, "KROW": krow}
+        relperm = {col: values for col, values in relperm.items() if values is not None}
+        if relperm:
             if sorw is None:
-                sorw = float(dframe[swcolname].max()) - estimate_diffjumppoint(
-                    dframe, xcol=swcolname, ycol=krwcolname, side="right"
+                col = next(iter(relperm))
+                sorw = float(sw.max()) - estimate_diffjumppoint(
+                    pd.DataFrame({"SW": sw, col: relperm[col]}),
+                    xcol="SW",
+                    ycol=col,
+                    side="right",
                 )
                 self.logger.info("Estimated sorw in tabular data to %f", sorw)
             assert -epsilon <= sorw <= 1 + epsilon
-            if dframe[krwcolname].max() > 1.0:
-                raise ValueError("KRW is above 1 in incoming table")
-            if dframe[krwcolname].min() < 0.0:
-                raise ValueError("KRW is below 0 in incoming table")
-            linearpart = dframe[swcolname] >= 1 - sorw
-            nonlinearpart = dframe[swcolname] <= 1 - sorw  # (overlapping at sorw)
-            if sum(linearpart) < 2:
+            linearpart = sw >= 1 - sorw
+            nonlinearpart = sw <= 1 - sorw  # (overlapping at sorw)
+            if linearpart.sum() < 2:
                 # A linear section of length 1 is not a linear section,
                 # recategorize as nonlinear:
-                linearpart = pd.Series([False] * len(linearpart))
-                nonlinearpart = ~linearpart
+                linearpart[:] = False
+                nonlinearpart[:] = True
                 sorw = 0
-            if sum(nonlinearpart) < 2:
+            if nonlinearpart.sum() < 2:
                 # A nonlinear section of length 1 is not a nonlinear section,
                 # recategorize as linear:
-                nonlinearpart = pd.Series([False] * len(nonlinearpart))
-                linearpart = ~nonlinearpart
-                sorw = 1 - float(self.table["SW"].min())
-            if not np.isclose(dframe[swcolname].min(), self.table["SW"].min()):
+                nonlinearpart[:] = False
+                linearpart[:] = True
+                sorw = 1 - float(swgrid.min())
+            if not np.isclose(sw.min(), swgrid.min()):
                 raise ValueError("Incompatible swl")
-            # Verify that incoming data is increasing (or level):
-            if not (dframe[krwcolname].diff().dropna() > -epsilon).all():
-                raise ValueError("Incoming KRW not increasing")
-            if dframe[krwcolname].max() > 1.0:
-                raise ValueError("KRW is above 1 in incoming table")
-            if dframe[krwcolname].min() < 0.0:
-                raise ValueError("KRW is below 0 in incoming table")
-            if sum(nonlinearpart) >= 2:
-                pchip = PchipInterpolator(
-                    dframe[nonlinearpart][swcolname].astype(float),
-                    dframe[nonlinearpart][krwcolname].astype(float),
-                )
-                self.table.loc[self.table["SW"] <= 1 - sorw, "KRW"] = pchip(
-                    self.table.loc[self.table["SW"] <= 1 - sorw, "SW"]
-                )
-            if sum(linearpart) >= 2:
-                linearinterpolator = interp1d(
-                    dframe[linearpart][swcolname].astype(float),
-                    dframe[linearpart][krwcolname].astype(float),
-                )
-                self.table.loc[
-                    self.table["SW"] >= 1 - sorw, "KRW"
-                ] = linearinterpolator(
-                    self.table.loc[self.table["SW"] >= 1 - sorw, "SW"]
-                )
-            self.table["KRW"].clip(lower=0.0, upper=1.0, inplace=True)
-            self.sorw = sorw
-            self.krwcomment = "-- krw from tabular input" + krwcomment + "\n"
-            self.swcr = self.estimate_swcr()
 
-        if krowcolname in dframe:
-            if sorw is None:
-                sorw = float(dframe[swcolname].max()) - estimate_diffjumppoint(
-                    dframe, xcol=swcolname, ycol=krowcolname, side="right"
-                )
-                self.logger.info("Estimated sorw in tabular data from krow to %s", sorw)
-            assert -epsilon <= sorw <= 1 + epsilon
-            linearpart = dframe[swcolname] >= 1 - sorw
-            nonlinearpart = dframe[swcolname] <= 1 - sorw  # (overlapping at sorw)
-            if sum(linearpart) < 2:
-                linearpart = pd.Series([False] * len(linearpart))
-                nonlinearpart = ~linearpart
-                sorw = 0
-            if sum(nonlinearpart) < 2:
-                nonlinearpart = pd.Series([False] * len(nonlinearpart))
-                linearpart = ~nonlinearpart
-                sorw = 1 - float(self.table["SW"].min())
-            if not np.isclose(dframe[swcolname].min(), self.table["SW"].min()):
-                raise ValueError("Incompatible swl")
-            if not (dframe[krowcolname].diff().dropna() < epsilon).all():
-                raise ValueError("Incoming KROW Not decreasing")
-            if dframe[krowcolname].max() > 1.0:
-                raise ValueError("KROW is above 1 in incoming table")
-            if dframe[krowcolname].min() < 0.0:
-                raise ValueError("KROW is below 0 in incoming table")
-            if sum(nonlinearpart) >= 2:
-                pchip = PchipInterpolator(
-                    dframe.loc[nonlinearpart, swcolname].astype(float),
-                    dframe.loc[nonlinearpart, krowcolname].astype(float),
-                )
-                self.table.loc[self.table["SW"] <= 1 - sorw, "KROW"] = pchip(
-                    self.table.loc[self.table["SW"] <= 1 - sorw, "SW"]
-                )
-            if sum(linearpart) >= 2:
-                linearinterpolator = interp1d(
-                    dframe.loc[linearpart, swcolname].astype(float),
-                    dframe.loc[linearpart, krowcolname].astype(float),
-                )
-                self.table.loc[
-                    self.table["SW"] >= 1 - sorw, "KROW"
-                ] = linearinterpolator(
-                    self.table.loc[self.table["SW"] >= 1 - sorw, "SW"]
-                )
-            self.table["KROW"].clip(lower=0.0, upper=1.0, inplace=True)
+            values = np.column_stack(list(relperm.values()))
+            resampled = np.full((len(swgrid), len(relperm)), np.nan)
+            if nonlinearpart.sum() >= 2:
+                gridpart = swgrid <= 1 - sorw
+                resampled[gridpart] = PchipInterpolator(
+                    sw[nonlinearpart], values[nonlinearpart]
+                )(swgrid[gridpart])
+            if linearpart.sum() >= 2:
+                gridpart = swgrid >= 1 - sorw
+                resampled[gridpart] = interp1d(
+                    sw[linearpart], values[linearpart], axis=0
+                )(swgrid[gridpart])
+            np.clip(resampled, 0.0, 1.0, out=resampled)
+            for idx, col in enumerate(relperm):
+                self.table[col] = resampled[:, idx]
             self.sorw = sorw
-            self.krowcomment = "-- krow from tabular input" + krowcomment + "\n"
-        if pccolname in dframe:
-            # Incoming dataframe must cover the range:
-            if dframe[swcolname].min() > self.table["SW"].min():
+            if "KRW" in relperm:
+                self.krwcomment = "-- krw from tabular input" + krwcomment + "\n"
+                self.swcr = self.estimate_swcr()
+            if "KROW" in relperm:
+                self.krowcomment = "-- krow from tabular input" + krowcomment + "\n"
+
+        if pc is not None:
+            if sw.min() > swgrid.min():
                 raise ValueError("Too large swl for pc interpolation")
-            if dframe[swcolname].max() < self.table["SW"].max():
+            if sw.max() < swgrid.max():
                 raise ValueError("max(sw) of incoming data not large enough")
-            if np.isinf(dframe[pccolname]).any():
+            if np.isinf(pc).any():
                 self.logger.warning(
-                    (
-                        "Infinity pc values detected. Will be dropped. "
-                        "Risk of extrapolation"
-                    )
+                    "Infinity pc values detected. Will be dropped. "
+                    "Risk of extrapolation"
                 )
-            dframe = dframe.replace([np.inf, -np.inf], np.nan)
-            dframe.dropna(subset=[pccolname], how="all", inplace=True)
-            # If nonzero, then it must be decreasing:
-            if dframe[pccolname].abs().sum() > 0:
-                if not (dframe[pccolname].diff().dropna() < 0.0).all():
-                    raise ValueError("Incoming pc not decreasing")
-            pchip = PchipInterpolator(
-                dframe[swcolname].astype(float), dframe[pccolname].astype(float)
-            )
-            self.table["PC"] = pchip(self.table["SW"])
-            if np.isnan(self.table["PC"]).any() or np.isinf(self.table["PC"]).any():
+            finite = np.isfinite(pc)
+            self.table["PC"] = PchipInterpolator(sw[finite], pc[finite])(swgrid)
+            if not np.isfinite(self.table["PC"]).all():
                 raise ValueError("inf/nan in interpolated data, check input")
             self.pccomment = "-- pc from tabular input" + pccomment + "\n"
 
@@ -435,7 +461,7 @@ class WaterOil(object):
         else:
             assert 0 < krwend <= 1.0
 
-        self.table["KRW"] = krwend * self.table["SWN"] ** nw
+        self.table["KRW"] = kernels.get("corey")(self.swn.values, nw, krwend)
 
         self.set_endpoints_linearpart_krw(krwend, krwmax)
 
@@ -479,13 +505,12 @@ class WaterOil(object):
         # If the linear section is longer than two rows, do linear
         # interpolation inside for krw:
         if len(linear_section_indices) > 2:
-            self.table.loc[linear_section_indices[1:-1], "KRW"] = np.nan
-            interp_krw = (
-                self.table[["SW", "KRW"]]
-                .set_index("SW")
-                .interpolate(method="index")["KRW"]
+            self.table["KRW"] = kernels.get("linear_section")(
+                self.table["SW"].values,
+                self.table["KRW"].values,
+                linear_section_indices[0],
+                linear_section_indices[-1],
             )
-            self.table.loc[:, "KRW"] = interp_krw.values
 
         # Left linear section is all zero:
         self.table.loc[self.table["SW"] < self.swcr, "KRW"] = 0
@@ -546,13 +571,10 @@ class WaterOil(object):
         else:
             assert 0 < krwend <= 1.0
 
-        self.table["KRW"] = (
-            krwend
-            * self.table["SWN"] ** l
-            / ((self.table["SWN"] ** l) + e * (1 - self.table["SWN"]) ** t)
-        )
+        swn = self.swn
+        self.table["KRW"] = kernels.get("let")(swn.values, l, e, t, krwend)
         # This equation is undefined for t a float and swn=1, set explicitly:
-        self.table.loc[np.isclose(self.table["SWN"], 1.0), "KRW"] = krwend
+        self.table.loc[np.isclose(swn, 1.0), "KRW"] = krwend
 
         self.set_endpoints_linearpart_krw(krwend, krwmax)
 
@@ -591,13 +613,10 @@ class WaterOil(object):
         if kromax is not None:
             self.logger.error("kromax is DEPRECATED, ignored")
 
-        self.table["KROW"] = (
-            kroend
-            * self.table["SON"] ** l
-            / ((self.table["SON"] ** l) + e * (1 - self.table["SON"]) ** t)
-        )
+        son = self.son
+        self.table["KROW"] = kernels.get("let")(son.values, l, e, t, kroend)
         # This equation is undefined for t a float and son=1, set explicitly:
-        self.table.loc[np.isclose(self.table["SON"], 1.0), "KROW"] = kroend
+        self.table.loc[np.isclose(son, 1.0), "KROW"] = kroend
 
         self.table.loc[self.table["SW"] >= (1 - self.sorw), "KROW"] = 0
 
@@ -626,7 +645,7 @@ class WaterOil(object):
         if kromax is not None:
             self.logger.error("kromax is DEPRECATED, ignored")
 
-        self.table["KROW"] = kroend * self.table["SON"] ** now
+        self.table["KROW"] = kernels.get("corey")(self.son.values, now, kroend)
         self.table.loc[self.table["SW"] >= (1 - self.sorw), "KROW"] = 0
 
         self.set_endpoints_linearpart_krow(kroend)
@@ -697,9 +716,7 @@ class WaterOil(object):
         # respect to swirr, not to swl (the swirr here is sometimes
         # called 'swirra' - asymptotic swirr)
 
-        self.table["PC"] = simple_J(
-            self.table["SWNPC"], a, b, poro_ref, perm_ref, drho, g
-        )
+        self.table["PC"] = simple_J(self.swnpc, a, b, poro_ref, perm_ref, drho, g)
         self.pccomment = (
             "-- Simplified J-function for Pc; rms version, in bar\n--   "
             f"a={a:g}, b={b:g}, poro_ref={poro_ref:g}, perm_ref={perm_ref:g} mD,"
@@ -767,11 +784,10 @@ class WaterOil(object):
             )
 
         # Convert from "Petrophysical" a's and b's to "RMS" a's and b's:
-        rms_a = math.pow(1 / a, 1 / b)
-        rms_b = 1 / b
+        rms_a, rms_b = simpleJ_petro_to_rms(a, b)
 
         # Use the other variant of this function for actual computation
-        self.add_simple_J(rms_a, rms_b, poro_ref, perm_ref, drho, g)
+        self.add_simple_J(float(rms_a), float(rms_b), poro_ref, perm_ref, drho, g)
 
         self.pccomment = (
             "-- Simplified J-function for Pc, petrophysical version, in bar \n--   "
@@ -836,7 +852,7 @@ class WaterOil(object):
 
         perm_darcy = perm / 1000
         perm_sq_meters = perm_darcy * 9.869233e-13
-        tmp = (self.table["SWNPC"] / a) ** (1.0 / b)
+        tmp = (self.swnpc / a) ** (1.0 / b)
         tmp = tmp / math.sqrt(perm_sq_meters / poro)
         tmp = tmp * sigma_costau / 1000  # Converting mN/m to N/m
         self.table["PC"] = tmp * pascal_to_bar
@@ -901,17 +917,17 @@ class WaterOil(object):
         # respect to swirr, not to swl (the swirr here is sometimes
         # called 'swirra' - asymptotic swirr)
 
-        # swnpc is generated upon object initialization, but overwritten
-        # here to most likely the same values.
-        self.table["SWNPC"] = (self.table["SW"] - swr) / (1 - swr)
+        # swnpc is also available as a property, but swr can differ
+        # from swirr here:
+        swnpc = (self.table["SW"] - swr) / (1 - swr)
 
         # sonpc is almost like 'son', but swl is not used here:
-        self.table["SONPC"] = (1 - self.table["SW"] - sor) / (1 - sor)
+        sonpc = (1 - self.table["SW"] - sor) / (1 - sor)
 
         # The Skjæveland correlation
-        self.table.loc[self.table["SW"] < 1 - sor, "PC"] = cw / (
-            self.table["SWNPC"] ** aw
-        ) + co / (self.table["SONPC"] ** ao)
+        pcw = cw / np.power(swnpc, aw)
+        pco = co / np.power(sonpc, ao)
+        self.table.loc[self.table["SW"] < 1 - sor, "PC"] = pcw + pco
 
         # From 1-sor, the pc is not defined. Extrapolate constantly, and let
         # the non-monotonicity be fixed in the output generators.
@@ -944,23 +960,19 @@ class WaterOil(object):
         assert epsilon < Tt < MAX_EXPONENT
         assert Pct <= Pcmax
 
+        swnpc = self.swnpc
+
         # The "forced part"
-        self.table["Ffpcow"] = (1 - self.table["SWNPC"]) ** Lp / (
-            (1 - self.table["SWNPC"]) ** Lp + Ep * self.table["SWNPC"] ** Tp
-        )
+        ffpcow = (1 - swnpc) ** Lp / ((1 - swnpc) ** Lp + Ep * np.power(swnpc, Tp))
 
         # The gradual rise part:
-        self.table["Ftpcow"] = self.table["SWNPC"] ** Lt / (
-            self.table["SWNPC"] ** Lt + Et * (1 - self.table["SWNPC"]) ** Tt
-        )
+        ftpcow = np.power(swnpc, Lt) / (np.power(swnpc, Lt) + Et * (1 - swnpc) ** Tt)
 
         # Putting it together:
-        self.table["PC"] = (
-            (Pcmax - Pct) * self.table["Ffpcow"] - Pct * self.table["Ftpcow"] + Pct
-        )
+        self.table["PC"] = (Pcmax - Pct) * ffpcow - Pct * ftpcow + Pct
 
         # Special handling of the interval [0,swirr]
-        self.table.loc[self.table["SWN"] < epsilon, "PC"] = Pcmax
+        self.table.loc[self.swn < epsilon, "PC"] = Pcmax
         self.pccomment = (
             "-- LET correlation for primary drainage Pc;\n"
             f"-- Lp={Lp:g}, Ep={Ep:g}, Tp={Tp:g}, "
@@ -994,31 +1006,21 @@ class WaterOil(object):
         assert Pcmin <= Pct <= Pcmax
 
         # Normalized water saturation including sorw
-        self.table["SWNPCO"] = (self.table["SW"] - self.swirr) / (
-            1 - self.sorw - self.swirr
-        )
+        swnpco = (self.table["SW"] - self.swirr) / (1 - self.sorw - self.swirr)
 
         # The "forced part"
-        self.table["Fficow"] = self.table["SWNPCO"] ** Lf / (
-            self.table["SWNPCO"] ** Lf + Ef * (1 - self.table["SWNPCO"]) ** Tf
-        )
+        fficow = np.power(swnpco, Lf) / (np.power(swnpco, Lf) + Ef * (1 - swnpco) ** Tf)
 
         # The spontaneous part:
-        self.table["Fsicow"] = (1 - self.table["SWNPCO"]) ** Ls / (
-            (1 - self.table["SWNPCO"]) ** Ls + Es * self.table["SWNPCO"] ** Ts
-        )
+        fsicow = (1 - swnpco) ** Ls / ((1 - swnpco) ** Ls + Es * np.power(swnpco, Ts))
 
         # Putting it together:
-        self.table["PC"] = (
-            (Pcmax - Pct) * self.table["Fsicow"]
-            + (Pcmin - Pct) * self.table["Fficow"]
-            + Pct
-        )
+        self.table["PC"] = (Pcmax - Pct) * fsicow + (Pcmin - Pct) * fficow + Pct
 
         # Special handling of the interval [0,swirr]
-        self.table.loc[self.table["SWNPCO"] < epsilon, "PC"] = Pcmax
+        self.table.loc[swnpco < epsilon, "PC"] = Pcmax
         # and [1-sorw,1]
-        self.table.loc[self.table["SWNPCO"] > 1 - epsilon, "PC"] = Pcmin
+        self.table.loc[swnpco > 1 - epsilon, "PC"] = Pcmin
         self.pccomment = (
             "-- LET correlation for imbibition Pc;\n"
             f"-- Ls={Ls:g}, Es={Es:g}, Ts={Ts:g}, "
@@ -1083,6 +1085,12 @@ class WaterOil(object):
         assert self.table[curve].sum() > 0
         return estimate_diffjumppoint(self.table, xcol="SW", ycol=curve, side="left")
 
+    def _default_pc(self) -> None:
+        """Add zero capillary pressure if there is none, before output"""
+        if "PC" not in self.table.columns:
+            self.table["PC"] = 0.0
+            self.pccomment = "-- Zero capillary pressure\n"
+
     def crosspoint(self) -> float:
         """Locate and return the saturation point where krw = krow
 
@@ -1108,6 +1116,7 @@ class WaterOil(object):
         Args:
             mode: "SWOF" or "SWFN". If SWFN, krow is not required.
         """
+        stats.increment("selfcheck_calls")
         error = False
         if "KRW" not in self.table:
             self.logger.error("krw data not found")
@@ -1176,7 +1185,7 @@ class WaterOil(object):
                 be printed. Defualt True
 
         """
-        if not self.fast and not self.selfcheck():
+        if self.validation != "none" and not checked(self, "selfcheck"):
             # selfcheck failed and has issued an error message
             return ""
         string = ""
@@ -1184,15 +1193,13 @@ class WaterOil(object):
             string += "SWOF\n"
         string += comment_formatter(self.tag)
         string += "-- pyscal: " + str(pyscal.__version__) + "\n"
-        if "PC" not in self.table.columns:
-            self.table["PC"] = 0.0
-            self.pccomment = "-- Zero capillary pressure\n"
+        self._default_pc()
         if dataincommentrow:
             string += self.swcomment
             string += self.krwcomment
             string += self.krowcomment
-            if not self.fast:
-                string += f"-- krw = krow @ sw={self.crosspoint():1.5f}\n"
+            if self.validation == "full":
+                string += f"-- krw = krow @ sw={checked(self, 'crosspoint'):1.5f}\n"
             string += self.pccomment
         width = 10
         string += (
@@ -1210,8 +1217,9 @@ class WaterOil(object):
                 "KRW": {"sign": 1, "lower": 0, "upper": 1},
                 "PC": {"sign": -1, "allowzero": True},
             }
-            if not self.fast
+            if self.validation == "full"
             else None,
+            cache=self._formatcache,
         )
         string += "/\n"  # Empty line at the end
         return string
@@ -1244,13 +1252,11 @@ class WaterOil(object):
                 string, overrides what this object can provide. Used by GasWater.
                 If None, it will be computed, use empty string to avoid.
         """
-        if not self.selfcheck(mode="SWFN"):
+        if self.validation != "none" and not checked(self, "selfcheck", "SWFN"):
             # selfcheck will print errors/warnings
             return ""
         string = ""
-        if "PC" not in self.table.columns:
-            self.table["PC"] = 0.0
-            self.pccomment = "-- Zero capillary pressure\n"
+        self._default_pc()
         if header:
             string += "SWFN\n"
         string += comment_formatter(self.tag)
@@ -1262,8 +1268,8 @@ class WaterOil(object):
                 string += self.swcomment
             string += self.krwcomment
             if crosspointcomment is None:
-                if "KROW" in self.table.columns and not self.fast:
-                    string += f"-- krw = krow @ sw={self.crosspoint():1.5f}\n"
+                if "KROW" in self.table.columns and self.validation == "full":
+                    string += f"-- krw = krow @ sw={checked(self, 'crosspoint'):1.5f}\n"
             else:
                 string += crosspointcomment
             string += self.pccomment
@@ -1281,18 +1287,20 @@ class WaterOil(object):
                 "KRW": {"sign": 1, "lower": 0, "upper": 1},
                 "PC": {"sign": -1, "allowzero": True},
             }
-            if not self.fast
+            if self.validation == "full"
             else None,
+            cache=self._formatcache,
         )
         string += "/\n"  # Empty line at the end
         return string
 
     def WOTABLE(self, header: bool = True, dataincommentrow: bool = True) -> str:
         """Return a string for a Nexus WOTABLE"""
+        if self.validation != "none" and not checked(self, "selfcheck"):
+            # selfcheck failed and has issued an error message
+            return ""
         string = ""
-        if "PC" not in self.table.columns:
-            self.table["PC"] = 0.0
-            self.pccomment = "-- Zero capillary pressure\n"
+        self._default_pc()
 
         if header:
             string += "WOTABLE\n"
@@ -1302,8 +1310,8 @@ class WaterOil(object):
             string += self.swcomment.replace("--", "!")
             string += self.krwcomment.replace("--", "!")
             string += self.krowcomment.replace("--", "!")
-            if not self.fast:
-                string += f"! krw = krow @ sw={self.crosspoint():1.5f}\n"
+            if self.validation == "full":
+                string += f"! krw = krow @ sw={checked(self, 'crosspoint'):1.5f}\n"
             string += self.pccomment.replace("--", "!")
         width = 10
         string += (
@@ -1321,8 +1329,9 @@ class WaterOil(object):
                 "KRW": {"sign": 1, "lower": 0, "upper": 1},
                 "PC": {"sign": -1, "allowzero": True},
             }
-            if not self.fast
+            if self.validation == "full"
             else None,
+            cache=self._formatcache,
         )
         return string
 
@@ -1335,11 +1344,16 @@ class WaterOil(object):
         linestyle: str = "-",
         label: str = "",
         logyscale: bool = False,
+        decimate: bool = False,
     ) -> None:
         """Plot capillary pressure (pc)
 
         If mpl_ax is supplied, the curve will be drawn on
         that, if not, a new axis (plot) will be made
+
+        If decimate is True, the curves are drawn through a subset of the
+        table rows, enough for the resolution of the axis, see
+        pyscal.utils.decimation. The table is not modified.
         """
         # pylint: disable=import-outside-toplevel
         # Lazy import for speed reaons.
@@ -1354,7 +1368,12 @@ class WaterOil(object):
         if logyscale:
             useax.set_yscale("log")
             useax.set_ylim([1e-6, 100])
-        self.table.plot(
+        table = self.table
+        if decimate:
+            table = decimation.decimate_table(
+                table, "SW", ["PC"], decimation.axis_pixels(useax)
+            )
+        table.plot(
             ax=useax,
             x="SW",
             y="PC",
@@ -1378,12 +1397,18 @@ class WaterOil(object):
         marker: Optional[str] = None,
         label: str = "",
         logyscale: bool = False,
+        decimate: bool = False,
     ) -> None:
         """Plot krw and krow
 
         If the argument 'mpl_ax' is not supplied, a new plot
         window will be made. If supplied, it will draw on
-        the specified axis."""
+        the specified axis.
+
+        If decimate is True, the curves are drawn through a subset of the
+        table rows, enough for the resolution of the axis, see
+        pyscal.utils.decimation. The table is not modified.
+        """
         # pylint: disable=import-outside-toplevel
         # Lazy import for speed reaons.
         import matplotlib
@@ -1397,7 +1422,12 @@ class WaterOil(object):
         if logyscale:
             useax.set_yscale("log")
             useax.set_ylim([1e-8, 1])
-        self.table.plot(
+        table = self.table
+        if decimate:
+            table = decimation.decimate_table(
+                table, "SW", ["KRW", "KROW"], decimation.axis_pixels(useax)
+            )
+        table.plot(
             ax=useax,
             x="SW",
             y="KRW",
@@ -1409,7 +1439,7 @@ class WaterOil(object):
             linestyle=linestyle,
             marker=marker,
         )
-        self.table.plot(
+        table.plot(
             ax=useax,
             x="SW",
             y="KROW",
@@ -7,14 +7,15 @@ import pandas as pd
 
 import pyscal
 from pyscal.constants import SWINTEGERS
+from pyscal.utils.pickling import PicklableLogger
 from pyscal.utils.string import comment_formatter, df2str
-from pyscal import getLogger_pyscal
+from pyscal.utils.validation import FastFlag, validation_level
 
 from .gasoil import GasOil
 from .wateroil import WaterOil
 
 
-class WaterOilGas(object):
+class WaterOilGas(FastFlag, PicklableLogger):
 
     """A representation of three-phase properties for oil-water-gas
 
@@ -40,7 +41,11 @@ class WaterOilGas(object):
         h: Saturation intervals in generated tables.
         tag: Optional text that will be included as comments.
         fast: Set to True if you prefer speed over robustness. Not recommended,
-            pyscal will not guarantee valid output in this mode.
+            pyscal will not guarantee valid output in this mode. Equivalent
+            to validation="none".
+        validation: Level of validation when making output, "none",
+            "cheap" or "full", see pyscal.utils.validation. Overrides
+            fast if given. Default "full".
         args: Verbose, debug and output arguments from CLI
             to create logger that splits log messages to stdout and stderr
     """
@@ -56,10 +61,11 @@ class WaterOilGas(object):
         h: Optional[float] = None,
         tag: str = "",
         fast: bool = False,
+        validation: Optional[str] = None,
         args: Optional[dict] = None,
     ) -> None:
         """Sets up the saturation range for three phases"""
-        self.fast: bool = fast
+        self.validation: str = validation_level(validation, fast)
         self.wateroil: Optional[WaterOil] = WaterOil(
             swirr=swirr,
             swl=swl,
@@ -67,7 +73,7 @@ class WaterOilGas(object):
             sorw=sorw,
             h=h,
             tag=tag,
-            fast=fast,
+            validation=self.validation,
             args=args,
         )
         self.gasoil: Optional[GasOil] = GasOil(
@@ -77,10 +83,39 @@ class WaterOilGas(object):
             swl=swl,
             h=h,
             tag=tag,
-            fast=fast,
+            validation=self.validation,
             args=args,
         )
-        self.logger: Optional[object] = getLogger_pyscal(__name__, args)
+        self._set_logger(args)
+
+    @classmethod
+    def from_curves(
+        cls,
+        wateroil: Optional[WaterOil],
+        gasoil: Optional[GasOil],
+        validation: Optional[str] = None,
+        args: Optional[dict] = None,
+    ) -> "WaterOilGas":
+        """Make a WaterOilGas object from existing WaterOil and GasOil objects
+
+        The objects are used as they are, without computing the default
+        saturation ranges of the initializer, and must have compatible
+        saturation ranges. Either can be None, and set later.
+
+        Args:
+            wateroil: WaterOil object, or None.
+            gasoil: GasOil object, or None.
+            validation: Level of validation when making output, "none",
+                "cheap" or "full", see pyscal.utils.validation. Default "full".
+            args: Verbose, debug and output arguments from CLI
+                to create logger that splits log messages to stdout and stderr
+        """
+        wateroilgas = cls.__new__(cls)
+        wateroilgas.validation = validation_level(validation)
+        wateroilgas.wateroil = wateroil
+        wateroilgas.gasoil = gasoil
+        wateroilgas._set_logger(args)
+        return wateroilgas
 
     def selfcheck(self) -> bool:
         """Run selfcheck on both wateroil and gasoil.
@@ -161,7 +196,8 @@ class WaterOilGas(object):
         ):
             self.logger.error("Both WaterOil and GasOil krow/krog is needed for SOF3")
             return ""
-        self.threephaseconsistency()
+        if self.validation != "none":
+            self.threephaseconsistency()
 
         # Copy of the wateroil data:
         table = pd.DataFrame(self.wateroil.table[["SW", "KROW"]])
@@ -26,7 +26,11 @@ REQUIREMENTS = [
 TEST_REQUIREMENTS = Path("test_requirements.txt").read_text().splitlines()
 
 SETUP_REQUIREMENTS = ["pytest-runner", "setuptools >=28", "setuptools_scm"]
-EXTRAS_REQUIRE = {"tests": TEST_REQUIREMENTS}
+EXTRAS_REQUIRE = {
+    "tests": TEST_REQUIREMENTS,
+    "numba": ["numba"],
+    "pyarrow": ["pyarrow"],
+}
 
 setup(
     name="pyscal",
@@ -1,7 +1,8 @@
-"""Example code for benchmarking of the "fast" feature"""
+"""Example code for benchmarking of the "fast" feature and memory footprint"""
 import timeit
 
-from pyscal import WaterOilGas
+from pyscal import SCALrecommendation, WaterOilGas
+from pyscal.utils import kernels
 
 
 def benchme(fast=False, doprint=False):
@@ -28,7 +29,35 @@ def benchme(fast=False, doprint=False):
         print(wog.SGOF())
 
 
+def footprint(h=0.01):
+    """Memory usage in bytes of the tables in a typical interpolated object
+
+    The object is used in the same way as pyscal does for one SATNUM in an
+    ensemble, including endpoint estimation and capillary pressure.
+
+    Run this module directly to print the footprint.
+    """
+    cases = []
+    for nexp in [2, 3, 4]:
+        wog = WaterOilGas(swl=0.1, sorw=0.1, sorg=0.1, h=h)
+        wog.wateroil.add_corey_oil(now=nexp, kroend=0.9)
+        wog.wateroil.add_corey_water(nw=nexp, krwend=0.6)
+        wog.wateroil.add_LET_pc_pd(2, 2, 2, 2, 2, 2, 3, 1)
+        wog.gasoil.add_corey_oil(nog=nexp)
+        wog.gasoil.add_corey_gas(ng=nexp)
+        cases.append(wog)
+    interpolant = SCALrecommendation(*cases, h=h).interpolate(0.5)
+    interpolant.wateroil.add_LET_pc_imb(2, 2, 2, 2, 2, 2, 3, -1, 1)
+    interpolant.wateroil.estimate_sorw()
+    interpolant.gasoil.estimate_sorg()
+    return int(
+        interpolant.wateroil.table.memory_usage(deep=True).sum()
+        + interpolant.gasoil.table.memory_usage(deep=True).sum()
+    )
+
+
 if __name__ == "__main__":
+    print(f"Memory footprint of tables for one SATNUM: {footprint()} bytes")
     print("Running in robust and slow mode:")
     print(
         timeit.timeit(
@@ -41,3 +70,18 @@ if __name__ == "__main__":
             stmt="benchme(fast=True)", setup="from benchme import benchme", number=100
         )
     )
+    for backend in ["numpy", "numba"]:
+        try:
+            kernels.set_backend(backend)
+        except ImportError:
+            print(f"Skipping {backend} kernels, not installed")
+            continue
+        benchme()  # Compiles numba kernels
+        print(f"Running with {backend} kernels:")
+        print(
+            timeit.timeit(
+                stmt="benchme(fast=False)",
+                setup="from benchme import benchme",
+                number=100,
+            )
+        )
@@ -0,0 +1,216 @@
+"""Test the DensePyscalList module"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pyscal.densepyscallist
+from pyscal import (
+    DensePyscalList,
+    GasOil,
+    GasWater,
+    PyscalFactory,
+    PyscalList,
+    WaterOil,
+    WaterOilGas,
+)
+from pyscal.utils.testing import sat_table_str_ok
+
+TESTDIR = Path(__file__).absolute().parent
+
+
+def assert_df_equal(dense_df: pd.DataFrame, list_df: pd.DataFrame) -> None:
+    """Compare dataframes disregarding column order and index"""
+    pd.testing.assert_frame_equal(
+        dense_df.sort_index(axis=1),
+        list_df.sort_index(axis=1).reset_index(drop=True),
+        check_dtype=False,
+    )
+
+
+def test_dense_basic():
+    """Test list behaviour and conversion from objects"""
+    dense = DensePyscalList()
+    assert not dense
+    assert dense.dump_family_1() == ""
+
+    wateroil = WaterOil(swl=0.1, h=0.1)
+    wateroil.add_corey_water()
+    wateroil.add_corey_oil()
+    dense = DensePyscalList([wateroil, WaterOil(swl=0.2, sorw=0.1, h=0.2)])
+    assert len(dense) == 2
+    assert dense.pyscaltype == WaterOil
+    assert isinstance(dense[1], WaterOil)
+    assert dense[2].swl == 0.2
+    assert dense[2].sorw == 0.1
+    assert len(dense[1].table) == len(wateroil.table)
+    assert dense[1].SWOF() == wateroil.SWOF()
+    with pytest.raises(IndexError):
+        # pylint: disable=W0104
+        dense[0]
+    with pytest.raises(IndexError):
+        # pylint: disable=W0104
+        dense[3]
+
+    # The second table has no relperm columns, these must not be
+    # padded into it when recreating the object:
+    assert "KRW" not in dense[2].table
+
+    with pytest.raises(TypeError, match="does not support append"):
+        dense.append(WaterOil())
+    with pytest.raises(ValueError, match="Not a pyscal object"):
+        DensePyscalList([dict()])
+    with pytest.raises(ValueError, match="Trying to add"):
+        DensePyscalList([WaterOil(), GasOil()])
+
+
+@pytest.mark.parametrize("memmap", [False, True])
+def test_dense_streaming(memmap, tmp_path, monkeypatch):
+    """Objects are copied into the arrays as they arrive, growing the arrays"""
+    monkeypatch.setattr(pyscal.densepyscallist, "GROWTH_CHUNK", 2)
+    memmap_dir = tmp_path / "memmap" if memmap else None
+    events = []
+    added = []
+
+    def wateroils():
+        for idx in range(9):
+            wateroil = WaterOil(swl=0.01 * idx, h=0.3 / (idx + 1))
+            wateroil.add_corey_water()
+            if idx % 3:
+                wateroil.add_corey_oil()
+            added.append(wateroil)
+            events.append(("yield", idx))
+            yield wateroil
+
+    original_store = DensePyscalList._store
+
+    def store(self, idx, tables):
+        events.append(("store", idx))
+        original_store(self, idx, tables)
+
+    monkeypatch.setattr(DensePyscalList, "_store", store)
+    dense = DensePyscalList(wateroils(), memmap_dir=memmap_dir)
+    # Each object is stored before the next one is made:
+    assert events == [(event, idx) for idx in range(9) for event in ["yield", "store"]]
+    assert len(dense) == 9
+    assert_df_equal(dense.df(), PyscalList(added).df())
+    assert dense.columns["table"]["SW"].shape == (9, len(added[-1].table))
+    assert dense.dump_family_1() == PyscalList(added).dump_family_1()
+    if memmap:
+        assert sorted(path.name for path in memmap_dir.iterdir()) == [
+            "table.KROW.npy",
+            "table.KRW.npy",
+            "table.SW.npy",
+        ]
+
+
+def test_dense_keywords(tmp_path):
+    """Keyword output must be identical to PyscalList"""
+    relperm_data = PyscalFactory.load_relperm_df(
+        TESTDIR / "data/relperm-input-example.xlsx"
+    )
+    pyscal_list = PyscalFactory.create_pyscal_list(relperm_data)
+    for memmap_dir in [None, tmp_path / "arrays"]:
+        dense = DensePyscalList(pyscal_list, memmap_dir=memmap_dir)
+        assert_df_equal(dense.df(), pyscal_list.df())
+        assert len(dense) == len(pyscal_list)
+        assert dense.pyscaltype == WaterOilGas
+
+        fam1 = dense.dump_family_1()
+        sat_table_str_ok(fam1)
+        assert fam1 == pyscal_list.dump_family_1()
+        assert dense.dump_family_2() == pyscal_list.dump_family_2()
+        assert dense.build_eclipse_data(family=1) == pyscal_list.build_eclipse_data(
+            family=1
+        )
+
+    assert (tmp_path / "arrays" / "wateroil.table.SW.npy").is_file()
+    assert isinstance(dense.columns["wateroil.table"]["SW"], np.memmap)
+
+
+def test_dense_gaswater():
+    """Test a list of GasWater objects"""
+    gaswater = GasWater(swl=0.1, h=0.1)
+    gaswater.add_corey_water()
+    gaswater.add_corey_gas()
+    pyscal_list = PyscalList([gaswater, gaswater])
+    dense = DensePyscalList(pyscal_list)
+    assert dense.pyscaltype == GasWater
+    assert dense[2].swl == 0.1
+    assert dense[1].wateroil.swl == 0.1
+    dframe = dense.df()
+    assert set(dframe["SATNUM"]) == {1, 2}
+    assert {"SW", "KRW", "SG", "KRG"}.issubset(dframe.columns)
+
+
+def test_dense_scalrec(tmp_path):
+    """Interpolation in a DensePyscalList of SCAL recommendations"""
+    scalrec_data = PyscalFactory.load_relperm_df(
+        TESTDIR / "data/scal-pc-input-example.xlsx"
+    )
+    scalrec_list = PyscalFactory.create_scal_recommendation_list(scalrec_data, h=0.1)
+    dense_scalrec = DensePyscalList(scalrec_list)
+    assert_df_equal(dense_scalrec.df(), scalrec_list.df())
+    assert set(dense_scalrec.df()["CASE"]) == {"pess", "base", "opt"}
+
+    with pytest.raises(TypeError):
+        dense_scalrec.SWOF()
+
+    dense_wog = dense_scalrec.interpolate(-0.3, [0, 0.5, 1], memmap_dir=tmp_path)
+    assert isinstance(dense_wog, DensePyscalList)
+    assert dense_wog.pyscaltype == WaterOilGas
+    wog_list = scalrec_list.interpolate(-0.3, [0, 0.5, 1])
+    assert_df_equal(dense_wog.df(), wog_list.df())
+    assert dense_wog.SWOF() == wog_list.SWOF()
+    assert dense_wog.SGOF() == wog_list.SGOF()
+    assert (
+        dense_scalrec.interpolate(-0.3, [0, 0.5, 1], processes=2).SGOF()
+        == wog_list.SGOF()
+    )
+
+    with pytest.raises(ValueError, match="Too few interpolation parameters"):
+        dense_scalrec.interpolate([-1, 1])
+
+
+def test_bundle(tmp_path):
+    """Save and reopen bundles"""
+    relperm_data = PyscalFactory.load_relperm_df(
+        TESTDIR / "data/relperm-input-example.xlsx"
+    )
+    pyscal_list = PyscalFactory.create_pyscal_list(relperm_data)
+    list_df = pyscal_list.df()
+    pyscal_list.save_bundle(tmp_path / "bundle")
+    assert (tmp_path / "bundle" / "index.json").is_file()
+
+    bundle = PyscalList.open_bundle(tmp_path / "bundle")
+    assert isinstance(bundle, DensePyscalList)
+    assert bundle.pyscaltype == WaterOilGas
+    assert len(bundle) == len(pyscal_list)
+    assert isinstance(bundle.columns["wateroil.table"]["KRW"], np.memmap)
+    assert_df_equal(bundle.df(), list_df)
+    assert bundle[2].wateroil.swl == pyscal_list[2].wateroil.swl
+    assert bundle.build_eclipse_data(family=1) == pyscal_list.build_eclipse_data(
+        family=1
+    )
+
+    # Save a reopened bundle elsewhere:
+    bundle.save_bundle(tmp_path / "copy")
+    copied = DensePyscalList.open_bundle(tmp_path / "copy")
+    assert copied.SWOF() == pyscal_list.SWOF()
+
+    # Bundle of SCAL recommendations, type information must survive:
+    scalrec_list = PyscalFactory.create_scal_recommendation_list(
+        PyscalFactory.load_relperm_df(TESTDIR / "data/scal-pc-input-example.xlsx"),
+        h=0.1,
+    )
+    scalrec_list.save_bundle(tmp_path / "scalrec")
+    scalrec_bundle = PyscalList.open_bundle(tmp_path / "scalrec")
+    assert scalrec_bundle[1].type == WaterOilGas
+    assert (
+        scalrec_bundle.interpolate(0.5).SWOF() == scalrec_list.interpolate(0.5).SWOF()
+    )
+
+    with pytest.raises(ValueError, match="Not a pyscal bundle"):
+        PyscalList.open_bundle(tmp_path)
@@ -1,10 +1,13 @@
 """Test the PyscalFactory module"""
+import logging
 import os
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
 
 from pyscal import (
     GasOil,
@@ -779,6 +782,161 @@ def test_load_relperm_df(tmp_path, caplog):
         PyscalFactory.load_relperm_df("mergedcellscase.csv")
 
 
+def test_load_relperm_df_cache(tmp_path, monkeypatch):
+    """Loading through a cache directory gives the same validated data"""
+    pytest.importorskip("pyarrow")
+    testdir = Path(__file__).absolute().parent
+    scalfile_xls = testdir / "data/scal-pc-input-example.xlsx"
+    reference = PyscalFactory.load_relperm_df(scalfile_xls)
+
+    cache_dir = tmp_path / "cache"
+    for _ in range(2):
+        pd.testing.assert_frame_equal(
+            PyscalFactory.load_relperm_df(scalfile_xls, cache_dir=cache_dir),
+            reference,
+        )
+    assert len(list(cache_dir.iterdir())) == 1
+
+    # The validation is applied also to cached data:
+    with pytest.raises(ValueError, match="Non-existing sheet-name"):
+        PyscalFactory.load_relperm_df(
+            scalfile_xls, sheet_name="foo", cache_dir=cache_dir
+        )
+    monkeypatch.setattr(
+        factory.tabular,
+        "_read_cache",
+        lambda path: pd.DataFrame({"SATNUM": [1, 3], "nw": [2, 2]}),
+    )
+    with pytest.raises(ValueError, match="Missing SATNUMs"):
+        PyscalFactory.load_relperm_df(scalfile_xls, cache_dir=cache_dir)
+    monkeypatch.undo()
+
+    monkeypatch.setenv("PYSCAL_CACHE_DIR", str(tmp_path / "envcache"))
+    pd.testing.assert_frame_equal(
+        PyscalFactory.load_relperm_df(scalfile_xls), reference
+    )
+    assert len(list((tmp_path / "envcache").iterdir())) == 1
+
+
+def test_load_relperm_dfs(tmp_path):
+    """Several sheets are loaded and validated at once"""
+    testdir = Path(__file__).absolute().parent
+    relperm_file = testdir / "data/relperm-input-example.xlsx"
+    relperm_dfs = PyscalFactory.load_relperm_dfs(relperm_file)
+    assert list(relperm_dfs) == ["relperm", "simple"]
+    for sheet_name, relperm_df in relperm_dfs.items():
+        pd.testing.assert_frame_equal(
+            relperm_df,
+            PyscalFactory.load_relperm_df(relperm_file, sheet_name=sheet_name),
+        )
+    assert list(
+        PyscalFactory.load_relperm_dfs(relperm_file, sheet_names=["simple"])
+    ) == ["simple"]
+
+    with pytest.raises(ValueError, match="Non-existing sheet-name foo"):
+        PyscalFactory.load_relperm_dfs(relperm_file, sheet_names=["simple", "foo"])
+    with pytest.raises(IOError):
+        PyscalFactory.load_relperm_dfs("not-existing-file")
+    os.chdir(tmp_path)
+    relperm_dfs["simple"].to_csv("relperm.csv")
+    with pytest.raises(ValueError, match="Sheets can only be loaded from XLSX/XLS"):
+        PyscalFactory.load_relperm_dfs("relperm.csv")
+
+    pd.DataFrame({"SATNUM": [1, 3], "nw": [2, 2]}).to_excel(
+        "gaps.xlsx", sheet_name="gaps", index=False
+    )
+    with pytest.raises(ValueError, match="Error in sheet gaps: Missing SATNUMs"):
+        PyscalFactory.load_relperm_dfs("gaps.xlsx")
+
+
+def test_check_relperm_df():
+    """All problems in the input data are reported at once"""
+    testdir = Path(__file__).absolute().parent
+    for filename in ["relperm-input-example.xlsx", "scal-pc-input-example.xlsx"]:
+        relperm_df = PyscalFactory.load_relperm_df(testdir / "data" / filename)
+        assert factory.check_relperm_df(relperm_df).empty
+        assert factory.format_problems(factory.check_relperm_df(relperm_df)) == ""
+
+    problems = factory.check_relperm_df(
+        pd.DataFrame(
+            columns=["SATNUM", "SWL", "sorw", "Nw", "Lw", "Ew", "Tw", "now", "krwend"],
+            data=[
+                [1, 0.1, 0.1, 2, None, None, None, 2, 1],
+                [2, 0.6, 0.5, 0, None, None, None, 2, 1],
+                [3, 0.1, 0.1, None, 2, 1, None, 2, 1.2],
+                [4, "foo", 0.1, 2, None, None, None, None, 1],
+                [5, 0.1, 0.1, None, 2, 1, 1, 2, 1],
+            ],
+        )
+    )
+    assert list(zip(problems["SATNUM"], problems["PROBLEM"])) == [
+        (2, "Corey exponent nw must be positive and less than 100"),
+        (2, "swl must be less than 1 - sorw"),
+        (3, "Missing water parametrization, needs nw or all of lw, ew, tw"),
+        (3, "krwend must be larger than 0 and at most 1"),
+        (4, "Not a number"),
+        (
+            4,
+            "Missing oil (water-oil) parametrization, "
+            "needs now or all of low, eow, tow",
+        ),
+    ]
+    assert problems["PARAMETERS"][1] == "swl=0.6, sorw=0.5"
+    report = factory.format_problems(problems)
+    assert report.startswith("Found 6 problems in 3 SATNUMs")
+    assert "SATNUM 3: Missing water parametrization" in report
+
+    # Gas-oil consistency and the number of cases in SCAL recommendations:
+    problems = factory.check_relperm_df(
+        pd.DataFrame(
+            columns=["SATNUM", "CASE", "swl", "sgcr", "sorg", "sgro", "ng", "nog"],
+            data=[
+                [1, "low", 0.1, 0.1, 0.1, 0, 2, 2],
+                [1, "base", 0.5, 0.3, 0.3, 0, 2, 2],
+                [1, "high", 0.1, 0.1, 0.1, 0.05, 2, 2],
+                [2, "low", 0.1, 0.1, 0.1, 0, 2, 2],
+                [2, "base", 0.1, 0.1, 0.1, 0, 2, 2],
+            ],
+        )
+    )
+    assert list(zip(problems["SATNUM"], problems["CASE"], problems["PROBLEM"])) == [
+        (1, "high", "sgro must be zero or equal to sgcr"),
+        (1, "base", "swl + sgcr + sorg must be less than 1"),
+        (2, None, "Expected 3 cases for SATNUM, got 2"),
+    ]
+    assert "SATNUM 1 (high): sgro" in factory.format_problems(problems)
+
+    # Columns not used by the factory are not checked:
+    assert factory.check_relperm_df(
+        pd.DataFrame(
+            columns=["SATNUM", "swl", "nw", "now", "FACIES"],
+            data=[[1, 0.1, 2, 3, "sand"]],
+        )
+    ).empty
+
+
+@settings(deadline=None, max_examples=50)
+@given(
+    st.floats(-0.1, 0.7),
+    st.floats(-0.1, 0.7),
+    st.floats(-0.1, 0.6),
+    st.floats(-1, 5),
+    st.floats(0, 1.3),
+    st.floats(0, 0.6),
+)
+def test_check_relperm_df_wateroilgas(swl, swcr, sorw, nw, krwend, sgcr):
+    """Parameters without reported problems can be used for curves, and
+    vice versa"""
+    params = dict(swl=swl, swcr=swcr, sorw=sorw, nw=nw, krwend=krwend, now=2)
+    params.update(sgcr=sgcr, sorg=0.1, ng=2, nog=2)
+    problems = factory.check_relperm_df(pd.DataFrame([params]))
+    try:
+        PyscalFactory.create_water_oil_gas(params)
+        assert problems.empty
+    except (AssertionError, ValueError) as err:
+        assert not problems.empty, str(err)
+
+
 def test_many_nans():
     """Excel or oocalc sometimes saves a xlsx file that gives all NaN rows and
     all-NaN columns, maybe some column setting that triggers Pandas to load
@@ -864,6 +1022,71 @@ def test_create_scal_recommendation_list():
         )
 
 
+def test_duplicated_parameter_rows(caplog):
+    """Rows that only differ in SATNUM and TAG are computed once"""
+    dframe = PyscalFactory.load_relperm_df(
+        pd.DataFrame(
+            columns=["SATNUM", "TAG", "swl", "nw", "now", "ng", "nog", "nw_gw"],
+            data=[
+                [1, "facies A", 0.1, 2, 2, 2, 2, 3],
+                [2, "facies B", 0.2, 2, 2, 2, 2, 3],
+                [3, "facies A, other region", 0.1, 2, 2, 2, 2, 3],
+            ],
+        )
+    )
+    caplog.set_level(logging.INFO, logger="pyscal.factory")
+    wog_list = PyscalFactory.create_wateroilgas_list(dframe, h=0.1)
+    assert "Computed 2 distinct parameter sets for 3 SATNUMs" in caplog.text
+    assert wog_list[3].wateroil is not wog_list[1].wateroil
+    assert wog_list[3].tag == "SATNUM 3 facies A, other region"
+    assert wog_list[1].tag == "SATNUM 1 facies A"
+    assert (
+        wog_list[3]
+        .SWOF()
+        .replace("SATNUM 3 facies A, other region", "SATNUM 1 facies A")
+        == wog_list[1].SWOF()
+    )
+    pd.testing.assert_frame_equal(wog_list[3].gasoil.table, wog_list[1].gasoil.table)
+
+    two_phase_dframe = dframe.drop(["nw_gw"], axis="columns")
+    for pyscal_list in [
+        PyscalFactory.create_wateroil_list(two_phase_dframe, h=0.1),
+        PyscalFactory.create_gasoil_list(two_phase_dframe, h=0.1),
+        PyscalFactory.create_gaswater_list(
+            dframe.drop(["nw", "now", "nog"], axis="columns").rename(
+                {"nw_gw": "nw"}, axis="columns"
+            ),
+            h=0.1,
+        ),
+    ]:
+        assert pyscal_list[3].tag == "SATNUM 3 facies A, other region"
+        assert pyscal_list[1].tag == "SATNUM 1 facies A"
+        assert pyscal_list[2].tag == "SATNUM 2 facies B"
+
+    # Clones are independent:
+    wog_list[3].wateroil.add_corey_water(nw=4)
+    assert not wog_list[3].wateroil.table.equals(wog_list[1].wateroil.table)
+
+    caplog.clear()
+    scal_dframe = PyscalFactory.load_relperm_df(
+        pd.concat(
+            [
+                dframe.drop(["TAG"], axis="columns").assign(CASE=case, nw=nw)
+                for case, nw in [("low", 1), ("base", 2), ("high", 3)]
+            ]
+        ).assign(TAG=lambda x: "case " + x["CASE"])
+    )
+    scal_list = PyscalFactory.create_scal_recommendation_list(scal_dframe, h=0.1)
+    assert "Computed 2 distinct parameter sets for 3 SATNUMs" in caplog.text
+    assert scal_list[3].low.tag == "SATNUM 3 case low"
+    assert scal_list[3].high.tag == "SATNUM 3 case high"
+    assert scal_list[1].high.tag == "SATNUM 1 case high"
+    pd.testing.assert_frame_equal(
+        scal_list[3].interpolate(0.5).wateroil.table,
+        scal_list[1].interpolate(0.5).wateroil.table,
+    )
+
+
 def test_create_pyscal_list():
     """Test the factory methods for making pyscal lists"""
     testdir = Path(__file__).absolute().parent
@@ -6,7 +6,7 @@ import pandas as pd
 import pytest
 from hypothesis import given, settings
 
-from pyscal import GasOil, WaterOil, WaterOilGas
+from pyscal import GasOil, PyscalFactory, PyscalList, WaterOil, WaterOilGas
 from pyscal.utils.testing import check_table, float_df_checker
 
 
@@ -625,6 +625,42 @@ def test_fromtable_types():
         )
 
 
+def test_fromtable_input_unchanged():
+    """The incoming dataframe must not be modified by add_fromtable(),
+    also when columns are converted, pc has infinite values or max sg is
+    perturbed"""
+    dframe = pd.DataFrame(
+        columns=["SW", "KRW", "KROW", "PC"],
+        data=[["0", "0", "1", "inf"], ["0.5", "0.2", "0.3", "2"], ["1", "1", "0", "0"]],
+    )
+    original = dframe.copy()
+    wateroil = WaterOil(h=0.1)
+    wateroil.add_fromtable(dframe, pccolname="PC")
+    check_table(wateroil.table)
+    pd.testing.assert_frame_equal(dframe, original)
+
+    dframe = pd.DataFrame(
+        columns=["SG", "KRG", "KROG", "PCOG"],
+        data=[[0, 0, 1, 0], [0.5, 0.2, 0.3, 0.5], [1 - 1e-10, 1, 0, 1]],
+    )
+    original = dframe.copy()
+    gasoil = GasOil(h=0.1)
+    gasoil.add_fromtable(dframe)
+    check_table(gasoil.table)
+    pd.testing.assert_frame_equal(dframe, original)
+
+
+def test_fromtable_large():
+    """Tables with many rows are resampled like short tables"""
+    sw = np.linspace(0, 1, 100000)
+    dframe = pd.DataFrame({"SW": sw, "KRW": np.square(sw), "KROW": np.square(1 - sw)})
+    wateroil = WaterOil(h=0.01)
+    wateroil.add_fromtable(dframe)
+    check_table(wateroil.table)
+    assert np.isclose(wateroil.table["KRW"], wateroil.table["SW"] ** 2).all()
+    assert np.isclose(wateroil.table["KROW"], (1 - wateroil.table["SW"]) ** 2).all()
+
+
 @settings(deadline=2000)
 @given(st.floats(min_value=1e-5, max_value=1))
 def test_wo_fromtable_h(h):
@@ -636,3 +672,77 @@ def test_wo_fromtable_h(h):
     wateroil = WaterOil(h=h, swl=0.15, sorw=1 - 0.89)
     wateroil.add_fromtable(df1)
     check_table(wateroil.table)
+
+
+def test_fromtable_list():
+    """Batched creation from a dataframe with many SATNUMs must give the
+    same result as add_fromtable() on each SATNUM"""
+    wateroils = []
+    gasoils = []
+    for satnum in range(1, 5):
+        wateroil = WaterOil(swl=0.05 * satnum, sorw=0.3 - 0.05 * satnum, h=0.05)
+        wateroil.add_corey_water(nw=satnum)
+        wateroil.add_corey_oil(now=5 - satnum)
+        wateroil.add_simple_J()
+        wateroils.append(wateroil)
+        gasoil = GasOil(swl=0.05 * satnum, sgcr=0.05, sorg=0.1, h=0.05)
+        gasoil.add_corey_gas(ng=satnum)
+        gasoil.add_corey_oil(nog=5 - satnum)
+        gasoils.append(gasoil)
+
+    for objects in [wateroils, gasoils]:
+        # Shuffle the SATNUMs, the order within each SATNUM is kept:
+        dframe = (
+            PyscalList(objects)
+            .df()
+            .sort_values("SATNUM", ascending=False, kind="stable")
+        )
+        pyscal_list = PyscalFactory.create_fromtable_list(dframe, h=0.02)
+        assert len(pyscal_list) == len(objects)
+        for satnum, satnum_df in dframe.groupby("SATNUM"):
+            if "SW" in satnum_df:
+                reference = WaterOil(swl=satnum_df["SW"].min(), h=0.02)
+                reference.add_fromtable(satnum_df)
+                assert pyscal_list[satnum].sorw == reference.sorw
+                assert pyscal_list[satnum].swcr == reference.swcr
+            else:
+                reference = GasOil(swl=1 - satnum_df["SG"].max(), h=0.02)
+                reference.add_fromtable(satnum_df)
+                assert pyscal_list[satnum].sgcr == reference.sgcr
+                assert pyscal_list[satnum].sorg == reference.sorg
+            pd.testing.assert_frame_equal(pyscal_list[satnum].table, reference.table)
+            check_table(pyscal_list[satnum].table)
+
+
+def test_fromtable_list_errors():
+    """Errors for all SATNUMs are reported together"""
+    dframe = pd.DataFrame(
+        columns=["SATNUM", "SW", "KRW", "KROW"],
+        data=[
+            [1, 0.1, 0, 1],
+            [1, 1, 1.1, 0],
+            [2, 0.1, 0, 1],
+            [2, 1, 1, 0],
+            [3, 0.1, 0.5, 1],
+            [3, 1, 0.2, 0],
+            [4, 1, 0, 1],
+            [4, 0.1, 0, 1],
+        ],
+    )
+    with pytest.raises(ValueError) as err:
+        PyscalFactory.create_fromtable_list(dframe)
+    message = str(err.value)
+    assert "KRW is above 1 for SATNUM 1\n" in message
+    assert "KRW not monotone for SATNUM 3" in message
+    assert "SW data not sorted or missing for SATNUM 4" in message
+    assert "SATNUM 2" not in message
+
+    with pytest.raises(ValueError, match="SATNUM column is required"):
+        PyscalFactory.create_fromtable_list(dframe.drop("SATNUM", axis="columns"))
+    with pytest.raises(ValueError, match="Both SW and SG"):
+        PyscalFactory.create_fromtable_list(dframe.assign(SG=0))
+    with pytest.raises(ValueError, match="Error for SATNUM 2"):
+        # pc does not cover the saturation range:
+        PyscalFactory.create_fromtable_list(
+            dframe[dframe["SATNUM"] == 2].assign(SW=[0.1, 0.9], PCOW=[2, 1])
+        )
@@ -105,6 +105,7 @@ def test_plotting(mocker):
     gasoil.plotkrgkrog(mpl_ax=matplotlib.pyplot.subplots()[1])
     gasoil.plotkrgkrog(mpl_ax=None)
     gasoil.plotkrgkrog(logyscale=True, mpl_ax=None)
+    gasoil.plotkrgkrog(mpl_ax=matplotlib.pyplot.subplots()[1], decimate=True)
 
 
 @settings(deadline=300)
@@ -136,27 +137,29 @@ def test_gasoil_normalization(swl, sgcr, sorg, h, tag):
     )
     assert not gasoil.table.empty
     assert not gasoil.table.isnull().values.any()
+    table = gasoil.table.assign(SGN=gasoil.sgn, SON=gasoil.son)
 
     # Check that son is 1 at sg=0
-    assert float_df_checker(gasoil.table, "SG", 0, "SON", 1)
+    assert float_df_checker(table, "SG", 0, "SON", 1)
 
     # Check that son is 0 at sorg with this krgendanchor.
     # It is important to use the endpoints from the returned gasoil
     # object, as they can be modified in case they are too close to zero.
-    assert float_df_checker(gasoil.table, "SG", 1 - gasoil.sorg - gasoil.swl, "SON", 0)
+    assert float_df_checker(table, "SG", 1 - gasoil.sorg - gasoil.swl, "SON", 0)
 
     # Check that sgn is 0 at sgcr
-    assert float_df_checker(gasoil.table, "SG", gasoil.sgcr, "SGN", 0)
+    assert float_df_checker(table, "SG", gasoil.sgcr, "SGN", 0)
 
     # Check that sgn is 1 at sorg
-    assert float_df_checker(gasoil.table, "SG", 1 - gasoil.sorg - gasoil.swl, "SGN", 1)
+    assert float_df_checker(table, "SG", 1 - gasoil.sorg - gasoil.swl, "SGN", 1)
 
     # Redo with different krgendanchor
     gasoil = GasOil(
         swirr=0.0, swl=swl, sgcr=sgcr, sorg=sorg, h=h, krgendanchor="", tag=tag
     )
-    assert float_df_checker(gasoil.table, "SG", 1 - gasoil.swl, "SGN", 1)
-    assert float_df_checker(gasoil.table, "SG", gasoil.sgcr, "SGN", 0)
+    table = gasoil.table.assign(SGN=gasoil.sgn)
+    assert float_df_checker(table, "SG", 1 - gasoil.swl, "SGN", 1)
+    assert float_df_checker(table, "SG", gasoil.sgcr, "SGN", 0)
 
 
 @settings(deadline=1000)
@@ -221,31 +224,32 @@ def test_gasoil_krendmax(
 def check_endpoints(gasoil, krgend, krgmax, kroend, kromax):
     """Discrete tests that endpoints get numerically correct"""
     swtol = 1 / SWINTEGERS
+    table = gasoil.table.assign(SGN=gasoil.sgn, SON=gasoil.son)
 
     # Oil curve, from sg = 0 to sg = 1:
     if gasoil.sgro > 0:
         # Gas-condensate: sgcr = sgro > 0
         assert float_df_checker(gasoil.table, "SG", 0, "KROG", kromax)
-        assert float_df_checker(gasoil.table, "SON", 1.0, "KROG", kroend)
+        assert float_df_checker(table, "SON", 1.0, "KROG", kroend)
         assert np.isclose(gasoil.table["KROG"].max(), kromax)
     else:
         assert float_df_checker(gasoil.table, "SG", 0, "KROG", kroend)
         assert np.isclose(gasoil.table["KROG"].max(), kroend)
 
     # son=0 @ 1 - sorg - swl or 1 - swl) should be zero:
-    assert float_df_checker(gasoil.table, "SON", 0.0, "KROG", 0)
+    assert float_df_checker(table, "SON", 0.0, "KROG", 0)
     # sgn=1 @ 1 - swl:
-    assert float_df_checker(gasoil.table, "SGN", 1.0, "KROG", 0)
+    assert float_df_checker(table, "SGN", 1.0, "KROG", 0)
     assert np.isclose(gasoil.table["KROG"].min(), 0.0)
 
     # Gas curve, from sg=0 to sg=1:
     assert float_df_checker(gasoil.table, "SG", 0.0, "KRG", 0)
-    assert float_df_checker(gasoil.table, "SGN", 0.0, "KRG", 0)
+    assert float_df_checker(table, "SGN", 0.0, "KRG", 0)
     assert float_df_checker(gasoil.table, "SG", gasoil.sgcr, "KRG", 0)
 
     # If krgendanchor == "sorg" then krgmax is irrelevant.
     if gasoil.sorg > swtol and gasoil.sorg > gasoil.h and gasoil.krgendanchor == "sorg":
-        assert float_df_checker(gasoil.table, "SGN", 1.0, "KRG", krgend)
+        assert float_df_checker(table, "SGN", 1.0, "KRG", krgend)
         assert np.isclose(gasoil.table["KRG"].max(), krgmax)
     if gasoil.krgendanchor != "sorg":
         assert np.isclose(gasoil.table["KRG"].max(), krgend)
@@ -341,6 +345,20 @@ def test_linearsegments():
     check_linear_sections(gasoil)
 
 
+def test_no_scratch_columns():
+    """Normalized saturations must not be stored in the table"""
+    gasoil = GasOil(h=0.1, swl=0.1, sgcr=0.2, sorg=0.2)
+    assert set(gasoil.table.columns) == {"SG", "SL"}
+    gasoil.add_LET_gas()
+    gasoil.add_corey_oil()
+    gasoil.estimate_sorg()
+    gasoil.estimate_sgcr()
+    assert set(gasoil.table.columns) == {"SG", "SL", "KRG", "KROG"}
+
+    assert np.isclose(gasoil.sgn.iloc[0], -0.2 / 0.5)
+    assert np.isclose(gasoil.son.iloc[0], 1.0)
+
+
 def test_kroend():
     """Manual testing of kromax and kroend behaviour"""
     gasoil = GasOil(swirr=0.01, sgcr=0.01, h=0.01, swl=0.1, sorg=0.05)
@@ -526,8 +544,6 @@ def test_roundoff():
             [1, 1, 0, 0],
         ],
     )
-    gasoil.table["SGN"] = gasoil.table["SG"]
-    gasoil.table["SON"] = 1 - gasoil.table["SG"]
     # If this value (as string) occurs, then we are victim of floating point truncation
     # in float_format=".7f":
     assert "0.1952404" not in gasoil.SGOF()
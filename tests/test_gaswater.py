@@ -24,17 +24,19 @@ def check_endpoints(gaswater, krwend, krwmax, krgend):
 
     # Check endpoints for gas curve:
     # krg at swl should be krgend:
-    assert float_df_checker(gaswater.gasoil.table, "SGN", 1.0, "KRG", krgend)
+    gasoil_table = gaswater.gasoil.table.assign(SGN=gaswater.gasoil.sgn)
+    assert float_df_checker(gasoil_table, "SGN", 1.0, "KRG", krgend)
     assert float_df_checker(gaswater.gasoil.table, "SL", gaswater.swl, "KRG", krgend)
     # krg at sgcr (sgn is zero there) should be zero:
-    assert float_df_checker(gaswater.gasoil.table, "SGN", 0.0, "KRG", 0.0)
+    assert float_df_checker(gasoil_table, "SGN", 0.0, "KRG", 0.0)
     assert float_df_checker(gaswater.gasoil.table, "SL", 1 - gaswater.sgcr, "KRG", 0.0)
 
     check_linear_sections(gaswater.gasoil)
     check_linear_sections(gaswater.wateroil)
 
     # Check endpoints for water curve: (np.isclose is only reliable around 1)
-    assert float_df_checker(gaswater.wateroil.table, "SWN", 0.0, "KRW", 0.0)
+    wateroil_table = gaswater.wateroil.table.assign(SWN=gaswater.wateroil.swn)
+    assert float_df_checker(wateroil_table, "SWN", 0.0, "KRW", 0.0)
     assert float_df_checker(gaswater.wateroil.table, "SW", gaswater.swcr, "KRW", 0)
 
     if gaswater.sgrw > swtol:
@@ -303,6 +305,7 @@ def test_plotting():
     gaswater.add_corey_gas()
     gaswater.add_corey_water()
     gaswater.plotkrwkrg(mpl_ax=matplotlib.pyplot.subplots()[1])
+    gaswater.plotkrwkrg(mpl_ax=matplotlib.pyplot.subplots()[1], decimate=True)
 
 
 def test_comments():
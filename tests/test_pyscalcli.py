@@ -236,6 +236,70 @@ def test_pyscal_client_static(tmp_path, caplog, default_loglevel, mocker):
     assert linecount2 > linecount1 * 4  # since we don't filter out non-numerical lines
 
 
+def test_pyscal_client_sheets(tmp_path, mocker):
+    """Several sheets are processed in one run, with one output file
+    pr. sheet"""
+    testdir = Path(__file__).absolute().parent
+    relperm_file = testdir / "data/relperm-input-example.xlsx"
+    os.chdir(tmp_path)
+
+    for sheet in ["relperm", "simple"]:
+        mocker.patch(
+            "sys.argv",
+            ["pyscal", str(relperm_file), "--sheet_name", sheet, "-o", f"{sheet}.inc"],
+        )
+        pyscalcli.main()
+
+    mocker.patch(
+        "sys.argv",
+        [
+            "pyscal",
+            str(relperm_file),
+            "--sheet_name",
+            "simple",
+            "--sheet_name",
+            "relperm",
+            "-o",
+            "out/relperm.inc",
+        ],
+    )
+    Path("out").mkdir()
+    pyscalcli.main()
+    for sheet in ["relperm", "simple"]:
+        assert (
+            Path(f"out/relperm_{sheet}.inc").read_text()
+            == Path(f"{sheet}.inc").read_text()
+        )
+    assert not Path("out/relperm.inc").exists()
+
+    mocker.patch(
+        "sys.argv", ["pyscal", str(relperm_file), "--all_sheets", "-o", "all.inc"]
+    )
+    pyscalcli.main()
+    assert sorted(path.name for path in Path(".").glob("all_*.inc")) == [
+        "all_relperm.inc",
+        "all_simple.inc",
+    ]
+    assert Path("all_simple.inc").read_text() == Path("simple.inc").read_text()
+
+    mocker.patch(
+        "sys.argv",
+        [
+            "pyscal",
+            str(relperm_file),
+            "--sheet_name",
+            "simple",
+            "--sheet_name",
+            "foo",
+            "-o",
+            "failed.inc",
+        ],
+    )
+    with pytest.raises(SystemExit, match="Non-existing sheet-name foo"):
+        pyscalcli.main()
+    assert not list(Path(".").glob("failed*"))
+
+
 def test_pyscalcli_exception_catching(capsys, mocker):
     """The command line client catches selected exceptions.
 
@@ -298,6 +362,19 @@ def test_pyscalcli_oilwater(tmp_path, caplog, mocker):
     assert not any(record.levelno == logging.ERROR for record in caplog.records)
 
 
+def test_pyscalcli_extra_columns(tmp_path, mocker):
+    """Columns not used by pyscal are ignored, also when they contain text"""
+    os.chdir(tmp_path)
+    relperm_file = "facies.csv"
+    pd.DataFrame(
+        columns=["SATNUM", "swl", "nw", "now", "FACIES"],
+        data=[[1, 0.1, 2, 3, "sand"], [2, 0.2, 2, 2, "shale"]],
+    ).to_csv(relperm_file, index=False)
+    mocker.patch("sys.argv", ["pyscal", relperm_file, "--output", "facies.inc"])
+    pyscalcli.main()
+    assert open("facies.inc").read().count("SATNUM") == 2
+
+
 def test_pyscalcli_gaswater(tmp_path, caplog, mocker):
     """Test the command line endpoint on gas-water problems"""
     os.chdir(tmp_path)
@@ -423,3 +500,87 @@ def test_pyscal_client_scal(tmp_path, caplog, default_loglevel, mocker):
     )
     with pytest.raises(SystemExit):
         pyscalcli.main()
+
+
+def test_pyscalcli_stats(tmp_path, capsys, mocker):
+    """Runtime statistics can be printed after processing"""
+    os.chdir(tmp_path)
+    relperm_file = "oilwater.csv"
+    pd.DataFrame(columns=["SATNUM", "nw", "now"], data=[[1, 2, 3], [2, 3, 4]]).to_csv(
+        relperm_file, index=False
+    )
+    mocker.patch("sys.argv", ["pyscal", relperm_file, "--stats", "--output", "ow.inc"])
+    pyscalcli.main()
+    captured = capsys.readouterr()
+    assert "pyscal runtime statistics" in captured.out
+    assert "tables_initialized" in captured.out
+    assert "max in SATNUM" in captured.out
+
+    # When the include file goes to stdout, statistics go to stderr:
+    mocker.patch("sys.argv", ["pyscal", relperm_file, "--stats", "--output", "-"])
+    pyscalcli.main()
+    captured = capsys.readouterr()
+    assert "SWOF" in captured.out
+    assert "statistics" not in captured.out
+    assert "pyscal runtime statistics" in captured.err
+
+
+def test_pyscalcli_aggregate_logs(tmp_path, capsys, mocker):
+    """Repeated warnings can be summarized after processing"""
+    os.chdir(tmp_path)
+    relperm_file = "oilwater.csv"
+    pd.DataFrame(
+        columns=["SATNUM", "nw", "now", "sorw"],
+        data=[[1, 2, 3, 0.00005], [2, 3, 4, 0.00005]],
+    ).to_csv(relperm_file, index=False)
+    mocker.patch(
+        "sys.argv", ["pyscal", relperm_file, "--aggregate_logs", "--output", "-"]
+    )
+    pyscalcli.main()
+    captured = capsys.readouterr()
+    assert "SWOF" in captured.out
+    assert "Suppressed" not in captured.out
+    # Messages are summarized by their template:
+    assert "Suppressed 1 repeated log messages" in captured.err
+    assert "2 x WARNING:pyscal.utils.relperm:%s was close to zero" in captured.err
+    assert "(SATNUM 1: 1, 2: 1)" in captured.err
+
+
+@pytest.mark.parametrize("validation", ["none", "cheap", "full"])
+def test_pyscalcli_validation(validation, tmp_path, capsys, mocker):
+    """The validation level can be set from the command line"""
+    os.chdir(tmp_path)
+    relperm_file = "oilwater.csv"
+    pd.DataFrame(columns=["SATNUM", "nw", "now"], data=[[1, 2, 3]]).to_csv(
+        relperm_file, index=False
+    )
+    mocker.patch(
+        "sys.argv",
+        ["pyscal", relperm_file, "--validation", validation, "--output", "-"],
+    )
+    pyscalcli.main()
+    swof = capsys.readouterr().out
+    assert "SWOF" in swof
+    assert ("krw = krow" in swof) == (validation == "full")
+
+    mocker.patch("sys.argv", ["pyscal", relperm_file, "--validation", "fast"])
+    with pytest.raises(SystemExit):
+        pyscalcli.main()
+
+
+def test_pyscalcli_preflight(tmp_path, mocker):
+    """All problems in the input are reported before any curves are computed"""
+    os.chdir(tmp_path)
+    relperm_file = "bad.csv"
+    pd.DataFrame(
+        columns=["SATNUM", "swl", "sorw", "nw", "now"],
+        data=[[1, 0.1, 0.1, 2, 2], [2, 0.6, 0.5, 2, 2], [3, 0.1, 0.1, -1, 2]],
+    ).to_csv(relperm_file, index=False)
+    mocker.patch("sys.argv", ["pyscal", relperm_file, "--output", "relperm.inc"])
+    with pytest.raises(SystemExit) as exit_info:
+        pyscalcli.main()
+    err = str(exit_info.value)
+    assert "Found 2 problems in 2 SATNUMs" in err
+    assert "SATNUM 2: swl must be less than 1 - sorw" in err
+    assert "SATNUM 3: Corey exponent nw" in err
+    assert not Path("relperm.inc").exists()
@@ -1,11 +1,14 @@
 """Test the PyscalList module"""
 
+import asyncio
+import pickle
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 import pytest
 
+import pyscal
 from pyscal import (
     GasOil,
     GasWater,
@@ -127,6 +130,23 @@ def test_load_scalrec(tmp_path):
     ):
         scalrec_list.interpolate(1, [-1, 1, 0, 0])
 
+    # Interpolation in worker processes, in SATNUM order:
+    assert (
+        scalrec_list.interpolate(-0.3, [0, 0.5, 1], processes=2).build_eclipse_data()
+        == scalrec_list.interpolate(-0.3, [0, 0.5, 1]).build_eclipse_data()
+    )
+    with pytest.raises(ValueError, match="Error for SATNUM 3: Interpolation"):
+        scalrec_list.interpolate([-1, 0, 1.1], processes=2)
+    with pytest.raises(ValueError, match="Error for SATNUM 3: Interpolation"):
+        scalrec_list.interpolate([-1, 0, 1.1])
+
+    # Loggers are left out when pickling, for Python 3.6:
+    assert "logger" not in scalrec_list[1].__getstate__()
+    assert "logger" not in scalrec_list[1].base.wateroil.__getstate__()
+    unpickled = pickle.loads(pickle.dumps(scalrec_list[1]))
+    assert unpickled.base.wateroil.logger is scalrec_list[1].base.wateroil.logger
+    assert unpickled.interpolate(0.3).SWOF() == scalrec_list[1].interpolate(0.3).SWOF()
+
     # Test slicing the scalrec to base, this is relevant for API usage.
     base_data = scalrec_data[scalrec_data["CASE"] == "base"].drop("CASE", axis=1)
     PyscalFactory.load_relperm_df(base_data)  # Ensure no errors.
@@ -321,6 +341,76 @@ def test_dump(tmpdir):
     assert "SOF3" in Path("output-fam2.inc").read_text()
 
 
+def test_write_async(tmp_path):
+    """Test writing the same data to many files concurrently"""
+    p_list = PyscalFactory.create_pyscal_list(
+        pd.DataFrame(columns=["SATNUM", "nw", "now"], data=[[1, 2, 2], [2, 3, 3]]),
+        h=0.1,
+    )
+    filenames = [
+        tmp_path / f"realization-{real}" / "iter-0" / "swof.inc" for real in range(5)
+    ]
+    (tmp_path / "realization-4").write_text("")  # Makes the last path invalid
+    loop = asyncio.new_event_loop()
+    errors = loop.run_until_complete(
+        p_list.write_async(filenames, max_concurrency=2, fsync=True)
+    )
+    loop.close()
+    assert list(errors) == [filenames[-1]]
+    for filename in filenames[:-1]:
+        assert filename.read_text() == p_list.build_eclipse_data()
+
+
+def test_plot_report(tmp_path):
+    """Test plotting all SATNUMs to a report file"""
+    testdir = Path(__file__).absolute().parent
+    scalrec_list = PyscalFactory.create_scal_recommendation_list(
+        PyscalFactory.load_relperm_df(testdir / "data/scal-pc-input-example.xlsx"),
+        h=0.1,
+    )
+    scalrec_list.plot_report(tmp_path / "scal.pdf", processes=2)
+    assert (tmp_path / "scal.pdf").read_bytes().startswith(b"%PDF")
+    scalrec_list.interpolate(-0.5).plot_report(tmp_path / "interpolated.html")
+    assert len(list((tmp_path / "interpolated_files").glob("*.png"))) == 3
+
+
+def test_make_ecl_keywords():
+    """Several keywords made in one pass must be equal to the keywords
+    made one by one, also when they share formatted columns"""
+    dframe = pd.DataFrame(
+        columns=["SATNUM", "nw", "now", "ng", "nog", "swl", "a", "b"],
+        data=[[1, 2, 2, 2, 2, 0.1, 2, -2], [2, 3, 3, 3, 3, 0.2, 3, -1]],
+    )
+    p_list = PyscalFactory.create_pyscal_list(
+        PyscalFactory.load_relperm_df(
+            dframe.assign(poro_ref=0.2, perm_ref=100, drho=300)
+        ),
+        h=0.1,
+    )
+    keywords = ["SWOF", "SWFN", "SGOF", "SGFN"]
+    pyscal.reset_stats()
+    separately = {keyword: getattr(p_list, keyword)() for keyword in keywords}
+    assert pyscal.stats()["selfcheck_calls"] == 4 * len(p_list)
+    pyscal.reset_stats()
+    together = p_list.make_ecl_keywords(keywords)
+    assert list(together) == keywords
+    assert together == separately
+    assert pyscal.stats()["formatted_columns_reused"] > 0
+    # The SWOF and SGOF selfchecks are reused for SWFN and SGFN:
+    assert pyscal.stats()["selfcheck_calls"] == 2 * len(p_list)
+    assert not any(
+        "_checks" in vars(part)
+        for wateroilgas in p_list.pyscal_list
+        for part in [wateroilgas, wateroilgas.wateroil, wateroilgas.gasoil]
+    )
+
+    # Modified tables are formatted again:
+    for wateroilgas in p_list.pyscal_list:
+        wateroilgas.wateroil.table["KRW"] = 0.5 * wateroilgas.wateroil.table["KRW"]
+    assert p_list.make_ecl_keywords(["SWOF", "SWFN"])["SWOF"] == p_list.SWOF()
+    assert p_list.SWOF() != separately["SWOF"]
+
+
 def test_capillary_pressure():
     """Test that we recognize capillary pressure parametrizations"""
     dframe = pd.DataFrame(
@@ -1,11 +1,22 @@
 """Test module for SCAL recommendation objects"""
 
+import pickle
+
 import hypothesis.strategies as st
+import numpy as np
 import pandas as pd
 import pytest
 from hypothesis import given, settings
 
-from pyscal import GasWater, PyscalFactory, SCALrecommendation, WaterOil, WaterOilGas
+from pyscal import (
+    CompiledSCALrecommendation,
+    GasWater,
+    PyscalFactory,
+    PyscalList,
+    SCALrecommendation,
+    WaterOil,
+    WaterOilGas,
+)
 from pyscal.factory import slicedict
 from pyscal.utils.testing import check_table, sat_table_str_ok
 
@@ -432,3 +443,147 @@ def test_fast():
     interp = rec.interpolate(-0.5)
     assert not rec.fast
     assert not interp.fast
+
+
+@settings(max_examples=20, deadline=None)
+@given(st.floats(min_value=-1, max_value=1), st.floats(min_value=-1, max_value=1))
+def test_compiled(param_wo, param_go):
+    """Compiled interpolation gives the same tables as the ordinary"""
+    rec = PyscalFactory.create_scal_recommendation(
+        {"low": LOW_SAMPLE_LET, "base": BASE_SAMPLE_LET, "high": HIGH_SAMPLE_LET},
+        "foo",
+        h=0.1,
+    )
+    compiled = rec.compile()
+    assert isinstance(compiled, CompiledSCALrecommendation)
+    assert compiled.compile() is compiled
+
+    # Capillary pressure added after compilation is included:
+    rec.add_simple_J()
+    compiled.add_simple_J()
+
+    try:
+        interpolant = rec.interpolate(param_wo, param_go, h=0.05)
+    except ValueError:
+        with pytest.raises(ValueError):
+            compiled.interpolate(param_wo, param_go, h=0.05)
+        return
+    compiled_interpolant = compiled.interpolate(param_wo, param_go, h=0.05)
+    assert isinstance(compiled_interpolant, WaterOilGas)
+    assert compiled_interpolant.validation == interpolant.validation
+    for obj, compiled_obj in [
+        (interpolant.wateroil, compiled_interpolant.wateroil),
+        (interpolant.gasoil, compiled_interpolant.gasoil),
+    ]:
+        assert obj.tag == compiled_obj.tag
+        assert list(obj.table.columns) == list(compiled_obj.table.columns)
+        assert np.allclose(obj.table.values, compiled_obj.table.values, atol=1e-12)
+    assert interpolant.SWOF() == compiled_interpolant.SWOF()
+    assert interpolant.SGOF() == compiled_interpolant.SGOF()
+
+    keywords = compiled.make_ecl_keywords(["SGOF", "SWOF"], param_wo, param_go, h=0.05)
+    assert list(keywords) == ["SGOF", "SWOF"]
+    assert keywords["SWOF"] == interpolant.SWOF()
+
+
+def test_compiled_twophase():
+    """Compiled water-oil only and gas-water recommendations"""
+    rec = PyscalFactory.create_scal_recommendation(
+        {
+            "low": {"swl": 0.05, "sorw": 0.1, "nw": 1.5, "now": 1.5},
+            "base": {"swl": 0.1, "nw": 2, "now": 2},
+            "high": {"swl": 0.2, "swcr": 0.25, "nw": 3, "now": 3},
+        },
+        h=0.1,
+    )
+    compiled = rec.compile()
+    assert compiled.interpolate(0.3).SWOF() == rec.interpolate(0.3).SWOF()
+    assert compiled.interpolate(0.3).gasoil is None
+    assert compiled.make_ecl_keywords(["SWOF"], 0.3)["SWOF"] == (
+        rec.interpolate(0.3).SWOF()
+    )
+
+    dframe = pd.DataFrame(
+        columns=["SATNUM", "CASE", "NW", "NG"],
+        data=[[1, "low", 2, 2], [1, "base", 3, 3], [1, "high", 4, 4]],
+    )
+    rec = PyscalFactory.create_scal_recommendation_list(
+        PyscalFactory.load_relperm_df(dframe), h=0.1
+    )[1]
+    compiled = rec.compile()
+    assert isinstance(compiled.interpolate(-0.4), GasWater)
+    assert compiled.interpolate(-0.4).SWFN() == rec.interpolate(-0.4).SWFN()
+    assert compiled.interpolate(-0.4).SGFN() == rec.interpolate(-0.4).SGFN()
+    with pytest.raises(ValueError, match="Keyword SWOF not supported"):
+        compiled.make_ecl_keywords(["SWOF"], 0.5)
+
+    # Compiled recommendations are pickled with their resampled curves,
+    # and can be interpolated in lists:
+    unpickled = pickle.loads(pickle.dumps(compiled))
+    assert unpickled.interpolate(0.7).SWFN() == rec.interpolate(0.7).SWFN()
+    rec_list = PyscalList([compiled])
+    assert rec_list.pyscaltype == SCALrecommendation
+    expected = PyscalList([rec]).interpolate(0.2).build_eclipse_data(family=2)
+    assert rec_list.interpolate(0.2).build_eclipse_data(family=2) == expected
+
+
+@pytest.mark.parametrize("parameter, parameter2", [(0.8, None), (0.3, -0.6), (0, 1)])
+def test_interpolate_with_derivatives(parameter, parameter2):
+    """Analytic derivatives agree with one-sided finite differences of the
+    tables, also where the table rows are at knots of the input curves"""
+    # swl differs only in the low case, which gives the same saturation grid
+    # in all interpolants towards high, except for rows at the other
+    # endpoints, while the normalized knots of the cases differ by roundoff:
+    common = {"sgcr": 0.05, "poro_ref": 0.25, "perm_ref": 100, "drho": 300}
+    keys = ["swl", "swcr", "sorw", "sorg", "nw", "now", "ng", "nog", "krwend", "a", "b"]
+    cases = {
+        "low": [0.15, 0.15, 0.2, 0.1, 3, 2.5, 2, 4, 0.5, 2, -1],
+        "base": [0.1, 0.2, 0.1, 0.2, 2, 2, 3, 3, 0.7, 2, -1.5],
+        "high": [0.1, 0.1, 0.05, 0.15, 1.5, 1.5, 4, 2, 0.9, 3, -2],
+    }
+    rec = PyscalFactory.create_scal_recommendation(
+        {case: dict(common, **dict(zip(keys, cases[case]))) for case in cases},
+        h=0.01,
+    )
+    interpolant, derivatives = rec.interpolate_with_derivatives(
+        parameter, parameter2, h=0.01
+    )
+    assert set(derivatives) == {"wateroil", "gasoil"}
+    assert interpolant.SWOF() == rec.interpolate(parameter, parameter2, h=0.01).SWOF()
+
+    if parameter2 is None:
+        parameter2 = parameter
+    delta = 1e-6
+    for name, param in [("wateroil", parameter), ("gasoil", parameter2)]:
+        satcol = derivatives[name].columns[0]
+        table = getattr(interpolant, name).table
+        assert (derivatives[name][satcol] == table[satcol]).all()
+        # Saturation values can differ by roundoff between the interpolants:
+        derivative = derivatives[name].set_index(derivatives[name][satcol].round(8))
+        del derivative[satcol]
+        assert list(derivative.columns) == [
+            col for col in table.columns if col in ["KRW", "KROW", "KRG", "KROG", "PC"]
+        ]
+
+        # Finite differences inside (0, 1) or (-1, 0), where the interpolants
+        # are not copies of the low, base or high objects, on the side of the
+        # derivatives, away from base except at -1 and 1:
+        center = np.clip(param, -1 + 1e-4, 1 - 1e-4)
+        if -1e-4 < center < 1e-4:
+            center = 1e-4
+        step = delta if (center > 0) != (abs(param) == 1) else -delta
+        tables = []
+        for perturbation in [0, step]:
+            if name == "wateroil":
+                perturbed = rec.interpolate(center + perturbation, parameter2, h=0.01)
+            else:
+                perturbed = rec.interpolate(parameter, center + perturbation, h=0.01)
+            perturbed_table = getattr(perturbed, name).table
+            tables.append(perturbed_table.set_index(perturbed_table[satcol].round(8)))
+        # At parameter 0 and 1, the interpolant is a copy with its own grid:
+        rows = derivative.index.intersection(tables[0].index)
+        rows = rows.intersection(tables[1].index)
+        assert len(rows) > 50
+        for col in derivative.columns:
+            one_sided = (tables[1].loc[rows, col] - tables[0].loc[rows, col]) / step
+            assert np.allclose(derivative.loc[rows, col], one_sided, atol=1e-3)
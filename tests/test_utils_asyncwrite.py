@@ -0,0 +1,67 @@
+"""Test concurrent writing of output files"""
+
+import threading
+import time
+
+import pytest
+
+from pyscal.utils import asyncwrite
+
+
+def test_write_files(tmp_path):
+    """Files are written to new directories, existing files are overwritten"""
+    contents = {
+        tmp_path / f"realization-{real}" / "iter-0" / "relperm.inc": f"-- {real}\n"
+        for real in range(20)
+    }
+    (tmp_path / "realization-0" / "iter-0").mkdir(parents=True)
+    (tmp_path / "realization-0" / "iter-0" / "relperm.inc").write_text("old")
+
+    assert asyncwrite.write_files(contents, max_concurrency=4, fsync=True) == {}
+    for path, string in contents.items():
+        assert path.read_text() == string
+
+    # String paths are also accepted:
+    assert asyncwrite.write_files({str(tmp_path / "a.inc"): "a"}) == {}
+    assert (tmp_path / "a.inc").read_text() == "a"
+
+    with pytest.raises(ValueError):
+        asyncwrite.write_files(contents, max_concurrency=0)
+
+
+def test_errors_per_path(tmp_path, caplog):
+    """A failing path does not stop the other writes"""
+    (tmp_path / "notadir").write_text("")
+    bad_path = tmp_path / "notadir" / "relperm.inc"
+    contents = {
+        tmp_path / "real-0" / "relperm.inc": "foo",
+        bad_path: "bar",
+        tmp_path / "real-1" / "relperm.inc": "com",
+    }
+    errors = asyncwrite.write_files(contents)
+    assert list(errors) == [bad_path]
+    assert isinstance(errors[bad_path], OSError)
+    assert f"Could not write {bad_path}" in caplog.text
+    assert (tmp_path / "real-0" / "relperm.inc").read_text() == "foo"
+    assert (tmp_path / "real-1" / "relperm.inc").read_text() == "com"
+
+
+def test_max_concurrency(tmp_path, monkeypatch):
+    """No more than max_concurrency files are written at the same time"""
+    lock = threading.Lock()
+    active = []
+    max_active = []
+
+    def slow_write(path, string, fsync):
+        with lock:
+            active.append(path)
+            max_active.append(len(active))
+        time.sleep(0.01)
+        with lock:
+            active.remove(path)
+
+    monkeypatch.setattr(asyncwrite, "_write_file", slow_write)
+    contents = {tmp_path / f"{idx}.inc": "" for idx in range(30)}
+    assert asyncwrite.write_files(contents, max_concurrency=3) == {}
+    assert len(max_active) == 30
+    assert 1 < max(max_active) <= 3
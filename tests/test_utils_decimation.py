@@ -0,0 +1,68 @@
+"""Test thinning of tabulated curves for plotting"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from pyscal import WaterOil
+from pyscal.utils import decimation
+
+
+def test_decimate():
+    """Endpoints, kinks and crossings are kept"""
+    wateroil = WaterOil(swl=0.1, swcr=0.2, sorw=0.15, h=0.0001)
+    wateroil.add_corey_water(nw=2, krwend=0.6, krwmax=0.9)
+    wateroil.add_corey_oil(now=3)
+    table = wateroil.table
+    idxs = decimation.decimate(
+        table["SW"].values, [table["KRW"].values, table["KROW"].values], 400
+    )
+    assert len(table) > 9000
+    assert len(idxs) < 2000
+    assert (np.diff(idxs) > 0).all()
+    assert idxs[0] == 0
+    assert idxs[-1] == len(table) - 1
+
+    kept = table["SW"].values[idxs]
+    # The kinks at swcr and 1 - sorw:
+    for sat in [wateroil.swcr, 1 - wateroil.sorw]:
+        assert np.isclose(kept, sat).any()
+    # Both sides of the crosspoint:
+    diff = table["KRW"].values[idxs] - table["KROW"].values[idxs]
+    cross = np.flatnonzero(np.sign(diff[:-1]) != np.sign(diff[1:]))
+    assert len(cross) == 1
+    assert idxs[cross[0] + 1] == idxs[cross[0]] + 1
+
+    # The table itself is untouched, and short tables are not thinned:
+    pd.testing.assert_frame_equal(
+        decimation.decimate_table(table, "SW", ["KRW"], 100_000), table
+    )
+    assert len(decimation.decimate_table(table, "SW", ["KRW"], 100)) < len(table)
+    with pytest.raises(ValueError):
+        decimation.decimate(table["SW"].values, [], 0)
+
+
+@settings(max_examples=50)
+@given(
+    st.lists(st.floats(min_value=-1, max_value=1), min_size=2, max_size=500),
+    st.integers(min_value=1, max_value=50),
+    st.booleans(),
+)
+def test_decimate_extremes(values, pixels, descending):
+    """The lowest and highest point in each pixel column is kept"""
+    x = np.linspace(0, 1, len(values))
+    if descending:
+        x = x[::-1]
+    curve = np.array(values)
+    idxs = decimation.decimate(x, [curve], pixels)
+    assert idxs[0] == 0
+    assert idxs[-1] == len(values) - 1
+    assert len(np.unique(idxs)) == len(idxs)
+    column = np.minimum((np.abs(x - x[0]) * pixels).astype(int), pixels - 1)
+    for col in np.unique(column):
+        in_column = column == col
+        kept = curve[idxs][in_column[idxs]]
+        assert kept.min() == curve[in_column].min()
+        assert kept.max() == curve[in_column].max()
@@ -0,0 +1,43 @@
+"""Test the vectorized helpers for tabulated data"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyscal.utils import fromtable
+
+
+def test_group_rows():
+    """Rows are grouped stably by key"""
+    order, keys, groups = fromtable.group_rows(np.array([3, 1, 3, 1, 2]))
+    assert list(order) == [1, 3, 4, 0, 2]
+    assert list(keys) == [1, 2, 3]
+    assert list(groups) == [0, 0, 1, 2, 2]
+    assert list(fromtable.group_starts(groups)) == [0, 2, 3]
+
+
+def test_grouped_diff():
+    """Differences are not computed across groups"""
+    groups = np.array([0, 0, 0, 1, 1])
+    diffs = fromtable.grouped_diff(np.array([0.0, 1, 3, 0, -1]), groups)
+    assert np.isnan(diffs[[0, 3]]).all()
+    assert list(diffs[[1, 2, 4]]) == [1, 2, -1]
+    assert list(fromtable.failed_groups(diffs < 0, groups)) == [1]
+    assert not fromtable.failed_groups(diffs > 5, groups).size
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [np.nan, 1, 2, np.nan],
+        [np.nan, np.nan, 1, np.nan, 2],
+        [1, 2, 3],
+        [np.nan, np.nan],
+    ],
+)
+def test_fill_ends(values):
+    """Compare with forward and backward filling in pandas"""
+    array = np.column_stack([values, values[::-1]]).astype(float)
+    expected = pd.DataFrame(array).fillna(method="ffill").fillna(method="bfill")
+    fromtable.fill_ends(array)
+    np.testing.assert_array_equal(array, expected.to_numpy())
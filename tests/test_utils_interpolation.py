@@ -1,15 +1,22 @@
 """Test module for relperm interpolation support code"""
 
+import pickle
+
 import hypothesis.strategies as st
 import numpy as np
 import pandas as pd
 import pytest
 from hypothesis import given, settings
 from matplotlib import pyplot as plt
+from scipy.interpolate import interp1d
 
+import pyscal
 from pyscal import GasOil, WaterOil
 from pyscal.constants import EPSILON as epsilon
 from pyscal.utils.interpolation import (
+    CURVECACHE_SIZE,
+    NormalizedCurve,
+    curve_slope,
     interpolate_go,
     interpolate_wo,
     normalize_nonlinpart_go,
@@ -164,6 +171,80 @@ def test_normalize_nonlinpart_wo():
     assert np.isclose(kron(1), 0.8)
 
 
+def test_normalized_curve():
+    """NormalizedCurve evaluates as a scipy interp1d with constant fill values,
+    and can be pickled, hashed and compared"""
+    sat = np.array([0.3, 0.1, 0.2, 0.5])
+    values = np.array([0.4, 0.0, 0.1, 1.0])
+    curve = NormalizedCurve(sat, values, offset=0.1, scale=0.4, left=0, right=0.9)
+    scipy_interp = interp1d(
+        sat, values, bounds_error=False, fill_value=(0, 0.9), assume_sorted=False
+    )
+    sn = np.linspace(-0.5, 1.5, 41)
+    assert np.allclose(curve(sn), scipy_interp(0.1 + sn * 0.4))
+    assert np.isclose(curve(0.5), scipy_interp(0.3))
+
+    copy = pickle.loads(pickle.dumps(curve))
+    assert copy == curve
+    assert hash(copy) == hash(curve)
+    assert np.allclose(copy(sn), curve(sn))
+    assert len({curve, copy}) == 1
+    assert curve != NormalizedCurve(sat, values, 0.1, 0.4, 0, 1)
+    assert curve != NormalizedCurve(sat, values * 2, 0.1, 0.4, 0, 0.9)
+    with pytest.raises(ValueError):
+        curve.values[0] = 1
+
+
+def test_curve_slope():
+    """Slopes of normalized curves, on either side of the knots"""
+    curve = NormalizedCurve([0.1, 0.2, 0.3, 0.5], [0, 0.1, 0.4, 1], 0.1, 0.4, 0, 1)
+    sn = np.array([-0.1, 0.0, 0.1, 0.25, 0.5, 1.0, 1.1])
+    # The slopes in sat are 1, 3 and 3, times the scale
+    assert np.allclose(curve_slope(curve, sn), [0, 0.4, 0.4, 1.2, 1.2, 0, 0])
+    assert np.allclose(
+        curve_slope(curve, sn, direction=-np.ones(len(sn))),
+        [0, 0, 0.4, 0.4, 1.2, 1.2, 0],
+    )
+    eps = 1e-7
+    assert np.allclose(
+        curve_slope(curve, sn[1:-1]), (curve(sn[1:-1] + eps) - curve(sn[1:-1])) / eps
+    )
+    # Roundoff next to a knot does not change the side:
+    at_knot = np.array([0.25 - 1e-12, 0.25 + 1e-12])
+    assert np.allclose(curve_slope(curve, at_knot), [1.2, 1.2])
+    assert np.allclose(curve_slope(curve, at_knot, direction=-np.ones(2)), [0.4, 0.4])
+
+
+def test_normalized_curve_cache():
+    """Normalized curves are reused as long as the table and endpoints
+    are unchanged"""
+    wateroil = WaterOil(swl=0.1, sorw=0.1, h=0.1)
+    wateroil.add_corey_water()
+    wateroil.add_corey_oil()
+    wateroil.add_simple_J()
+    pyscal.reset_stats()
+    krwn, kron = normalize_nonlinpart_wo(wateroil)
+    pc_fn = normalize_pc(wateroil)
+    assert normalize_nonlinpart_wo(wateroil) == (krwn, kron)
+    assert normalize_nonlinpart_wo(wateroil)[0] is krwn
+    assert normalize_pc(wateroil) is pc_fn
+    assert pyscal.stats()["normalized_curves_reused"] == 5
+
+    wateroil.table["KRW"] = wateroil.table["KRW"] / 2
+    assert np.isclose(normalize_nonlinpart_wo(wateroil)[0](1), krwn(1) / 2)
+    assert normalize_nonlinpart_wo(wateroil)[1] is kron
+    wateroil.sorw = 0.2
+    assert normalize_nonlinpart_wo(wateroil)[1] is not kron
+
+    # The least recently used curves are dropped first:
+    pc_fn = normalize_pc(wateroil)
+    for sorw in np.linspace(0.21, 0.3, CURVECACHE_SIZE):
+        wateroil.sorw = sorw
+        normalize_nonlinpart_wo(wateroil)
+        assert normalize_pc(wateroil) is pc_fn
+    assert len(wateroil._curvecache) == CURVECACHE_SIZE
+
+
 def test_tag_preservation():
     """Test that we can preserve tags/comments through interpolation"""
     wo_low = WaterOil(swl=0.1)
@@ -0,0 +1,159 @@
+"""Test the numerical kernels and their backends"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from pyscal import GasOil, WaterOil
+from pyscal.utils import kernels
+from pyscal.utils.monotonicity import clip_accumulate, rows_to_be_fixed
+from pyscal.utils.relperm import crosspoint
+
+
+def _backend_params():
+    """The loop kernels are always tested as plain Python, and compiled
+    if numba is installed"""
+    return [
+        "numpy",
+        "loops",
+        pytest.param(
+            "numba",
+            marks=pytest.mark.skipif(
+                not kernels._numba_available(),  # pylint: disable=protected-access
+                reason="numba not installed",
+            ),
+        ),
+    ]
+
+
+def _kernel(name, backend):
+    """Return a kernel, or its uncompiled loop version"""
+    if backend == "loops":
+        return kernels.LOOP_KERNELS[name]
+    return kernels.get(name, backend)
+
+
+@pytest.fixture
+def reset_backend():
+    """Restore the default backend after the test"""
+    yield
+    kernels.set_backend("auto")
+
+
+def test_set_backend(reset_backend):
+    """The backend can be selected at runtime"""
+    kernels.set_backend("numpy")
+    assert kernels.get_backend() == "numpy"
+    assert kernels.get("corey") is kernels.corey
+    kernels.set_backend("auto")
+    assert kernels.get_backend() in ["numpy", "numba"]
+    with pytest.raises(ValueError, match="Unknown kernel backend"):
+        kernels.set_backend("fortran")
+    if not kernels._numba_available():  # pylint: disable=protected-access
+        with pytest.raises(ImportError):
+            kernels.set_backend("numba")
+        assert kernels.get_backend() == "numpy"
+
+
+@pytest.mark.parametrize("backend", _backend_params())
+def test_parametrizations(backend):
+    """Corey and LET kernels agree with the numpy expressions"""
+    swn = np.linspace(0, 1, 101)
+    corey = _kernel("corey", backend)
+    assert np.allclose(corey(swn, 2.5, 0.8), 0.8 * np.power(swn, 2.5))
+    assert np.allclose(
+        _kernel("let", backend)(swn[:-1], 2, 3, 1.5, 0.9),
+        kernels.let(swn[:-1], 2, 3, 1.5, 0.9),
+    )
+
+
+@pytest.mark.parametrize("backend", _backend_params())
+def test_linear_section(backend):
+    """The linear section is the same as pandas interpolation"""
+    sat = np.linspace(0.1, 1, 10)
+    values = np.square(sat)
+    filled = _kernel("linear_section", backend)(sat, values, 5, 9)
+    series = pd.Series(values.copy(), index=sat)
+    series.iloc[6:9] = np.nan
+    assert np.allclose(filled, series.interpolate(method="index").values)
+    assert np.allclose(values, np.square(sat))  # Input is not modified
+
+
+@settings(deadline=None)
+@given(
+    st.lists(st.integers(min_value=0, max_value=100), min_size=2, max_size=30),
+    st.sampled_from([1, -1]),
+    st.integers(min_value=1, max_value=4),
+)
+def test_monotone_fix(ints, sign, digits):
+    """All backends agree with the pandas implementation of the monotonicity
+    fix, which is kept in rows_to_be_fixed() and clip_accumulate()"""
+    values = np.sort(np.array(ints) / 100.0)[::sign]
+    spec = {"sign": sign, "lower": 0, "upper": 1}
+    series = pd.Series(values.copy())
+    iterations = 0
+    constants = rows_to_be_fixed(series, spec, digits)
+    while constants.any():
+        iterations += 1
+        series[constants] = series[constants] + sign * np.power(10.0, -digits) - 1e-08
+        series = clip_accumulate(series, spec)
+        constants = rows_to_be_fixed(series, spec, digits)
+
+    for backend in ["numpy", "loops"]:
+        fixed, kernel_iterations = _kernel("monotone_fix", backend)(
+            values, sign, digits, 0.0, 1.0
+        )
+        assert kernel_iterations == iterations
+        assert np.allclose(fixed, series.values)
+
+
+@pytest.mark.parametrize("backend", _backend_params())
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ([[0, 0, 1], [1, 1, 0]], 0.5),
+        ([[0, 0, 1], [0.5, 0.2, 0.2], [1, 1, 0]], 0.5),
+        ([[1, 1, 1], [0, 0, 0]], 1),
+        (
+            [[0, 0, 1], [0.2, 0.1, 0.9], [0.3, 0.1, 0.9], [1, 1, 0]],
+            0.3 + 0.7 * 0.8 / 1.8,
+        ),
+        ([[0, 0, 3], [1, 1, 2]], np.nan),
+    ],
+)
+def test_crosspoint(backend, data, expected):
+    """Crosspoint kernels give the same as for linear interpolation"""
+    sat, kr1, kr2 = np.array(data, dtype=float).T
+    assert np.isclose(
+        _kernel("crosspoint", backend)(sat, kr1, kr2), expected, equal_nan=True
+    )
+
+
+@pytest.mark.parametrize("backend", ["numpy", "numba"])
+def test_tables_equal(backend, reset_backend):
+    """Tables and crosspoints do not depend on the backend"""
+    if backend == "numba" and not kernels._numba_available():  # pylint: disable=W0212
+        pytest.skip("numba not installed")
+
+    def make_tables():
+        wateroil = WaterOil(swl=0.1, swcr=0.15, sorw=0.1, h=0.01)
+        wateroil.add_corey_water(nw=3, krwend=0.5, krwmax=0.8)
+        wateroil.add_LET_oil(kroend=0.9)
+        gasoil = GasOil(swl=0.1, sgcr=0.05, sgro=0.05, sorg=0.1, h=0.01)
+        gasoil.add_LET_gas()
+        gasoil.add_corey_oil(nog=2.5, kromax=1)
+        return wateroil, gasoil
+
+    kernels.set_backend("numpy")
+    reference = make_tables()
+    kernels.set_backend(backend)
+    tables = make_tables()
+    for ref_obj, obj in zip(reference, tables):
+        pd.testing.assert_frame_equal(ref_obj.table, obj.table)
+    assert reference[0].SWOF() == tables[0].SWOF()
+    assert reference[1].SGOF() == tables[1].SGOF()
+    assert np.isclose(
+        crosspoint(tables[0].table, "SW", "KRW", "KROW"), reference[0].crosspoint()
+    )
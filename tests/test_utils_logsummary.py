@@ -0,0 +1,58 @@
+"""Test aggregation of repeated log messages"""
+
+import pyscal
+from pyscal import WaterOil, getLogger_pyscal
+from pyscal.utils import logsummary, stats
+
+
+def test_aggregated_logging(caplog):
+    """Repeated messages are logged once, and counted pr. SATNUM"""
+    with pyscal.aggregated_logging() as aggregator:
+        for satnum in [1, 2, 2, 3]:
+            with stats.satnum_context(satnum):
+                WaterOil(sorw=0.1, socr=0.1001, h=0.1)
+    assert caplog.text.count("socr was close to sorw") == 2
+    assert "Suppressed 3 repeated log messages" in caplog.text
+
+    key = ("WARNING", "pyscal.wateroil", "socr was close to sorw, reset to sorw")
+    assert aggregator.counts[key] == 4
+    assert aggregator.suppressed() == {key: 3}
+    assert dict(aggregator.satnum_counts[key]) == {1: 1, 2: 2, 3: 1}
+    summary = aggregator.format_summary(top=2)
+    assert "4 x WARNING:pyscal.wateroil:socr was close to sorw" in summary
+    assert "(SATNUM 2: 2, 1: 1, ... 3 SATNUMs in total)" in summary
+
+    # The filter is removed after the block:
+    caplog.clear()
+    WaterOil(sorw=0.1, socr=0.1001, h=0.1)
+    WaterOil(sorw=0.1, socr=0.1001, h=0.1)
+    assert caplog.text.count("socr was close to sorw") == 2
+
+
+def test_max_repeats(caplog):
+    """The number of repeated messages let through can be set, and
+    messages with different templates are counted separately"""
+    with pyscal.aggregated_logging(max_repeats=2, summary=False) as aggregator:
+        # A logger created inside the block is also aggregated:
+        pyscal_logger = getLogger_pyscal("pyscal.test_max_repeats")
+        for value in range(5):
+            pyscal_logger.warning("Value is %d", value)
+            pyscal_logger.warning("Other message")
+    assert caplog.text.count("Value is") == 2
+    assert "Value is 1" in caplog.text
+    assert "Value is 2" not in caplog.text
+    assert caplog.text.count("Other message") == 2
+    assert "Suppressed" not in caplog.text
+    assert sum(aggregator.suppressed().values()) == 6
+    assert not aggregator.satnum_counts
+    assert "Suppressed 6 repeated log messages" in aggregator.format_summary()
+    assert aggregator not in pyscal_logger.filters
+
+
+def test_no_suppression():
+    """Nothing is summarized when no message is repeated"""
+    with pyscal.aggregated_logging() as aggregator:
+        getLogger_pyscal("pyscal.test_no_suppression").warning("Only once")
+    assert sum(aggregator.counts.values()) == 1
+    assert aggregator.format_summary() == ""
+    assert logsummary._ACTIVE is None  # pylint: disable=protected-access
@@ -0,0 +1,29 @@
+"""Test pickling of pyscal objects with loggers"""
+
+import copy
+import pickle
+
+import pytest
+
+from pyscal import GasOil, GasWater, WaterOil, WaterOilGas
+from pyscal.utils import pickling
+
+
+@pytest.mark.parametrize("cls", [WaterOil, GasOil, GasWater, WaterOilGas])
+def test_logger_args_kept(cls, monkeypatch):
+    """The logger is fetched again with the arguments from initialization"""
+    args = {"verbose": True, "debug": False, "output": "-"}
+    pyscal_obj = cls(h=0.1, args=args)
+    assert "logger" not in pyscal_obj.__getstate__()
+
+    requested = []
+
+    def get_logger(module_name, args_dict=None):
+        requested.append((module_name, args_dict))
+        return pyscal_obj.logger
+
+    monkeypatch.setattr(pickling, "getLogger_pyscal", get_logger)
+    for restored in [copy.deepcopy(pyscal_obj), pickle.loads(pickle.dumps(pyscal_obj))]:
+        assert restored.logger is pyscal_obj.logger
+        assert restored._logger_args == args
+    assert (cls.__module__, args) in requested
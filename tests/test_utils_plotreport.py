@@ -0,0 +1,114 @@
+"""Test plot reports for many SATNUMs"""
+
+from pathlib import Path
+
+import matplotlib.pyplot
+import pandas as pd
+import pytest
+
+from pyscal import GasOil, GasWater, PyscalFactory, WaterOil
+from pyscal.utils import plotreport
+
+TESTDIR = Path(__file__).absolute().parent
+
+
+def test_render_page():
+    """Each curve set gets a panel, SCAL cases are overlaid"""
+    pyplot_figures = matplotlib.pyplot.get_fignums()
+    wateroil = WaterOil(swl=0.1, h=0.1)
+    wateroil.add_corey_water()
+    wateroil.add_corey_oil()
+    figure = plotreport.render_page(wateroil, 3)
+    assert [ax.get_title() for ax in figure.axes] == ["Water-oil"]
+    assert figure._suptitle.get_text() == "SATNUM 3"
+
+    wateroil.add_simple_J()
+    gasoil = GasOil(h=0.1, tag="foo")
+    gasoil.add_corey_gas()
+    gasoil.add_corey_oil()
+    assert [ax.get_title() for ax in plotreport.render_page(wateroil, 1).axes] == [
+        "Water-oil",
+        "Capillary pressure",
+    ]
+    assert plotreport.render_page(gasoil, 1)._suptitle.get_text() == "SATNUM 1: foo"
+
+    gaswater = GasWater(h=0.1)
+    gaswater.add_corey_water()
+    gaswater.add_corey_gas()
+    assert [ax.get_title() for ax in plotreport.render_page(gaswater, 1).axes] == [
+        "Gas-water"
+    ]
+
+    scalrec = PyscalFactory.create_scal_recommendation_list(
+        PyscalFactory.load_relperm_df(TESTDIR / "data/scal-pc-input-example.xlsx"),
+        h=0.1,
+    )[1]
+    figure = plotreport.render_page(scalrec, 1, logyscale=True)
+    assert [ax.get_title() for ax in figure.axes] == [
+        "Water-oil",
+        "Gas-oil",
+        "Capillary pressure",
+    ]
+    assert [text.get_text() for text in figure.axes[0].get_legend().get_texts()] == [
+        "low",
+        "base",
+        "high",
+    ]
+    assert figure.axes[0].get_yscale() == "log"
+    assert figure.axes[2].get_yscale() == "linear"
+
+    # Pyplot is not involved:
+    assert matplotlib.pyplot.get_fignums() == pyplot_figures
+
+    with pytest.raises(TypeError):
+        plotreport.render_page("foo", 1)
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_plot_report(processes, tmp_path):
+    """Reports are written as PDF or HTML, one page pr. SATNUM"""
+    p_list = PyscalFactory.create_pyscal_list(
+        pd.DataFrame(
+            columns=["SATNUM", "nw", "now", "TAG"],
+            data=[[1, 2, 2, "a<b"], [2, 3, 3, ""], [3, 4, 4, ""]],
+        ),
+        h=0.1,
+    )
+    plotreport.plot_report(
+        p_list.pyscal_list, tmp_path / "report.pdf", processes=processes
+    )
+    pdf = (tmp_path / "report.pdf").read_bytes()
+    assert pdf.startswith(b"%PDF")
+    assert pdf.count(b"/Type /Page ") + pdf.count(b"/Type /Page\n") == 3
+
+    plotreport.plot_report(
+        p_list.pyscal_list, tmp_path / "report.html", processes=processes
+    )
+    index = (tmp_path / "report.html").read_text()
+    assert "SATNUM 1: a&lt;b" in index
+    for satnum in [1, 2, 3]:
+        image = tmp_path / "report_files" / f"satnum-{satnum}.png"
+        assert image.read_bytes().startswith(b"\x89PNG")
+        assert f'src="report_files/satnum-{satnum}.png"' in index
+
+    with pytest.raises(ValueError, match="Unsupported report format"):
+        plotreport.plot_report(p_list.pyscal_list, tmp_path / "report.svg")
+    with pytest.raises(ValueError, match="No pyscal objects"):
+        plotreport.plot_report([], tmp_path / "report.pdf")
+    with pytest.raises(ValueError, match="Error for SATNUM 2"):
+        plotreport.plot_report(
+            [p_list[1], "foo"], tmp_path / "report.pdf", processes=processes
+        )
+
+
+def test_render_page_decimate():
+    """Curves are drawn through fewer points, the tables are kept"""
+    wateroil = WaterOil(swl=0.1, sorw=0.1, h=0.0001)
+    wateroil.add_corey_water()
+    wateroil.add_corey_oil()
+    nrows = len(wateroil.table)
+    full = plotreport.render_page(wateroil, 1)
+    decimated = plotreport.render_page(wateroil, 1, dpi=50, decimate=True)
+    assert len(full.axes[0].get_lines()[0].get_xdata()) == nrows
+    assert len(decimated.axes[0].get_lines()[0].get_xdata()) < nrows / 5
+    assert len(wateroil.table) == nrows
@@ -0,0 +1,118 @@
+"""Test the parser for saturation function include files"""
+
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyscal import GasOil, PyscalFactory, WaterOil
+from pyscal.utils import satfunc
+
+
+def test_eclipse_keywords():
+    """Parse Eclipse keywords with comments and multiple SATNUMs"""
+    inc = """
+-- A comment
+RUNSPEC
+TABDIMS
+  2 1 /
+
+SWOF
+-- SW KRW KROW PCOW
+0.1 0 1 2   -- trailing comment
+0.5 0.2 0.3 1
+1   1   0   0 /
+0   0   1 0
+1   1   0 0
+/ SATNUM 2
+
+SGOF
+0   0 1 0
+1 1 0 0 /
+
+SOF3
+0 0 0
+0.9 1 1 /
+"""
+    dframe = satfunc.df(io.StringIO(inc))
+    assert set(dframe["KEYWORD"]) == {"SWOF", "SGOF", "SOF3"}
+    swof = dframe[dframe["KEYWORD"] == "SWOF"]
+    assert list(swof["SATNUM"]) == [1, 1, 1, 2, 2]
+    assert list(swof["SW"]) == [0.1, 0.5, 1, 0, 1]
+    assert list(swof["PCOW"]) == [2, 1, 0, 0, 0]
+    assert dframe[dframe["KEYWORD"] == "SOF3"]["KROG"].tolist() == [0, 1]
+
+    tables = list(satfunc.iter_tables(inc.splitlines(), keywords=["sgof"]))
+    assert len(tables) == 1
+    keyword, satnum, columns = tables[0]
+    assert (keyword, satnum) == ("SGOF", 1)
+    assert list(columns) == ["SG", "KRG", "KROG", "PCOG"]
+    assert isinstance(columns["KRG"], np.ndarray)
+
+
+def test_nexus_keywords():
+    """Parse Nexus tables, which have header lines and no terminators"""
+    wateroil = WaterOil(swl=0.1, h=0.1)
+    wateroil.add_corey_water()
+    wateroil.add_corey_oil()
+    gasoil = GasOil(swl=0.1, h=0.1)
+    gasoil.add_corey_gas()
+    gasoil.add_corey_oil()
+    inc = wateroil.WOTABLE() + wateroil.WOTABLE() + gasoil.GOTABLE()
+    dframe = satfunc.df(io.StringIO(inc))
+    wotable = dframe[dframe["KEYWORD"] == "WOTABLE"]
+    assert set(wotable["SATNUM"]) == {1, 2}
+    assert {"SW", "KRW", "KROW", "PCOW"}.issubset(wotable.columns)
+    gotable = dframe[dframe["KEYWORD"] == "GOTABLE"]
+    assert len(gotable) == len(gasoil.table)
+    assert gotable["PCOG"].sum() == 0
+
+
+def test_roundtrip(tmp_path):
+    """Tables parsed from pyscal output can be given to add_fromtable()"""
+    pyscal_list = PyscalFactory.create_pyscal_list(
+        PyscalFactory.load_relperm_df(
+            pd.DataFrame(
+                columns=["SATNUM", "swl", "nw", "now", "tag"],
+                data=[[1, 0.1, 2, 2, "a"], [2, 0.2, 3, 3, "b"]],
+            )
+        ),
+        h=0.1,
+    )
+    (tmp_path / "relperm.inc").write_text(pyscal_list.SWOF(), encoding="utf-8")
+    dframe = satfunc.df(tmp_path / "relperm.inc")
+    pd.testing.assert_frame_equal(
+        dframe.drop(["KEYWORD", "PCOW"], axis="columns"),
+        pyscal_list.df()[["SW", "KRW", "KROW", "SATNUM"]].reset_index(drop=True),
+        check_dtype=False,
+        atol=1e-7,
+    )
+    for satnum, satnum_df in dframe.groupby("SATNUM"):
+        wateroil = WaterOil(swl=satnum_df["SW"].min(), h=0.1)
+        wateroil.add_fromtable(satnum_df)
+        assert np.isclose(
+            wateroil.table["KRW"].sum(), pyscal_list[satnum].table["KRW"].sum()
+        )
+
+
+@pytest.mark.parametrize(
+    "inc, error",
+    [
+        ("SWOF\n0 0 1 0\n1 1 0 0\n", "not terminated"),
+        ("SWOF\n0 0 1 0\n1 1 0\n/\n", "not a multiple"),
+        ("SWOF\n0 0 1 0\n1 1* 0 0\n/\n", "not supported"),
+        ("WOTABLE\n0 0 1 0\n", "missing its header"),
+    ],
+)
+def test_errors(inc, error):
+    """Test error messages for malformed input"""
+    with pytest.raises(ValueError, match=error):
+        satfunc.df(io.StringIO(inc))
+
+
+def test_unsupported_keyword():
+    """Only known keywords can be asked for"""
+    with pytest.raises(ValueError, match="Unsupported keywords"):
+        list(satfunc.iter_tables([], keywords=["SWFX"]))
+    assert satfunc.df(io.StringIO("")).empty
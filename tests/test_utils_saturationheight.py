@@ -0,0 +1,130 @@
+"""Test module for batched saturation height functions"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyscal import WaterOil
+from pyscal.utils import saturationheight
+from pyscal.utils.capillarypressure import _height_to_pc
+
+HEIGHTS = np.array([-1, 0, 0.5, 2, 10, 50, 300])
+
+
+def pc_at(sw_value, swirr, method, **kwargs):
+    """Capillary pressure from a WaterOil object at one saturation"""
+    wateroil = WaterOil(swl=0.2, swirr=swirr, h=0.1)
+    wateroil.table = pd.DataFrame({"SW": [sw_value]})
+    getattr(wateroil, method)(**kwargs)
+    return wateroil.table["PC"][0]
+
+
+def test_simple_J():
+    """Saturations must balance the capillary pressure from add_simple_J()"""
+    # pylint: disable=invalid-name
+    rockclasses = pd.DataFrame(
+        columns=["A", "B", "PORO_REF", "PERM_REF", "DRHO", "SWIRR"],
+        data=[[5, -1.5, 0.25, 100, 300, 0.05], [1, -2, 0.1, 10, 200, 0.1]],
+    )
+    sw = saturationheight.sw_height(HEIGHTS, rockclasses)
+    assert sw.shape == (len(HEIGHTS), len(rockclasses))
+    assert np.isclose(sw[HEIGHTS <= 0], 1).all()
+    assert (np.diff(sw, axis=0) <= 0).all()
+    for col, row in rockclasses.iterrows():
+        for height, sw_value in zip(HEIGHTS, sw[:, col]):
+            if height <= 0 or sw_value == 1:
+                continue
+            assert np.isclose(
+                pc_at(
+                    sw_value,
+                    row["SWIRR"],
+                    "add_simple_J",
+                    a=row["A"],
+                    b=row["B"],
+                    poro_ref=row["PORO_REF"],
+                    perm_ref=row["PERM_REF"],
+                    drho=row["DRHO"],
+                ),
+                _height_to_pc(height, row["DRHO"], 9.81),
+            )
+
+
+def test_simple_J_petro():
+    """Saturations must balance the capillary pressure from
+    add_simple_J_petro()"""
+    # pylint: disable=invalid-name
+    rockclasses = pd.DataFrame(
+        columns=["a_petro", "b_petro", "poro_ref", "perm_ref", "drho"],
+        data=[[0.5, -0.7, 0.25, 100, 300]],
+    )
+    sw = saturationheight.sw_height(HEIGHTS, rockclasses)
+    for height, sw_value in zip(HEIGHTS[2:], sw[2:, 0]):
+        assert np.isclose(
+            pc_at(
+                sw_value,
+                0.0,
+                "add_simple_J_petro",
+                a=0.5,
+                b=-0.7,
+                poro_ref=0.25,
+                perm_ref=100,
+                drho=300,
+            ),
+            _height_to_pc(height, 300, 9.81),
+        )
+
+
+def test_normalized_J():
+    """Saturations must balance the capillary pressure from
+    add_normalized_J()"""
+    # pylint: disable=invalid-name
+    rockclasses = pd.DataFrame(
+        columns=["a", "b", "poro", "perm", "sigma_costau", "drho", "swirr"],
+        data=[[0.5, -0.7, 0.25, 100, 30, 300, 0.1], [1, -1, 0.3, 1000, 25, 250, 0]],
+    )
+    sw = saturationheight.sw_height(HEIGHTS, rockclasses)
+    for col, row in rockclasses.iterrows():
+        for height, sw_value in zip(HEIGHTS, sw[:, col]):
+            if height <= 0 or sw_value == 1:
+                continue
+            assert np.isclose(
+                pc_at(
+                    sw_value,
+                    row["swirr"],
+                    "add_normalized_J",
+                    a=row["a"],
+                    b=row["b"],
+                    poro=row["poro"],
+                    perm=row["perm"],
+                    sigma_costau=row["sigma_costau"],
+                ),
+                _height_to_pc(height, row["drho"], 9.81),
+            )
+
+
+def test_sw_height_df():
+    """Test the dataframe export"""
+    rockclasses = pd.DataFrame(
+        columns=["NAME", "a", "b", "poro_ref", "perm_ref"],
+        data=[["sand", 5, -1.5, 0.25, 100], ["shale", 1, -2, 0.1, 1]],
+    )
+    dframe = saturationheight.sw_height_df(HEIGHTS, rockclasses, idcolumn="NAME")
+    assert list(dframe.columns) == ["NAME", "HEIGHT", "SW"]
+    assert len(dframe) == len(HEIGHTS) * len(rockclasses)
+    wide = dframe.pivot(index="HEIGHT", columns="NAME", values="SW")
+    assert np.allclose(
+        wide[["sand", "shale"]].to_numpy(),
+        saturationheight.sw_height(HEIGHTS, rockclasses),
+    )
+
+    dframe = saturationheight.sw_height_df(HEIGHTS, rockclasses.assign(drho=300))
+    assert list(dframe.columns) == ["ROCKCLASS", "HEIGHT", "SW", "PC"]
+    assert np.isclose(dframe["PC"], _height_to_pc(dframe["HEIGHT"], 300, 9.81)).all()
+
+
+def test_missing_parameters():
+    """Incomplete parameter sets must be reported"""
+    with pytest.raises(ValueError, match="Rock classes must have all of"):
+        saturationheight.sw_height(
+            HEIGHTS, pd.DataFrame(columns=["a", "b"], data=[[1, 2]])
+        )
@@ -0,0 +1,114 @@
+"""Test the runtime statistics counters"""
+
+import pandas as pd
+import pytest
+
+import pyscal
+from pyscal import PyscalList, WaterOil
+from pyscal.factory import PyscalFactory
+from pyscal.utils import stats
+
+
+@pytest.fixture(name="clean_stats")
+def fixture_clean_stats():
+    """Ensure counters from other tests do not leak into a test"""
+    stats.reset_stats()
+    yield
+    stats.reset_stats()
+
+
+def test_increment(clean_stats):
+    """Counters are accumulated in total and pr. SATNUM"""
+    assert pyscal.stats() == {}
+    assert stats.format_stats() == ""
+    stats.increment("foo")
+    stats.increment("foo", 2)
+    with stats.satnum_context(3):
+        assert stats.current_satnum() == 3
+        stats.increment("foo")
+        with stats.satnum_context(4):
+            stats.increment("bar", 5)
+        assert stats.current_satnum() == 3
+    assert stats.current_satnum() is None
+    assert pyscal.stats() == {"bar": 5, "foo": 4}
+    assert stats.satnum_stats() == {3: {"foo": 1}, 4: {"bar": 5}}
+
+    summary = stats.format_stats()
+    assert "foo" in summary
+    assert "max in SATNUM 3: 1" in summary
+
+    pyscal.reset_stats()
+    assert pyscal.stats() == {}
+    assert stats.satnum_stats() == {}
+
+
+def test_satnum_context_exception(clean_stats):
+    """The SATNUM context must be left also when exceptions occur"""
+    with pytest.raises(ValueError):
+        with stats.satnum_context(1):
+            raise ValueError
+    assert stats.current_satnum() is None
+
+
+def test_wateroil_counters(clean_stats):
+    """Initialization and output of tables should be counted"""
+    wateroil = WaterOil(swl=0.1, h=0.1)
+    wateroil.add_corey_water()
+    wateroil.add_corey_oil()
+    counters = pyscal.stats()
+    assert counters["tables_initialized"] == 1
+    assert counters["table_rows"] == len(wateroil.table)
+
+    wateroil.SWOF()
+    counters = pyscal.stats()
+    assert counters["selfcheck_calls"] == 1
+    assert counters["rows_formatted"] == len(wateroil.table)
+    assert "monotonicity_iterations" in counters
+
+    # Fast mode skips the selfcheck:
+    wateroil.fast = True
+    wateroil.SWOF()
+    assert pyscal.stats()["selfcheck_calls"] == 1
+
+
+def test_grid_points_dropped(clean_stats):
+    """Saturation points closer than the grid resolution are dropped"""
+    WaterOil(swl=0.1, h=0.1)
+    dropped_coarse = pyscal.stats().get("grid_points_dropped", 0)
+    WaterOil(swl=0.1000001, swcr=0.1000002, sorw=0.0000001, h=0.1)
+    assert pyscal.stats()["grid_points_dropped"] > dropped_coarse
+
+
+def test_pyscallist_stats(clean_stats):
+    """Counters are attributed to the SATNUMs in a PyscalList"""
+    dframe = pd.DataFrame(
+        columns=["SATNUM", "Nw", "Now"], data=[[1, 2, 2], [2, 3, 3], [3, 4, 4]]
+    )
+    p_list = PyscalFactory.create_pyscal_list(
+        PyscalFactory.load_relperm_df(dframe), h=0.1
+    )
+    p_list.SWOF()
+    list_stats = p_list.stats
+    assert list(list_stats.index) == [1, 2, 3]
+    assert list_stats.index.name == "SATNUM"
+    assert (list_stats["tables_initialized"] == 1).all()
+    assert (list_stats["selfcheck_calls"] > 0).all()
+    assert list_stats["table_rows"].sum() == pyscal.stats()["table_rows"]
+
+    assert PyscalList().stats.empty
+
+
+def test_interpolation_deepcopies(clean_stats):
+    """Interpolation at the endpoints copies instead of interpolating"""
+    dframe = pd.DataFrame(
+        columns=["SATNUM", "CASE", "Nw", "Now"],
+        data=[[1, "low", 2, 2], [1, "base", 3, 3], [1, "high", 4, 4]],
+    )
+    rec_list = PyscalFactory.create_scal_recommendation_list(
+        PyscalFactory.load_relperm_df(dframe), h=0.1
+    )
+    rec_list.interpolate(-1)
+    assert pyscal.stats()["interpolation_deepcopies"] == 1
+    assert rec_list.stats.loc[1, "interpolation_deepcopies"] == 1
+    rec_list.interpolate(-0.5)
+    assert pyscal.stats()["interpolation_deepcopies"] == 1
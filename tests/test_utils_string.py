@@ -2,7 +2,9 @@
 
 import pandas as pd
 
-from pyscal.utils.string import comment_formatter, df2str
+import pyscal
+from pyscal import WaterOil
+from pyscal.utils.string import FORMATCACHE_SIZE, comment_formatter, df2str
 
 
 def test_df2str():
@@ -79,3 +81,63 @@ def test_comment_formatter():
     assert comment_formatter("foo") == "-- foo\n"
     assert comment_formatter("foo", prefix="gaa") == "gaafoo\n"
     assert comment_formatter("foo\nbar") == "-- foo\n-- bar\n"
+
+
+def test_df2str_cache():
+    """Formatted columns are reused only for unchanged data and equal
+    formatting options"""
+    pyscal.reset_stats()
+    dframe = pd.DataFrame({"SW": [0.1, 0.5, 1.0], "KRW": [0.0, 0.3, 1.0]})
+    monotonicity = {"KRW": {"sign": 1, "lower": 0, "upper": 1}}
+    cache = {}
+    string = df2str(dframe, monotonicity=monotonicity, cache=cache)
+    assert string == df2str(dframe, monotonicity=monotonicity)
+    assert len(cache) == 2
+    assert "formatted_columns_reused" not in pyscal.stats()
+
+    assert df2str(dframe, monotonicity=monotonicity, cache=cache) == string
+    assert pyscal.stats()["formatted_columns_reused"] == 2
+
+    # Other options give other strings:
+    assert df2str(dframe, cache=cache) == df2str(dframe)
+    assert df2str(dframe, digits=3, cache=cache) == df2str(dframe, digits=3)
+    assert pyscal.stats()["formatted_columns_reused"] == 2
+
+    # Modified data is formatted again:
+    dframe.loc[1, "KRW"] = 0.4
+    assert df2str(dframe, monotonicity=monotonicity, cache=cache) == df2str(
+        dframe, monotonicity=monotonicity
+    )
+    assert pyscal.stats()["formatted_columns_reused"] == 3  # Only SW reused
+
+    for digits in range(2 * FORMATCACHE_SIZE):
+        df2str(dframe, digits=digits, cache=cache)
+    assert len(cache) <= FORMATCACHE_SIZE
+
+    # The least recently used columns are dropped first:
+    cache = {}
+    df2str(dframe, monotonicity=monotonicity, cache=cache)
+    for digits in range(FORMATCACHE_SIZE // 2 - 1):
+        df2str(dframe, digits=digits, cache=cache)
+    assert len(cache) == FORMATCACHE_SIZE
+    df2str(dframe, monotonicity=monotonicity, cache=cache)
+    df2str(dframe, digits=FORMATCACHE_SIZE, cache=cache)
+    reused = pyscal.stats()["formatted_columns_reused"]
+    df2str(dframe, monotonicity=monotonicity, cache=cache)
+    assert pyscal.stats()["formatted_columns_reused"] == reused + 2
+    assert len(cache) == FORMATCACHE_SIZE
+
+
+def test_keyword_cache():
+    """SWOF and WOTABLE share formatted columns"""
+    pyscal.reset_stats()
+    wateroil = WaterOil(swl=0.1, h=0.1)
+    wateroil.add_corey_water()
+    wateroil.add_corey_oil()
+    swof = wateroil.SWOF()
+    wateroil.WOTABLE()
+    assert pyscal.stats()["formatted_columns_reused"] == 4
+    assert wateroil.SWOF() == swof
+
+    wateroil.add_corey_water(nw=3)
+    assert wateroil.SWOF() != swof
@@ -0,0 +1,153 @@
+"""Test module for per cell SWL and SWATINIT from simple-J"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyscal import PyscalFactory, WaterOil
+from pyscal.utils import capillarypressure, swatinit
+from pyscal.utils.capillarypressure import _height_to_pc
+
+JPARAMS = pd.DataFrame(
+    columns=["SATNUM", "a", "b", "swirr", "swlheight"],
+    data=[[1, 5, -1.5, 0.1, 200], [2, 1, -2, 0.05, 100]],
+)
+
+
+def test_sw_from_height_simpleJ():
+    """The scalar and vectorized evaluations must agree, and be the
+    inverse of the capillary pressure curve"""
+    # pylint: disable=invalid-name
+    heights = np.array([-10, 0, 0.1, 1, 10, 100, 1000])
+    sw = capillarypressure.sw_from_height_simpleJ(heights, 0.1, 5, -1.5, 0.25, 100)
+    assert np.isclose(sw[:2], 1).all()
+    assert (np.diff(sw) <= 0).all()
+    for height, sw_value in zip(heights, sw):
+        assert np.isclose(
+            capillarypressure.sw_from_height_simpleJ(height, 0.1, 5, -1.5, 0.25, 100),
+            sw_value,
+        )
+    assert np.isclose(
+        sw[-1], capillarypressure.swl_from_height_simpleJ(1000, 0.1, 5, -1.5, 0.25, 100)
+    )
+
+
+def test_swl_like_factory():
+    """SWL for a cell must equal the swl the factory computes from swlheight
+    with the cell properties as reference values"""
+    poro = np.array([0.1, 0.2, 0.3, 0.25])
+    perm = np.array([10, 100, 1000, 500])
+    satnum = np.array([1, 1, 2, 2])
+    height = np.array([5, 500, 2, 10])
+    swl, _ = swatinit.swl_swatinit(height, poro, perm, satnum, JPARAMS)
+    for idx, cellsatnum in enumerate(satnum):
+        params = JPARAMS.set_index("SATNUM").loc[cellsatnum].to_dict()
+        wateroil = PyscalFactory.create_water_oil(
+            dict(
+                swlheight=params["swlheight"],
+                swirr=params["swirr"],
+                a=params["a"],
+                b=params["b"],
+                poro_ref=poro[idx],
+                perm_ref=perm[idx],
+                drho=300,
+                nw=2,
+                now=2,
+            )
+        )
+        assert np.isclose(swl[idx], wateroil.swl)
+
+
+def test_swatinit_like_add_simple_J():
+    """The capillary pressure at SWATINIT must correspond to the cell height
+    when using the same simple-J parameters in add_simple_J()"""
+    poro, perm, drho, g = 0.2, 150.0, 300, 9.81
+    heights = np.array([1.0, 5.0, 20.0, 60.0])
+    swl, swat = swatinit.swl_swatinit(
+        heights, np.full(4, poro), np.full(4, perm), np.ones(4), JPARAMS
+    )
+    assert (swat > swl).all()
+    wateroil = WaterOil(swl=swl[0], swirr=0.1, h=0.01)
+    for height, sw_value in zip(heights, swat):
+        wateroil.table = pd.DataFrame({"SW": [sw_value]})
+        wateroil.add_simple_J(a=5, b=-1.5, poro_ref=poro, perm_ref=perm, drho=drho)
+        assert np.isclose(wateroil.table["PC"][0], _height_to_pc(height, drho, g))
+
+
+def test_petro():
+    """Petrophysical coefficients must give the same as the converted
+    RMS coefficients"""
+    petro = pd.DataFrame(
+        columns=["SATNUM", "A_PETRO", "B_PETRO", "SWIRR", "SWLHEIGHT"],
+        data=[[1, 0.5, -0.7, 0.1, 200]],
+    )
+    a_rms, b_rms = capillarypressure.simpleJ_petro_to_rms(0.5, -0.7)
+    rms = pd.DataFrame(
+        columns=["SATNUM", "a", "b", "swirr", "swlheight"],
+        data=[[1, a_rms, b_rms, 0.1, 200]],
+    )
+    args = (np.array([1.0, 10.0]), np.array([0.2, 0.3]), np.array([100, 10]), [1, 1])
+    for petro_res, rms_res in zip(
+        swatinit.swl_swatinit(*args, petro), swatinit.swl_swatinit(*args, rms)
+    ):
+        assert np.allclose(petro_res, rms_res)
+
+
+def test_chunks(tmp_path):
+    """Chunked processing of memory mapped arrays must give the same as
+    processing everything at once, also in GRDECL output"""
+    rng = np.random.default_rng(seed=1)
+    ncells = 1003
+    props = {
+        "height": rng.uniform(-5, 100, ncells),
+        "poro": rng.uniform(0.05, 0.35, ncells),
+        "perm": rng.uniform(1, 2000, ncells),
+        "satnum": rng.integers(1, 3, ncells),
+    }
+    for name, values in props.items():
+        np.save(tmp_path / f"{name}.npy", values)
+    mmapped = {name: np.load(tmp_path / f"{name}.npy", mmap_mode="r") for name in props}
+    swl, swat = swatinit.swl_swatinit(**props, jparams=JPARAMS)
+    assert np.isclose(swat[props["height"] <= 0], 1).all()
+    assert (swat >= swl).all()
+
+    chunks = list(swatinit.iter_swl_swatinit(**mmapped, jparams=JPARAMS, chunksize=100))
+    assert len(chunks) == 11
+    assert np.allclose(np.concatenate([chunk[0] for chunk in chunks]), swl)
+    assert np.allclose(np.concatenate([chunk[1] for chunk in chunks]), swat)
+
+    swatinit.write_swl_swatinit(
+        tmp_path / "swl.grdecl",
+        tmp_path / "swatinit.grdecl",
+        **mmapped,
+        jparams=JPARAMS,
+        chunksize=100,
+    )
+    for filename, keyword, expected in [
+        ("swl.grdecl", "SWL", swl),
+        ("swatinit.grdecl", "SWATINIT", swat),
+    ]:
+        lines = (tmp_path / filename).read_text().splitlines()
+        assert lines[0] == keyword
+        assert lines[-1] == "/"
+        assert max(len(line.split()) for line in lines) == swatinit.VALUES_PER_LINE
+        values = np.array(" ".join(lines[1:-1]).split(), dtype=float)
+        assert np.allclose(values, expected, atol=1e-5)
+
+
+@pytest.mark.parametrize(
+    "jparams, satnum, message",
+    [
+        (JPARAMS.drop("SATNUM", axis="columns"), [1], "SATNUM column missing"),
+        (JPARAMS.drop("b", axis="columns"), [1], "Simple-J parameters must have"),
+        (JPARAMS.assign(SATNUM=1), [1], "Duplicate SATNUM"),
+        (JPARAMS.assign(swlheight=0), [1], "swlheight must be larger than zero"),
+        (JPARAMS, [3], "not covered by simple-J parameters"),
+        (JPARAMS, [0], "not covered by simple-J parameters"),
+        (JPARAMS.iloc[[1]], [1], "not covered by simple-J parameters"),
+    ],
+)
+def test_errors(jparams, satnum, message):
+    """Invalid parameters or SATNUMs must be reported"""
+    with pytest.raises(ValueError, match=message):
+        swatinit.swl_swatinit([10], [0.2], [100], satnum, jparams)
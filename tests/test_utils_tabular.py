@@ -0,0 +1,216 @@
+"""Test loading of tabular files"""
+
+import os
+from pathlib import Path
+
+import openpyxl
+import pandas as pd
+import pytest
+
+from pyscal.utils import tabular
+
+TESTDIR = Path(__file__).absolute().parent
+
+
+@pytest.mark.parametrize(
+    "filename", ["relperm-input-example.xlsx", "scal-pc-input-example.xlsx"]
+)
+def test_read_xlsx(filename):
+    """The streaming XLSX reader gives the same as pandas"""
+    xlsxfile = TESTDIR / "data" / filename
+    sheet_names = openpyxl.load_workbook(xlsxfile, read_only=True).sheetnames
+    for sheet_name in sheet_names:
+        pd.testing.assert_frame_equal(
+            tabular.read_xlsx(xlsxfile, sheet_name),
+            pd.read_excel(xlsxfile, sheet_name=sheet_name, engine="openpyxl"),
+        )
+    pd.testing.assert_frame_equal(
+        tabular.read_xlsx(xlsxfile), pd.read_excel(xlsxfile, engine="openpyxl")
+    )
+    with pytest.raises(KeyError):
+        tabular.read_xlsx(xlsxfile, "foo")
+
+
+def test_read_xlsx_header(tmp_path):
+    """Empty and repeated column names are named like pandas names them,
+    and empty cells are NaN"""
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.active
+    worksheet.append(["SATNUM", None, "nw", "nw", "TAG"])
+    worksheet.append([1, 2, 3, 4, None])
+    worksheet.append([2, 2, 3, None, "foo"])
+    workbook.save(tmp_path / "header.xlsx")
+    dframe = tabular.read_xlsx(tmp_path / "header.xlsx")
+    assert list(dframe.columns) == ["SATNUM", "Unnamed: 1", "nw", "nw.1", "TAG"]
+    pd.testing.assert_frame_equal(
+        dframe, pd.read_excel(tmp_path / "header.xlsx", engine="openpyxl")
+    )
+
+
+def test_sniff_file_format(tmp_path, monkeypatch):
+    """File formats are recognized from the first bytes, without parsing"""
+
+    def fail(*args, **kwargs):
+        raise AssertionError("The file should not be parsed")
+
+    monkeypatch.setattr(pd, "read_csv", fail)
+    monkeypatch.setattr(pd, "read_excel", fail)
+    monkeypatch.setattr(tabular, "read_xlsx", fail)
+    datadir = TESTDIR / "data"
+    assert tabular.sniff_file_format(datadir / "scal-pc-input-example.xlsx") == "xlsx"
+    assert tabular.sniff_file_format(datadir / "scal-pc-input-example.xls") == "xls"
+    Path(tmp_path / "some.csv").write_text("SATNUM,nw\n1,2\n")
+    assert tabular.sniff_file_format(tmp_path / "some.csv") == "csv"
+    # A multibyte character may be cut where the sniffing stops:
+    Path(tmp_path / "long.csv").write_text(
+        "SATNUM\n" + "æ" * tabular.SNIFF_BYTES, encoding="utf-8"
+    )
+    assert tabular.sniff_file_format(tmp_path / "long.csv") == "csv"
+    Path(tmp_path / "binary.csv").write_bytes(b"SATNUM\x00nw")
+    assert tabular.sniff_file_format(tmp_path / "binary.csv") == ""
+    with pytest.raises(OSError):
+        tabular.sniff_file_format(tmp_path / "nonexisting.xlsx")
+
+
+def test_read_csv(tmp_path):
+    """Whitespace after delimiters is skipped, also if pyarrow is installed"""
+    Path(tmp_path / "relperm.csv").write_text(
+        "SATNUM, nw, TAG\n1, 2, foo\n2, 3.5,\n", encoding="utf-8"
+    )
+    dframe = tabular.read_csv(tmp_path / "relperm.csv")
+    assert list(dframe.columns) == ["SATNUM", "nw", "TAG"]
+    assert list(dframe["nw"]) == [2, 3.5]
+    assert dframe["TAG"][0] == "foo"
+    assert pd.isnull(dframe["TAG"][1])
+
+
+def test_read_csv_pyarrow(tmp_path):
+    """pyarrow gives the same as pandas for ordinary CSV files"""
+    pytest.importorskip("pyarrow")
+    Path(tmp_path / "relperm.csv").write_text(
+        "SATNUM,nw,TAG\n1,2,foo\n2,3.5,\n", encoding="utf-8"
+    )
+    pd.testing.assert_frame_equal(
+        tabular.read_csv(tmp_path / "relperm.csv"),
+        pd.read_csv(tmp_path / "relperm.csv"),
+        check_dtype=False,
+    )
+
+
+def test_read_tabular_cache(tmp_path, monkeypatch):
+    """Unchanged files are loaded from the cache, changed files are reread"""
+    pytest.importorskip("pyarrow")
+    xlsxfile = tmp_path / "relperm.xlsx"
+    xlsxfile.write_bytes((TESTDIR / "data/relperm-input-example.xlsx").read_bytes())
+    cache_dir = tmp_path / "cache"
+
+    first = tabular.read_tabular(xlsxfile, "xlsx", "simple", cache_dir=cache_dir)
+    assert len(list(cache_dir.iterdir())) == 1
+    assert tabular.cache_path(cache_dir, xlsxfile, "simple").is_file()
+
+    def fail(*args):
+        raise AssertionError("The file should not be parsed")
+
+    monkeypatch.setattr(tabular, "read_xlsx", fail)
+    pd.testing.assert_frame_equal(
+        tabular.read_tabular(xlsxfile, "xlsx", "simple", cache_dir=cache_dir), first
+    )
+    # Another sheet, or a modified file, is not in the cache:
+    with pytest.raises(AssertionError):
+        tabular.read_tabular(xlsxfile, "xlsx", "relperm", cache_dir=cache_dir)
+    stat = xlsxfile.stat()
+    os.utime(xlsxfile, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    with pytest.raises(AssertionError):
+        tabular.read_tabular(xlsxfile, "xlsx", "simple", cache_dir=cache_dir)
+    monkeypatch.undo()
+
+    # Unreadable cache files are ignored and replaced:
+    sidecar = tabular.cache_path(cache_dir, xlsxfile, "simple")
+    tabular.read_tabular(xlsxfile, "xlsx", "simple", cache_dir=cache_dir)
+    sidecar.write_bytes(b"garbage")
+    pd.testing.assert_frame_equal(
+        tabular.read_tabular(xlsxfile, "xlsx", "simple", cache_dir=cache_dir), first
+    )
+    pd.testing.assert_frame_equal(tabular._read_cache(sidecar), first)
+
+
+def test_read_tabular_no_pyarrow(tmp_path, monkeypatch):
+    """Without pyarrow, the cache directory is ignored"""
+    monkeypatch.setattr(tabular, "_pyarrow_available", lambda: False)
+    xlsxfile = TESTDIR / "data/relperm-input-example.xlsx"
+    cache_dir = tmp_path / "cache"
+    pd.testing.assert_frame_equal(
+        tabular.read_tabular(xlsxfile, "xlsx", "simple", cache_dir=cache_dir),
+        tabular.read_tabular(xlsxfile, "xlsx", "simple"),
+    )
+    sheets = tabular.read_tabular_sheets(xlsxfile, "xlsx", cache_dir=cache_dir)
+    assert list(sheets) == ["relperm", "simple"]
+    assert not cache_dir.exists()
+
+
+def test_read_tabular_xls():
+    """XLS files are read with xlrd, missing sheets give KeyError"""
+    xlsfile = TESTDIR / "data/scal-pc-input-example.xls"
+    pd.testing.assert_frame_equal(
+        tabular.read_tabular(xlsfile, "xls"), pd.read_excel(xlsfile, engine="xlrd")
+    )
+    with pytest.raises(KeyError):
+        tabular.read_tabular(xlsfile, "xls", sheet_name="foo")
+
+
+def test_sheet_names_in():
+    """Sheet names are listed without reading the sheets"""
+    assert tabular.sheet_names_in(
+        TESTDIR / "data/relperm-input-example.xlsx", "xlsx"
+    ) == ["relperm", "simple"]
+    xlsfile = TESTDIR / "data/scal-pc-input-example.xls"
+    assert tabular.sheet_names_in(xlsfile, "xls") == list(
+        pd.read_excel(xlsfile, sheet_name=None, engine="xlrd")
+    )
+
+
+@pytest.mark.parametrize(
+    "filename, file_format",
+    [
+        ("relperm-input-example.xlsx", "xlsx"),
+        ("scal-pc-input-example.xls", "xls"),
+    ],
+)
+def test_read_tabular_sheets(filename, file_format, tmp_path, monkeypatch):
+    """Several sheets are read at once, in the requested order"""
+    inputfile = TESTDIR / "data" / filename
+    names = tabular.sheet_names_in(inputfile, file_format)
+    dframes = tabular.read_tabular_sheets(inputfile, file_format)
+    assert list(dframes) == names
+    for name in names:
+        pd.testing.assert_frame_equal(
+            dframes[name], tabular.read_tabular(inputfile, file_format, name)
+        )
+    reversed_sheets = tabular.read_tabular_sheets(inputfile, file_format, names[::-1])
+    assert list(reversed_sheets) == names[::-1]
+    with pytest.raises(KeyError):
+        tabular.read_tabular_sheets(inputfile, file_format, ["foo"])
+    with pytest.raises(ValueError, match="Only XLSX and XLS"):
+        tabular.read_tabular_sheets(inputfile, "csv")
+
+    # Sheets in the cache are not read again:
+    pytest.importorskip("pyarrow")
+    cache_dir = tmp_path / "cache"
+    tabular.read_tabular_sheets(inputfile, file_format, names[:1], cache_dir=cache_dir)
+    read_sheets = []
+
+    def read_xlsx_sheets(filename, sheet_names):
+        read_sheets.extend(sheet_names)
+        return {name: dframes[name] for name in sheet_names}
+
+    monkeypatch.setattr(tabular, "read_xlsx_sheets", read_xlsx_sheets)
+    monkeypatch.setattr(tabular, "_read_xls", read_xlsx_sheets)
+    cached = tabular.read_tabular_sheets(inputfile, file_format, cache_dir=cache_dir)
+    assert read_sheets == names[1:]
+    for name in names:
+        pd.testing.assert_frame_equal(cached[name], dframes[name])
+    # Single sheet reading shares the cache:
+    pd.testing.assert_frame_equal(
+        tabular.read_tabular(inputfile, file_format, names[-1], cache_dir=cache_dir),
+        dframes[names[-1]],
+    )
@@ -0,0 +1,130 @@
+"""Test the validation levels"""
+
+import pytest
+
+from pyscal import GasOil, PyscalFactory, SCALrecommendation, WaterOil, WaterOilGas
+from pyscal.utils.validation import strictest, validation_level
+
+
+def test_validation_level():
+    """The validation argument overrides the fast argument"""
+    assert validation_level() == "full"
+    assert validation_level(fast=True) == "none"
+    assert validation_level("cheap", fast=True) == "cheap"
+    assert validation_level("FULL", fast=True) == "full"
+    with pytest.raises(ValueError, match="Unknown validation level"):
+        validation_level("fast")
+    with pytest.raises(ValueError, match="Unknown validation level"):
+        validation_level(True)
+
+    assert strictest(["none", "full", "cheap"]) == "full"
+    assert strictest(["none", "cheap"]) == "cheap"
+    assert strictest(["none"]) == "none"
+
+
+def test_fast_property():
+    """The fast attribute reflects the validation level"""
+    wateroil = WaterOil(fast=True)
+    assert wateroil.validation == "none"
+    assert wateroil.fast
+    wateroil.fast = False
+    assert wateroil.validation == "full"
+    assert not WaterOil(validation="cheap").fast
+
+    wog = WaterOilGas(validation="cheap")
+    assert wog.wateroil.validation == "cheap"
+    assert wog.gasoil.validation == "cheap"
+
+
+@pytest.mark.parametrize("validation", ["none", "cheap", "full"])
+def test_wateroil_validation(validation):
+    """Invalid tables give output only without validation, and crosspoints
+    are only computed for full validation"""
+    wateroil = WaterOil(h=0.1, validation=validation)
+    wateroil.add_corey_water()
+    wateroil.add_corey_oil()
+    assert ("krw = krow" in wateroil.SWOF()) == (validation == "full")
+    assert ("krw = krow" in wateroil.SWFN()) == (validation == "full")
+    assert ("krw = krow" in wateroil.WOTABLE()) == (validation == "full")
+
+    # Make the table invalid:
+    wateroil.table["KRW"] = wateroil.table["KRW"].values[::-1]
+    for keyword in [wateroil.SWOF, wateroil.SWFN, wateroil.WOTABLE]:
+        assert (keyword() == "") == (validation != "none")
+
+
+@pytest.mark.parametrize("validation", ["none", "cheap", "full"])
+def test_gasoil_validation(validation):
+    """Invalid tables give output only without validation, and crosspoints
+    are only computed for full validation"""
+    gasoil = GasOil(h=0.1, validation=validation)
+    gasoil.add_corey_gas()
+    gasoil.add_corey_oil()
+    keywords = [gasoil.SGOF, gasoil.SLGOF, gasoil.SGFN, gasoil.GOTABLE]
+    for keyword in keywords:
+        assert ("krg = krog" in keyword()) == (validation == "full")
+
+    gasoil.table["KRG"] = gasoil.table["KRG"].values[::-1]
+    for keyword in keywords:
+        assert (keyword() == "") == (validation != "none")
+
+
+@pytest.mark.parametrize("validation", ["none", "cheap", "full"])
+def test_sof3_validation(validation, mocker):
+    """Three-phase consistency is only checked with validation"""
+    wog = WaterOilGas(h=0.1, validation=validation)
+    wog.wateroil.add_corey_water()
+    wog.wateroil.add_corey_oil()
+    wog.gasoil.add_corey_gas()
+    wog.gasoil.add_corey_oil()
+    spy = mocker.spy(wog, "threephaseconsistency")
+    assert "SOF3" in wog.SOF3()
+    assert spy.call_count == (0 if validation == "none" else 1)
+
+
+def test_factory_validation():
+    """The factory passes on the validation level, and does not check
+    the objects without validation"""
+    wateroil = PyscalFactory.create_water_oil(
+        {"nw": 2, "now": 2}, fast=True, validation="cheap"
+    )
+    assert wateroil.validation == "cheap"
+    wog = PyscalFactory.create_water_oil_gas(
+        {"nw": 2, "now": 2, "ng": 2, "nog": 2}, validation="none"
+    )
+    assert wog.validation == wog.wateroil.validation == wog.gasoil.validation
+    assert wog.fast
+    with pytest.raises(ValueError, match="Unknown validation level"):
+        PyscalFactory.create_gas_oil({"ng": 2, "nog": 2}, validation="some")
+
+
+def test_factory_no_selfcheck(mocker):
+    """With validation none, the factory does not run selfcheck()"""
+    spy = mocker.spy(WaterOil, "selfcheck")
+    PyscalFactory.create_water_oil({"nw": 2, "now": 2}, validation="none")
+    assert spy.call_count == 0
+    PyscalFactory.create_water_oil({"nw": 2, "now": 2}, validation="cheap")
+    assert spy.call_count == 1
+
+
+def test_scalrecommendation_validation(caplog):
+    """SCALrecommendation uses the most thorough validation level of its
+    objects, and the interpolants can be given another level"""
+    params = {"nw": 2, "now": 2, "ng": 2, "nog": 2}
+    scalrec = PyscalFactory.create_scal_recommendation(
+        {"low": params, "base": params, "high": params}, validation="cheap"
+    )
+    assert scalrec.validation == "cheap"
+    interpolant = scalrec.interpolate(-0.5)
+    assert interpolant.validation == "cheap"
+    assert interpolant.wateroil.validation == "cheap"
+    interpolant = scalrec.interpolate(0.5, 0, validation="none")
+    assert interpolant.validation == "none"
+    assert interpolant.wateroil.validation == "none"
+    assert interpolant.gasoil.validation == "none"
+
+    scalrec.low.validation = "full"
+    scalrec = SCALrecommendation(scalrec.low, scalrec.base, scalrec.high)
+    assert "different validation levels" in caplog.text
+    assert scalrec.validation == "full"
+    assert scalrec.base.validation == "full"
@@ -0,0 +1,34 @@
+"""Test processing of SATNUMs in worker processes"""
+
+import os
+
+import pytest
+
+from pyscal.utils import workers
+
+
+def _square(shared, idx):
+    """Square the shared value for a SATNUM, fail for negative values"""
+    if shared[idx] is None:
+        raise KeyError("no value")
+    assert shared[idx] >= 0, "negative value"
+    return shared[idx] ** 2, os.getpid()
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_satnum_map(processes):
+    """Results are in SATNUM order, errors are raised alike from workers"""
+    values = list(range(13))
+    results = list(workers.satnum_map(_square, values, len(values), processes))
+    assert [square for square, _ in results] == [value * value for value in values]
+    if processes == 1:
+        assert {pid for _, pid in results} == {os.getpid()}
+    else:
+        assert os.getpid() not in {pid for _, pid in results}
+
+    with pytest.raises(ValueError, match="Error for SATNUM 3: negative value"):
+        list(workers.satnum_map(_square, [1, 2, -3, 4], 4, processes))
+    with pytest.raises(KeyError, match="no value"):
+        list(workers.satnum_map(_square, [1, None, 3], 3, processes))
+
+    assert not list(workers.satnum_map(_square, [], 0, processes))
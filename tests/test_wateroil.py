@@ -23,16 +23,17 @@ def check_endpoints(wateroil, krwend, krwmax, kroend):
     """Check that the code produces correct endpoints for
     parametrizations, on discrete cases"""
     swtol = 1 / SWINTEGERS
+    table = wateroil.table.assign(SWN=wateroil.swn, SON=wateroil.son)
 
     # Check endpoints for oil curve:
     assert float_df_checker(wateroil.table, "SW", wateroil.swl, "KROW", kroend)
-    assert float_df_checker(wateroil.table, "SON", 1, "KROW", kroend)
+    assert float_df_checker(table, "SON", 1, "KROW", kroend)
     assert np.isclose(wateroil.table["KROW"].max(), kroend)
-    assert float_df_checker(wateroil.table, "SON", 0.0, "KROW", 0.0)
+    assert float_df_checker(table, "SON", 0.0, "KROW", 0.0)
     assert float_df_checker(wateroil.table, "SW", 1 - wateroil.socr, "KROW", 0.0)
 
     # Check endpoints for water curve: (np.isclose is only reliable around 1)
-    assert float_df_checker(wateroil.table, "SWN", 0.0, "KRW", 0.0)
+    assert float_df_checker(table, "SWN", 0.0, "KRW", 0.0)
     assert float_df_checker(wateroil.table, "SW", wateroil.swcr, "KRW", 0)
 
     if wateroil.sorw > swtol:
@@ -190,6 +191,25 @@ def test_linearsegments():
     check_linear_sections(wateroil)
 
 
+def test_no_scratch_columns():
+    """Normalized saturations and other intermediate results
+    must not be stored in the table"""
+    wateroil = WaterOil(h=0.1, swl=0.1, swcr=0.2, sorw=0.2)
+    assert list(wateroil.table.columns) == ["SW"]
+    wateroil.add_LET_water()
+    wateroil.add_corey_oil()
+    wateroil.add_LET_pc_pd(2, 2, 2, 2, 2, 2, 3, 1)
+    wateroil.add_LET_pc_imb(2, 2, 2, 2, 2, 2, 3, -1, 1)
+    wateroil.add_skjaeveland_pc(cw=1, co=-1, aw=1, ao=1)
+    wateroil.estimate_sorw()
+    wateroil.estimate_swcr()
+    assert set(wateroil.table.columns) == {"SW", "KRW", "KROW", "PC"}
+
+    assert np.isclose(wateroil.swn[wateroil.table["SW"] == 0.2], 0.0).all()
+    assert np.isclose(wateroil.son.iloc[0], 1.0)
+    assert np.isclose(wateroil.swnpc.iloc[-1], 1.0)
+
+
 def test_plotting(mocker):
     """Test that plotting code pass through (nothing displayed)"""
     mocker.patch("matplotlib.pyplot.show", return_value=None)
@@ -199,9 +219,11 @@ def test_plotting(mocker):
     wateroil.plotkrwkrow(mpl_ax=matplotlib.pyplot.subplots()[1])
     wateroil.plotkrwkrow(logyscale=True, mpl_ax=matplotlib.pyplot.subplots()[1])
     wateroil.plotkrwkrow(mpl_ax=None)
+    wateroil.plotkrwkrow(mpl_ax=matplotlib.pyplot.subplots()[1], decimate=True)
 
     wateroil.add_simple_J()
     wateroil.plotpc(mpl_ax=matplotlib.pyplot.subplots()[1])
+    wateroil.plotpc(mpl_ax=matplotlib.pyplot.subplots()[1], decimate=True)
     wateroil.plotpc(mpl_ax=None)
     wateroil.plotpc(logyscale=True)
 
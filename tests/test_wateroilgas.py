@@ -120,6 +120,28 @@ def test_manipulated_attributes_none():
         wog_nones.swirr
 
 
+def test_from_curves():
+    """WaterOilGas objects can be made from existing curves"""
+    wateroil = WaterOil(swl=0.1, h=0.1)
+    wateroil.add_corey_water()
+    wateroil.add_corey_oil()
+    gasoil = GasOil(swl=0.1, h=0.1)
+    gasoil.add_corey_gas()
+    gasoil.add_corey_oil()
+    wog = WaterOilGas.from_curves(wateroil, gasoil)
+    assert wog.wateroil is wateroil
+    assert wog.gasoil is gasoil
+    assert wog.validation == "full"
+    assert "SOF3" in wog.SOF3()
+    assert wog.selfcheck()
+
+    wog_go = WaterOilGas.from_curves(None, gasoil, validation="cheap")
+    assert wog_go.validation == "cheap"
+    assert wog_go.SGOF() == gasoil.SGOF()
+    assert wog_go.SWOF() == ""
+    assert not wog_go.fast
+
+
 def test_not_threephase_consistency():
     wog = WaterOilGas()
     # To trigger this, we need to hack the WaterOilGas object